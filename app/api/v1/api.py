@@ -2,7 +2,7 @@
 API v1 라우터 연결
 """
 from fastapi import APIRouter
-from .endpoints import news, health
+from .endpoints import news, health, webhooks
 
 api_router = APIRouter()
 
@@ -11,3 +11,6 @@ api_router.include_router(health.router, prefix="/health", tags=["health"])
 
 # 뉴스 라우터
 api_router.include_router(news.router, prefix="/news", tags=["news"])
+
+# 웹훅 라우터
+api_router.include_router(webhooks.router, prefix="/webhooks", tags=["webhooks"])
@@ -2,7 +2,11 @@
 헬스 체크 엔드포인트
 """
 from fastapi import APIRouter
-from ...models.news import HealthResponse
+from ....core.admission import get_admission_controller
+from ....core.cache import get_response_cache
+from ....core.deadline import deadline_stats
+from ....models.news import HealthResponse
+from ....services.enrichment import get_enrichment_pipeline
 
 router = APIRouter()
 
@@ -14,3 +18,27 @@ async def health_check():
         status="healthy",
         message="서비스가 정상적으로 작동 중입니다."
     )
+
+
+@router.get("/cache")
+async def cache_stats():
+    """응답 캐시 상태 확인 (조회 수는 요청을 처리한 워커 기준)"""
+    return get_response_cache().stats()
+
+
+@router.get("/admission")
+async def admission_stats():
+    """라우트별 동시 처리 한도와 대기/거절 현황 (요청을 처리한 워커 기준)"""
+    return get_admission_controller().stats()
+
+
+@router.get("/deadlines")
+async def deadline_stats_view():
+    """라우트별 처리 시간 예산 사용 현황 (요청을 처리한 워커 기준)"""
+    return deadline_stats.snapshot()
+
+
+@router.get("/enrichment")
+async def enrichment_stats():
+    """기사 보강 파이프라인의 대기열/배치 처리 현황 (요청을 처리한 워커 기준)"""
+    return get_enrichment_pipeline().stats()
@@ -1,14 +1,33 @@
 """
 뉴스 관련 엔드포인트
 """
-from fastapi import APIRouter, Depends, HTTPException
-from typing import Optional
-from ...models.news import (
-    CompanyNewsRequest, DeepSearchNewsRequest,
-    NewsResponse, DeepSearchNewsResponse, CombinedNewsResponse
+import asyncio
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi.responses import JSONResponse, StreamingResponse
+from typing import List, Optional
+from ....core.settings import settings
+from ....models.news import (
+    CompanyNewsRequest, DeepSearchNewsRequest, FeedNewsRequest,
+    NewsResponse, DeepSearchNewsResponse, CombinedNewsResponse, ArticleResponse,
+    CompanyEntry, NewsStatsResponse, TrendingResponse, NewsHistoryResponse, NewsSyncResponse,
+    NewsStoriesResponse, AutocompleteResponse, RelatedArticlesResponse
 )
-from ...services.naver_news import NaverNewsService
-from ...services.deepsearch_news import DeepSearchNewsService
+from ....services.naver_news import NaverNewsService
+from ....services.deepsearch_news import DeepSearchNewsService
+from ....services.feed_news import FeedNewsService
+from ....services.ingestion import IngestionService
+from ....services.company_dictionary import CompanyDictionary, get_company_dictionary
+from ....services.autocomplete import CompanyAutocomplete, get_company_autocomplete
+from ....services.query_planner import CompanyQueryPlanner
+from ....services.history import HistoryService
+from ....services.sync import SyncService
+from ....services.projection import item_fields, project_content, project_items, resolve_fields
+from ....services.export import MEDIA_TYPES, parquet_available, parse_time_bound, stream_export
+from ....services.aggregation import INTERVAL_HOURS, NewsAggregator, get_news_aggregator
+from ....services.trending import TrendDetector, get_trend_detector
+from ....services.stories import StoryClusterer, get_story_clusterer
+from ....services.related import RelatedArticleIndex, get_related_index
+from ....services.subscriptions import Subscriber, get_subscription_hub
 
 router = APIRouter()
 
@@ -23,34 +42,127 @@ def get_deepsearch_service() -> DeepSearchNewsService:
     return DeepSearchNewsService()
 
 
+def get_feed_service() -> FeedNewsService:
+    """RSS/Atom 피드 뉴스 서비스 의존성 주입"""
+    return FeedNewsService()
+
+
+def get_query_planner() -> CompanyQueryPlanner:
+    """기업 별칭 검색 계획 서비스 의존성 주입"""
+    return CompanyQueryPlanner()
+
+
+def get_ingestion_service() -> IngestionService:
+    """기사 수집 서비스 의존성 주입"""
+    return IngestionService()
+
+
+def get_history_service() -> HistoryService:
+    """기사 이력 조회 서비스 의존성 주입"""
+    return HistoryService()
+
+
+def get_sync_service() -> SyncService:
+    """기사 증분 동기화 서비스 의존성 주입"""
+    return SyncService()
+
+
+def _schedule_ingest(
+    background_tasks: BackgroundTasks, ingestion_service: IngestionService, company: str, items: list
+):
+    """응답 후 검색 결과 수집 예약 (읽기 전용 모드에서는 수집 워커가 담당하므로 생략)"""
+    if not settings.api_read_only:
+        background_tasks.add_task(ingestion_service.ingest_and_enrich, company, items)
+
+
+async def _projected_search(
+    service, request, fields, kind: str, background_tasks: BackgroundTasks, ingestion_service: IngestionService
+) -> JSONResponse:
+    """
+    필드 선택 검색 공통 처리
+
+    서비스가 원본 응답에서 요청한 필드만 만들고(모델 생성과 요청하지 않은 보강 생략), 수집은 보강 전
+    레코드로 예약합니다 (생략한 보강은 보강 파이프라인에서 수행).
+    """
+    content, records = await service.search_company_news_projected(request, item_fields(fields, kind))
+    _schedule_ingest(background_tasks, ingestion_service, request.company_name, records)
+    return JSONResponse(project_content(content, fields, kind))
+
+
+async def _search_company_news(
+    request: CompanyNewsRequest,
+    fields: Optional[str],
+    profile: Optional[str],
+    background_tasks: BackgroundTasks,
+    ingestion_service: IngestionService,
+    naver_service: NaverNewsService,
+    query_planner: CompanyQueryPlanner
+):
+    """POST/GET 기업 뉴스 검색 공통 처리"""
+    selected = resolve_fields(fields, profile, "naver")
+    service = query_planner if request.expand_aliases else naver_service
+    if selected is not None:
+        return await _projected_search(service, request, selected, "naver", background_tasks, ingestion_service)
+
+    response = await service.search_company_news(request)
+    _schedule_ingest(background_tasks, ingestion_service, request.company_name, response.items)
+    return response
+
+
 @router.post("/company", response_model=NewsResponse)
 async def get_company_news(
     request: CompanyNewsRequest,
-    naver_service: NaverNewsService = Depends(get_naver_service)
+    background_tasks: BackgroundTasks,
+    fields: Optional[str] = None,
+    profile: Optional[str] = None,
+    ingestion_service: IngestionService = Depends(get_ingestion_service),
+    naver_service: NaverNewsService = Depends(get_naver_service),
+    query_planner: CompanyQueryPlanner = Depends(get_query_planner)
 ):
     """
     특정 기업에 대한 최신 뉴스를 검색합니다 (네이버 API).
+    expand_aliases가 true이면 별칭/종목코드 검색 결과를 합쳐 반환합니다.
+    
+    - **fields**: 아이템에 포함할 필드 (쉼표 구분, 예: title,link,pubDate)
+    - **profile**: 이름 있는 필드 묶음 (minimal, full)
     """
-    return await naver_service.search_company_news(request)
+    return await _search_company_news(
+        request, fields, profile, background_tasks, ingestion_service, naver_service, query_planner
+    )
 
 
 @router.post("/deepsearch", response_model=DeepSearchNewsResponse)
 async def get_deepsearch_news(
     request: DeepSearchNewsRequest,
+    background_tasks: BackgroundTasks,
+    fields: Optional[str] = None,
+    profile: Optional[str] = None,
+    ingestion_service: IngestionService = Depends(get_ingestion_service),
     deepsearch_service: DeepSearchNewsService = Depends(get_deepsearch_service)
 ):
     """
     딥서치 뉴스 API를 통해 특정 기업에 대한 뉴스를 검색합니다.
     """
-    return await deepsearch_service.search_company_news(request)
+    selected = resolve_fields(fields, profile, "deepsearch")
+    if selected is not None:
+        return await _projected_search(deepsearch_service, request, selected, "deepsearch", background_tasks, ingestion_service)
+    response = await deepsearch_service.search_company_news(request)
+    _schedule_ingest(background_tasks, ingestion_service, request.company_name, response.items)
+    return response
 
 
 @router.get("/company/{company_name}", response_model=NewsResponse)
 async def get_company_news_simple(
     company_name: str,
+    background_tasks: BackgroundTasks,
     display: int = 10,
     start: int = 1,
-    naver_service: NaverNewsService = Depends(get_naver_service)
+    expand_aliases: bool = False,
+    fields: Optional[str] = None,
+    profile: Optional[str] = None,
+    ingestion_service: IngestionService = Depends(get_ingestion_service),
+    naver_service: NaverNewsService = Depends(get_naver_service),
+    query_planner: CompanyQueryPlanner = Depends(get_query_planner)
 ):
     """
     GET 요청으로 기업 뉴스를 검색합니다 (네이버 API, 간단한 버전).
@@ -58,41 +170,104 @@ async def get_company_news_simple(
     request = CompanyNewsRequest(
         company_name=company_name,
         display=display,
-        start=start
+        start=start,
+        expand_aliases=expand_aliases
+    )
+    return await _search_company_news(
+        request, fields, profile, background_tasks, ingestion_service, naver_service, query_planner
     )
-    return await naver_service.search_company_news(request)
 
 
 @router.get("/deepsearch/{company_name}", response_model=DeepSearchNewsResponse)
 async def get_deepsearch_news_simple(
     company_name: str,
+    background_tasks: BackgroundTasks,
     limit: int = 10,
     days_back: int = 30,
+    fields: Optional[str] = None,
+    profile: Optional[str] = None,
+    ingestion_service: IngestionService = Depends(get_ingestion_service),
     deepsearch_service: DeepSearchNewsService = Depends(get_deepsearch_service)
 ):
     """
     GET 요청으로 딥서치 뉴스를 검색합니다 (간단한 버전).
     """
+    selected = resolve_fields(fields, profile, "deepsearch")
     request = DeepSearchNewsRequest(
         company_name=company_name,
         limit=limit,
         days_back=days_back
     )
-    return await deepsearch_service.search_company_news(request)
+    if selected is not None:
+        return await _projected_search(deepsearch_service, request, selected, "deepsearch", background_tasks, ingestion_service)
+    response = await deepsearch_service.search_company_news(request)
+    _schedule_ingest(background_tasks, ingestion_service, request.company_name, response.items)
+    return response
+
+
+@router.post("/feed", response_model=NewsResponse)
+async def get_feed_news(
+    request: FeedNewsRequest,
+    background_tasks: BackgroundTasks,
+    fields: Optional[str] = None,
+    profile: Optional[str] = None,
+    ingestion_service: IngestionService = Depends(get_ingestion_service),
+    feed_service: FeedNewsService = Depends(get_feed_service)
+):
+    """
+    설정된 RSS/Atom 피드에서 특정 기업에 대한 뉴스를 검색합니다.
+    """
+    selected = resolve_fields(fields, profile, "naver")
+    if selected is not None:
+        return await _projected_search(feed_service, request, selected, "naver", background_tasks, ingestion_service)
+    response = await feed_service.search_company_news(request)
+    _schedule_ingest(background_tasks, ingestion_service, request.company_name, response.items)
+    return response
+
+
+@router.get("/feed/{company_name}", response_model=NewsResponse)
+async def get_feed_news_simple(
+    company_name: str,
+    background_tasks: BackgroundTasks,
+    limit: int = 10,
+    fields: Optional[str] = None,
+    profile: Optional[str] = None,
+    ingestion_service: IngestionService = Depends(get_ingestion_service),
+    feed_service: FeedNewsService = Depends(get_feed_service)
+):
+    """
+    GET 요청으로 RSS/Atom 피드 뉴스를 검색합니다 (간단한 버전).
+    """
+    selected = resolve_fields(fields, profile, "naver")
+    request = FeedNewsRequest(
+        company_name=company_name,
+        limit=limit
+    )
+    if selected is not None:
+        return await _projected_search(feed_service, request, selected, "naver", background_tasks, ingestion_service)
+    response = await feed_service.search_company_news(request)
+    _schedule_ingest(background_tasks, ingestion_service, request.company_name, response.items)
+    return response
 
 
 @router.get("/combined/{company_name}", response_model=CombinedNewsResponse)
 async def get_combined_news(
     company_name: str,
+    background_tasks: BackgroundTasks,
     naver_limit: int = 5,
     deepsearch_limit: int = 5,
     deepsearch_days_back: int = 30,
+    profile: Optional[str] = None,
     naver_service: NaverNewsService = Depends(get_naver_service),
-    deepsearch_service: DeepSearchNewsService = Depends(get_deepsearch_service)
+    deepsearch_service: DeepSearchNewsService = Depends(get_deepsearch_service),
+    ingestion_service: IngestionService = Depends(get_ingestion_service)
 ):
     """
     네이버와 딥서치 API를 모두 사용하여 통합된 뉴스 결과를 반환합니다.
+    (아이템 형식이 제공자마다 달라 필드 선택은 profile만 지원합니다.)
     """
+    naver_fields = resolve_fields(None, profile, "naver")
+    deepsearch_fields = resolve_fields(None, profile, "deepsearch")
     try:
         # 네이버 뉴스 가져오기
         naver_request = CompanyNewsRequest(
@@ -110,6 +285,19 @@ async def get_combined_news(
         )
         deepsearch_news = await deepsearch_service.search_company_news(deepsearch_request)
         
+        _schedule_ingest(background_tasks, ingestion_service, company_name, naver_news.items + deepsearch_news.items)
+        
+        if naver_fields is not None:
+            return JSONResponse({
+                "company": company_name,
+                "naver_news": {"total": naver_news.total, "items": project_items(naver_news.items, naver_fields)},
+                "deepsearch_news": {
+                    "total": deepsearch_news.total,
+                    "items": project_items(deepsearch_news.items, deepsearch_fields)
+                },
+                "combined_total": naver_news.total + deepsearch_news.total
+            })
+        
         return CombinedNewsResponse(
             company=company_name,
             naver_news={
@@ -128,3 +316,292 @@ async def get_combined_news(
             status_code=500, 
             detail=f"통합 뉴스 검색 중 오류가 발생했습니다: {str(e)}"
         )
+
+
+@router.get("/article", response_model=ArticleResponse)
+async def get_article(
+    url: str,
+    ingestion_service: IngestionService = Depends(get_ingestion_service)
+):
+    """
+    수집된 기사를 본문과 함께 조회합니다.
+    """
+    article = await asyncio.to_thread(ingestion_service.store.get_article, url)
+    if article is None:
+        raise HTTPException(status_code=404, detail="저장된 기사를 찾을 수 없습니다.")
+    return ArticleResponse(**{field: article[field] for field in ArticleResponse.model_fields})
+
+
+@router.get("/history/{company_name}", response_model=NewsHistoryResponse)
+async def get_news_history(
+    company_name: str,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    profile: Optional[str] = None,
+    history_service: HistoryService = Depends(get_history_service)
+):
+    """
+    저장소에 수집된 기업 기사를 최신순으로 조회합니다 (네이버 1000건 제한 없음).
+    
+    - **cursor**: 이전 응답의 next_cursor (생략하면 가장 최신 기사부터)
+    """
+    if not 1 <= limit <= 100:
+        raise HTTPException(status_code=400, detail="limit은 1 이상 100 이하여야 합니다.")
+    selected = resolve_fields(fields, profile, "stored")
+    history = await history_service.get_history(company_name, limit, cursor)
+    if selected is not None:
+        history["items"] = project_items(history["items"], selected)
+        return JSONResponse(history)
+    return history
+
+
+@router.get("/sync/{company_name}", response_model=NewsSyncResponse)
+async def sync_company_news(
+    company_name: str,
+    token: Optional[str] = None,
+    limit: int = 100,
+    fields: Optional[str] = None,
+    profile: Optional[str] = None,
+    sync_service: SyncService = Depends(get_sync_service)
+):
+    """
+    이전 동기화 이후 저장소에 추가된 기업 기사만 반환합니다.
+    
+    - **token**: 이전 응답의 next_token (생략하면 처음부터)
+    - has_more가 true이면 next_token으로 바로 다시 요청하고, false이면 다음 주기에 요청합니다.
+    """
+    if not 1 <= limit <= 500:
+        raise HTTPException(status_code=400, detail="limit은 1 이상 500 이하여야 합니다.")
+    selected = resolve_fields(fields, profile, "stored")
+    result = await sync_service.sync(company_name, limit, token)
+    if selected is not None:
+        result["items"] = project_items(result["items"], selected)
+        return JSONResponse(result)
+    return result
+
+
+@router.get("/export")
+async def export_articles(
+    format: str = "ndjson",
+    company: Optional[str] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    after_id: int = 0,
+    include_body: bool = False,
+    ingestion_service: IngestionService = Depends(get_ingestion_service)
+):
+    """
+    저장된 기사를 id 순서로 스트리밍 내보내기합니다 (NDJSON, CSV, Parquet).
+    
+    - **since/until**: 발행일시 구간 (ISO 8601, until 미포함)
+    - **after_id**: 중단된 내보내기를 이어받을 때 마지막으로 받은 기사 id
+    """
+    if format not in MEDIA_TYPES:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 형식입니다: {format}")
+    try:
+        since, until = parse_time_bound(since), parse_time_bound(until)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="since/until은 ISO 8601 형식이어야 합니다.")
+    
+    if format == "parquet" and not parquet_available():
+        raise HTTPException(status_code=501, detail="Parquet으로 내보내려면 pyarrow 패키지를 설치하세요.")
+    
+    return StreamingResponse(
+        stream_export(
+            ingestion_service.store, format, company, since, until, after_id, include_body,
+            settings.export_chunk_size
+        ),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="articles.{format}"'}
+    )
+
+
+@router.get("/stats/{company_name}", response_model=NewsStatsResponse)
+async def get_news_stats(
+    company_name: str,
+    days: int = 30,
+    interval: str = "hour",
+    aggregator: NewsAggregator = Depends(get_news_aggregator)
+):
+    """
+    수집된 기사로 기업의 기간별 뉴스량과 감정 분포를 집계합니다.
+    
+    - **days**: 최근 며칠을 집계할지 (보관 기간 이내)
+    - **interval**: 버킷 간격 (hour 또는 day)
+    """
+    if interval not in INTERVAL_HOURS:
+        raise HTTPException(status_code=400, detail="interval은 hour 또는 day만 지원합니다.")
+    if not 1 <= days <= aggregator.retention_days:
+        raise HTTPException(
+            status_code=400,
+            detail=f"days는 1 이상 {aggregator.retention_days} 이하여야 합니다."
+        )
+    return aggregator.query(company_name, days, interval)
+
+
+@router.get("/trending", response_model=TrendingResponse)
+async def get_trending_companies(
+    limit: int = 10,
+    detector: TrendDetector = Depends(get_trend_detector)
+):
+    """
+    수집된 기사에서 평소보다 언급이 급증한 기업을 찾습니다.
+    """
+    if not 1 <= limit <= 100:
+        raise HTTPException(status_code=400, detail="limit은 1 이상 100 이하여야 합니다.")
+    return TrendingResponse(window_seconds=detector.window_seconds, items=detector.trending(limit))
+
+
+@router.get("/stories/{company_name}", response_model=NewsStoriesResponse)
+async def get_news_stories(
+    company_name: str,
+    limit: int = 20,
+    min_articles: int = 1,
+    clusterer: StoryClusterer = Depends(get_story_clusterer)
+):
+    """
+    수집된 기사를 같은 사건(실적 발표, 리콜 등)끼리 묶은 스토리 목록을 반환합니다.
+    
+    - **limit**: 최대 스토리 수 (1~100)
+    - **min_articles**: 이 수 이상의 기사가 묶인 스토리만 반환
+    """
+    if not 1 <= limit <= 100:
+        raise HTTPException(status_code=400, detail="limit은 1 이상 100 이하여야 합니다.")
+    if min_articles < 1:
+        raise HTTPException(status_code=400, detail="min_articles는 1 이상이어야 합니다.")
+    return NewsStoriesResponse(company=company_name, items=clusterer.stories(company_name, limit, min_articles))
+
+
+@router.get("/autocomplete", response_model=AutocompleteResponse)
+async def autocomplete_company(
+    q: str,
+    limit: int = 10,
+    autocomplete: CompanyAutocomplete = Depends(get_company_autocomplete)
+):
+    """
+    입력 중인 기업명의 자동 완성 후보를 반환합니다 (업스트림을 호출하지 않음).
+    
+    - **q**: 입력 중인 기업명 ("삼성젅" 같은 조합 중인 글자, "ㅅㅅㅈ" 같은 초성도 가능)
+    - **limit**: 최대 후보 수 (1~50)
+    """
+    if not 1 <= limit <= 50:
+        raise HTTPException(status_code=400, detail="limit은 1 이상 50 이하여야 합니다.")
+    return AutocompleteResponse(query=q, items=autocomplete.suggest(q, limit))
+
+
+@router.get("/related", response_model=RelatedArticlesResponse)
+async def get_related_articles(
+    url: str,
+    limit: int = 10,
+    company: Optional[str] = None,
+    days: Optional[float] = None,
+    index: RelatedArticleIndex = Depends(get_related_index)
+):
+    """
+    저장된 기사와 내용(제목+설명)이 비슷한 기사를 유사도 순으로 반환합니다.
+    
+    - **url**: 기준 기사 URL (저장소에 있는 기사)
+    - **limit**: 최대 기사 수 (1~50)
+    - **company**: 이 기업 검색으로 저장된 기사만
+    - **days**: 최근 이 일수 안에 발행된 기사만
+    """
+    if not 1 <= limit <= 50:
+        raise HTTPException(status_code=400, detail="limit은 1 이상 50 이하여야 합니다.")
+    if days is not None and days <= 0:
+        raise HTTPException(status_code=400, detail="days는 0보다 커야 합니다.")
+    items = await asyncio.to_thread(index.related, url, limit, company, days)
+    if items is None:
+        raise HTTPException(status_code=404, detail="저장된 기사를 찾을 수 없습니다.")
+    return RelatedArticlesResponse(url=url, items=items)
+
+
+@router.get("/companies", response_model=List[CompanyEntry])
+async def list_companies(
+    dictionary: CompanyDictionary = Depends(get_company_dictionary)
+):
+    """
+    기업 사전에 등록된 기업 목록을 반환합니다.
+    """
+    return dictionary.companies()
+
+
+@router.put("/companies", response_model=CompanyEntry)
+async def upsert_company(
+    entry: CompanyEntry,
+    dictionary: CompanyDictionary = Depends(get_company_dictionary)
+):
+    """
+    기업 사전에 기업을 추가하거나 별칭/종목코드를 수정합니다.
+    """
+    dictionary.upsert(entry.model_dump())
+    return entry
+
+
+@router.delete("/companies/{company_name}")
+async def delete_company(
+    company_name: str,
+    dictionary: CompanyDictionary = Depends(get_company_dictionary)
+):
+    """
+    기업 사전에서 기업을 삭제합니다.
+    """
+    if not dictionary.remove(company_name):
+        raise HTTPException(status_code=404, detail="기업 사전에 없는 기업입니다.")
+    return {"company": company_name, "deleted": True}
+
+
+@router.websocket("/ws")
+async def news_subscription(websocket: WebSocket):
+    """
+    기업 뉴스 실시간 구독 (WebSocket).
+    
+    클라이언트 메시지: {"action": "subscribe" | "unsubscribe", "companies": ["삼성전자", ...]}
+    서버 메시지: {"type": "articles", "company": ..., "items": [...]} (새로 발견된 기사만)
+    같은 기업의 구독자들은 업스트림 폴러 하나를 공유합니다.
+    """
+    await websocket.accept()
+    hub = get_subscription_hub()
+    subscriber = Subscriber()
+    
+    async def send_loop():
+        while True:
+            message = await subscriber.queue.get()
+            await websocket.send_json(message)
+    
+    async def receive_loop():
+        while True:
+            message = await websocket.receive_json()
+            if not isinstance(message, dict) or not isinstance(message.get("companies", []), list):
+                subscriber.offer({"type": "error", "detail": "메시지는 {\"action\": ..., \"companies\": [...]} 형식이어야 합니다."})
+                continue
+            action = message.get("action")
+            companies = [company for company in message.get("companies", []) if isinstance(company, str) and company]
+            if action == "subscribe":
+                for company in companies:
+                    hub.subscribe(subscriber, company)
+            elif action == "unsubscribe":
+                for company in companies:
+                    hub.unsubscribe(subscriber, company)
+            else:
+                subscriber.offer({"type": "error", "detail": f"알 수 없는 action입니다: {action}"})
+                continue
+            subscriber.offer({"type": "subscriptions", "companies": sorted(subscriber.companies)})
+    
+    tasks = [
+        asyncio.create_task(send_loop()),
+        asyncio.create_task(receive_loop()),
+        asyncio.create_task(subscriber.closed.wait()),
+    ]
+    try:
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        if tasks[2] in done:
+            # 메시지를 너무 많이 놓친 느린 클라이언트
+            await websocket.close(code=1013, reason="slow consumer")
+        for task in done:
+            if not task.cancelled() and task.exception() and not isinstance(task.exception(), WebSocketDisconnect):
+                print(f"구독 연결 처리 중 오류가 발생했습니다: {str(task.exception())}")
+    finally:
+        for task in tasks:
+            task.cancel()
+        hub.remove(subscriber)
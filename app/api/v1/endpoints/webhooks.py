@@ -0,0 +1,43 @@
+"""
+웹훅 구독 API 엔드포인트
+"""
+from fastapi import APIRouter, Depends, HTTPException
+from typing import List
+from ....models.webhooks import WebhookSubscriptionRequest, WebhookSubscription
+from ....services.webhooks import WebhookDispatcher, get_webhook_dispatcher
+
+router = APIRouter()
+
+
+@router.post("", response_model=WebhookSubscription)
+async def create_webhook(
+    request: WebhookSubscriptionRequest,
+    dispatcher: WebhookDispatcher = Depends(get_webhook_dispatcher)
+):
+    """
+    웹훅 구독 등록
+    
+    - **target_url**: 새 기사 배치를 POST로 받을 URL
+    - **companies**: 구독할 기업명 목록 (기사의 기업 또는 언급 기업과 일치하면 전달)
+    """
+    if not request.target_url.startswith(("http://", "https://")):
+        raise HTTPException(status_code=400, detail="target_url은 http:// 또는 https://로 시작해야 합니다.")
+    subscription = await dispatcher.subscribe(request.target_url, request.companies)
+    return WebhookSubscription(**subscription)
+
+
+@router.get("", response_model=List[WebhookSubscription])
+async def list_webhooks(dispatcher: WebhookDispatcher = Depends(get_webhook_dispatcher)):
+    """웹훅 구독 목록 조회"""
+    return [WebhookSubscription(**subscription) for subscription in await dispatcher.subscriptions()]
+
+
+@router.delete("/{subscription_id}")
+async def delete_webhook(
+    subscription_id: int,
+    dispatcher: WebhookDispatcher = Depends(get_webhook_dispatcher)
+):
+    """웹훅 구독 삭제 (전달 대기 중인 배치도 함께 삭제)"""
+    if not await dispatcher.unsubscribe(subscription_id):
+        raise HTTPException(status_code=404, detail=f"웹훅 구독을 찾을 수 없습니다: {subscription_id}")
+    return {"deleted": subscription_id}
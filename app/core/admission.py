@@ -0,0 +1,203 @@
+"""
+요청 수용 제어 (부하 차단) 미들웨어
+"""
+import asyncio
+import json
+import time
+from collections import deque
+from typing import Deque, Dict, Optional
+
+from .routes import route_template
+from .settings import settings
+
+
+class AdaptiveLimiter:
+    """
+    경로 하나의 동시 처리 한도
+
+    한도만큼만 동시에 처리하고, 나머지는 크기가 제한된 대기열에서 최대 queue_timeout초 기다립니다.
+    한도는 AIMD 방식으로 조정합니다. 응답 시간이 목표보다 길면 한도를 곱으로 줄이고,
+    한도를 다 쓰면서도 응답이 빠르면 조금씩 늘립니다.
+    """
+
+    def __init__(self, limit: int, min_limit: int, max_limit: int, queue_size: int, queue_timeout: float,
+                 target_latency: float):
+        self.limit = float(limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.queue_size = queue_size
+        self.queue_timeout = queue_timeout
+        self.target_latency = target_latency
+        self.in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._last_decrease = 0.0
+        self.admitted = 0
+        self.rejected = 0
+        self.timed_out = 0
+
+    def _has_capacity(self) -> bool:
+        return self.in_flight < int(self.limit)
+
+    async def acquire(self) -> bool:
+        """처리 슬롯 획득 (대기열이 가득 찼거나 대기 시간을 넘기면 False)"""
+        if self._has_capacity() and not self._waiters:
+            self.in_flight += 1
+            self.admitted += 1
+            return True
+        if len(self._waiters) >= self.queue_size:
+            self.rejected += 1
+            return False
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), self.queue_timeout)
+        except asyncio.TimeoutError:
+            pass
+        except asyncio.CancelledError:
+            # 슬롯을 넘겨받은 직후 요청이 취소되면 슬롯을 돌려줌
+            if waiter.done() and not waiter.cancelled():
+                self._free_slot()
+            raise
+        finally:
+            if not waiter.done():
+                waiter.cancel()
+                self._waiters.remove(waiter)
+        if waiter.cancelled():
+            self.timed_out += 1
+            return False
+        # release에서 슬롯을 넘겨받음 (in_flight는 넘겨준 쪽에서 유지)
+        self.admitted += 1
+        return True
+
+    def release(self, latency: float):
+        """처리 완료: 한도 조정 후 대기 중인 요청에 슬롯을 넘김"""
+        self._adjust(latency)
+        self._free_slot()
+
+    def _free_slot(self):
+        self.in_flight -= 1
+        while self._waiters and self._has_capacity():
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+    def _adjust(self, latency: float):
+        now = time.monotonic()
+        if latency > self.target_latency:
+            # 같은 과부하 구간에서 연달아 줄이지 않도록 목표 응답 시간에 한 번만 감소
+            if now - self._last_decrease >= self.target_latency:
+                self.limit = max(self.min_limit, self.limit * 0.9)
+                self._last_decrease = now
+        elif self.in_flight >= int(self.limit):
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+
+    def stats(self) -> dict:
+        return {
+            "limit": int(self.limit),
+            "in_flight": self.in_flight,
+            "queued": len(self._waiters),
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "timed_out": self.timed_out,
+        }
+
+
+class AdmissionController:
+    """경로(라우트 템플릿)별 동시 처리 한도 관리 클래스"""
+
+    def __init__(self):
+        self.route_limits: Dict[str, int] = settings.admission_route_limits
+        self._limiters: Dict[str, AdaptiveLimiter] = {}
+
+    def limiter(self, route: str) -> AdaptiveLimiter:
+        limiter = self._limiters.get(route)
+        if limiter is None:
+            limit = self.route_limits.get(route, settings.admission_default_limit)
+            limiter = self._limiters[route] = AdaptiveLimiter(
+                limit=limit,
+                min_limit=settings.admission_min_limit,
+                max_limit=max(limit, settings.admission_max_limit),
+                queue_size=settings.admission_queue_size,
+                queue_timeout=settings.admission_queue_timeout,
+                target_latency=settings.admission_target_latency
+            )
+        return limiter
+
+    def stats(self) -> dict:
+        return {route: limiter.stats() for route, limiter in self._limiters.items()}
+
+
+class AdmissionControlMiddleware:
+    """
+    요청 수용 제어 ASGI 미들웨어
+
+    /api/ 아래의 HTTP 요청을 라우트 템플릿(예: /api/v1/news/company/{company_name})별 한도로 제한하고,
+    한도를 넘으면 대기열에서 기다리게 하거나 즉시 503(Retry-After)으로 거절합니다.
+    응답 본문을 다 보내면 슬롯을 반환하고 응답 시간을 기록하므로, 응답 후 백그라운드 작업은 한도와
+    응답 시간에 포함되지 않습니다. 헬스 체크와 WebSocket은 제한하지 않습니다.
+    """
+
+    def __init__(self, app, controller: AdmissionController):
+        self.app = app
+        self.controller = controller
+        self.exempt_prefixes = tuple(settings.admission_exempt_prefixes)
+
+    async def __call__(self, scope, receive, send):
+        path = scope.get("path", "")
+        if scope["type"] != "http" or not path.startswith("/api/") or path.startswith(self.exempt_prefixes):
+            await self.app(scope, receive, send)
+            return
+
+        limiter = self.controller.limiter(route_template(scope))
+        if not await limiter.acquire():
+            await self._reject(send)
+            return
+
+        started = time.monotonic()
+        released = False
+
+        def release():
+            nonlocal released
+            if not released:
+                released = True
+                limiter.release(time.monotonic() - started)
+
+        async def send_and_release(message):
+            await send(message)
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                release()
+
+        try:
+            await self.app(scope, receive, send_and_release)
+        finally:
+            # 응답을 끝내지 못하고 오류/취소로 끝난 경우
+            release()
+
+    async def _reject(self, send):
+        body = json.dumps(
+            {"detail": "요청이 많아 잠시 처리할 수 없습니다. 잠시 후 다시 시도하세요."},
+            ensure_ascii=False
+        ).encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": 503,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(settings.admission_retry_after).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+
+_controller: Optional[AdmissionController] = None
+
+
+def get_admission_controller() -> AdmissionController:
+    """전역 수용 제어기 인스턴스 반환"""
+    global _controller
+    if _controller is None:
+        _controller = AdmissionController()
+    return _controller
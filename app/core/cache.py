@@ -0,0 +1,251 @@
+"""
+업스트림 응답 캐시
+"""
+import asyncio
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from fastapi import HTTPException
+from . import deadline
+from .settings import settings
+from .cache_backends import CacheBackend, create_cache_backend
+
+
+# 부정 캐시 항목 표시 키 (업스트림 오류를 캐시 값으로 저장할 때 사용)
+NEGATIVE_MARKER = "__negative__"
+
+
+class UpstreamError(HTTPException):
+    """
+    분류된 업스트림 호출 실패 (부정 캐시 대상)
+
+    kind는 client_error(4xx), server_error(5xx, 429, 연결 실패), timeout 중 하나입니다.
+    요청 예산이 모자라 생긴 504는 업스트림 문제가 아니므로 이 예외를 쓰지 않습니다.
+    """
+
+    def __init__(self, status_code: int, detail: str, kind: str):
+        super().__init__(status_code=status_code, detail=detail)
+        self.kind = kind
+
+
+def classify_status(status_code: Optional[int]) -> str:
+    """업스트림 HTTP 상태 코드 분류 (응답이 없으면 연결 실패로 보고 server_error)"""
+    if status_code is not None and 400 <= status_code < 500 and status_code != 429:
+        return "client_error"
+    return "server_error"
+
+
+def jittered(ttl: float) -> float:
+    """만료 시각이 한꺼번에 몰리지 않도록 TTL에 ±negative_cache_jitter 비율의 무작위 편차를 줌"""
+    jitter = settings.negative_cache_jitter
+    return ttl * random.uniform(1 - jitter, 1 + jitter)
+
+
+class ResponseCache:
+    """
+    업스트림 응답 캐시
+
+    값은 업스트림 API의 JSON 응답(딕셔너리)을 그대로 저장합니다. 저장소는 설정의
+    cache_backend로 선택하며(memory/sqlite/redis), 공유 저장소를 쓰면 같은 호스트의
+    모든 워커가 캐시 항목을 공유합니다.
+
+    get_or_load는 같은 키에 대한 동시 미스를 하나의 업스트림 호출로 합칩니다 (single-flight).
+    워커 내부에서는 Future로, 워커 사이에서는 저장소의 잠금으로 합칩니다.
+
+    빈 결과와 분류된 업스트림 오류(UpstreamError)는 종류별로 짧은 TTL(지터 적용)의 부정 캐시 항목으로
+    저장하여, 같은 잘못된 검색어가 반복되어도 만료 전까지 업스트림을 다시 호출하지 않습니다.
+    """
+
+    def __init__(self, backend: Optional[CacheBackend] = None):
+        self.backend = backend or create_cache_backend(settings.cache_backend, settings)
+        self.lock_timeout = settings.cache_lock_timeout
+        self.lock_poll_interval = settings.cache_lock_poll_interval
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.negative_ttls = {
+            "empty": settings.negative_cache_empty_ttl,
+            "client_error": settings.negative_cache_client_error_ttl,
+            "server_error": settings.negative_cache_server_error_ttl,
+            "timeout": settings.negative_cache_timeout_ttl,
+        }
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.negative_hits = 0
+        self.negative_stored = {kind: 0 for kind in self.negative_ttls}
+
+    async def _run(self, func, *args):
+        """공유 저장소 호출은 이벤트 루프를 막지 않도록 스레드에서 실행"""
+        if self.backend.shared:
+            return await asyncio.to_thread(func, *args)
+        return func(*args)
+
+    def get(self, key: str) -> Optional[Any]:
+        """캐시 조회 (만료되었거나 없으면 None)"""
+        return self.backend.get(key)
+
+    def set(self, key: str, value: Any, ttl: float):
+        """캐시 저장"""
+        self.backend.set(key, value, ttl)
+
+    def delete(self, key: str):
+        """캐시 삭제"""
+        self.backend.delete(key)
+
+    async def put(self, key: str, value: Any, ttl: float):
+        """캐시 저장 (공유 저장소도 이벤트 루프를 막지 않음)"""
+        await self._run(self.backend.set, key, value, ttl)
+
+    async def _wait_for_other_worker(self, key: str):
+        """
+        다른 워커가 로드 중인 키의 값을 기다립니다.
+        반환값은 (값, 잠금 토큰)이며, 값 없이 잠금이 풀리면 잠금을 넘겨받습니다.
+        """
+        wait_until = time.monotonic() + self.lock_timeout
+        left = deadline.remaining()
+        if left is not None:
+            # 요청 예산보다 오래 기다리지 않음
+            wait_until = min(wait_until, time.monotonic() + left)
+        while time.monotonic() < wait_until:
+            await asyncio.sleep(self.lock_poll_interval)
+            value = await self._run(self.backend.get, key)
+            if value is not None:
+                return value, None
+            token = await self._run(self.backend.acquire_lock, key, self.lock_timeout)
+            if token is not None:
+                return None, token
+        return None, None
+
+    @staticmethod
+    def _is_negative(value: Any) -> bool:
+        return isinstance(value, dict) and NEGATIVE_MARKER in value
+
+    def _raise_negative(self, value: dict):
+        """캐시된 업스트림 오류를 다시 발생시킴"""
+        self.negative_hits += 1
+        raise UpstreamError(value["status_code"], value["detail"], value[NEGATIVE_MARKER])
+
+    async def _store_negative(self, key: str, error: UpstreamError):
+        if not settings.negative_cache_enabled:
+            return
+        entry = {NEGATIVE_MARKER: error.kind, "status_code": error.status_code, "detail": error.detail}
+        await self._run(self.backend.set, key, entry, jittered(self.negative_ttls[error.kind]))
+        self.negative_stored[error.kind] += 1
+
+    def _ttl_for(self, value: Any, ttl: float, is_empty: Optional[Callable[[Any], bool]]) -> float:
+        if settings.negative_cache_enabled and is_empty is not None and is_empty(value):
+            self.negative_stored["empty"] += 1
+            return min(ttl, jittered(self.negative_ttls["empty"]))
+        return ttl
+
+    async def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: float,
+        is_empty: Optional[Callable[[Any], bool]] = None
+    ) -> Any:
+        """
+        캐시에 없으면 loader로 값을 가져와 저장합니다. 동시에 들어온 같은 키 요청은 한 번만 로드합니다.
+
+        is_empty가 참인 값(빈 결과)은 짧은 TTL로 저장하고, loader가 UpstreamError를 발생시키면
+        오류 종류별 TTL로 오류 자체를 캐시합니다.
+        """
+        value = await self._run(self.backend.get, key)
+        if value is not None:
+            if self._is_negative(value):
+                self._raise_negative(value)
+            self.hits += 1
+            return value
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.coalesced += 1
+            try:
+                # 먼저 온 요청의 로드는 취소하지 않고, 이 요청의 예산만큼만 기다림
+                return await deadline.wait(asyncio.shield(inflight), "cache")
+            except HTTPException as e:
+                # 먼저 온 요청이 자신의 예산을 다 써서 실패했으면 남은 예산으로 직접 로드
+                left = deadline.remaining()
+                if e.status_code != 504 or (left is not None and left <= 0):
+                    raise
+                return await self.get_or_load(key, loader, ttl, is_empty)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        token = None
+        try:
+            token = await self._run(self.backend.acquire_lock, key, self.lock_timeout)
+            if token is None:
+                value, token = await self._wait_for_other_worker(key)
+                if value is not None:
+                    if self._is_negative(value):
+                        self._raise_negative(value)
+                    self.coalesced += 1
+                    future.set_result(value)
+                    return value
+
+            self.misses += 1
+            try:
+                value = await loader()
+            except UpstreamError as e:
+                await self._store_negative(key, e)
+                raise
+            await self._run(self.backend.set, key, value, self._ttl_for(value, ttl, is_empty))
+            future.set_result(value)
+            return value
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # 기다리는 요청이 없으면 "exception was never retrieved" 경고 방지
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+            if token is not None:
+                await self._run(self.backend.release_lock, key, token)
+
+    def load_snapshot(self) -> bool:
+        """디스크 스냅샷 연결 (항목은 조회될 때 지연 로드)"""
+        return self.backend.load_snapshot(settings.cache_snapshot_path)
+
+    def save_snapshot(self) -> int:
+        """현재 캐시를 디스크 스냅샷으로 저장"""
+        return self.backend.save_snapshot(settings.cache_snapshot_path)
+
+    async def run_periodic_snapshots(self, interval: float):
+        """interval초마다 스냅샷 저장 (앱 시작 시 백그라운드 작업으로 실행)"""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await asyncio.to_thread(self.save_snapshot)
+            except Exception as e:
+                print(f"캐시 스냅샷 저장 중 오류가 발생했습니다: {str(e)}")
+
+    def stats(self) -> dict:
+        """캐시 통계 (조회 수는 이 워커 기준)"""
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            "backend": settings.cache_backend,
+            "entries": self.backend.size(),
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "hit_rate": (self.hits + self.coalesced) / lookups if lookups else 0.0,
+            "negative_hits": self.negative_hits,
+            "negative_stored": dict(self.negative_stored),
+            **self.backend.stats(),
+        }
+
+
+_cache: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> ResponseCache:
+    """전역 응답 캐시 인스턴스 반환"""
+    global _cache
+    if _cache is None:
+        _cache = ResponseCache()
+    return _cache
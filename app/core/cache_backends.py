@@ -0,0 +1,439 @@
+"""
+응답 캐시 저장소 백엔드
+"""
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Set, Tuple
+
+from .cache_snapshot import SnapshotReader, claim_shard, snapshot_paths, write_snapshot
+
+
+class CacheBackend:
+    """
+    캐시 저장소 인터페이스
+
+    값은 JSON으로 직렬화할 수 있는 객체여야 합니다. acquire_lock/release_lock은
+    여러 워커가 같은 키를 동시에 로드하지 않도록 하는 single-flight 잠금입니다.
+    """
+
+    # 여러 프로세스가 공유하는 저장소인지 여부
+    shared = False
+
+    def get(self, key: str) -> Optional[Any]:
+        raise NotImplementedError
+
+    def set(self, key: str, value: Any, ttl: float):
+        raise NotImplementedError
+
+    def delete(self, key: str):
+        raise NotImplementedError
+
+    def acquire_lock(self, key: str, ttl: float) -> Optional[str]:
+        """잠금 획득 시 토큰 반환, 다른 워커가 잡고 있으면 None"""
+        return "local"
+
+    def release_lock(self, key: str, token: str):
+        pass
+
+    def size(self) -> int:
+        raise NotImplementedError
+
+    def stats(self) -> dict:
+        """저장소별 추가 통계 (메모리 사용량 등)"""
+        return {}
+
+    def load_snapshot(self, path: str) -> bool:
+        """스냅샷 연결 (영속 저장소는 필요 없으므로 기본 구현은 아무것도 하지 않음)"""
+        return False
+
+    def save_snapshot(self, path: str) -> int:
+        """스냅샷 저장 후 저장한 항목 수 반환"""
+        return 0
+
+
+def estimate_size(value: Any) -> int:
+    """JSON 값(딕셔너리/리스트/문자열/숫자)이 메모리에서 차지하는 대략적인 바이트 수"""
+    size = 0
+    seen = set()
+    stack = [value]
+    while stack:
+        obj = stack.pop()
+        # JSON 디코더가 같은 키 문자열을 공유하므로 같은 객체는 한 번만 셈
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple)):
+            stack.extend(obj)
+    return size
+
+
+# 항목 하나의 저장 오버헤드 (OrderedDict 노드와 (만료 시각, 값, 크기) 튜플)
+_ENTRY_OVERHEAD = 200
+
+
+class FrequencySketch:
+    """
+    TinyLFU 입장 판단용 접근 빈도 스케치
+
+    4비트 카운터(최대 15)의 Count-Min 스케치입니다. 기록한 접근 수가 sample_size에 이르면
+    모든 카운터를 절반으로 줄여(aging) 최근 빈도가 반영되도록 합니다.
+    """
+
+    def __init__(self, capacity: int, depth: int = 4):
+        width = 1
+        while width < max(capacity, 64):
+            width <<= 1
+        self.mask = width - 1
+        self.depth = depth
+        self.table = [bytearray(width) for _ in range(depth)]
+        self.sample_size = 10 * width
+        self.additions = 0
+
+    def _indexes(self, key: str):
+        h = hash(key)
+        step = (h >> 32) | 1
+        return [(h + i * step) & self.mask for i in range(self.depth)]
+
+    def increment(self, key: str):
+        for row, index in zip(self.table, self._indexes(key)):
+            if row[index] < 15:
+                row[index] += 1
+        self.additions += 1
+        if self.additions >= self.sample_size:
+            self.table = [bytearray(count >> 1 for count in row) for row in self.table]
+            self.additions //= 2
+
+    def estimate(self, key: str) -> int:
+        return min(row[index] for row, index in zip(self.table, self._indexes(key)))
+
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    프로세스 내부 TTL 기반 LRU 저장소 (바이트 한도)
+
+    항목마다 메모리 크기를 추정하여 max_bytes(0이면 제한 없음)와 max_entries 안에서 보관합니다.
+    새 항목을 넣기 위해 다른 항목을 내보내야 할 때는 TinyLFU 방식으로 입장을 판단합니다: 새 항목이 차지할
+    바이트만큼 LRU 쪽 항목들을 내보낼 후보로 고르고, 새 키의 최근 접근 빈도가 후보들보다 낮지 않을 때만 넣습니다.
+    한 번 조회되고 마는 검색어가 자주 조회되는 큰 항목들을 밀어내지 않습니다.
+
+    스냅샷이 연결되어 있으면 메모리에서 찾지 못한 키를 스냅샷에서 찾아 메모리로 올립니다.
+    스냅샷 전체를 시작 시에 읽지 않으므로 재시작 직후에도 시작 시간이 일정합니다.
+    워커마다 자신의 조각 파일에만 저장하고, 읽을 때는 모든 워커의 조각을 함께 찾습니다.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int = 0):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, Tuple[float, Any, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        # 조각 파일 경로 -> 스냅샷
+        self._snapshots: Dict[str, SnapshotReader] = {}
+        # 이 워커가 저장하는 조각 파일 (처음 저장할 때 확보)
+        self._shard: Optional[str] = None
+        self._shard_lock = None
+        # 스냅샷 이후 삭제된 키 (스냅샷에서 되살아나지 않도록)
+        self._tombstones: Set[str] = set()
+        self._sketch = FrequencySketch(max_entries * 4)
+        self.resident_bytes = 0
+        self.admitted = 0
+        self.rejected = 0
+        self.evictions: Dict[str, int] = {"expired": 0, "capacity": 0}
+
+    def _over_budget(self, extra_bytes: int = 0, extra_entries: int = 0) -> bool:
+        if len(self._entries) + extra_entries > self.max_entries:
+            return True
+        return bool(self.max_bytes) and self.resident_bytes + extra_bytes > self.max_bytes
+
+    def _remove(self, key: str, reason: Optional[str] = None):
+        _, _, size = self._entries.pop(key)
+        self.resident_bytes -= size
+        if reason is not None:
+            self.evictions[reason] += 1
+
+    def _admit(self, key: str, size: int) -> bool:
+        """새 항목이 내보낼 LRU 쪽 후보들보다 자주 조회되는지 판단 (만료된 후보는 먼저 정리)"""
+        now = time.time()
+        frequency = self._sketch.estimate(key)
+        freed_bytes = freed_entries = 0
+        expired = []
+        for victim, (expires_at, _, victim_size) in self._entries.items():
+            if not self._over_budget(size - freed_bytes, 1 - freed_entries):
+                break
+            if expires_at <= now:
+                expired.append(victim)
+            else:
+                victim_frequency = self._sketch.estimate(victim)
+                # 빈도가 같으면 최근 키를 받되, 처음 보는 키끼리는 기존 항목을 유지
+                if victim_frequency > frequency or (victim_frequency == frequency and frequency <= 1):
+                    return False
+            freed_bytes += victim_size
+            freed_entries += 1
+        for victim in expired:
+            self._remove(victim, "expired")
+        return True
+
+    def _store(self, key: str, expires_at: float, value: Any, admit: bool = True):
+        size = estimate_size(value) + sys.getsizeof(key) + _ENTRY_OVERHEAD
+        replacing = key in self._entries
+        if replacing:
+            self._remove(key)
+        if self.max_bytes and size > self.max_bytes:
+            self.rejected += 1
+            return
+        # 이미 있던 키의 갱신은 입장 판단 없이 받아들임
+        if admit and not replacing and self._over_budget(size, 1) and not self._admit(key, size):
+            self.rejected += 1
+            return
+
+        self._entries[key] = (expires_at, value, size)
+        self.resident_bytes += size
+        self.admitted += 1
+        now = time.time()
+        while self._over_budget() and len(self._entries) > 1:
+            victim, (victim_expires_at, _, _) = next(iter(self._entries.items()))
+            self._remove(victim, "expired" if victim_expires_at <= now else "capacity")
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            self._sketch.increment(key)
+            entry = self._entries.get(key)
+            if entry is None:
+                return self._get_from_snapshot(key)
+            expires_at, value, _ = entry
+            if expires_at <= time.time():
+                self._remove(key, "expired")
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def _get_from_snapshot(self, key: str) -> Optional[Any]:
+        if not self._snapshots or key in self._tombstones:
+            return None
+        # 여러 워커의 조각에 같은 키가 있으면 가장 늦게 만료되는 항목
+        entries = [entry for entry in (reader.get(key) for reader in self._snapshots.values()) if entry is not None]
+        if not entries:
+            return None
+        expires_at, value = max(entries, key=lambda entry: entry[0])
+        # 재시작 전에 메모리에 있던 항목이므로 입장 판단 없이 올림
+        self._store(key, expires_at, value, admit=False)
+        return value
+
+    def set(self, key: str, value: Any, ttl: float):
+        with self._lock:
+            self._store(key, time.time() + ttl, value)
+
+    def delete(self, key: str):
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if self._snapshots:
+                self._tombstones.add(key)
+
+    def size(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        return {
+            "resident_bytes": self.resident_bytes,
+            "max_bytes": self.max_bytes,
+            "admitted": self.admitted,
+            "admission_rejects": self.rejected,
+            "evictions": dict(self.evictions),
+        }
+
+    def load_snapshot(self, path: str) -> bool:
+        readers = {}
+        for snapshot_path in snapshot_paths(path):
+            reader = SnapshotReader.open(snapshot_path)
+            if reader is not None:
+                readers[snapshot_path] = reader
+        with self._lock:
+            previous, self._snapshots = self._snapshots, readers
+            self._tombstones = set()
+        for reader in previous.values():
+            reader.close()
+        return bool(readers)
+
+    def save_snapshot(self, path: str) -> int:
+        if self._shard is None:
+            self._shard, self._shard_lock = claim_shard(path)
+        with self._lock:
+            entries = {key: (expires_at, value) for key, (expires_at, value, _) in self._entries.items()}
+            snapshot, tombstones = self._snapshots.get(self._shard), set(self._tombstones)
+        # 아직 조회되지 않은 이 조각의 이전 항목도 만료 전이면 이어서 보존 (다른 워커의 조각은 그 워커가 저장)
+        if snapshot is not None:
+            for key, expires_at, value in snapshot:
+                if key not in entries and key not in tombstones:
+                    entries[key] = (expires_at, value)
+        count = write_snapshot(self._shard, ((key, expires_at, value) for key, (expires_at, value) in entries.items()))
+        reader = SnapshotReader.open(self._shard)
+        with self._lock:
+            previous = self._snapshots.pop(self._shard, None)
+            if reader is not None:
+                self._snapshots[self._shard] = reader
+        if previous is not None:
+            previous.close()
+        return count
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """
+    SQLite 기반 공유 저장소 (외부 서버 없이 같은 호스트의 워커들이 공유)
+
+    항목 쓰기는 단일 문장으로 원자적이며, WAL 모드와 메모리 매핑으로 읽기가 쓰기를 막지 않습니다.
+    single-flight 잠금은 만료 시각이 있는 잠금 행으로 구현하여 잠금을 잡은 워커가 죽어도 풀립니다.
+    """
+
+    shared = True
+
+    _SCHEMA = """
+    CREATE TABLE IF NOT EXISTS cache_entries (
+        key TEXT PRIMARY KEY,
+        value TEXT NOT NULL,
+        expires_at REAL NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS ix_cache_entries_expires_at ON cache_entries (expires_at);
+    CREATE TABLE IF NOT EXISTS cache_locks (
+        key TEXT PRIMARY KEY,
+        token TEXT NOT NULL,
+        expires_at REAL NOT NULL
+    );
+    """
+
+    def __init__(self, path: str, max_entries: int, mmap_size: int = 256 * 1024 * 1024):
+        self.path = path
+        self.max_entries = max_entries
+        self.mmap_size = mmap_size
+        self._local = threading.local()
+        self._writes = 0
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._connection().executescript(self._SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(f"PRAGMA mmap_size={self.mmap_size}")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> Optional[Any]:
+        row = self._connection().execute(
+            "SELECT value FROM cache_entries WHERE key = ? AND expires_at > ?",
+            (key, time.time())
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set(self, key: str, value: Any, ttl: float):
+        conn = self._connection()
+        conn.execute(
+            "INSERT OR REPLACE INTO cache_entries (key, value, expires_at) VALUES (?, ?, ?)",
+            (key, json.dumps(value, ensure_ascii=False), time.time() + ttl)
+        )
+        self._writes += 1
+        if self._writes % 100 == 0:
+            self._evict(conn)
+
+    def _evict(self, conn: sqlite3.Connection):
+        """만료된 항목과 최대 개수를 넘는 항목(만료가 가까운 순) 정리"""
+        now = time.time()
+        conn.execute("DELETE FROM cache_entries WHERE expires_at <= ?", (now,))
+        conn.execute("DELETE FROM cache_locks WHERE expires_at <= ?", (now,))
+        excess = self.size() - self.max_entries
+        if excess > 0:
+            conn.execute(
+                "DELETE FROM cache_entries WHERE key IN "
+                "(SELECT key FROM cache_entries ORDER BY expires_at LIMIT ?)",
+                (excess,)
+            )
+
+    def delete(self, key: str):
+        self._connection().execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+
+    def acquire_lock(self, key: str, ttl: float) -> Optional[str]:
+        conn = self._connection()
+        token = uuid.uuid4().hex
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute("DELETE FROM cache_locks WHERE key = ? AND expires_at <= ?", (key, now))
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO cache_locks (key, token, expires_at) VALUES (?, ?, ?)",
+                (key, token, now + ttl)
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return token if cursor.rowcount else None
+
+    def release_lock(self, key: str, token: str):
+        self._connection().execute("DELETE FROM cache_locks WHERE key = ? AND token = ?", (key, token))
+
+    def size(self) -> int:
+        return self._connection().execute("SELECT COUNT(*) FROM cache_entries").fetchone()[0]
+
+
+class RedisCacheBackend(CacheBackend):
+    """Redis 호환 서버 저장소 (redis 패키지가 설치된 경우에만 사용 가능)"""
+
+    shared = True
+
+    _RELEASE_SCRIPT = """
+    if redis.call("get", KEYS[1]) == ARGV[1] then
+        return redis.call("del", KEYS[1])
+    end
+    return 0
+    """
+
+    def __init__(self, url: str, prefix: str = "newsgathering:"):
+        try:
+            import redis
+        except ImportError as e:
+            raise RuntimeError("redis 캐시 백엔드를 사용하려면 redis 패키지를 설치하세요: pip install redis") from e
+        self.prefix = prefix
+        self._client = redis.Redis.from_url(url)
+
+    def get(self, key: str) -> Optional[Any]:
+        value = self._client.get(self.prefix + key)
+        return json.loads(value) if value is not None else None
+
+    def set(self, key: str, value: Any, ttl: float):
+        self._client.set(self.prefix + key, json.dumps(value, ensure_ascii=False), px=max(1, int(ttl * 1000)))
+
+    def delete(self, key: str):
+        self._client.delete(self.prefix + key)
+
+    def acquire_lock(self, key: str, ttl: float) -> Optional[str]:
+        token = uuid.uuid4().hex
+        acquired = self._client.set(f"{self.prefix}lock:{key}", token, nx=True, px=max(1, int(ttl * 1000)))
+        return token if acquired else None
+
+    def release_lock(self, key: str, token: str):
+        self._client.eval(self._RELEASE_SCRIPT, 1, f"{self.prefix}lock:{key}", token)
+
+    def size(self) -> int:
+        return self._client.dbsize()
+
+
+def create_cache_backend(name: str, settings) -> CacheBackend:
+    """설정값으로 캐시 백엔드 생성"""
+    if name == "memory":
+        return MemoryCacheBackend(settings.cache_max_entries, settings.cache_max_bytes)
+    if name == "sqlite":
+        return SQLiteCacheBackend(settings.cache_sqlite_path, settings.cache_max_entries)
+    if name == "redis":
+        return RedisCacheBackend(settings.cache_redis_url)
+    raise ValueError(f"지원하지 않는 캐시 백엔드입니다: {name}")
@@ -0,0 +1,185 @@
+"""
+응답 캐시 스냅샷 (배포 후 빠른 웜 스타트용)
+
+파일 형식 (리틀 엔디언):
+    헤더   : magic(4s) version(H) reserved(H) count(I) created_at(d)
+    인덱스 : count개의 (key_hash(Q) expires_at(d) offset(Q) length(I)), key_hash 오름차순
+    데이터 : 항목별 key_length(H) key(utf-8) zlib(JSON 값)
+
+읽을 때는 파일을 메모리 매핑하고 인덱스를 이진 탐색하므로 스냅샷 크기와 무관하게
+시작 시간이 일정하며, 실제로 조회된 항목만 디코딩합니다.
+
+여러 워커는 같은 경로에 덮어쓰지 않도록 파일 잠금으로 확보한 조각 파일(path.0, path.1, ...)에
+각자 저장하고, 시작할 때 모든 조각을 함께 엽니다.
+"""
+import fcntl
+import hashlib
+import json
+import mmap
+import os
+import struct
+import time
+import zlib
+from typing import IO, Any, Iterable, Iterator, List, Optional, Tuple
+
+MAGIC = b"NGCS"
+VERSION = 1
+_HEADER = struct.Struct("<4sHHId")
+_INDEX_ENTRY = struct.Struct("<QdQI")
+_KEY_LENGTH = struct.Struct("<H")
+
+
+def key_hash(key: str) -> int:
+    """캐시 키의 64비트 해시"""
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def snapshot_paths(path: str) -> List[str]:
+    """path 아래의 워커별 조각 파일(path.<번호>) 목록 (이전 형식의 단일 파일 path도 포함)"""
+    directory, base = os.path.split(os.path.abspath(path))
+    paths = [path] if os.path.exists(path) else []
+    try:
+        names = sorted(os.listdir(directory))
+    except FileNotFoundError:
+        return paths
+    for name in names:
+        if name.startswith(base + ".") and name[len(base) + 1:].isdigit():
+            paths.append(os.path.join(directory, name))
+    return paths
+
+
+def claim_shard(path: str, limit: int = 1024) -> Tuple[str, IO]:
+    """
+    다른 프로세스가 쓰고 있지 않은 조각 파일 경로를 파일 잠금으로 확보합니다.
+
+    잠금 파일은 프로세스가 끝나면 풀리므로 재시작한 워커들이 같은 번호를 다시 쓰고, 조각 파일 수는
+    동시에 실행된 워커 수를 넘지 않습니다. 반환한 파일 객체를 닫으면 잠금이 풀립니다.
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    for index in range(limit):
+        lock_file = open(f"{path}.{index}.lock", "a+")
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            continue
+        return f"{path}.{index}", lock_file
+    raise RuntimeError(f"사용할 수 있는 캐시 스냅샷 조각이 없습니다: {path}")
+
+
+def write_snapshot(path: str, entries: Iterable[Tuple[str, float, Any]]) -> int:
+    """
+    (키, 만료 시각, 값) 목록을 스냅샷 파일로 원자적으로 저장하고 저장한 항목 수를 반환합니다.
+    이미 만료된 항목은 저장하지 않습니다.
+    """
+    now = time.time()
+    records = []
+    for key, expires_at, value in entries:
+        if expires_at <= now:
+            continue
+        encoded_key = key.encode("utf-8")
+        blob = _KEY_LENGTH.pack(len(encoded_key)) + encoded_key + zlib.compress(
+            json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8"), 1
+        )
+        records.append((key_hash(key), expires_at, blob))
+    records.sort(key=lambda record: record[0])
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, 0, len(records), now))
+        offset = _HEADER.size + _INDEX_ENTRY.size * len(records)
+        for hashed, expires_at, blob in records:
+            f.write(_INDEX_ENTRY.pack(hashed, expires_at, offset, len(blob)))
+            offset += len(blob)
+        for _, _, blob in records:
+            f.write(blob)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    return len(records)
+
+
+class SnapshotReader:
+    """메모리 매핑된 스냅샷 파일에서 키 단위로 항목을 읽는 클래스"""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, _, self.count, self.created_at = _HEADER.unpack_from(self._mmap, 0)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"지원하지 않는 캐시 스냅샷 형식입니다: {path}")
+            # 저장 도중 잘린 파일: 인덱스와 마지막 항목(데이터는 인덱스 순서로 기록됨)이 파일 안에 있어야 함
+            end = _HEADER.size + self.count * _INDEX_ENTRY.size
+            if self.count:
+                _, _, offset, length = _INDEX_ENTRY.unpack_from(self._mmap, end - _INDEX_ENTRY.size)
+                end = offset + length
+            if end > len(self._mmap):
+                raise ValueError(f"잘린 캐시 스냅샷입니다: {path}")
+        except (ValueError, struct.error):
+            self._mmap.close()
+            raise
+
+    @classmethod
+    def open(cls, path: str) -> Optional["SnapshotReader"]:
+        """스냅샷 파일이 없거나 손상되었으면 None"""
+        try:
+            return cls(path)
+        except (OSError, ValueError, struct.error) as e:
+            if not isinstance(e, FileNotFoundError):
+                print(f"캐시 스냅샷을 열 수 없습니다 ({path}): {str(e)}")
+            return None
+
+    def _index_entry(self, position: int) -> Tuple[int, float, int, int]:
+        return _INDEX_ENTRY.unpack_from(self._mmap, _HEADER.size + position * _INDEX_ENTRY.size)
+
+    def _decode(self, offset: int, length: int) -> Tuple[str, Any]:
+        (key_length,) = _KEY_LENGTH.unpack_from(self._mmap, offset)
+        start = offset + _KEY_LENGTH.size
+        key = self._mmap[start:start + key_length].decode("utf-8")
+        value = json.loads(zlib.decompress(self._mmap[start + key_length:offset + length]))
+        return key, value
+
+    def get(self, key: str) -> Optional[Tuple[float, Any]]:
+        """(만료 시각, 값) 반환. 없거나 만료되었으면 None"""
+        hashed = key_hash(key)
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            if self._index_entry(middle)[0] < hashed:
+                low = middle + 1
+            else:
+                high = middle
+        now = time.time()
+        # 해시 충돌에 대비해 같은 해시의 항목을 모두 확인
+        while low < self.count:
+            entry_hash, expires_at, offset, length = self._index_entry(low)
+            if entry_hash != hashed:
+                break
+            if expires_at > now:
+                try:
+                    stored_key, value = self._decode(offset, length)
+                except (ValueError, struct.error, zlib.error):
+                    # 손상된 항목은 없는 것으로 처리
+                    return None
+                if stored_key == key:
+                    return expires_at, value
+            low += 1
+        return None
+
+    def __iter__(self) -> Iterator[Tuple[str, float, Any]]:
+        """만료되지 않은 모든 항목 (키, 만료 시각, 값)"""
+        now = time.time()
+        for position in range(self.count):
+            _, expires_at, offset, length = self._index_entry(position)
+            if expires_at > now:
+                try:
+                    key, value = self._decode(offset, length)
+                except (ValueError, struct.error, zlib.error):
+                    continue
+                yield key, expires_at, value
+
+    def close(self):
+        self._mmap.close()
@@ -1,9 +1,21 @@
 """
 애플리케이션 설정 초기화
 """
+import asyncio
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from .admission import AdmissionControlMiddleware, get_admission_controller
+from .cache import get_response_cache
+from .deadline import DeadlineMiddleware
 from .settings import settings
+from ..services.aggregation import get_news_aggregator
+from ..services.autocomplete import get_company_autocomplete
+from ..services.enrichment import get_enrichment_pipeline
+from ..services.related import get_related_index
+from ..services.stories import get_story_clusterer
+from ..services.store_follower import get_store_follower
+from ..services.trending import get_trend_detector
+from ..services.webhooks import get_webhook_dispatcher
 
 
 def create_app() -> FastAPI:
@@ -16,6 +28,15 @@ def create_app() -> FastAPI:
         debug=settings.debug
     )
     
+    # 요청 수용 제어: 라우트별 동시 처리 한도를 넘으면 대기 후 503으로 빠르게 거절
+    # (CORS보다 먼저 등록하여 503 응답에도 CORS 헤더가 붙도록 안쪽에 위치)
+    if settings.admission_enabled:
+        app.add_middleware(AdmissionControlMiddleware, controller=get_admission_controller())
+    
+    # 요청 처리 시간 예산: 업스트림 호출까지 전파되며, 예산 안에 응답하지 못하면 504
+    # (수용 제어 대기 시간도 예산에 포함되도록 수용 제어보다 바깥에 위치)
+    app.add_middleware(DeadlineMiddleware)
+    
     # CORS 미들웨어 추가
     app.add_middleware(
         CORSMiddleware,
@@ -25,4 +46,103 @@ def create_app() -> FastAPI:
         allow_headers=settings.cors_allow_headers,
     )
     
+    # 응답 캐시 스냅샷: 시작 시 지연 로드, 주기적/종료 시 저장
+    if settings.cache_snapshot_enabled:
+        background_tasks = []
+        
+        @app.on_event("startup")
+        async def load_cache_snapshot():
+            cache = get_response_cache()
+            cache.load_snapshot()
+            if settings.cache_snapshot_interval > 0:
+                background_tasks.append(
+                    asyncio.create_task(cache.run_periodic_snapshots(settings.cache_snapshot_interval))
+                )
+        
+        @app.on_event("shutdown")
+        async def save_cache_snapshot():
+            for task in background_tasks:
+                task.cancel()
+            get_response_cache().save_snapshot()
+    
+    if settings.api_read_only:
+        # 읽기 모델들이 저장된 기사를 적재하기 전에 저장소 추종 위치를 잡음 (적재 도중 저장된 기사도 전달)
+        @app.on_event("startup")
+        async def mark_store_follower():
+            await get_store_follower().mark()
+    
+    # 뉴스량/감정 집계: 시작 시 저장된 기사로 버킷을 채우고 이후 새 기사로 갱신
+    @app.on_event("startup")
+    async def start_news_aggregator():
+        await get_news_aggregator().start()
+    
+    @app.on_event("shutdown")
+    async def stop_news_aggregator():
+        get_news_aggregator().stop()
+    
+    # 급상승 기업 탐지: 새 기사의 언급 기업을 스트리밍으로 집계
+    @app.on_event("startup")
+    async def start_trend_detector():
+        await get_trend_detector().start()
+    
+    @app.on_event("shutdown")
+    async def stop_trend_detector():
+        get_trend_detector().stop()
+    
+    # 기사 묶음: 시작 시 저장된 기사로 스토리를 만들고 이후 새 기사를 배정
+    @app.on_event("startup")
+    async def start_story_clusterer():
+        await get_story_clusterer().start()
+    
+    @app.on_event("shutdown")
+    async def stop_story_clusterer():
+        get_story_clusterer().stop()
+    
+    # 기업명 자동 완성: 시작 시 최근 기사로 뉴스량을 채우고 이후 새 기사로 갱신
+    @app.on_event("startup")
+    async def start_company_autocomplete():
+        await get_company_autocomplete().start()
+    
+    @app.on_event("shutdown")
+    async def stop_company_autocomplete():
+        get_company_autocomplete().stop()
+    
+    # 관련 기사 색인 (쓰기 잠금을 얻은 프로세스만 색인, 나머지는 읽기만)
+    @app.on_event("startup")
+    async def start_related_index():
+        await get_related_index().start()
+    
+    @app.on_event("shutdown")
+    async def stop_related_index():
+        get_related_index().stop()
+    
+    if settings.api_read_only:
+        # 읽기 전용: 수집 워커(python -m app.ingest)가 저장한 새 기사를 따라 읽어 집계/급상승 탐지에 반영
+        # (웹훅 전달은 여러 API 워커가 중복으로 보내지 않도록 수집 워커가 담당)
+        @app.on_event("startup")
+        async def start_store_follower():
+            await get_store_follower().start()
+        
+        @app.on_event("shutdown")
+        async def stop_store_follower():
+            get_store_follower().stop()
+    else:
+        # 웹훅 전달: 시작 시 남은 배치 전달 재개, 종료 시 모아 둔 기사를 저장
+        @app.on_event("startup")
+        async def start_webhook_dispatcher():
+            await get_webhook_dispatcher().start()
+        
+        @app.on_event("shutdown")
+        async def stop_webhook_dispatcher():
+            await get_webhook_dispatcher().stop()
+        
+        # 기사 보강: 수집 전 정규화/감정 분석/기업 언급 추출을 프로세스 풀에서 수행
+        @app.on_event("startup")
+        async def start_enrichment_pipeline():
+            get_enrichment_pipeline().start()
+        
+        @app.on_event("shutdown")
+        async def stop_enrichment_pipeline():
+            await get_enrichment_pipeline().stop()
+    
     return app
@@ -0,0 +1,210 @@
+"""
+요청 처리 시간 예산(deadline) 관리
+"""
+import asyncio
+import contextvars
+import time
+from typing import Awaitable, Dict, Optional, TypeVar
+
+from fastapi import HTTPException
+from .routes import route_template
+from .settings import settings
+
+
+T = TypeVar("T")
+
+# 현재 요청의 마감 시각 (time.monotonic 기준). 요청이 만든 작업과 스레드(asyncio.to_thread)로 전파됩니다.
+_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar("request_deadline", default=None)
+
+
+class DeadlineStats:
+    """라우트별 예산 사용 통계 (워커 기준)"""
+
+    def __init__(self):
+        self.routes: Dict[str, dict] = {}
+        self.upstream_calls = 0
+        self.upstream_skipped = 0
+        self.upstream_remaining_total = 0.0
+
+    def route(self, route: str) -> dict:
+        stats = self.routes.get(route)
+        if stats is None:
+            stats = self.routes[route] = {"requests": 0, "timed_out": 0, "remaining_total": 0.0, "remaining_min": None}
+        return stats
+
+    def record_request(self, route: str, remaining_at_response: Optional[float]):
+        stats = self.route(route)
+        stats["requests"] += 1
+        if remaining_at_response is None:
+            stats["timed_out"] += 1
+            return
+        stats["remaining_total"] += remaining_at_response
+        if stats["remaining_min"] is None or remaining_at_response < stats["remaining_min"]:
+            stats["remaining_min"] = remaining_at_response
+
+    def snapshot(self) -> dict:
+        answered = {
+            route: stats["requests"] - stats["timed_out"] for route, stats in self.routes.items()
+        }
+        return {
+            "routes": {
+                route: {
+                    "requests": stats["requests"],
+                    "timed_out": stats["timed_out"],
+                    "avg_remaining": round(stats["remaining_total"] / answered[route], 3) if answered[route] else None,
+                    "min_remaining": round(stats["remaining_min"], 3) if stats["remaining_min"] is not None else None,
+                }
+                for route, stats in self.routes.items()
+            },
+            "upstream_calls": self.upstream_calls,
+            "upstream_skipped": self.upstream_skipped,
+            "upstream_avg_remaining": (
+                round(self.upstream_remaining_total / self.upstream_calls, 3) if self.upstream_calls else None
+            ),
+        }
+
+
+deadline_stats = DeadlineStats()
+
+
+def remaining() -> Optional[float]:
+    """현재 요청의 남은 예산 (초, 예산이 없으면 None)"""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def start(budget: float) -> contextvars.Token:
+    """현재 컨텍스트에 예산 설정"""
+    return _deadline.set(time.monotonic() + budget)
+
+
+def reset(token: contextvars.Token):
+    _deadline.reset(token)
+
+
+def _exceeded(stage: str) -> HTTPException:
+    return HTTPException(status_code=504, detail=f"요청 처리 시간 예산을 모두 사용했습니다 ({stage}).")
+
+
+def upstream_timeout(default: float, stage: str = "upstream") -> float:
+    """
+    업스트림 호출에 쓸 timeout: 기본값과 남은 예산 중 작은 값
+
+    예산이 이미 소진되었으면 호출하지 않도록 504 HTTPException을 발생시킵니다.
+    """
+    left = remaining()
+    if left is None:
+        return default
+    if left <= 0:
+        deadline_stats.upstream_skipped += 1
+        print(f"남은 예산이 없어 업스트림 호출을 건너뜁니다 ({stage})")
+        raise _exceeded(stage)
+    deadline_stats.upstream_calls += 1
+    deadline_stats.upstream_remaining_total += left
+    return min(default, left)
+
+
+async def wait(awaitable: Awaitable[T], stage: str) -> T:
+    """남은 예산 안에서만 기다림 (예산이 없으면 그대로 기다림)"""
+    left = remaining()
+    if left is None:
+        return await awaitable
+    if left <= 0:
+        raise _exceeded(stage)
+    try:
+        return await asyncio.wait_for(awaitable, left)
+    except asyncio.TimeoutError:
+        raise _exceeded(stage)
+
+
+class DeadlineMiddleware:
+    """
+    요청 처리 시간 예산 ASGI 미들웨어
+
+    예산은 X-Request-Timeout 헤더(초) 또는 라우트별 기본값(request_timeout_routes, request_timeout_default)이며,
+    request_timeout_max를 넘지 않습니다. 예산 안에 응답을 시작하지 못하면 처리 작업을 취소하고 504로 응답합니다.
+    응답을 시작한 뒤에는 취소하지 않으므로 스트리밍 응답과 응답 후 백그라운드 작업은 끝까지 실행됩니다.
+    """
+
+    header = b"x-request-timeout"
+
+    def __init__(self, app):
+        self.app = app
+
+    def _budget(self, scope, route: str) -> Optional[float]:
+        budget = settings.request_timeout_routes.get(route, settings.request_timeout_default)
+        for name, value in scope.get("headers", ()):
+            if name == self.header:
+                try:
+                    budget = float(value)
+                except ValueError:
+                    pass
+                break
+        if not budget or budget <= 0:
+            return None
+        return min(budget, settings.request_timeout_max)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not scope.get("path", "").startswith("/api/"):
+            await self.app(scope, receive, send)
+            return
+
+        route = route_template(scope)
+        budget = self._budget(scope, route)
+        if budget is None:
+            await self.app(scope, receive, send)
+            return
+
+        response_started = asyncio.Event()
+        remaining_at_response: Optional[float] = None
+
+        async def send_with_budget(message):
+            nonlocal remaining_at_response
+            if message["type"] == "http.response.start":
+                remaining_at_response = remaining()
+                response_started.set()
+                headers = list(message.get("headers", []))
+                headers.append((b"x-budget-remaining-ms", str(max(0, int(remaining_at_response * 1000))).encode()))
+                message = dict(message, headers=headers)
+            await send(message)
+
+        token = start(budget)
+        try:
+            # 작업은 현재 컨텍스트(예산 포함)를 복사하여 실행
+            task = asyncio.create_task(self.app(scope, receive, send_with_budget))
+        finally:
+            reset(token)
+
+        started_waiter = asyncio.create_task(response_started.wait())
+        try:
+            done, _ = await asyncio.wait(
+                {task, started_waiter}, timeout=budget, return_when=asyncio.FIRST_COMPLETED
+            )
+            if not done:
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+                deadline_stats.record_request(route, None)
+                print(f"요청 처리 시간 예산 {budget:.1f}초를 넘겨 처리를 중단했습니다 ({route})")
+                await self._timeout_response(send, budget)
+                return
+            await task
+            deadline_stats.record_request(route, remaining_at_response)
+        except asyncio.CancelledError:
+            task.cancel()
+            raise
+        finally:
+            started_waiter.cancel()
+
+    async def _timeout_response(self, send, budget: float):
+        body = f'{{"detail":"요청 처리 시간 예산 {budget:.1f}초를 넘겼습니다."}}'.encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": 504,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,45 @@
+"""
+요청 경로의 라우트 템플릿 조회 (미들웨어용)
+"""
+from collections import OrderedDict
+
+from starlette.routing import Match
+
+
+# (method, path) -> 라우트 템플릿 (경로 매칭 결과 캐시)
+_cache: "OrderedDict[tuple, str]" = OrderedDict()
+_CACHE_SIZE = 10000
+
+# 어떤 라우트와도 맞지 않는 경로(404)를 묶는 키 (임의 경로마다 한도/통계 항목이 생기지 않도록)
+UNMATCHED_ROUTE = "unmatched"
+
+
+def route_template(scope) -> str:
+    """
+    요청 경로에 해당하는 라우트 템플릿 반환 (예: /api/v1/news/company/{company_name})
+
+    미들웨어는 라우팅 전에 실행되므로 앱의 라우트와 직접 매칭합니다. 경로만 맞고 메서드가 다르면(405)
+    그 라우트의 템플릿을, 맞는 라우트가 없으면 UNMATCHED_ROUTE를 반환합니다.
+    """
+    key = (scope.get("method"), scope["path"])
+    route = _cache.get(key)
+    if route is not None:
+        _cache.move_to_end(key)
+        return route
+    partial = None
+    for candidate in getattr(scope.get("app"), "routes", ()):
+        match, _ = candidate.matches(scope)
+        if match == Match.FULL:
+            route = candidate.path
+            break
+        if match == Match.PARTIAL and partial is None:
+            partial = candidate.path
+    else:
+        # 맞지 않는 경로는 캐시하지 않음 (임의 경로가 캐시의 실제 라우트를 밀어내지 않도록)
+        if partial is None:
+            return UNMATCHED_ROUTE
+        route = partial
+    _cache[key] = route
+    if len(_cache) > _CACHE_SIZE:
+        _cache.popitem(last=False)
+    return route
@@ -24,9 +24,151 @@ class Settings(BaseSettings):
     naver_client_secret: Optional[str] = None
     naver_news_api_url: str = "https://openapi.naver.com/v1/search/news.json"
     
+    naver_cache_ttl: int = 300  # 초 단위
+    naver_page_window: int = 100  # 네이버 호출 단위 (이 크기로 정렬된 창을 캐시하고 페이지는 창에서 잘라 응답)
+    
+    # 응답 캐시 설정
+    cache_backend: str = "memory"  # memory | sqlite | redis (멀티 워커 배포는 sqlite 권장)
+    cache_max_entries: int = 10000
+    cache_max_bytes: int = 512 * 1024 * 1024  # memory 백엔드의 메모리 한도 (워커당, 0이면 항목 수로만 제한)
+    cache_sqlite_path: str = "data/cache.db"
+    cache_redis_url: str = "redis://localhost:6379/0"
+    cache_lock_timeout: float = 10.0  # 워커 간 single-flight 잠금 유지 시간 (초)
+    cache_lock_poll_interval: float = 0.05
+    cache_snapshot_enabled: bool = True  # memory 백엔드만 해당
+    cache_snapshot_path: str = "data/cache.snapshot"
+    cache_snapshot_interval: int = 300  # 주기적 스냅샷 간격 (초, 0이면 종료 시에만)
+    
+    # 부정 캐시 설정 (빈 결과와 업스트림 오류, TTL은 초 단위)
+    negative_cache_enabled: bool = True
+    negative_cache_empty_ttl: int = 60
+    negative_cache_client_error_ttl: int = 120  # 4xx (429 제외)
+    negative_cache_server_error_ttl: int = 15  # 5xx, 429, 연결 실패
+    negative_cache_timeout_ttl: int = 5
+    negative_cache_jitter: float = 0.2  # TTL 편차 비율 (±20%)
+    
+    # 기업 별칭 검색 설정
+    query_planner_max_queries: int = 6
+    
     # 딥서치 뉴스 API 설정
     deepsearch_api_key: Optional[str] = None
     deepsearch_news_api_url: str = "https://api.deepsearch.com/v1/news/search"
+    deepsearch_cache_ttl: int = 300  # 초 단위
+    
+    # RSS/Atom 피드 설정
+    feed_urls: list = []
+    feed_poll_interval: int = 300  # 초 단위
+    feed_request_timeout: float = 10.0
+    feed_poll_concurrency: int = 16
+    
+    # 기사 저장소 설정
+    article_store_path: str = "data/news.db"
+    
+    # 기사 본문 수집 설정
+    article_fetch_enabled: bool = True
+    article_fetch_concurrency: int = 64
+    article_fetch_per_host: int = 4
+    article_fetch_delay: float = 0.25  # 같은 호스트 요청 간격 (초)
+    article_fetch_timeout: float = 10.0
+    article_fetch_max_bytes: int = 2 * 1024 * 1024
+    article_fetch_user_agent: str = "newsGathering/1.0 (+article-fetcher)"
+    
+    # 기업 사전 설정
+    company_dictionary_path: str = "data/companies.json"
+    
+    # 감정 분석 설정
+    sentiment_cache_size: int = 100000
+    
+    # 실시간 구독(WebSocket) 설정
+    ws_poll_interval: float = 30.0  # 기업별 폴링 간격 (초)
+    ws_poll_display: int = 20
+    ws_queue_size: int = 100  # 구독자별 전송 대기열 크기
+    ws_max_dropped_messages: int = 500  # 이 이상 메시지를 버린 느린 클라이언트는 연결 종료
+    ws_seen_limit: int = 1000  # 기업별로 기억하는 기사 URL 수
+    
+    # 기사 내보내기 설정
+    export_chunk_size: int = 5000  # 저장소에서 한 번에 읽어 인코딩하는 행 수
+    
+    # 뉴스량/감정 집계 설정
+    aggregation_retention_days: int = 90  # 시간 버킷을 보관하는 기간
+    
+    # 급상승 기업 탐지 설정
+    trending_window_seconds: float = 3600.0  # 시간 창 길이
+    trending_baseline_windows: int = 24  # 기준선으로 삼는 지난 시간 창 수
+    trending_sketch_width: int = 2048
+    trending_sketch_depth: int = 4
+    trending_top_k: int = 200  # 시간 창마다 추적하는 후보 기업 수
+    trending_min_count: int = 3  # 급상승으로 보기 위한 현재 창 최소 언급 수
+    trending_seen_urls: int = 100000  # 중복 집계를 막기 위해 기억하는 기사 URL 수
+    
+    # 기사 묶음(스토리) 설정
+    story_similarity_threshold: float = 0.35  # 같은 스토리로 보는 최소 추정 Jaccard 유사도
+    story_window_hours: float = 48.0  # 스토리의 처음/마지막 기사에서 이 시간 안에 발행된 기사만 묶음
+    story_retention_hours: float = 168.0  # 마지막 기사 이후 이 시간이 지난 스토리는 정리
+    story_shingle_size: int = 2  # 문자 shingle 길이
+    story_lsh_bands: int = 32  # MinHash 서명 길이 = bands * rows (후보가 되는 유사도 ≈ (1/bands)^(1/rows))
+    story_lsh_rows: int = 3
+    story_recent_signatures: int = 8  # 스토리마다 비교에 쓰는 최근 기사 서명 수
+    
+    # 기업명 자동 완성 설정
+    autocomplete_half_life_hours: float = 24.0  # 순위에 쓰는 뉴스량의 반감기
+    autocomplete_warmup_days: int = 7  # 시작 시 뉴스량을 채울 때 읽는 기간
+    autocomplete_seen_urls: int = 100000  # 중복 집계를 막기 위해 기억하는 (기사 URL, 기업) 수
+    
+    # 관련 기사 설정
+    related_index_path: str = "data/related"  # 해시 TF-IDF 벡터 청크 파일을 두는 디렉터리
+    related_dimensions: int = 128  # 벡터 차원 (클수록 정확하지만 조회가 느려짐, 바꾸면 색인을 다시 만듦)
+    related_chunk_rows: int = 65536  # 청크 파일 하나의 행 수
+    related_sync_batch_size: int = 5000  # 저장소에서 한 번에 읽어 색인하는 기사 수
+    
+    # 웹훅 설정
+    webhook_store_path: str = "data/webhooks.db"
+    webhook_batch_window: float = 2.0  # 새 기사를 모아 한 배치로 보내는 시간 (초)
+    webhook_max_batch_size: int = 100
+    webhook_concurrency: int = 32  # 동시에 전송 중인 배치 수
+    webhook_timeout: float = 10.0
+    webhook_max_attempts: int = 8
+    webhook_backoff_base: float = 1.0  # 재시도 간격 (초, 시도마다 2배)
+    webhook_backoff_max: float = 300.0
+    webhook_refresh_interval: float = 5.0  # 다른 프로세스에서 바꾼 구독과 저장한 배치를 반영하는 간격 (초)
+    
+    # 수집 워커 설정 (python -m app.ingest)
+    ingest_watchlist: list = []  # 주기적으로 수집할 기업 목록
+    ingest_interval: int = 300  # 수집 주기 (초)
+    ingest_concurrency: int = 4  # 동시에 수집하는 기업 수
+    ingest_naver_display: int = 100
+    ingest_deepsearch_limit: int = 50
+    ingest_deepsearch_days_back: int = 3
+    ingest_feed_limit: int = 100
+    # true면 API 워커는 요청 처리 중 수집하지 않고 저장소를 읽기만 합니다 (수집은 수집 워커가 담당)
+    api_read_only: bool = False
+    store_follow_interval: float = 2.0  # 읽기 전용 API 워커가 저장소의 새 기사를 확인하는 간격 (초)
+    store_follow_batch_size: int = 1000
+    
+    # 기사 보강 파이프라인 설정 (HTML 정리, 발행일시 정규화, 중복 제거, 감정 분석, 기업 언급 추출)
+    enrichment_workers: int = 2  # 보강 프로세스 수 (0이면 프로세스 풀 없이 스레드에서 보강)
+    enrichment_batch_size: int = 256  # 한 번에 보강하는 최대 기사 수
+    enrichment_batch_window: float = 0.05  # 배치를 채우기 위해 기다리는 최대 시간 (초)
+    enrichment_queue_size: int = 64  # 보강을 기다리는 수집 작업 수 (가득 차면 제출하는 쪽이 기다림)
+    
+    # 요청 처리 시간 예산 설정 (X-Request-Timeout 헤더로 요청마다 지정 가능)
+    request_timeout_default: float = 15.0  # 초
+    request_timeout_max: float = 60.0
+    request_timeout_routes: dict = {"/api/v1/news/export": 0}  # 라우트 템플릿별 기본값 (0이면 예산 없음)
+    naver_request_timeout: float = 5.0  # 네이버 API 호출 하나의 최대 시간
+    deepsearch_request_timeout: float = 10.0  # 딥서치 API 호출 하나의 최대 시간
+    
+    # 요청 수용 제어(부하 차단) 설정
+    admission_enabled: bool = True
+    admission_default_limit: int = 64  # 라우트별 초기 동시 처리 한도
+    admission_route_limits: dict = {"/api/v1/news/export": 4}  # 라우트 템플릿별 초기 한도
+    admission_min_limit: int = 2
+    admission_max_limit: int = 256
+    admission_queue_size: int = 128  # 라우트별 대기열 크기
+    admission_queue_timeout: float = 2.0  # 대기열에서 기다리는 최대 시간 (초)
+    admission_target_latency: float = 2.0  # 이보다 느리면 한도를 줄임 (초)
+    admission_retry_after: int = 1  # 503 응답의 Retry-After (초)
+    admission_exempt_prefixes: list = ["/api/v1/health"]
     
     # CORS 설정
     cors_origins: list = ["*"]
@@ -0,0 +1,155 @@
+"""
+저장된 기사 대량 내보내기 CLI
+
+사용법:
+    python -m app.export --format ndjson --output samsung.ndjson --company 삼성전자 --since 2024-01-01
+    python -m app.export --format parquet --output exports/news.parquet --resume
+
+NDJSON/CSV는 청크를 쓸 때마다 "<output>.offset" 파일에 (마지막 id, 파일 크기)를 기록합니다.
+--resume으로 다시 실행하면 기록된 크기로 파일을 잘라 중간에 끊긴 쓰기를 버리고 그 id 이후부터 이어 씁니다.
+Parquet은 footer까지 써야 읽을 수 있는 형식이므로 --rows-per-file 행마다 완성된 파일
+("<stem>-<첫 id>.parquet")로 나누어 쓰고, 파일이 완성될 때마다 offset을 기록합니다.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Optional, Tuple
+
+from .core.settings import settings
+from .services.article_store import ArticleStore
+from .services.export import (
+    MEDIA_TYPES, ParquetEncoder, encode_csv, encode_ndjson, export_columns, parse_time_bound
+)
+
+
+def _checkpoint_path(output: str) -> str:
+    return output + ".offset"
+
+
+def _read_checkpoint(output: str) -> Tuple[int, int]:
+    """(마지막으로 내보낸 id, 그때의 파일 크기) 반환 (기록이 없으면 (0, 0))"""
+    try:
+        with open(_checkpoint_path(output), encoding="utf-8") as f:
+            data = json.load(f)
+        return data["after_id"], data.get("size", 0)
+    except FileNotFoundError:
+        return 0, 0
+
+
+def _write_checkpoint(output: str, after_id: int, size: int = 0):
+    temp_path = _checkpoint_path(output) + ".tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump({"after_id": after_id, "size": size}, f)
+    os.replace(temp_path, _checkpoint_path(output))
+
+
+def _export_text(args, store: ArticleStore, after_id: int, size: int) -> int:
+    """NDJSON/CSV를 하나의 파일에 이어 쓰기"""
+    columns = export_columns(args.include_body)
+    mode = "r+b" if after_id and os.path.exists(args.output) else "wb"
+    count = 0
+    with open(args.output, mode) as f:
+        if mode == "r+b":
+            f.truncate(size)
+            f.seek(size)
+        chunks = store.iter_export_chunks(
+            columns, args.company, args.since, args.until, after_id, args.chunk_size,
+            as_json=args.format == "ndjson"
+        )
+        # 이어 쓰더라도 파일이 없어졌거나 비어 있으면 CSV 헤더부터 씀
+        header = f.tell() == 0
+        for rows in chunks:
+            if args.format == "csv":
+                f.write(encode_csv(rows, columns, header=header))
+                header = False
+            else:
+                f.write(encode_ndjson(rows))
+            f.flush()
+            count += len(rows)
+            _write_checkpoint(args.output, rows[-1][0], f.tell())
+        if header and args.format == "csv":
+            f.write(encode_csv([], columns, header=True))
+    return count
+
+
+def _export_parquet(args, store: ArticleStore, after_id: int) -> int:
+    """Parquet을 --rows-per-file 행 단위의 완성된 파일들로 쓰기"""
+    columns = export_columns(args.include_body)
+    stem, ext = os.path.splitext(args.output)
+    count = 0
+    encoder: Optional[ParquetEncoder] = None
+    f = None
+    part_path = temp_path = None
+    part_rows = 0
+    last_id = after_id
+
+    def finish_part():
+        f.write(encoder.close())
+        f.close()
+        os.replace(temp_path, part_path)
+        _write_checkpoint(args.output, last_id)
+
+    chunks = store.iter_export_chunks(columns, args.company, args.since, args.until, after_id, args.chunk_size)
+    for rows in chunks:
+        if encoder is None:
+            part_path = f"{stem}-{rows[0][0]}{ext or '.parquet'}"
+            temp_path = part_path + ".tmp"
+            encoder = ParquetEncoder(columns)
+            f = open(temp_path, "wb")
+            part_rows = 0
+        f.write(encoder.write(rows))
+        part_rows += len(rows)
+        count += len(rows)
+        last_id = rows[-1][0]
+        if part_rows >= args.rows_per_file:
+            finish_part()
+            encoder = None
+    if encoder is not None:
+        finish_part()
+    return count
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="저장된 기사를 NDJSON/CSV/Parquet으로 내보냅니다.")
+    parser.add_argument("--format", choices=sorted(MEDIA_TYPES), default="ndjson")
+    parser.add_argument("--output", required=True, help="출력 파일 경로")
+    parser.add_argument("--company", help="기업명 (생략하면 전체)")
+    parser.add_argument("--since", help="발행일시 시작 (ISO 8601, 포함)")
+    parser.add_argument("--until", help="발행일시 끝 (ISO 8601, 미포함)")
+    parser.add_argument("--include-body", action="store_true", help="기사 본문 포함")
+    parser.add_argument("--resume", action="store_true", help="이전에 중단된 내보내기를 이어서 실행")
+    parser.add_argument("--chunk-size", type=int, default=settings.export_chunk_size)
+    parser.add_argument("--rows-per-file", type=int, default=1_000_000, help="Parquet 파일 하나의 최대 행 수")
+    parser.add_argument("--store", default=settings.article_store_path, help="기사 저장소 경로")
+    args = parser.parse_args(argv)
+
+    try:
+        args.since = parse_time_bound(args.since)
+        args.until = parse_time_bound(args.until)
+    except ValueError:
+        parser.error("--since/--until은 ISO 8601 형식이어야 합니다.")
+
+    after_id, size = _read_checkpoint(args.output) if args.resume else (0, 0)
+    if args.resume and after_id:
+        print(f"id {after_id} 이후부터 이어서 내보냅니다.")
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    store = ArticleStore(args.store)
+    started = time.perf_counter()
+    try:
+        if args.format == "parquet":
+            count = _export_parquet(args, store, after_id)
+        else:
+            count = _export_text(args, store, after_id, size)
+    except RuntimeError as e:
+        print(str(e), file=sys.stderr)
+        return 1
+    elapsed = time.perf_counter() - started
+    print(f"{count}개 기사를 내보냈습니다 ({elapsed:.1f}초).")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
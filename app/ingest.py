@@ -0,0 +1,67 @@
+"""
+기사 수집 워커 CLI (API 서버와 별도 프로세스)
+
+사용법:
+    python -m app.ingest                          # INGEST_WATCHLIST 기업을 INGEST_INTERVAL초마다 수집
+    python -m app.ingest --companies 삼성전자 LG전자 --once
+
+watchlist 기업의 최신 뉴스를 가져와 보강 파이프라인(정규화/감정 분석/기업 언급 추출, 프로세스 풀)과
+본문 수집을 거쳐 공유 기사 저장소와 응답 캐시에 기록하고, 웹훅 구독자에게 새 기사를 전달합니다. API 서버는 API_READ_ONLY=true로 실행하면
+요청 처리 중에는 수집하지 않고, 이 워커가 저장한 기사를 저장소에서 따라 읽습니다.
+응답 캐시를 API 워커와 공유하려면 CACHE_BACKEND=sqlite(또는 redis)로 실행해야 합니다.
+"""
+import argparse
+import asyncio
+import sys
+import time
+
+from .core.settings import settings
+from .services.enrichment import get_enrichment_pipeline
+from .services.ingest_worker import IngestWorker
+from .services.related import get_related_index
+from .services.webhooks import get_webhook_dispatcher
+
+
+async def _run(args) -> None:
+    worker = IngestWorker(args.companies)
+    dispatcher = get_webhook_dispatcher()
+    pipeline = get_enrichment_pipeline()
+    related = get_related_index()
+    await dispatcher.start()
+    pipeline.start()
+    await related.start()
+    try:
+        while True:
+            started = time.perf_counter()
+            counts = await worker.run_once()
+            elapsed = time.perf_counter() - started
+            print(f"{len(counts)}개 기업에서 새 기사 {sum(counts.values())}개를 수집했습니다 ({elapsed:.1f}초).")
+            if args.once:
+                break
+            await asyncio.sleep(max(0.0, args.interval - elapsed))
+    finally:
+        related.stop()
+        await pipeline.stop()
+        await dispatcher.stop()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="watchlist 기업의 뉴스를 주기적으로 수집합니다.")
+    parser.add_argument("--companies", nargs="+", default=settings.ingest_watchlist,
+                        help="수집할 기업 목록 (생략하면 INGEST_WATCHLIST)")
+    parser.add_argument("--interval", type=float, default=settings.ingest_interval, help="수집 주기 (초)")
+    parser.add_argument("--once", action="store_true", help="한 번만 수집하고 종료")
+    args = parser.parse_args(argv)
+
+    if not args.companies:
+        parser.error("수집할 기업이 없습니다. --companies 또는 INGEST_WATCHLIST를 설정하세요.")
+
+    try:
+        asyncio.run(_run(args))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
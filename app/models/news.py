@@ -2,7 +2,7 @@
 뉴스 관련 데이터 모델
 """
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 
 
@@ -14,6 +14,8 @@ class NewsItem(BaseModel):
     description: str = Field(..., description="뉴스 요약")
     pubDate: str = Field(..., description="발행일시")
     source: str = Field(default="naver", description="뉴스 소스")
+    sentiment: Optional[str] = Field(default=None, description="감정 분석 결과 (로컬 사전 기반)")
+    company_mentions: Optional[List[str]] = Field(default=None, description="기업 언급 목록")
 
 
 class DeepSearchNewsItem(BaseModel):
@@ -48,6 +50,7 @@ class CompanyNewsRequest(BaseModel):
     company_name: str = Field(..., description="검색할 기업명")
     display: Optional[int] = Field(default=10, ge=1, le=100, description="한 번에 가져올 뉴스 개수")
     start: Optional[int] = Field(default=1, ge=1, description="시작 위치")
+    expand_aliases: Optional[bool] = Field(default=False, description="기업 사전의 별칭/종목코드로도 검색하여 합칠지 여부")
 
 
 class DeepSearchNewsRequest(BaseModel):
@@ -57,6 +60,12 @@ class DeepSearchNewsRequest(BaseModel):
     days_back: Optional[int] = Field(default=30, ge=1, le=365, description="검색 기간 (일)")
 
 
+class FeedNewsRequest(BaseModel):
+    """RSS/Atom 피드 뉴스 요청 모델"""
+    company_name: str = Field(..., description="검색할 기업명")
+    limit: Optional[int] = Field(default=10, ge=1, le=100, description="가져올 뉴스 개수")
+
+
 class CombinedNewsResponse(BaseModel):
     """통합 뉴스 응답 모델"""
     company: str = Field(..., description="검색한 기업명")
@@ -65,6 +74,140 @@ class CombinedNewsResponse(BaseModel):
     combined_total: int = Field(..., description="총 뉴스 개수")
 
 
+class CompanyEntry(BaseModel):
+    """기업 사전 항목 모델"""
+    name: str = Field(..., description="대표 기업명")
+    aliases: List[str] = Field(default_factory=list, description="별칭 목록 (영문명, 약칭 등)")
+    ticker: Optional[str] = Field(default=None, description="종목코드")
+
+
+class ArticleResponse(BaseModel):
+    """저장된 기사 응답 모델"""
+    url: str = Field(..., description="기사 URL")
+    company: str = Field(..., description="기사를 수집한 기업명")
+    title: str = Field(..., description="뉴스 제목")
+    description: str = Field(..., description="뉴스 요약")
+    published_at: str = Field(..., description="발행일시 (UTC)")
+    source: str = Field(..., description="뉴스 소스")
+    body: Optional[str] = Field(default=None, description="기사 본문 (수집 전이면 null)")
+
+
+class StoredArticle(BaseModel):
+    """저장된 기사 모델 (본문 제외)"""
+    id: int = Field(..., description="저장소 기사 ID")
+    url: str = Field(..., description="기사 URL")
+    source: str = Field(..., description="뉴스 소스")
+    title: str = Field(..., description="뉴스 제목")
+    description: str = Field(..., description="뉴스 요약")
+    published_at: str = Field(..., description="발행일시 (UTC)")
+    sentiment: Optional[str] = Field(default=None, description="감정 분석 결과")
+    company_mentions: Optional[List[str]] = Field(default=None, description="언급된 기업들")
+
+
+class NewsHistoryResponse(BaseModel):
+    """기업 기사 이력 응답 모델"""
+    company: str = Field(..., description="기업명")
+    items: List[StoredArticle] = Field(..., description="기사 목록 (최신순)")
+    next_cursor: Optional[str] = Field(default=None, description="다음 페이지 커서 (마지막 페이지면 null)")
+
+
+class NewsSyncResponse(BaseModel):
+    """기업 기사 증분 동기화 응답 모델"""
+    company: str = Field(..., description="기업명")
+    items: List[StoredArticle] = Field(..., description="token 이후 저장된 기사 목록 (저장순)")
+    next_token: str = Field(..., description="다음 동기화에 쓸 sync token")
+    has_more: bool = Field(..., description="아직 받지 않은 기사가 더 있는지 여부")
+    reset: bool = Field(default=False, description="저장소가 새로 만들어져 처음부터 다시 동기화했는지 여부")
+
+
+class NewsStatsBucket(BaseModel):
+    """뉴스 집계 버킷 모델"""
+    start: str = Field(..., description="버킷 시작 시각 (UTC)")
+    count: int = Field(..., description="기사 수")
+    sentiment: Dict[str, int] = Field(..., description="감정별 기사 수 (positive/negative/neutral)")
+    outlets: int = Field(..., description="기사를 낸 언론사 수")
+
+
+class NewsStatsResponse(BaseModel):
+    """기업 뉴스량/감정 집계 응답 모델"""
+    company: str = Field(..., description="기업명")
+    interval: str = Field(..., description="버킷 간격 (hour/day)")
+    start: str = Field(..., description="집계 구간 시작 (UTC)")
+    end: str = Field(..., description="집계 구간 끝 (UTC, 미포함)")
+    total: int = Field(..., description="구간 전체 기사 수")
+    sentiment: Dict[str, int] = Field(..., description="구간 전체 감정별 기사 수")
+    outlets: int = Field(..., description="구간 전체 언론사 수")
+    buckets: List[NewsStatsBucket] = Field(..., description="버킷 목록 (오래된 순)")
+
+
+class TrendingCompany(BaseModel):
+    """급상승 기업 모델"""
+    company: str = Field(..., description="기업명")
+    count: int = Field(..., description="현재 시간 창 언급 기사 수 (근사값)")
+    baseline: float = Field(..., description="지난 시간 창 평균 언급 기사 수 (근사값)")
+    score: float = Field(..., description="급상승 점수")
+
+
+class TrendingResponse(BaseModel):
+    """급상승 기업 응답 모델"""
+    window_seconds: float = Field(..., description="시간 창 길이 (초)")
+    items: List[TrendingCompany] = Field(..., description="급상승 점수 순 기업 목록")
+
+
+class StoryArticle(BaseModel):
+    """스토리에 속한 기사 모델"""
+    url: str = Field(..., description="기사 URL")
+    title: str = Field(..., description="제목")
+    published_at: str = Field(..., description="발행일시 (UTC)")
+
+
+class NewsStory(BaseModel):
+    """기사 묶음(스토리) 모델"""
+    story_id: int = Field(..., description="스토리 ID (프로세스 안에서만 유효)")
+    headline: str = Field(..., description="스토리를 시작한 기사의 제목")
+    url: str = Field(..., description="스토리를 시작한 기사의 URL")
+    count: int = Field(..., description="스토리에 속한 기사 수")
+    first_seen: str = Field(..., description="가장 이른 기사 발행일시 (UTC)")
+    last_seen: str = Field(..., description="가장 늦은 기사 발행일시 (UTC)")
+    articles: List[StoryArticle] = Field(..., description="최근 배정된 기사 (최신 순, 최대 5개)")
+
+
+class NewsStoriesResponse(BaseModel):
+    """기업 스토리 목록 응답 모델"""
+    company: str = Field(..., description="기업명")
+    items: List[NewsStory] = Field(..., description="마지막 기사가 최근인 순 스토리 목록")
+
+
+class AutocompleteItem(BaseModel):
+    """기업명 자동 완성 후보 모델"""
+    name: str = Field(..., description="기업명")
+    matched: str = Field(..., description="입력과 일치한 이름 (기업명, 별칭 또는 종목코드)")
+    volume: float = Field(..., description="최근 뉴스량 (반감기로 감쇠한 기사 수)")
+
+
+class AutocompleteResponse(BaseModel):
+    """기업명 자동 완성 응답 모델"""
+    query: str = Field(..., description="입력")
+    items: List[AutocompleteItem] = Field(..., description="최근 뉴스량 순 후보 목록")
+
+
+class RelatedArticle(BaseModel):
+    """관련 기사 모델"""
+    url: str = Field(..., description="기사 URL")
+    company: str = Field(..., description="기사를 저장한 검색 기업명")
+    source: str = Field(..., description="출처 (naver/deepsearch/feed)")
+    title: str = Field(..., description="제목")
+    description: str = Field(..., description="요약/설명")
+    published_at: str = Field(..., description="발행일시 (UTC)")
+    score: float = Field(..., description="코사인 유사도 (-1~1)")
+
+
+class RelatedArticlesResponse(BaseModel):
+    """관련 기사 응답 모델"""
+    url: str = Field(..., description="기준 기사 URL")
+    items: List[RelatedArticle] = Field(..., description="유사도 순 관련 기사 목록")
+
+
 class HealthResponse(BaseModel):
     """헬스 체크 응답 모델"""
     status: str = Field(..., description="서비스 상태")
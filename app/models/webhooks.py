@@ -0,0 +1,19 @@
+"""
+웹훅 관련 데이터 모델
+"""
+from pydantic import BaseModel, Field
+from typing import List
+
+
+class WebhookSubscriptionRequest(BaseModel):
+    """웹훅 구독 요청 모델"""
+    target_url: str = Field(..., description="새 기사를 받을 URL (POST)")
+    companies: List[str] = Field(..., min_length=1, description="구독할 기업명 목록")
+
+
+class WebhookSubscription(BaseModel):
+    """웹훅 구독 모델"""
+    id: int = Field(..., description="구독 ID")
+    target_url: str = Field(..., description="새 기사를 받을 URL (POST)")
+    companies: List[str] = Field(..., description="구독할 기업명 목록")
+    pending_batches: int = Field(default=0, description="전달 대기 중인 배치 수")
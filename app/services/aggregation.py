@@ -0,0 +1,215 @@
+"""
+기업별 뉴스량/감정 시간 버킷 집계 서비스
+"""
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Set
+from urllib.parse import urlparse
+
+import numpy as np
+
+from ..core.settings import settings
+from ..utils.dates import epoch_seconds
+from .article_store import ArticleStore, get_article_store
+from .ingestion import add_article_listener, remove_article_listener
+
+
+SENTIMENTS = ("positive", "negative", "neutral")
+_SENTIMENT_INDEX = {label: i for i, label in enumerate(SENTIMENTS)}
+
+# 집계 간격별 버킷 크기 (시간 단위)
+INTERVAL_HOURS = {"hour": 1, "day": 24}
+
+
+def _epoch_hour(published_at: str) -> Optional[int]:
+    """UTC ISO 발행일시를 1970-01-01부터의 시간 수로 변환"""
+    seconds = epoch_seconds(published_at)
+    return None if seconds is None else int(seconds) // 3600
+
+
+def _outlet(url: str) -> str:
+    """기사 URL의 언론사 호스트 (www. 제외)"""
+    host = urlparse(url).hostname or ""
+    return host[4:] if host.startswith("www.") else host
+
+
+class CompanyBuckets:
+    """
+    기업 하나의 시간 단위 링 버퍼
+
+    슬롯 i는 (시간 % capacity)에 해당하며, hours[i]에 슬롯이 담고 있는 시간을 함께 저장하여
+    오래된 슬롯은 다시 쓰일 때 초기화합니다. 기사 수와 감정별 기사 수는 NumPy 배열로 보관하여
+    구간 조회가 기사 수가 아닌 버킷 수에 비례합니다.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.hours = np.full(capacity, -1, dtype=np.int64)
+        self.counts = np.zeros(capacity, dtype=np.int32)
+        self.sentiments = np.zeros((capacity, len(SENTIMENTS)), dtype=np.int32)
+        self.outlets: List[Optional[Set[str]]] = [None] * capacity
+
+    def add(self, hour: int, sentiment: Optional[str], outlet: str) -> bool:
+        """기사 하나를 반영 (보관 기간보다 오래된 기사면 False)"""
+        slot = hour % self.capacity
+        current = self.hours[slot]
+        if current > hour:
+            return False
+        if current != hour:
+            self.hours[slot] = hour
+            self.counts[slot] = 0
+            self.sentiments[slot] = 0
+            self.outlets[slot] = set()
+        self.counts[slot] += 1
+        # 감정 분석 결과가 없는 기사는 중립으로 집계
+        self.sentiments[slot, _SENTIMENT_INDEX.get(sentiment, 2)] += 1
+        if outlet:
+            self.outlets[slot].add(outlet)
+        return True
+
+    def query(self, start_hour: int, end_hour: int, step: int) -> List[dict]:
+        """[start_hour, end_hour) 구간을 step시간 단위 버킷으로 집계"""
+        span = np.arange(start_hour, end_hour, dtype=np.int64)
+        slots = span % self.capacity
+        valid = self.hours[slots] == span
+
+        counts = np.where(valid, self.counts[slots], 0)
+        sentiments = np.where(valid[:, None], self.sentiments[slots], 0)
+        buckets = len(span) // step
+        counts = counts.reshape(buckets, step).sum(axis=1)
+        sentiments = sentiments.reshape(buckets, step, len(SENTIMENTS)).sum(axis=1)
+
+        results = []
+        for b in range(buckets):
+            outlets: Set[str] = set()
+            for slot in slots[b * step:(b + 1) * step][valid[b * step:(b + 1) * step]]:
+                outlets.update(self.outlets[slot])
+            results.append({
+                "hour": start_hour + b * step,
+                "count": int(counts[b]),
+                "sentiment": {label: int(sentiments[b, i]) for i, label in enumerate(SENTIMENTS)},
+                "outlets": outlets,
+            })
+        return results
+
+
+class NewsAggregator:
+    """
+    기업별 뉴스량/감정/언론사 수 집계 클래스
+
+    기사 저장소에 새 기사가 추가될 때마다 시간 버킷을 갱신하고(수집 리스너),
+    시작 시에는 보관 기간 안의 저장된 기사로 버킷을 한 번 채웁니다.
+    """
+
+    def __init__(self, store: Optional[ArticleStore] = None, retention_days: Optional[int] = None):
+        self.store = store or get_article_store()
+        self.retention_days = retention_days or settings.aggregation_retention_days
+        self.capacity = self.retention_days * 24
+        self._companies: Dict[str, CompanyBuckets] = {}
+        self._started = False
+        # 시작할 때 적재한 마지막 기사 id (적재 범위를 정하는 중에는 None)와 그동안 들어온 새 기사
+        self._loaded_id: Optional[int] = 0
+        self._early: List[tuple] = []
+
+    def add(self, company: str, url: str, published_at: str, sentiment: Optional[str]):
+        """기사 하나를 집계에 반영"""
+        hour = _epoch_hour(published_at)
+        if hour is None:
+            return
+        buckets = self._companies.get(company)
+        if buckets is None:
+            buckets = self._companies[company] = CompanyBuckets(self.capacity)
+        buckets.add(hour, sentiment, _outlet(url))
+
+    async def on_new_articles(self, company: str, articles: List[dict]):
+        """수집 리스너: 새로 저장된 기사 반영 (시작할 때 적재한 기사는 건너뜀)"""
+        if self._loaded_id is None:
+            self._early.append((company, articles))
+            return
+        for article in articles:
+            if article["id"] <= self._loaded_id:
+                continue
+            self.add(company, article["url"], article["published_at"], article.get("sentiment"))
+
+    async def start(self):
+        """저장된 기사로 버킷을 채우고 새 기사 리스너 등록"""
+        if self._started:
+            return
+        self._started = True
+        # 적재 중 들어온 새 기사도 놓치지 않도록 리스너를 먼저 등록하고, 그 뒤의 마지막 id까지만 적재
+        # (리스너로 들어온 기사 중 적재 범위에 든 것은 건너뛰므로 두 번 세지 않음)
+        self._loaded_id = None
+        add_article_listener(self.on_new_articles)
+        self._loaded_id = await asyncio.to_thread(self.store.last_id)
+        early, self._early = self._early, []
+        for company, articles in early:
+            await self.on_new_articles(company, articles)
+        since = (datetime.now(timezone.utc) - timedelta(days=self.retention_days)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        rows = await asyncio.to_thread(
+            lambda: list(self.store.iter_published_since(since, until_id=self._loaded_id))
+        )
+        for company, url, published_at, sentiment in rows:
+            self.add(company, url, published_at, sentiment)
+
+    def stop(self):
+        """새 기사 리스너 해제"""
+        remove_article_listener(self.on_new_articles)
+        self._started = False
+
+    def query(self, company: str, days: int, interval: str = "hour") -> dict:
+        """최근 days일 동안의 기업 뉴스량/감정 분포를 interval 단위로 집계"""
+        step = INTERVAL_HOURS[interval]
+        days = min(days, self.retention_days)
+        now_hour = int(datetime.now(timezone.utc).timestamp()) // 3600
+        # 마지막 버킷이 현재 시각을 포함하도록 정렬
+        end_hour = (now_hour // step + 1) * step
+        start_hour = end_hour - days * 24
+
+        buckets = self._companies.get(company)
+        if buckets is None:
+            rows = [
+                {"hour": start_hour + b * step, "count": 0, "sentiment": dict.fromkeys(SENTIMENTS, 0), "outlets": set()}
+                for b in range(days * 24 // step)
+            ]
+        else:
+            rows = buckets.query(start_hour, end_hour, step)
+
+        all_outlets: Set[str] = set()
+        totals = dict.fromkeys(SENTIMENTS, 0)
+        for row in rows:
+            all_outlets.update(row["outlets"])
+            for label in SENTIMENTS:
+                totals[label] += row["sentiment"][label]
+
+        def iso(hour: int) -> str:
+            return datetime.fromtimestamp(hour * 3600, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+        return {
+            "company": company,
+            "interval": interval,
+            "start": iso(start_hour),
+            "end": iso(end_hour),
+            "total": sum(totals.values()),
+            "sentiment": totals,
+            "outlets": len(all_outlets),
+            "buckets": [
+                {
+                    "start": iso(row["hour"]),
+                    "count": row["count"],
+                    "sentiment": row["sentiment"],
+                    "outlets": len(row["outlets"]),
+                }
+                for row in rows
+            ],
+        }
+
+
+_aggregator: Optional[NewsAggregator] = None
+
+
+def get_news_aggregator() -> NewsAggregator:
+    """전역 뉴스 집계 인스턴스 반환"""
+    global _aggregator
+    if _aggregator is None:
+        _aggregator = NewsAggregator()
+    return _aggregator
@@ -0,0 +1,248 @@
+"""
+기사 본문 수집 서비스
+"""
+import asyncio
+import codecs
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import urlsplit
+
+import charset_normalizer
+import requests
+from requests.adapters import HTTPAdapter
+from ..core.settings import settings
+
+
+# 본문이 아닌 영역 (내부 텍스트를 모두 무시)
+_SKIP_TAGS = {
+    "script", "style", "noscript", "iframe", "svg", "nav", "header", "footer",
+    "aside", "form", "button", "select", "figure"
+}
+# 텍스트 블록 경계가 되는 태그
+_BLOCK_TAGS = {"p", "div", "section", "article", "li", "td", "br", "h1", "h2", "h3", "h4", "blockquote"}
+_WHITESPACE = re.compile(r"\s+")
+# Content-Type 헤더와 <meta charset> / <meta http-equiv="Content-Type" content="...; charset=..."> 의 문자셋
+_HEADER_CHARSET = re.compile(r"charset\s*=\s*[\"']?([\w.:-]+)", re.IGNORECASE)
+_META_CHARSET = re.compile(rb"<meta[^>]+charset\s*=\s*[\"']?([\w.:-]+)", re.IGNORECASE)
+
+
+class ArticleTextExtractor(HTMLParser):
+    """
+    HTML에서 본문 텍스트를 추출하는 파서
+
+    문서를 텍스트 블록으로 나눈 뒤 짧은 블록과 링크 비율이 높은 블록(메뉴, 관련기사 목록 등)을
+    버립니다. <article> 요소가 있으면 그 안의 블록만 사용합니다.
+    """
+
+    def __init__(self, min_block_length: int = 25, max_link_density: float = 0.5):
+        super().__init__(convert_charrefs=True)
+        self.min_block_length = min_block_length
+        self.max_link_density = max_link_density
+        self._skip_depth = 0
+        self._link_depth = 0
+        self._article_depth = 0
+        self._text: List[str] = []
+        self._link_chars = 0
+        self._blocks: List[tuple] = []  # (text, link_chars, in_article)
+
+    def _flush(self):
+        text = _WHITESPACE.sub(" ", "".join(self._text)).strip()
+        if text:
+            self._blocks.append((text, self._link_chars, self._article_depth > 0))
+        self._text = []
+        self._link_chars = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in _SKIP_TAGS:
+            self._skip_depth += 1
+        elif tag == "a":
+            self._link_depth += 1
+        if tag in _BLOCK_TAGS:
+            self._flush()
+        if tag == "article":
+            self._article_depth += 1
+
+    def handle_endtag(self, tag):
+        if tag in _SKIP_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag == "a":
+            self._link_depth = max(0, self._link_depth - 1)
+        if tag in _BLOCK_TAGS:
+            self._flush()
+        if tag == "article":
+            self._article_depth = max(0, self._article_depth - 1)
+
+    def handle_data(self, data):
+        if self._skip_depth:
+            return
+        self._text.append(data)
+        if self._link_depth:
+            self._link_chars += len(data.strip())
+
+    def extract(self, html_text: str) -> str:
+        """본문 텍스트 반환"""
+        self.feed(html_text)
+        self.close()
+        self._flush()
+
+        blocks = self._blocks
+        if any(in_article for _, _, in_article in blocks):
+            blocks = [block for block in blocks if block[2]]
+
+        paragraphs = [
+            text for text, link_chars, _ in blocks
+            if len(text) >= self.min_block_length and link_chars / len(text) <= self.max_link_density
+        ]
+        return "\n".join(paragraphs)
+
+
+def extract_article_text(html_text: str) -> str:
+    """HTML 문서에서 본문 텍스트 추출"""
+    return ArticleTextExtractor().extract(html_text)
+
+
+def detect_encoding(content_type: str, body: bytes) -> Optional[str]:
+    """
+    HTML 문서의 문자셋 (Content-Type 헤더 → <meta charset> → 내용 추정 순)
+
+    requests는 charset이 없는 text/html 응답을 ISO-8859-1로 보므로 response.encoding을 쓰지 않습니다.
+    헤더의 문자셋은 그대로 반환하고(알 수 없는 문자셋이면 디코딩에서 오류), 문서 안의 문자셋은
+    알려진 것만 사용합니다. 추정도 실패하면 None을 반환합니다.
+    """
+    match = _HEADER_CHARSET.search(content_type)
+    if match:
+        return match.group(1)
+    match = _META_CHARSET.search(body[:4096])
+    if match:
+        try:
+            return codecs.lookup(match.group(1).decode("ascii")).name
+        except (LookupError, UnicodeDecodeError):
+            pass
+    best = charset_normalizer.from_bytes(body).best()
+    return best.encoding if best is not None else None
+
+
+class _HostState:
+    """호스트별 동시 연결 수와 요청 간격 관리"""
+
+    def __init__(self, max_connections: int):
+        self.semaphore = asyncio.Semaphore(max_connections)
+        self.next_slot = 0.0
+        # 이 호스트를 기다리거나 수집 중인 요청 수 (0이고 요청 간격이 지났으면 정리)
+        self.active = 0
+
+
+class ArticleFetcher:
+    """
+    기사 본문 수집 클래스
+
+    전체 동시 요청 수와 호스트별 동시 연결 수를 제한하고, 같은 호스트에는
+    crawl delay 간격을 두고 요청합니다. 호스트 슬롯과 요청 간격을 먼저 기다린 뒤 전체 슬롯을 잡으므로
+    한 호스트에 몰린 요청이 전체 슬롯을 차지해 다른 호스트를 막지 않습니다.
+    HTTP 요청과 본문 추출은 전용 스레드 풀에서 실행됩니다.
+    """
+
+    def __init__(
+        self,
+        concurrency: Optional[int] = None,
+        per_host: Optional[int] = None,
+        crawl_delay: Optional[float] = None,
+        timeout: Optional[float] = None
+    ):
+        self.concurrency = concurrency or settings.article_fetch_concurrency
+        self.per_host = per_host or settings.article_fetch_per_host
+        self.crawl_delay = settings.article_fetch_delay if crawl_delay is None else crawl_delay
+        self.timeout = timeout or settings.article_fetch_timeout
+        self.max_bytes = settings.article_fetch_max_bytes
+
+        self._executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="article-fetch")
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.concurrency, pool_maxsize=self.per_host)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._session.headers["User-Agent"] = settings.article_fetch_user_agent
+        self._hosts: Dict[str, _HostState] = {}
+
+    def _download(self, url: str) -> Optional[str]:
+        """URL 하나를 내려받아 본문을 추출합니다. 영구 실패(4xx)면 빈 문자열을 반환합니다."""
+        try:
+            with self._session.get(url, timeout=self.timeout, stream=True) as response:
+                if 400 <= response.status_code < 500:
+                    return ""
+                response.raise_for_status()
+                content_type = response.headers.get("Content-Type", "")
+                if "html" not in content_type and "xml" not in content_type:
+                    return ""
+
+                chunks = []
+                size = 0
+                for chunk in response.iter_content(chunk_size=65536):
+                    chunks.append(chunk)
+                    size += len(chunk)
+                    if size >= self.max_bytes:
+                        break
+                body = b"".join(chunks)
+                encoding = detect_encoding(content_type, body) or "utf-8"
+                html_text = body.decode(encoding, errors="replace")
+        except requests.exceptions.RequestException as e:
+            # 일시적인 오류는 다음 수집 때 다시 시도
+            print(f"기사 본문 수집 중 오류가 발생했습니다 ({url}): {str(e)}")
+            return None
+        return extract_article_text(html_text)
+
+    async def _fetch_one(self, url: str, semaphore: asyncio.Semaphore) -> Optional[str]:
+        """호스트별 제한을 지키며 URL 하나를 수집"""
+        host = urlsplit(url).netloc.lower()
+        state = self._hosts.get(host)
+        if state is None:
+            state = self._hosts[host] = _HostState(self.per_host)
+
+        state.active += 1
+        try:
+            async with state.semaphore:
+                now = time.monotonic()
+                wait = state.next_slot - now
+                state.next_slot = max(now, state.next_slot) + self.crawl_delay
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                async with semaphore:
+                    loop = asyncio.get_running_loop()
+                    try:
+                        return await loop.run_in_executor(self._executor, self._download, url)
+                    except Exception as e:
+                        # 알 수 없는 문자셋, 추출 오류 등 URL 하나의 실패가 나머지 수집 결과를 버리지 않도록
+                        print(f"기사 본문 수집 중 오류가 발생했습니다 ({url}): {str(e)}")
+                        return None
+        finally:
+            state.active -= 1
+
+    def _prune_hosts(self):
+        """대기/수집 중인 요청이 없고 요청 간격도 지난 호스트 상태 정리"""
+        now = time.monotonic()
+        for host, state in list(self._hosts.items()):
+            if state.active == 0 and state.next_slot <= now:
+                del self._hosts[host]
+
+    async def fetch_many(self, urls: Iterable[str]) -> Dict[str, str]:
+        """여러 URL을 동시에 수집하여 {url: 본문}을 반환합니다 (일시적 실패는 제외)."""
+        urls = [url for url in dict.fromkeys(urls) if url.startswith(("http://", "https://"))]
+        semaphore = asyncio.Semaphore(self.concurrency)
+        try:
+            results = await asyncio.gather(*(self._fetch_one(url, semaphore) for url in urls))
+        finally:
+            self._prune_hosts()
+        return {url: body for url, body in zip(urls, results) if body is not None}
+
+
+_fetcher: Optional[ArticleFetcher] = None
+
+
+def get_article_fetcher() -> ArticleFetcher:
+    """전역 기사 본문 수집기 인스턴스 반환"""
+    global _fetcher
+    if _fetcher is None:
+        _fetcher = ArticleFetcher()
+    return _fetcher
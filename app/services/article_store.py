@@ -0,0 +1,321 @@
+"""
+수집한 기사 저장소 (SQLite)
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ..core.settings import settings
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    company TEXT NOT NULL,
+    url TEXT NOT NULL,
+    source TEXT NOT NULL,
+    title TEXT NOT NULL,
+    description TEXT NOT NULL,
+    published_at TEXT NOT NULL,
+    sentiment TEXT,
+    company_mentions TEXT,
+    body TEXT,
+    body_fetched_at REAL,
+    created_at REAL NOT NULL,
+    UNIQUE (company, url)
+);
+CREATE INDEX IF NOT EXISTS ix_articles_url ON articles (url);
+CREATE INDEX IF NOT EXISTS ix_articles_company_id ON articles (company, id);
+CREATE INDEX IF NOT EXISTS ix_articles_company_published ON articles (company, published_at, id);
+CREATE INDEX IF NOT EXISTS ix_articles_published ON articles (published_at);
+"""
+
+_COLUMNS = (
+    "id", "company", "url", "source", "title", "description", "published_at",
+    "sentiment", "company_mentions", "body", "body_fetched_at", "created_at"
+)
+
+
+# 목록 조회용 컬럼 (본문 제외)
+_SUMMARY_COLUMNS = [column for column in _COLUMNS if column != "body"]
+
+# until_id를 주지 않았을 때의 상한 (SQLite 정수 최댓값)
+_MAX_ID = 2 ** 63 - 1
+
+
+def _summary_rows(columns: List[str], rows: List[tuple]) -> List[dict]:
+    articles = []
+    for row in rows:
+        article = dict(zip(columns, row))
+        if article["company_mentions"]:
+            article["company_mentions"] = json.loads(article["company_mentions"])
+        articles.append(article)
+    return articles
+
+
+def _row_to_article(row: sqlite3.Row) -> dict:
+    """DB 행을 기사 딕셔너리로 변환"""
+    article = dict(zip(_COLUMNS, row))
+    if article["company_mentions"]:
+        article["company_mentions"] = json.loads(article["company_mentions"])
+    return article
+
+
+class ArticleStore:
+    """
+    기사 저장소 클래스
+
+    기업별 기사 하나가 한 행이며, id는 삽입 순서대로 증가합니다.
+    여러 프로세스가 같은 파일을 공유할 수 있도록 WAL 모드로 엽니다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._connection().executescript(_SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        """스레드별 연결 반환"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def add_articles(self, company: str, articles: Iterable[dict]) -> List[dict]:
+        """기사들을 저장하고 새로 추가된 기사만 반환합니다."""
+        conn = self._connection()
+        now = time.time()
+        added = []
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for article in articles:
+                mentions = article.get("company_mentions")
+                cursor = conn.execute(
+                    "INSERT OR IGNORE INTO articles "
+                    "(company, url, source, title, description, published_at, sentiment, company_mentions, created_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        company, article["url"], article["source"], article["title"],
+                        article["description"], article["published_at"], article.get("sentiment"),
+                        json.dumps(mentions, ensure_ascii=False) if mentions is not None else None,
+                        now
+                    )
+                )
+                if cursor.rowcount:
+                    added.append(dict(article, id=cursor.lastrowid, company=company, created_at=now))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return added
+
+    def urls_without_body(self, urls: Iterable[str]) -> List[str]:
+        """본문을 아직 가져오지 않은 URL만 반환합니다."""
+        urls = list(dict.fromkeys(urls))
+        if not urls:
+            return []
+        conn = self._connection()
+        fetched = set()
+        for i in range(0, len(urls), 500):
+            chunk = urls[i:i + 500]
+            placeholders = ",".join("?" * len(chunk))
+            fetched.update(
+                row[0] for row in conn.execute(
+                    f"SELECT DISTINCT url FROM articles WHERE body_fetched_at IS NOT NULL AND url IN ({placeholders})",
+                    chunk
+                )
+            )
+        return [url for url in urls if url not in fetched]
+
+    def set_bodies(self, bodies: Dict[str, str]):
+        """URL별 본문을 저장합니다 (같은 URL을 가진 모든 기업의 기사에 반영)."""
+        if not bodies:
+            return
+        now = time.time()
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany(
+                "UPDATE articles SET body = ?, body_fetched_at = ? WHERE url = ?",
+                [(body, now, url) for url, body in bodies.items()]
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def iter_published_since(
+        self,
+        since: str,
+        columns: Tuple[str, ...] = ("company", "url", "published_at", "sentiment"),
+        until_id: Optional[int] = None
+    ) -> Iterable[tuple]:
+        """
+        published_at(UTC ISO)이 since 이후인 기사의 columns 값(기본: company, url, published_at, sentiment)을 순회합니다.
+        until_id를 주면 그 id까지 저장된 기사만 순회합니다.
+        """
+        unknown = set(columns) - set(_COLUMNS)
+        if unknown:
+            raise ValueError(f"알 수 없는 컬럼입니다: {', '.join(sorted(unknown))}")
+        cursor = self._connection().execute(
+            f"SELECT {', '.join(columns)} FROM articles "
+            "WHERE published_at >= ? AND published_at LIKE '____-__-__T%' AND id <= ?",
+            (since, _MAX_ID if until_id is None else until_id)
+        )
+        while True:
+            rows = cursor.fetchmany(1000)
+            if not rows:
+                return
+            yield from rows
+
+    def iter_texts_since(self, since: str) -> Iterable[tuple]:
+        """published_at(UTC ISO)이 since 이후인 기사의 (company, url, title, description, published_at)를 발행 순으로 순회합니다."""
+        cursor = self._connection().execute(
+            "SELECT company, url, title, description, published_at FROM articles "
+            "WHERE published_at >= ? AND published_at LIKE '____-__-__T%' ORDER BY published_at, id",
+            (since,)
+        )
+        while True:
+            rows = cursor.fetchmany(1000)
+            if not rows:
+                return
+            yield from rows
+
+    def iter_export_chunks(
+        self,
+        columns: List[str],
+        company: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        after_id: int = 0,
+        chunk_size: int = 5000,
+        as_json: bool = False
+    ) -> Iterator[List[tuple]]:
+        """
+        id 순서로 기사 행을 chunk_size개씩 순회합니다 (내보내기용).
+        as_json이면 각 행은 (id, SQLite가 만든 JSON 객체 문자열)입니다.
+
+        청크마다 마지막 id 이후부터 다시 조회하므로(keyset) 결과 전체를 메모리에 올리지 않고,
+        after_id로 중단된 지점부터 이어서 내보낼 수 있습니다. 스트리밍 응답은 청크마다 다른
+        스레드에서 실행될 수 있어 스레드별 연결 대신 전용 연결을 사용합니다.
+        """
+        conditions = ["id > ?"]
+        params: list = []
+        if company:
+            conditions.append("company = ?")
+            params.append(company)
+        if since:
+            conditions.append("published_at >= ?")
+            params.append(since)
+        if until:
+            conditions.append("published_at < ?")
+            params.append(until)
+        if as_json:
+            fields = ", ".join(
+                f"'{column}', json({column})" if column == "company_mentions" else f"'{column}', {column}"
+                for column in columns
+            )
+            select = f"id, json_object({fields})"
+            id_index = 0
+        else:
+            select = ", ".join(columns)
+            id_index = columns.index("id")
+        query = f"SELECT {select} FROM articles WHERE {' AND '.join(conditions)} ORDER BY id LIMIT ?"
+
+        conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        try:
+            while True:
+                rows = conn.execute(query, [after_id, *params, chunk_size]).fetchall()
+                if not rows:
+                    return
+                yield rows
+                after_id = rows[-1][id_index]
+        finally:
+            conn.close()
+
+    def history_page(self, company: str, before: Tuple[str, int], limit: int) -> List[dict]:
+        """
+        기업 기사를 (published_at, id) 내림차순으로 before 직전부터 limit개 조회합니다.
+
+        (company, published_at, id) 인덱스를 before 위치로 바로 찾아가므로(keyset)
+        몇 번째 페이지든 비용이 같고, 새 기사가 추가되어도 페이지 경계가 밀리지 않습니다.
+        """
+        columns = _SUMMARY_COLUMNS
+        rows = self._connection().execute(
+            f"SELECT {', '.join(columns)} FROM articles "
+            "WHERE company = ? AND (published_at, id) < (?, ?) "
+            "ORDER BY published_at DESC, id DESC LIMIT ?",
+            (company, before[0], before[1], limit)
+        ).fetchall()
+        return _summary_rows(columns, rows)
+
+    def articles_after(self, company: Optional[str], after_id: int, limit: int) -> List[dict]:
+        """
+        after_id 이후에 저장된 기사를 저장 순서(id)대로 limit개 조회합니다 (company가 None이면 전체 기업).
+
+        id는 AUTOINCREMENT라 재사용되지 않으므로 서버를 재시작해도 같은 위치를 가리키며,
+        (company, id) 인덱스 또는 기본 키로 after_id 위치를 바로 찾아갑니다.
+        """
+        columns = _SUMMARY_COLUMNS
+        if company is None:
+            rows = self._connection().execute(
+                f"SELECT {', '.join(columns)} FROM articles WHERE id > ? ORDER BY id LIMIT ?",
+                (after_id, limit)
+            ).fetchall()
+        else:
+            rows = self._connection().execute(
+                f"SELECT {', '.join(columns)} FROM articles WHERE company = ? AND id > ? ORDER BY id LIMIT ?",
+                (company, after_id, limit)
+            ).fetchall()
+        return _summary_rows(columns, rows)
+
+    def articles_by_ids(self, ids: List[int]) -> List[dict]:
+        """id 목록의 기사를 조회합니다 (순서는 보장하지 않음, 없는 id는 빠짐)."""
+        columns = _SUMMARY_COLUMNS
+        articles = []
+        # SQLite 바인딩 변수 수 제한을 넘지 않도록 나눠서 조회
+        for offset in range(0, len(ids), 500):
+            batch = ids[offset:offset + 500]
+            rows = self._connection().execute(
+                f"SELECT {', '.join(columns)} FROM articles WHERE id IN ({', '.join('?' * len(batch))})",
+                batch
+            ).fetchall()
+            articles.extend(_summary_rows(columns, rows))
+        return articles
+
+    def last_id(self) -> int:
+        """지금까지 발급한 가장 큰 기사 id (삭제된 기사 포함, 없으면 0)"""
+        row = self._connection().execute(
+            "SELECT seq FROM sqlite_sequence WHERE name = 'articles'"
+        ).fetchone()
+        return row[0] if row else 0
+
+    def get_article(self, url: str) -> Optional[dict]:
+        """URL로 가장 먼저 저장된 기사를 조회합니다."""
+        row = self._connection().execute(
+            f"SELECT {', '.join(_COLUMNS)} FROM articles WHERE url = ? ORDER BY id LIMIT 1",
+            (url,)
+        ).fetchone()
+        return _row_to_article(row) if row else None
+
+
+_store: Optional[ArticleStore] = None
+_store_lock = threading.Lock()
+
+
+def get_article_store() -> ArticleStore:
+    """전역 기사 저장소 인스턴스 반환"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = ArticleStore(settings.article_store_path)
+    return _store
@@ -0,0 +1,204 @@
+"""
+기업명 자동 완성 서비스 (자모 단위 접두사 색인)
+"""
+import asyncio
+import heapq
+import json
+import math
+import time
+from bisect import bisect_left
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Set, Tuple
+
+from ..core.settings import settings
+from ..utils.dates import epoch_seconds
+from ..utils.hangul import is_choseong_query, to_choseong, to_jamo
+from .article_store import ArticleStore, get_article_store
+from .company_dictionary import CompanyDictionary, get_company_dictionary
+from .ingestion import add_article_listener, remove_article_listener
+
+
+# 접두사 범위의 끝을 찾기 위한 가장 큰 문자
+_MAX_CHAR = "\U0010ffff"
+
+
+class PrefixIndex:
+    """
+    정렬된 배열 접두사 색인
+
+    (키, 값) 쌍을 키 순으로 정렬해 두고 이진 탐색으로 접두사가 같은 구간을 찾습니다.
+    조회 비용은 O(log n + 구간 크기)입니다.
+    """
+
+    def __init__(self, pairs: List[Tuple[str, Tuple[str, str]]] = ()):
+        pairs = sorted(pairs)
+        self.keys = [key for key, _ in pairs]
+        self.values = [value for _, value in pairs]
+
+    def add(self, key: str, value: Tuple[str, str]):
+        index = bisect_left(self.keys, key)
+        self.keys.insert(index, key)
+        self.values.insert(index, value)
+
+    def prefix(self, prefix: str) -> List[Tuple[str, str]]:
+        lo = bisect_left(self.keys, prefix)
+        hi = bisect_left(self.keys, prefix + _MAX_CHAR, lo)
+        return self.values[lo:hi]
+
+
+class CompanyAutocomplete:
+    """
+    기업명 자동 완성 클래스
+
+    기업 사전의 기업명/별칭/종목코드와 수집된 기사에서 관찰된 기업명을 자모열(예: "삼성" → "ㅅㅏㅁㅅㅓㅇ")
+    정렬 배열에 넣어, 입력 중인 글자("삼성젅", "삼서")도 접두사로 찾습니다. 자음만 입력하면("ㅅㅅㅈ")
+    초성 색인에서 찾습니다. 후보는 최근 뉴스량(반감기 AUTOCOMPLETE_HALF_LIFE_HOURS로 감쇠한 기사 수) 순으로
+    정렬하며, 업스트림은 호출하지 않습니다. 사전이 바뀌면 다음 조회 때 색인을 다시 만듭니다.
+    """
+
+    def __init__(
+        self,
+        dictionary: Optional[CompanyDictionary] = None,
+        store: Optional[ArticleStore] = None,
+        half_life_hours: Optional[float] = None
+    ):
+        self.dictionary = dictionary or get_company_dictionary()
+        self.store = store or get_article_store()
+        self.half_life = (half_life_hours or settings.autocomplete_half_life_hours) * 3600
+        self.warmup_days = settings.autocomplete_warmup_days
+
+        self._jamo = PrefixIndex()
+        self._choseong = PrefixIndex()
+        self._version = -1
+        # 사전에 없지만 기사에서 관찰된 기업명
+        self._observed: Set[str] = set()
+        # 기업별 log2(감쇠 점수) + 마지막 갱신 시각/반감기. 시각이 달라도 크기 비교가 그대로 점수 비교
+        self._volume: Dict[str, float] = {}
+        # 같은 기사가 여러 기업 검색 결과로 저장되어도 기업마다 한 번만 집계
+        self._seen: "OrderedDict[Tuple[str, str], None]" = OrderedDict()
+        self._seen_limit = settings.autocomplete_seen_urls
+        self._started = False
+
+    def _rebuild(self):
+        """사전과 관찰된 기업명으로 색인을 다시 만듦"""
+        terms = []
+        for entry in self.dictionary.companies():
+            names = [entry["name"], *entry.get("aliases", [])]
+            if entry.get("ticker"):
+                names.append(entry["ticker"])
+            terms.extend((name.strip(), entry["name"]) for name in names if name and name.strip())
+        terms.extend((name, name) for name in self._observed)
+        self._jamo = PrefixIndex([(to_jamo(term), (term, company)) for term, company in terms])
+        self._choseong = PrefixIndex([(to_choseong(term), (term, company)) for term, company in terms])
+        self._version = self.dictionary.version
+
+    def _ensure_index(self):
+        if self._version != self.dictionary.version:
+            self._rebuild()
+
+    def _canonical(self, name: str) -> str:
+        entry = self.dictionary.get(name)
+        return entry["name"] if entry is not None else name
+
+    def _observe(self, name: str):
+        """사전에 없는 새 기업명을 색인에 추가"""
+        if name in self._observed or self.dictionary.get(name) is not None:
+            return
+        self._observed.add(name)
+        self._jamo.add(to_jamo(name), (name, name))
+        self._choseong.add(to_choseong(name), (name, name))
+
+    def record(self, name: str, published: Optional[float] = None):
+        """기업의 기사 하나를 뉴스량에 반영"""
+        name = name.strip()
+        if not name:
+            return
+        self._observe(name)
+        company = self._canonical(name)
+        at = (time.time() if published is None else published) / self.half_life
+        previous = self._volume.get(company)
+        if previous is None:
+            self._volume[company] = at
+        else:
+            # log2(2^previous + 2^at)를 넘침 없이 계산
+            high, low = max(previous, at), min(previous, at)
+            self._volume[company] = high + math.log2(1 + 2 ** (low - high))
+
+    def volume(self, company: str, now: Optional[float] = None) -> float:
+        """현재 시각 기준으로 감쇠한 최근 기사 수"""
+        score = self._volume.get(company)
+        if score is None:
+            return 0.0
+        return 2 ** (score - (time.time() if now is None else now) / self.half_life)
+
+    def _add_article(self, company: str, url: str, mentions: List[str], published_at: str):
+        published = epoch_seconds(published_at)
+        for name in dict.fromkeys([company, *(mentions or [])]):
+            key = (url, name)
+            if key in self._seen:
+                continue
+            self._seen[key] = None
+            while len(self._seen) > self._seen_limit:
+                self._seen.popitem(last=False)
+            self.record(name, published)
+
+    async def on_new_articles(self, company: str, articles: List[dict]):
+        """수집 리스너: 새로 저장된 기사의 기업과 언급 기업 반영"""
+        for article in articles:
+            self._add_article(company, article["url"], article.get("company_mentions"), article["published_at"])
+
+    async def start(self):
+        """최근 저장된 기사로 뉴스량을 채우고 새 기사 리스너 등록"""
+        if self._started:
+            return
+        self._started = True
+        add_article_listener(self.on_new_articles)
+        since = (datetime.now(timezone.utc) - timedelta(days=self.warmup_days)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        columns = ("company", "url", "company_mentions", "published_at")
+        rows = await asyncio.to_thread(lambda: list(self.store.iter_published_since(since, columns)))
+        for company, url, mentions, published_at in rows:
+            self._add_article(company, url, json.loads(mentions) if mentions else [], published_at)
+
+    def stop(self):
+        """새 기사 리스너 해제"""
+        remove_article_listener(self.on_new_articles)
+        self._started = False
+
+    def suggest(self, query: str, limit: int = 10) -> List[dict]:
+        """입력 중인 기업명의 자동 완성 후보 (최근 뉴스량이 많은 순, 같으면 짧은 이름 순)"""
+        query = query.strip()
+        if not query:
+            return []
+        self._ensure_index()
+        if is_choseong_query(query):
+            matches = self._choseong.prefix(to_choseong(query))
+        else:
+            matches = self._jamo.prefix(to_jamo(query))
+
+        # 기업마다 가장 짧은 일치 이름 하나만
+        best: Dict[str, str] = {}
+        for term, company in matches:
+            if company not in best or len(term) < len(best[company]):
+                best[company] = term
+
+        now = time.time()
+        top = heapq.nsmallest(
+            limit, best.items(),
+            key=lambda item: (-self._volume.get(item[0], -math.inf), len(item[0]), item[0])
+        )
+        return [
+            {"name": company, "matched": term, "volume": round(self.volume(company, now), 2)}
+            for company, term in top
+        ]
+
+
+_autocomplete: Optional[CompanyAutocomplete] = None
+
+
+def get_company_autocomplete() -> CompanyAutocomplete:
+    """전역 기업명 자동 완성 인스턴스 반환"""
+    global _autocomplete
+    if _autocomplete is None:
+        _autocomplete = CompanyAutocomplete()
+    return _autocomplete
@@ -0,0 +1,186 @@
+"""
+기업 사전 및 기업 언급 추출 서비스
+"""
+import json
+import os
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+
+from ..core.settings import settings
+from ..utils.aho_corasick import AhoCorasick
+
+
+def _is_word_char(char: str) -> bool:
+    """영문/숫자 경계 판정용"""
+    return char.isascii() and char.isalnum()
+
+
+def _needs_boundary(pattern: str) -> bool:
+    """영문/숫자로 시작하거나 끝나는 패턴(티커, 영문명)은 단어 경계를 요구"""
+    return _is_word_char(pattern[0]) or _is_word_char(pattern[-1])
+
+
+class CompanyDictionary:
+    """
+    기업 사전 클래스 (기업명, 별칭, 종목코드)
+
+    모든 이름을 하나의 Aho-Corasick 오토마톤에 넣어 제목과 설명을 한 번씩만 훑어
+    언급된 기업을 찾습니다. 사전 파일이 바뀌면 달라진 항목만 오토마톤에 반영합니다.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or settings.company_dictionary_path
+        self._companies: Dict[str, dict] = {}
+        self._automaton = AhoCorasick()
+        self._lock = threading.RLock()
+        self._mtime = 0.0
+        self._checked_at = 0.0
+        # 항목이 바뀔 때마다 증가 (사전으로 만든 다른 색인의 갱신 판단용)
+        self.version = 0
+        self.reload()
+
+    @staticmethod
+    def _terms(entry: dict) -> List[str]:
+        """기업 항목의 검색어 목록 (소문자)"""
+        terms = [entry["name"], *entry.get("aliases", [])]
+        if entry.get("ticker"):
+            terms.append(entry["ticker"])
+        return list(dict.fromkeys(term.strip().lower() for term in terms if term and term.strip()))
+
+    def _index(self, entry: dict):
+        for term in self._terms(entry):
+            self._automaton.add(term, entry["name"])
+
+    def _unindex(self, entry: dict):
+        for term in self._terms(entry):
+            self._automaton.remove(term, entry["name"])
+
+    def reload(self):
+        """사전 파일을 읽어 달라진 기업만 오토마톤에 반영"""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, encoding="utf-8") as f:
+            entries = {entry["name"]: entry for entry in json.load(f)}
+        with self._lock:
+            changed = False
+            for name, entry in list(self._companies.items()):
+                if entries.get(name) != entry:
+                    self._unindex(entry)
+                    del self._companies[name]
+                    changed = True
+            for name, entry in entries.items():
+                if name not in self._companies:
+                    self._companies[name] = entry
+                    self._index(entry)
+                    changed = True
+            if changed:
+                self.version += 1
+            self._mtime = os.path.getmtime(self.path)
+
+    def reload_if_changed(self, interval: float = 1.0):
+        """다른 워커가 사전 파일을 바꿨는지 최대 interval초마다 확인"""
+        now = time.monotonic()
+        if now - self._checked_at < interval:
+            return
+        self._checked_at = now
+        try:
+            if os.path.getmtime(self.path) != self._mtime:
+                self.reload()
+        except OSError:
+            pass
+
+    def _save(self):
+        """사전 파일에 원자적으로 저장"""
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(list(self._companies.values()), f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+        self._mtime = os.path.getmtime(self.path)
+
+    def companies(self) -> List[dict]:
+        """등록된 기업 목록"""
+        with self._lock:
+            return list(self._companies.values())
+
+    def get(self, name: str) -> Optional[dict]:
+        """기업명, 별칭 또는 종목코드로 기업 항목 조회"""
+        with self._lock:
+            entry = self._companies.get(name)
+            if entry is not None:
+                return entry
+            key = name.strip().lower()
+            for start, end, value in self._automaton.iter_matches(key):
+                if start == 0 and end == len(key):
+                    return self._companies.get(value)
+        return None
+
+    def upsert(self, entry: dict):
+        """기업 추가 또는 수정"""
+        with self._lock:
+            previous = self._companies.get(entry["name"])
+            if previous is not None:
+                self._unindex(previous)
+            self._companies[entry["name"]] = entry
+            self._index(entry)
+            self.version += 1
+            self._save()
+
+    def remove(self, name: str) -> bool:
+        """기업 삭제"""
+        with self._lock:
+            entry = self._companies.pop(name, None)
+            if entry is None:
+                return False
+            self._unindex(entry)
+            self.version += 1
+            self._save()
+            return True
+
+    def extract_mentions(self, *texts: str) -> List[str]:
+        """
+        텍스트에 언급된 기업명을 처음 등장한 순서대로 반환합니다.
+        같은 위치에서 겹치는 후보는 가장 긴 것을 선택합니다 (예: "삼성전자" > "삼성").
+        """
+        text = "\n".join(t for t in texts if t).lower()
+        with self._lock:
+            matches = self._automaton.find_all(text)
+
+        # 왼쪽 우선, 같은 시작이면 긴 매칭 우선으로 겹치지 않게 선택
+        matches.sort(key=lambda match: (match[0], match[0] - match[1]))
+        mentions: Dict[str, None] = {}
+        covered = 0
+        for start, end, name in matches:
+            if start < covered:
+                continue
+            pattern = text[start:end]
+            if _needs_boundary(pattern) and (
+                (start > 0 and _is_word_char(text[start - 1])) or
+                (end < len(text) and _is_word_char(text[end]))
+            ):
+                continue
+            mentions.setdefault(name, None)
+            covered = end
+        return list(mentions)
+
+    def fill_mentions(self, items: Iterable, text_fields=("title", "description")):
+        """뉴스 아이템들의 company_mentions를 채웁니다 (제공자가 준 값은 유지하고 합침)."""
+        for item in items:
+            found = self.extract_mentions(*(getattr(item, field) for field in text_fields))
+            existing = item.company_mentions or []
+            item.company_mentions = list(dict.fromkeys([*existing, *found]))
+
+
+_dictionary: Optional[CompanyDictionary] = None
+_dictionary_lock = threading.Lock()
+
+
+def get_company_dictionary() -> CompanyDictionary:
+    """전역 기업 사전 인스턴스 반환"""
+    global _dictionary
+    if _dictionary is None:
+        with _dictionary_lock:
+            if _dictionary is None:
+                _dictionary = CompanyDictionary()
+    _dictionary.reload_if_changed()
+    return _dictionary
@@ -1,13 +1,20 @@
 """
 딥서치 뉴스 API 서비스
 """
+import asyncio
 import requests
 import random
 from datetime import datetime, timedelta
-from typing import List
+from typing import List, Sequence, Tuple
 from fastapi import HTTPException
+from ..core import deadline
+from ..core.cache import UpstreamError, classify_status, get_response_cache
 from ..core.settings import settings
 from ..models.news import DeepSearchNewsItem, DeepSearchNewsResponse, DeepSearchNewsRequest
+from .company_dictionary import get_company_dictionary
+from .enrichment import ArticleRecord
+from .ingestion import record_from_item
+from .projection import project_items
 
 
 class DeepSearchNewsService:
@@ -16,6 +23,7 @@ class DeepSearchNewsService:
     def __init__(self):
         self.api_url = settings.deepsearch_news_api_url
         self.api_key = settings.deepsearch_api_key
+        self.cache = get_response_cache()
     
     def _validate_credentials(self):
         """API 자격 증명 검증"""
@@ -34,25 +42,8 @@ class DeepSearchNewsService:
         
         self._validate_credentials()
         
-        # 실제 딥서치 뉴스 API 호출
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
-        
-        payload = {
-            "query": request.company_name,
-            "limit": request.limit,
-            "days_back": request.days_back,
-            "include_company_mentions": True,
-            "include_sentiment": True
-        }
-        
         try:
-            response = requests.post(self.api_url, headers=headers, json=payload)
-            response.raise_for_status()
-            
-            data = response.json()
+            data = await self.fetch_news(request.company_name, request.limit, request.days_back)
             
             # 딥서치 뉴스 아이템들을 DeepSearchNewsItem 모델로 변환
             news_items = []
@@ -68,22 +59,123 @@ class DeepSearchNewsService:
                 )
                 news_items.append(news_item)
             
+            # 딥서치가 준 기업 언급에 사전 기반 추출 결과를 합침
+            await asyncio.to_thread(get_company_dictionary().fill_mentions, news_items)
+            
             return DeepSearchNewsResponse(
                 company=request.company_name,
                 total=len(news_items),
                 items=news_items
             )
             
-        except requests.exceptions.RequestException as e:
+        except HTTPException:
+            raise
+        except Exception as e:
             raise HTTPException(
                 status_code=500, 
-                detail=f"딥서치 API 호출 중 오류가 발생했습니다: {str(e)}"
+                detail=f"서버 오류가 발생했습니다: {str(e)}"
             )
+    
+    def project_articles(self, articles: List[dict], fields: Sequence[str]) -> List[dict]:
+        """
+        딥서치 원본 기사에서 요청한 필드만 만듭니다.
+        DeepSearchNewsItem을 만들지 않고, 기업 언급은 요청했을 때만 사전 추출 결과와 합칩니다.
+        """
+        dictionary = get_company_dictionary() if "company_mentions" in fields else None
+        projected = []
+        for article in articles:
+            row = {}
+            for field in fields:
+                if field == "source":
+                    row[field] = "deepsearch"
+                elif field == "company_mentions":
+                    found = dictionary.extract_mentions(article.get("title", ""), article.get("description", ""))
+                    row[field] = list(dict.fromkeys([*(article.get("company_mentions") or []), *found]))
+                else:
+                    row[field] = article.get(field, "")
+            projected.append(row)
+        return projected
+
+    def article_records(self, articles: List[dict]) -> List[ArticleRecord]:
+        """딥서치 원본 기사를 보강 파이프라인 레코드로 변환 (기업 언급 추출은 파이프라인에서 수행)"""
+        return [
+            (
+                article.get("url", ""), "deepsearch", article.get("title", ""), article.get("description", ""),
+                article.get("published_at", ""), article.get("sentiment") or None, article.get("company_mentions")
+            )
+            for article in articles
+        ]
+
+    async def search_company_news_projected(
+        self, request: DeepSearchNewsRequest, fields: Sequence[str]
+    ) -> Tuple[dict, List[ArticleRecord]]:
+        """기업 뉴스 검색 (필드 선택). (응답 딕셔너리, 수집용 레코드 목록)을 반환"""
+        if not self.api_key:
+            print("딥서치 API 키가 설정되지 않아 모의 데이터를 반환합니다.")
+            response = await self._get_mock_news(request)
+            content = response.model_dump(exclude={"items"})
+            content["items"] = project_items(response.items, fields)
+            return content, [record_from_item(item) for item in response.items]
+
+        try:
+            data = await self.fetch_news(request.company_name, request.limit, request.days_back)
+            articles = data.get("articles", [])
+            return {
+                "company": request.company_name,
+                "total": len(articles),
+                "items": await asyncio.to_thread(self.project_articles, articles, fields),
+            }, self.article_records(articles)
+        except HTTPException:
+            raise
         except Exception as e:
             raise HTTPException(
-                status_code=500, 
+                status_code=500,
                 detail=f"서버 오류가 발생했습니다: {str(e)}"
             )
+
+    def _request_news(self, query: str, limit: int, days_back: int) -> dict:
+        """딥서치 뉴스 API 호출 (블로킹)"""
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+        
+        payload = {
+            "query": query,
+            "limit": limit,
+            "days_back": days_back,
+            "include_company_mentions": True,
+            "include_sentiment": True
+        }
+        
+        timeout = deadline.upstream_timeout(settings.deepsearch_request_timeout, "deepsearch")
+        try:
+            response = requests.post(self.api_url, headers=headers, json=payload, timeout=timeout)
+            response.raise_for_status()
+            return response.json()
+        except requests.exceptions.Timeout as e:
+            detail = f"딥서치 API 응답 시간이 초과되었습니다: {str(e)}"
+            if timeout < settings.deepsearch_request_timeout:
+                # 요청 예산 때문에 줄어든 timeout이면 업스트림 오류로 캐시하지 않음
+                raise HTTPException(status_code=504, detail=detail)
+            raise UpstreamError(504, detail, "timeout")
+        except requests.exceptions.RequestException as e:
+            status = e.response.status_code if e.response is not None else None
+            raise UpstreamError(
+                500,
+                f"딥서치 API 호출 중 오류가 발생했습니다: {str(e)}",
+                classify_status(status)
+            )
+    
+    async def fetch_news(self, query: str, limit: int, days_back: int) -> dict:
+        """딥서치 원본 응답 (캐시 및 동시 요청 합치기 적용)"""
+        key = f"deepsearch:{query}:{limit}:{days_back}"
+        return await self.cache.get_or_load(
+            key,
+            lambda: asyncio.to_thread(self._request_news, query, limit, days_back),
+            ttl=settings.deepsearch_cache_ttl,
+            is_empty=lambda data: not data.get("articles")
+        )
     
     async def _get_mock_news(self, request: DeepSearchNewsRequest) -> DeepSearchNewsResponse:
         """모의 뉴스 데이터 생성 (API 키가 없을 때 사용)"""
@@ -118,6 +210,7 @@ class DeepSearchNewsService:
         ]
         
         # 요청된 개수만큼 뉴스 생성
+        dictionary = get_company_dictionary()
         news_items = []
         for i in range(min(request.limit, len(mock_news_templates))):
             template = mock_news_templates[i]
@@ -132,7 +225,7 @@ class DeepSearchNewsService:
                 description=template["description"],
                 published_at=pub_date.strftime("%Y-%m-%dT%H:%M:%SZ"),
                 source="deepsearch (mock)",
-                company_mentions=[request.company_name, request.company_name[:2]],
+                company_mentions=dictionary.extract_mentions(template["title"], template["description"]) or [request.company_name],
                 sentiment=template["sentiment"]
             )
             news_items.append(news_item)
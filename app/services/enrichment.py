@@ -0,0 +1,247 @@
+"""
+기사 보강(enrichment) 파이프라인 (프로세스 풀)
+"""
+import asyncio
+import html
+import multiprocessing
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import timezone
+from typing import List, Optional, Set, Tuple
+
+from ..core.settings import settings
+from ..utils.dates import ISO_FORMAT, parse_datetime
+from .article_store import ArticleStore
+from .company_dictionary import get_company_dictionary
+from .sentiment import content_hash, get_sentiment_scorer
+
+
+# 프로세스 사이에 주고받는 기사 레코드 (pydantic 모델 대신 문자열 튜플)
+# (url, source, title, description, published_at, sentiment, company_mentions)
+ArticleRecord = Tuple[str, str, str, str, str, Optional[str], Optional[List[str]]]
+
+RECORD_FIELDS = ("url", "source", "title", "description", "published_at", "sentiment", "company_mentions")
+
+_TAG_PATTERN = re.compile(r"<[^>]+>")
+
+
+def clean_html(text: str) -> str:
+    """HTML 태그와 엔티티 제거 (네이버 검색 결과의 <b>, &quot; 등)"""
+    if not text:
+        return ""
+    if "<" in text:
+        text = _TAG_PATTERN.sub("", text)
+    if "&" in text:
+        text = html.unescape(text)
+    return text
+
+
+def normalize_published_at(value: str) -> str:
+    """발행일시를 UTC ISO 8601 문자열로 통일 (파싱할 수 없으면 원본 유지)"""
+    parsed = parse_datetime(value)
+    return parsed.astimezone(timezone.utc).strftime(ISO_FORMAT) if parsed else value
+
+
+def _clean_group(records: List[ArticleRecord]) -> List[list]:
+    """HTML 정리, 발행일시 정규화, 중복 제거 (URL 또는 내용 서명이 같은 기사는 하나만 남김)"""
+    cleaned = []
+    seen_urls = set()
+    seen_signatures = set()
+    for url, source, title, description, published_at, sentiment, mentions in records:
+        if not url or url in seen_urls:
+            continue
+        title, description = clean_html(title), clean_html(description)
+        # 같은 기사가 여러 URL로 배포된 경우(통신사 기사 등) 하나만 남김
+        signature = content_hash(title, description)
+        if signature in seen_signatures:
+            continue
+        seen_urls.add(url)
+        seen_signatures.add(signature)
+        cleaned.append([url, source, title, description, normalize_published_at(published_at), sentiment, mentions])
+    return cleaned
+
+
+def enrich_batch(groups: List[List[ArticleRecord]]) -> List[List[ArticleRecord]]:
+    """
+    레코드 묶음들의 배치 보강 (프로세스 풀 워커에서 실행되는 CPU 작업)
+
+    묶음(기업 하나의 수집 결과)마다 HTML 정리, 발행일시 UTC 정규화, 중복 제거를 하고,
+    배치 전체에 대해 한 번에 비어 있는 감정 레이블을 계산하고 기업 언급을 추출(제공자가 준 값과 합침)합니다.
+    """
+    cleaned_groups = [_clean_group(records) for records in groups]
+    cleaned = [record for group in cleaned_groups for record in group]
+
+    pending = [record for record in cleaned if not record[5]]
+    if pending:
+        labels = get_sentiment_scorer().score_batch((record[2], record[3]) for record in pending)
+        for record, label in zip(pending, labels):
+            record[5] = label
+
+    dictionary = get_company_dictionary()
+    for record in cleaned:
+        found = dictionary.extract_mentions(record[2], record[3])
+        record[6] = list(dict.fromkeys([*(record[6] or []), *found]))
+
+    return [[tuple(record) for record in group] for group in cleaned_groups]
+
+
+def records_to_articles(records: List[ArticleRecord]) -> List[dict]:
+    """보강된 레코드를 저장소의 기사 형식으로 변환"""
+    return [dict(zip(RECORD_FIELDS, record)) for record in records]
+
+
+def _warm_worker():
+    """워커 프로세스 시작 시 감정 사전과 기업 사전을 미리 불러옴"""
+    get_sentiment_scorer()
+    get_company_dictionary()
+
+
+class EnrichmentPipeline:
+    """
+    단계별 기사 보강 파이프라인
+
+    배치 단계가 제출된 기사들을 ENRICHMENT_BATCH_SIZE개(또는 ENRICHMENT_BATCH_WINDOW초)씩 묶어
+    프로세스 풀에서 보강하고, 저장 단계가 결과를 순서대로 저장소에 기록합니다. 단계 사이의 대기열은
+    크기가 제한되어 있어 보강이 밀리면 제출하는 쪽이 기다리며(backpressure), 이벤트 루프에서는
+    배치를 나누고 결과를 받는 일만 합니다. ENRICHMENT_WORKERS가 0이면 스레드에서 보강합니다.
+    """
+
+    def __init__(self, workers: Optional[int] = None):
+        self.workers = settings.enrichment_workers if workers is None else workers
+        self.batch_size = settings.enrichment_batch_size
+        self.batch_window = settings.enrichment_batch_window
+        self.queue_size = settings.enrichment_queue_size
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._input: Optional[asyncio.Queue] = None
+        self._output: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._pending: Set[asyncio.Future] = set()
+        self.batches = 0
+        self.records = 0
+        self.enrich_seconds = 0.0
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks)
+
+    def start(self):
+        if self.running:
+            return
+        if self.workers > 0:
+            # 포크 시점의 스레드/DB 연결 상태를 물려받지 않도록 spawn으로 시작
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_warm_worker
+            )
+        self._input = asyncio.Queue(maxsize=self.queue_size)
+        # 동시에 보강 중인 배치 수 제한 (워커 수의 두 배까지 미리 제출)
+        self._output = asyncio.Queue(maxsize=max(1, self.workers) * 2)
+        self._tasks = [
+            asyncio.create_task(self._batch_stage()),
+            asyncio.create_task(self._store_stage()),
+        ]
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        for future in self._pending:
+            future.cancel()
+        self._pending.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def submit(self, store: ArticleStore, company: str, records: List[ArticleRecord]) -> List[dict]:
+        """레코드를 보강하여 저장하고 새로 추가된 기사 목록을 반환 (대기열이 가득 차면 기다림)"""
+        future = asyncio.get_running_loop().create_future()
+        self._pending.add(future)
+        future.add_done_callback(self._pending.discard)
+        await self._input.put((store, company, records, future))
+        return await future
+
+    async def _enrich(self, groups: List[List[ArticleRecord]]) -> List[List[ArticleRecord]]:
+        started = time.perf_counter()
+        if self._executor is not None:
+            result = await asyncio.get_running_loop().run_in_executor(self._executor, enrich_batch, groups)
+        else:
+            result = await asyncio.to_thread(enrich_batch, groups)
+        self.enrich_seconds += time.perf_counter() - started
+        return result
+
+    async def _batch_stage(self):
+        """제출된 작업을 배치로 묶어 보강 시작"""
+        loop = asyncio.get_running_loop()
+        while True:
+            jobs = [await self._input.get()]
+            count = len(jobs[0][2])
+            batch_deadline = loop.time() + self.batch_window
+            while count < self.batch_size:
+                try:
+                    job = self._input.get_nowait()
+                except asyncio.QueueEmpty:
+                    timeout = batch_deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        job = await asyncio.wait_for(self._input.get(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+                jobs.append(job)
+                count += len(job[2])
+
+            enriched = asyncio.ensure_future(self._enrich([records for _, _, records, _ in jobs]))
+            self.batches += 1
+            self.records += count
+            # 저장 단계가 밀리면 여기서 기다림
+            await self._output.put((jobs, enriched))
+
+    async def _store_stage(self):
+        """보강된 배치를 제출 순서대로 저장"""
+        while True:
+            jobs, enriched = await self._output.get()
+            try:
+                groups = await enriched
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                for _, _, _, future in jobs:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (store, company, _, future), records in zip(jobs, groups):
+                if future.done():
+                    continue
+                try:
+                    articles = records_to_articles(records)
+                    added = await asyncio.to_thread(store.add_articles, company, articles) if articles else []
+                except Exception as e:
+                    future.set_exception(e)
+                    continue
+                future.set_result(added)
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "running": self.running,
+            "queued": self._input.qsize() if self._input is not None else 0,
+            "in_flight_batches": self._output.qsize() if self._output is not None else 0,
+            "batches": self.batches,
+            "records": self.records,
+            "avg_batch_ms": round(self.enrich_seconds / self.batches * 1000, 2) if self.batches else None,
+        }
+
+
+_pipeline: Optional[EnrichmentPipeline] = None
+
+
+def get_enrichment_pipeline() -> EnrichmentPipeline:
+    """전역 보강 파이프라인 인스턴스 반환"""
+    global _pipeline
+    if _pipeline is None:
+        _pipeline = EnrichmentPipeline()
+    return _pipeline
@@ -0,0 +1,153 @@
+"""
+저장된 기사 대량 내보내기 (NDJSON, CSV, Parquet)
+"""
+import csv
+import importlib.util
+import io
+import json
+from datetime import datetime, timezone
+from typing import Iterator, List, Optional
+
+from .article_store import ArticleStore
+
+
+EXPORT_COLUMNS = [
+    "id", "company", "url", "source", "title", "description", "published_at",
+    "sentiment", "company_mentions", "created_at"
+]
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+
+def export_columns(include_body: bool) -> List[str]:
+    """내보낼 열 목록 (본문은 크기가 커서 요청한 경우에만 포함)"""
+    return EXPORT_COLUMNS + ["body"] if include_body else list(EXPORT_COLUMNS)
+
+
+def parquet_available() -> bool:
+    """Parquet 내보내기에 필요한 pyarrow 설치 여부"""
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def parse_time_bound(value: Optional[str]) -> Optional[str]:
+    """기간 조건(ISO 8601 날짜/일시)을 저장소 형식의 UTC 문자열로 변환"""
+    if not value:
+        return None
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _mentions_index(columns: List[str]) -> int:
+    return columns.index("company_mentions")
+
+
+def encode_ndjson(rows: List[tuple]) -> bytes:
+    """as_json으로 읽은 (id, JSON 객체) 행들을 NDJSON으로 변환"""
+    return "".join(f"{row[1]}\n" for row in rows).encode("utf-8")
+
+
+def encode_csv(rows: List[tuple], columns: List[str], header: bool = False) -> bytes:
+    """행들을 CSV로 변환 (company_mentions는 JSON 문자열 그대로)"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(columns)
+    writer.writerows(rows)
+    return buffer.getvalue().encode("utf-8")
+
+
+class _BytesSink(io.RawIOBase):
+    """ParquetWriter가 쓴 바이트를 모아 두었다가 꺼내는 쓰기 전용 파일 객체"""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data, self._chunks = b"".join(self._chunks), []
+        return data
+
+
+class ParquetEncoder:
+    """
+    청크마다 row group 하나를 쓰는 Parquet 인코더 (pyarrow가 설치된 경우에만 사용 가능)
+
+    write는 그 청크까지 인코딩된 바이트를, close는 파일 footer를 반환하므로
+    전체 결과를 메모리에 올리지 않고 스트리밍할 수 있습니다.
+    """
+
+    def __init__(self, columns: List[str]):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise RuntimeError("Parquet으로 내보내려면 pyarrow 패키지를 설치하세요: pip install pyarrow") from e
+        self._pa = pa
+        self.columns = columns
+        types = {"id": pa.int64(), "created_at": pa.float64(), "company_mentions": pa.list_(pa.string())}
+        self.schema = pa.schema([(column, types.get(column, pa.string())) for column in columns])
+        self._sink = _BytesSink()
+        self._writer = pq.ParquetWriter(self._sink, self.schema, compression="zstd")
+
+    def write(self, rows: List[tuple]) -> bytes:
+        mentions = _mentions_index(self.columns)
+        arrays = []
+        for i, column in enumerate(self.columns):
+            values = [row[i] for row in rows]
+            if i == mentions:
+                values = [json.loads(value) if value else None for value in values]
+            arrays.append(self._pa.array(values, type=self.schema.field(column).type))
+        self._writer.write_table(self._pa.Table.from_arrays(arrays, schema=self.schema))
+        return self._sink.drain()
+
+    def close(self) -> bytes:
+        self._writer.close()
+        return self._sink.drain()
+
+
+def stream_export(
+    store: ArticleStore,
+    fmt: str,
+    company: Optional[str] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    after_id: int = 0,
+    include_body: bool = False,
+    chunk_size: int = 5000
+) -> Iterator[bytes]:
+    """저장소에서 청크 단위로 읽어 바로 인코딩한 바이트를 순회 (메모리 사용량은 청크 크기에 비례)"""
+    columns = export_columns(include_body)
+    # NDJSON은 SQLite가 행을 JSON으로 직렬화하므로 파이썬에서 값을 다시 인코딩하지 않음
+    chunks = store.iter_export_chunks(
+        columns, company, since, until, after_id, chunk_size, as_json=fmt == "ndjson"
+    )
+
+    if fmt == "parquet":
+        encoder = ParquetEncoder(columns)
+        for rows in chunks:
+            yield encoder.write(rows)
+        yield encoder.close()
+        return
+
+    first = True
+    for rows in chunks:
+        if fmt == "csv":
+            # 이어받기 요청이면 앞부분에 이미 header가 있으므로 생략
+            yield encode_csv(rows, columns, header=first and after_id == 0)
+        else:
+            yield encode_ndjson(rows)
+        first = False
+    if first and fmt == "csv" and after_id == 0:
+        yield encode_csv([], columns, header=True)
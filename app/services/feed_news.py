@@ -0,0 +1,292 @@
+"""
+RSS/Atom 피드 뉴스 서비스
+"""
+import asyncio
+import html
+import re
+import time
+import xml.etree.ElementTree as ET
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import requests
+from fastapi import HTTPException
+from ..core import deadline
+from ..core.settings import settings
+from ..models.news import NewsItem, NewsResponse, FeedNewsRequest
+from ..utils.dates import parse_datetime
+from .sentiment import get_sentiment_scorer
+from .company_dictionary import get_company_dictionary
+from .enrichment import ArticleRecord
+
+
+_TAG_PATTERN = re.compile(r"<[^>]+>")
+
+# 피드 URL별 폴링 상태 (조건부 요청 헤더와 마지막으로 파싱한 항목)
+_feed_states: Dict[str, "FeedState"] = {}
+_session = requests.Session()
+
+
+class FeedState:
+    """피드 하나의 조건부 요청 상태"""
+
+    def __init__(self, url: str):
+        self.url = url
+        self.etag: Optional[str] = None
+        self.last_modified: Optional[str] = None
+        self.entries: List[dict] = []
+        self.polled_at: float = 0.0
+        # 같은 피드를 동시에 두 번 가져오지 않도록 피드마다 잠금 (다른 피드의 폴링은 막지 않음)
+        self.lock = asyncio.Lock()
+
+
+def _local_name(tag: str) -> str:
+    """네임스페이스를 제외한 태그 이름"""
+    return tag.rsplit("}", 1)[-1]
+
+
+def _clean_text(text: Optional[str]) -> str:
+    """HTML 태그와 엔티티 제거"""
+    if not text:
+        return ""
+    return html.unescape(_TAG_PATTERN.sub("", text)).strip()
+
+
+def _normalize_date(value: str) -> str:
+    """RSS(RFC 822)와 Atom(ISO 8601) 날짜를 네이버와 같은 RFC 822 형식으로 통일"""
+    parsed = parse_datetime(value)
+    return format_datetime(parsed) if parsed else value.strip()
+
+
+def _entry_from_element(elem: ET.Element) -> dict:
+    """<item> 또는 <entry> 요소를 정규화된 항목 딕셔너리로 변환"""
+    entry = {"title": "", "link": "", "description": "", "pubDate": ""}
+    for child in elem:
+        name = _local_name(child.tag)
+        if name == "title":
+            entry["title"] = _clean_text(child.text)
+        elif name == "link":
+            # Atom은 href 속성, RSS는 텍스트에 링크가 들어있음
+            href = child.get("href")
+            if href and child.get("rel", "alternate") == "alternate":
+                entry["link"] = href
+            elif child.text and not entry["link"]:
+                entry["link"] = child.text.strip()
+        elif name in ("description", "summary") or (name == "content" and not entry["description"]):
+            entry["description"] = _clean_text(child.text)
+        elif name in ("pubDate", "published", "updated", "date") and not entry["pubDate"]:
+            entry["pubDate"] = _normalize_date(child.text or "")
+    return entry
+
+
+def parse_feed_stream(chunks) -> List[dict]:
+    """
+    바이트 청크 이터러블을 스트리밍 XML 파서로 읽어 항목 목록을 반환합니다.
+    항목 요소는 처리 직후 부모에서 떼어 내서 전체 DOM을 메모리에 만들지 않습니다.
+    """
+    parser = ET.XMLPullParser(events=("start", "end"))
+    entries = []
+    # 현재 열려 있는 요소들 (마지막이 처리 중인 요소의 부모)
+    path: List[ET.Element] = []
+
+    def read_events():
+        for event, elem in parser.read_events():
+            if event == "start":
+                path.append(elem)
+                continue
+            path.pop()
+            if _local_name(elem.tag) in ("item", "entry"):
+                entries.append(_entry_from_element(elem))
+                if path:
+                    path[-1].remove(elem)
+
+    for chunk in chunks:
+        if not chunk:
+            continue
+        parser.feed(chunk)
+        read_events()
+    parser.close()
+    read_events()
+    return entries
+
+
+def _published_timestamp(entry: dict) -> float:
+    """정렬용 발행 시각 (파싱 실패 시 0)"""
+    try:
+        return parsedate_to_datetime(entry["pubDate"]).timestamp()
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class FeedNewsService:
+    """RSS/Atom 피드 뉴스 서비스 클래스"""
+
+    def __init__(self):
+        self.feed_urls = settings.feed_urls
+        self.poll_interval = settings.feed_poll_interval
+        self.timeout = settings.feed_request_timeout
+        self.concurrency = settings.feed_poll_concurrency
+
+    def _validate_feeds(self):
+        """피드 목록 설정 검증"""
+        if not self.feed_urls:
+            raise HTTPException(
+                status_code=500,
+                detail="RSS/Atom 피드 목록이 설정되지 않았습니다. .env 파일의 FEED_URLS를 확인하세요."
+            )
+
+    def _poll_feed(self, state: FeedState) -> FeedState:
+        """조건부 요청으로 피드 하나를 가져옵니다. 304 응답이면 파싱하지 않습니다."""
+        headers = {}
+        if state.etag:
+            headers["If-None-Match"] = state.etag
+        if state.last_modified:
+            headers["If-Modified-Since"] = state.last_modified
+
+        timeout = deadline.upstream_timeout(self.timeout, "feed")
+        try:
+            with _session.get(state.url, headers=headers, timeout=timeout, stream=True) as response:
+                if response.status_code == 304:
+                    state.polled_at = time.time()
+                    return state
+                response.raise_for_status()
+                entries = parse_feed_stream(response.iter_content(chunk_size=16384))
+                # 기업 언급은 항목을 새로 파싱할 때 한 번만 추출
+                dictionary = get_company_dictionary()
+                for entry in entries:
+                    entry["company_mentions"] = dictionary.extract_mentions(entry["title"], entry["description"])
+                state.entries = entries
+                state.etag = response.headers.get("ETag")
+                state.last_modified = response.headers.get("Last-Modified")
+                state.polled_at = time.time()
+        except (requests.exceptions.RequestException, ET.ParseError) as e:
+            # 피드 하나의 실패가 전체 결과를 막지 않도록 이전 항목을 유지
+            print(f"피드 폴링 중 오류가 발생했습니다 ({state.url}): {str(e)}")
+        return state
+
+    async def poll_feeds(self) -> List[FeedState]:
+        """폴링 주기가 지난 피드들을 동시에 갱신합니다."""
+        states = [_feed_states.setdefault(url, FeedState(url)) for url in self.feed_urls]
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def poll(state: FeedState):
+            async with state.lock:
+                # 잠금을 기다리는 동안 다른 요청이 갱신했으면 다시 가져오지 않음
+                if time.time() - state.polled_at < self.poll_interval:
+                    return
+                async with semaphore:
+                    await asyncio.to_thread(self._poll_feed, state)
+
+        await asyncio.gather(*(poll(state) for state in states))
+        return states
+
+    def _matches(self, entry: dict, company_name: str) -> bool:
+        """항목이 기업(별칭, 종목코드 포함)을 언급하는지 확인"""
+        return (
+            company_name in entry.get("company_mentions", ())
+            or company_name in entry["title"]
+            or company_name in entry["description"]
+        )
+
+    async def _matched_entries(self, request: FeedNewsRequest) -> List[dict]:
+        """기업을 언급한 피드 항목을 최신순으로 반환 (링크 기준 중복 제거)"""
+        states = await self.poll_feeds()
+        company = get_company_dictionary().get(request.company_name)
+        company_name = company["name"] if company else request.company_name
+
+        matched = {}
+        for state in states:
+            for entry in state.entries:
+                if entry["link"] and self._matches(entry, company_name):
+                    matched.setdefault(entry["link"], entry)
+        return sorted(matched.values(), key=_published_timestamp, reverse=True)
+
+    def project_entries(self, entries: List[dict], fields: Sequence[str]) -> List[dict]:
+        """
+        피드 항목에서 요청한 필드만 만듭니다.
+        NewsItem을 만들지 않고, 요청하지 않은 감정은 계산하지 않습니다.
+        """
+        projected = []
+        for entry in entries:
+            row = {}
+            for field in fields:
+                if field in ("originallink", "link"):
+                    row[field] = entry["link"]
+                elif field == "source":
+                    row[field] = "feed"
+                elif field == "company_mentions":
+                    row[field] = entry.get("company_mentions")
+                elif field in ("title", "description", "pubDate"):
+                    row[field] = entry[field]
+            projected.append(row)
+
+        if "sentiment" in fields:
+            labels = get_sentiment_scorer().score_batch((entry["title"], entry["description"]) for entry in entries)
+            for row, label in zip(projected, labels):
+                row["sentiment"] = label
+        return projected
+
+    def entry_records(self, entries: List[dict]) -> List[ArticleRecord]:
+        """피드 항목을 보강 파이프라인 레코드로 변환 (감정은 파이프라인에서 계산)"""
+        return [
+            (entry["link"], "feed", entry["title"], entry["description"], entry["pubDate"], None,
+             entry.get("company_mentions"))
+            for entry in entries
+        ]
+
+    async def search_company_news_projected(
+        self, request: FeedNewsRequest, fields: Sequence[str]
+    ) -> Tuple[dict, List[ArticleRecord]]:
+        """피드 뉴스 검색 (필드 선택). (응답 딕셔너리, 수집용 레코드 목록)을 반환"""
+        self._validate_feeds()
+
+        try:
+            entries = await self._matched_entries(request)
+            page = entries[:request.limit]
+            items = await asyncio.to_thread(self.project_entries, page, fields)
+            return {
+                "company": request.company_name,
+                "total": len(entries),
+                "start": 1,
+                "display": len(items),
+                "items": items,
+            }, self.entry_records(page)
+        except Exception as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"서버 오류가 발생했습니다: {str(e)}"
+            )
+
+    async def search_company_news(self, request: FeedNewsRequest) -> NewsResponse:
+        """피드 항목 중 기업을 언급한 뉴스 검색"""
+        self._validate_feeds()
+
+        try:
+            entries = await self._matched_entries(request)
+            news_items = [
+                NewsItem(
+                    title=entry["title"],
+                    originallink=entry["link"],
+                    link=entry["link"],
+                    description=entry["description"],
+                    pubDate=entry["pubDate"],
+                    source="feed",
+                    company_mentions=entry.get("company_mentions")
+                )
+                for entry in entries[:request.limit]
+            ]
+            await asyncio.to_thread(get_sentiment_scorer().score_items, news_items)
+
+            return NewsResponse(
+                company=request.company_name,
+                total=len(entries),
+                start=1,
+                display=len(news_items),
+                items=news_items
+            )
+
+        except Exception as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"서버 오류가 발생했습니다: {str(e)}"
+            )
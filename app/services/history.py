@@ -0,0 +1,53 @@
+"""
+저장된 기사 이력 조회 서비스 (keyset 페이지네이션)
+"""
+import asyncio
+import base64
+import json
+from typing import Optional, Tuple
+
+from fastapi import HTTPException
+from .article_store import ArticleStore, get_article_store
+
+
+# 첫 페이지의 기준점: 모든 UTC ISO 발행일시보다 뒤이면서, 파싱하지 못해 원본 그대로 저장된
+# 발행일시("Mon, 01 Jan ..." 등, 숫자보다 큰 문자로 시작)보다는 앞이라 이력에서 제외됩니다.
+_FIRST_PAGE = ("9999-12-31T23:59:59Z", 2 ** 63 - 1)
+
+
+def encode_cursor(published_at: str, article_id: int) -> str:
+    """마지막 기사의 (published_at, id)를 불투명한 커서 문자열로 변환"""
+    raw = json.dumps([published_at, article_id], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[str, int]:
+    """커서 문자열을 (published_at, id)로 변환"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        published_at, article_id = json.loads(raw)
+        if not isinstance(published_at, str) or not isinstance(article_id, int):
+            raise ValueError
+        return published_at, article_id
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="올바르지 않은 cursor입니다.")
+
+
+class HistoryService:
+    """기사 저장소의 기업별 기사 이력을 최신순으로 조회하는 서비스 클래스"""
+
+    def __init__(self, store: Optional[ArticleStore] = None):
+        self.store = store or get_article_store()
+
+    async def get_history(self, company: str, limit: int, cursor: Optional[str] = None) -> dict:
+        """기업 기사 한 페이지와 다음 페이지 커서 반환 (마지막 페이지면 next_cursor는 None)"""
+        before = decode_cursor(cursor) if cursor else _FIRST_PAGE
+        # 다음 페이지 존재 여부를 알기 위해 하나 더 조회
+        articles = await asyncio.to_thread(self.store.history_page, company, before, limit + 1)
+        has_more = len(articles) > limit
+        articles = articles[:limit]
+        next_cursor = None
+        if has_more:
+            last = articles[-1]
+            next_cursor = encode_cursor(last["published_at"], last["id"])
+        return {"company": company, "items": articles, "next_cursor": next_cursor}
@@ -0,0 +1,93 @@
+"""
+watchlist 기업 수집 워커 서비스
+"""
+import asyncio
+from typing import Dict, List, Optional
+
+from fastapi import HTTPException
+from ..core.settings import settings
+from ..models.news import DeepSearchNewsRequest, FeedNewsRequest
+from .naver_news import NaverNewsService
+from .deepsearch_news import DeepSearchNewsService
+from .feed_news import FeedNewsService
+from .ingestion import IngestionService
+
+
+class IngestWorker:
+    """
+    watchlist 기업 수집 클래스
+
+    기업마다 네이버(캐시를 거치지 않고 갱신), 딥서치, RSS/Atom 피드에서 최신 뉴스를 가져와
+    보강 파이프라인(정규화/감정 분석/기업 언급 추출)을 거쳐 기사 저장소에 기록하고 새 기사의 본문을 수집합니다.
+    네이버 응답은 공유 응답 캐시에도 저장되므로 API 워커는 업스트림 호출 없이 응답할 수 있습니다.
+    """
+
+    def __init__(
+        self,
+        companies: List[str],
+        ingestion_service: Optional[IngestionService] = None,
+        naver_service: Optional[NaverNewsService] = None,
+        deepsearch_service: Optional[DeepSearchNewsService] = None,
+        feed_service: Optional[FeedNewsService] = None
+    ):
+        self.companies = list(dict.fromkeys(companies))
+        self.ingestion_service = ingestion_service or IngestionService()
+        self.naver_service = naver_service or NaverNewsService()
+        self.deepsearch_service = deepsearch_service or DeepSearchNewsService()
+        self.feed_service = feed_service or FeedNewsService()
+        self.concurrency = settings.ingest_concurrency
+
+    async def _fetch_items(self, company: str) -> list:
+        """제공자별 최신 뉴스 아이템 (제공자 하나의 실패가 나머지를 막지 않음)"""
+        items = []
+        sources = []
+        if self.naver_service.client_id and self.naver_service.client_secret:
+            sources.append(("naver", self._naver_items))
+        if self.deepsearch_service.api_key:
+            sources.append(("deepsearch", self._deepsearch_items))
+        if self.feed_service.feed_urls:
+            sources.append(("feed", self._feed_items))
+
+        for name, fetch in sources:
+            try:
+                items.extend(await fetch(company))
+            except HTTPException as e:
+                print(f"{name} 수집 중 오류가 발생했습니다 ({company}): {e.detail}")
+            except Exception as e:
+                print(f"{name} 수집 중 오류가 발생했습니다 ({company}): {str(e)}")
+        return items
+
+    async def _naver_items(self, company: str) -> list:
+        data = await self.naver_service.refresh_page(company, settings.ingest_naver_display, 1)
+        return self.naver_service.raw_records(data.get("items", []))
+
+    async def _deepsearch_items(self, company: str) -> list:
+        response = await self.deepsearch_service.search_company_news(DeepSearchNewsRequest(
+            company_name=company,
+            limit=settings.ingest_deepsearch_limit,
+            days_back=settings.ingest_deepsearch_days_back
+        ))
+        return response.items
+
+    async def _feed_items(self, company: str) -> list:
+        response = await self.feed_service.search_company_news(
+            FeedNewsRequest(company_name=company, limit=settings.ingest_feed_limit)
+        )
+        return response.items
+
+    async def ingest_company(self, company: str) -> int:
+        """기업 하나를 수집하고 새로 저장된 기사 수를 반환"""
+        items = await self._fetch_items(company)
+        added = await self.ingestion_service.ingest_and_enrich(company, items)
+        return len(added)
+
+    async def run_once(self) -> Dict[str, int]:
+        """watchlist 전체를 한 번 수집 (기업별 새 기사 수 반환)"""
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def ingest(company: str) -> int:
+            async with semaphore:
+                return await self.ingest_company(company)
+
+        counts = await asyncio.gather(*(ingest(company) for company in self.companies))
+        return dict(zip(self.companies, counts))
@@ -0,0 +1,99 @@
+"""
+기사 수집(ingestion) 서비스
+"""
+import asyncio
+from typing import Awaitable, Callable, Iterable, List, Optional, Union
+
+from ..core.settings import settings
+from ..models.news import NewsItem, DeepSearchNewsItem
+from .article_store import ArticleStore, get_article_store
+from .article_fetcher import ArticleFetcher, get_article_fetcher
+from .enrichment import ArticleRecord, enrich_batch, get_enrichment_pipeline, records_to_articles
+
+
+# 수집 대상: 뉴스 아이템 모델 또는 보강 파이프라인 레코드
+IngestItem = Union[NewsItem, DeepSearchNewsItem, ArticleRecord]
+
+# 새 기사가 저장될 때 호출되는 리스너 (company, 새 기사 목록)
+ArticleListener = Callable[[str, List[dict]], Awaitable[None]]
+_article_listeners: List[ArticleListener] = []
+
+
+def add_article_listener(listener: ArticleListener):
+    """새 기사 리스너 등록"""
+    if listener not in _article_listeners:
+        _article_listeners.append(listener)
+
+
+def remove_article_listener(listener: ArticleListener):
+    """새 기사 리스너 해제"""
+    if listener in _article_listeners:
+        _article_listeners.remove(listener)
+
+
+async def notify_article_listeners(company: str, articles: List[dict]):
+    """새 기사를 리스너들에게 전달 (리스너 하나의 실패가 다른 리스너를 막지 않음)"""
+    for listener in list(_article_listeners):
+        try:
+            await listener(company, articles)
+        except Exception as e:
+            print(f"새 기사 리스너 처리 중 오류가 발생했습니다: {str(e)}")
+
+
+def record_from_item(item: Union[NewsItem, DeepSearchNewsItem]) -> ArticleRecord:
+    """제공자별 뉴스 아이템을 보강 파이프라인의 레코드로 변환 (보강은 파이프라인에서 수행)"""
+    if isinstance(item, NewsItem):
+        return (
+            item.originallink or item.link, item.source, item.title, item.description, item.pubDate,
+            item.sentiment, item.company_mentions
+        )
+    return (
+        item.url, item.source, item.title, item.description, item.published_at,
+        item.sentiment or None, item.company_mentions
+    )
+
+
+class IngestionService:
+    """검색 결과를 저장소에 기록하고 새 기사의 본문을 수집하는 서비스 클래스"""
+
+    def __init__(self, store: Optional[ArticleStore] = None, fetcher: Optional[ArticleFetcher] = None):
+        self.store = store or get_article_store()
+        self.fetcher = fetcher or get_article_fetcher()
+
+    async def ingest(self, company: str, items: Iterable[IngestItem]) -> List[dict]:
+        """
+        기사를 보강하여 저장하고 새로 추가된 기사 목록을 반환
+
+        items는 뉴스 아이템 모델 또는 이미 레코드로 만든 원본 응답입니다. 보강(CPU 작업)은
+        보강 파이프라인의 프로세스 풀에서, 파이프라인이 실행 중이 아니면 스레드에서 수행합니다.
+        """
+        records = [item if isinstance(item, tuple) else record_from_item(item) for item in items]
+        records = [record for record in records if record[0]]
+        if not records:
+            return []
+        pipeline = get_enrichment_pipeline()
+        if pipeline.running:
+            return await pipeline.submit(self.store, company, records)
+        enriched = (await asyncio.to_thread(enrich_batch, [records]))[0]
+        return await asyncio.to_thread(self.store.add_articles, company, records_to_articles(enriched))
+
+    async def fetch_bodies(self, articles: Iterable[dict]):
+        """본문을 아직 가져오지 않은 기사만 수집하여 저장"""
+        urls = await asyncio.to_thread(self.store.urls_without_body, [article["url"] for article in articles])
+        if not urls:
+            return
+        bodies = await self.fetcher.fetch_many(urls)
+        await asyncio.to_thread(self.store.set_bodies, bodies)
+
+    async def ingest_and_enrich(self, company: str, items: Iterable[IngestItem]) -> List[dict]:
+        """요청 처리 후 백그라운드(또는 수집 워커)에서 실행되는 수집 작업. 새로 추가된 기사 목록을 반환"""
+        added = []
+        try:
+            added = await self.ingest(company, items)
+            if added:
+                await notify_article_listeners(company, added)
+            if added and settings.article_fetch_enabled:
+                await self.fetch_bodies(added)
+        except Exception as e:
+            print(f"기사 수집 중 오류가 발생했습니다 ({company}): {str(e)}")
+        return added
@@ -1,21 +1,34 @@
 """
 네이버 뉴스 API 서비스
 """
+import asyncio
 import requests
-from typing import List
+from typing import List, Sequence, Tuple
 from fastapi import HTTPException
+from ..core import deadline
+from ..core.cache import UpstreamError, classify_status, get_response_cache
 from ..core.settings import settings
 from ..models.news import NewsItem, NewsResponse, CompanyNewsRequest
+from .sentiment import get_sentiment_scorer
+from .company_dictionary import get_company_dictionary
+from .enrichment import ArticleRecord
+
+
+# 네이버 검색 API의 display 최댓값과 start 최댓값
+NAVER_MAX_DISPLAY = 100
+NAVER_MAX_START = 1000
 
 
 class NaverNewsService:
     """네이버 뉴스 API 서비스 클래스"""
-    
+
     def __init__(self):
         self.api_url = settings.naver_news_api_url
         self.client_id = settings.naver_client_id
         self.client_secret = settings.naver_client_secret
-    
+        self.cache = get_response_cache()
+        self.page_window = max(1, min(settings.naver_page_window, NAVER_MAX_DISPLAY))
+
     def _validate_credentials(self):
         """API 자격 증명 검증"""
         if not self.client_id or not self.client_secret:
@@ -23,46 +36,217 @@ class NaverNewsService:
                 status_code=500,
                 detail="네이버 API 키가 설정되지 않았습니다. .env 파일을 확인하세요."
             )
-    
+
     def _clean_html_tags(self, text: str) -> str:
         """HTML 태그 제거"""
         return text.replace("<b>", "").replace("</b>", "")
-    
-    async def search_company_news(self, request: CompanyNewsRequest) -> NewsResponse:
-        """기업 뉴스 검색"""
-        self._validate_credentials()
-        
+
+    def _request_page(self, query: str, display: int, start: int) -> dict:
+        """네이버 뉴스 API 호출 (블로킹)"""
         headers = {
             "X-Naver-Client-Id": self.client_id,
             "X-Naver-Client-Secret": self.client_secret
         }
-        
+
         params = {
-            "query": request.company_name,
-            "display": request.display,
-            "start": request.start,
+            "query": query,
+            "display": display,
+            "start": start,
             "sort": "date"  # 최신순으로 정렬
         }
-        
+
+        timeout = deadline.upstream_timeout(settings.naver_request_timeout, "naver")
         try:
-            response = requests.get(self.api_url, headers=headers, params=params)
+            response = requests.get(self.api_url, headers=headers, params=params, timeout=timeout)
             response.raise_for_status()
-            
-            data = response.json()
-            
+            return response.json()
+        except requests.exceptions.Timeout as e:
+            detail = f"네이버 API 응답 시간이 초과되었습니다: {str(e)}"
+            if timeout < settings.naver_request_timeout:
+                # 요청 예산 때문에 줄어든 timeout이면 업스트림 오류로 캐시하지 않음
+                raise HTTPException(status_code=504, detail=detail)
+            raise UpstreamError(504, detail, "timeout")
+        except requests.exceptions.RequestException as e:
+            status = e.response.status_code if e.response is not None else None
+            raise UpstreamError(
+                500,
+                f"네이버 API 호출 중 오류가 발생했습니다: {str(e)}",
+                classify_status(status)
+            )
+
+    def _windows(self, display: int, start: int) -> List[Tuple[int, int]]:
+        """
+        요청 구간(start부터 display개)을 덮는 창들의 (시작 위치, 크기)
+
+        정렬된 창으로 덮되, 네이버 start 한도(1000)를 넘어 호출할 수 없는 창 대신 한도 위치에서 시작하는
+        끝 창(start=1000, display=100) 하나로 나머지 구간(최대 1099번째까지)을 덮습니다.
+        """
+        size = self.page_window
+        first = (start - 1) // size * size + 1
+        last = (start + display - 2) // size * size + 1
+        windows = [(window, size) for window in range(first, last + 1, size) if window <= NAVER_MAX_START]
+        if last > NAVER_MAX_START and start < NAVER_MAX_START + NAVER_MAX_DISPLAY:
+            windows.append((NAVER_MAX_START, NAVER_MAX_DISPLAY))
+        return windows
+
+    def _window_key(self, query: str, window: Tuple[int, int]) -> str:
+        window_start, size = window
+        return f"naver:{query}:window{size}:{window_start}"
+
+    async def _load_window(self, query: str, window: Tuple[int, int]) -> dict:
+        window_start, size = window
+        return await self.cache.get_or_load(
+            self._window_key(query, window),
+            lambda: asyncio.to_thread(self._request_page, query, size, window_start),
+            ttl=settings.naver_cache_ttl,
+            is_empty=lambda data: not data.get("items")
+        )
+
+    async def _refresh_window(self, query: str, window: Tuple[int, int]) -> dict:
+        window_start, size = window
+        data = await asyncio.to_thread(self._request_page, query, size, window_start)
+        await self.cache.put(self._window_key(query, window), data, settings.naver_cache_ttl)
+        return data
+
+    def _slice_windows(self, windows: List[dict], spans: List[Tuple[int, int]], display: int, start: int) -> dict:
+        """연속된 창들에서 요청 구간만 잘라 네이버 응답 형식으로 반환"""
+        items = []
+        end = spans[0][0] if spans else start
+        for (window_start, size), data in zip(spans, windows):
+            window_items = data.get("items", [])
+            # 끝 창은 앞 창과 겹치므로 이미 모은 위치는 건너뜀
+            items.extend(window_items[max(0, end - window_start):])
+            end = max(end, window_start + len(window_items))
+            # 짧은 창은 검색 결과의 끝이므로 다음 창은 보지 않음
+            if len(window_items) < size:
+                break
+        offset = start - spans[0][0] if spans else 0
+        sliced = items[offset:offset + display]
+        return {
+            "total": windows[0].get("total", 0) if windows else 0,
+            "start": start,
+            "display": len(sliced),
+            "items": sliced,
+        }
+
+    async def fetch_page(self, query: str, display: int, start: int) -> dict:
+        """
+        검색어 한 페이지의 원본 응답 (캐시 및 동시 요청 합치기 적용)
+
+        네이버에는 NAVER_PAGE_WINDOW개 단위로 정렬된 창(1, 101, 201, ...)을 요청하고,
+        요청한 (display, start) 구간은 캐시된 창에서 잘라 응답합니다. 서로 겹치는 페이지 요청들이
+        창 하나의 호출로 처리됩니다. start 한도(1000) 이후 구간은 한도 위치에서 시작하는 끝 창에서 자릅니다.
+        """
+        self._validate_credentials()
+
+        spans = self._windows(display, start)
+        windows = await asyncio.gather(*(self._load_window(query, window) for window in spans))
+        return self._slice_windows(windows, spans, display, start)
+
+    async def refresh_page(self, query: str, display: int, start: int) -> dict:
+        """캐시를 거치지 않고 최신 응답을 가져와 캐시를 갱신 (구독 폴러용)"""
+        self._validate_credentials()
+
+        spans = self._windows(display, start)
+        windows = await asyncio.gather(*(self._refresh_window(query, window) for window in spans))
+        return self._slice_windows(windows, spans, display, start)
+
+    def build_items(self, raw_items: List[dict]) -> List[NewsItem]:
+        """
+        원본 응답 아이템들을 NewsItem 모델로 변환하고 감정/기업 언급을 채움
+
+        CPU 작업이므로 이벤트 루프에서는 asyncio.to_thread로 호출합니다.
+        """
+        news_items = []
+        for item in raw_items:
+            news_item = NewsItem(
+                title=self._clean_html_tags(item.get("title", "")),
+                originallink=item.get("originallink", ""),
+                link=item.get("link", ""),
+                description=self._clean_html_tags(item.get("description", "")),
+                pubDate=item.get("pubDate", ""),
+                source="naver"
+            )
+            news_items.append(news_item)
+
+        # 네이버는 감정 분석 결과를 제공하지 않으므로 로컬에서 채움
+        get_sentiment_scorer().score_items(news_items)
+        get_company_dictionary().fill_mentions(news_items)
+        return news_items
+
+    def raw_records(self, raw_items: List[dict]) -> List[ArticleRecord]:
+        """원본 응답 아이템을 보강 파이프라인 레코드로 변환 (HTML 정리/감정/기업 언급은 파이프라인에서 수행)"""
+        return [
+            (
+                item.get("originallink") or item.get("link", ""), "naver", item.get("title", ""),
+                item.get("description", ""), item.get("pubDate", ""), None, None
+            )
+            for item in raw_items
+        ]
+
+    def project_raw_items(self, raw_items: List[dict], fields: Sequence[str]) -> List[dict]:
+        """
+        원본 응답 아이템에서 요청한 필드만 만듭니다.
+        NewsItem을 만들지 않고, 요청하지 않은 감정/기업 언급은 계산하지 않습니다.
+        """
+        texts = [
+            (self._clean_html_tags(item.get("title", "")), self._clean_html_tags(item.get("description", "")))
+            for item in raw_items
+        ] if {"title", "description", "sentiment", "company_mentions"} & set(fields) else None
+
+        projected = []
+        for i, item in enumerate(raw_items):
+            row = {}
+            for field in fields:
+                if field == "title":
+                    row[field] = texts[i][0]
+                elif field == "description":
+                    row[field] = texts[i][1]
+                elif field == "source":
+                    row[field] = "naver"
+                elif field in ("originallink", "link", "pubDate"):
+                    row[field] = item.get(field, "")
+            projected.append(row)
+
+        if "sentiment" in fields:
+            for row, label in zip(projected, get_sentiment_scorer().score_batch(texts)):
+                row["sentiment"] = label
+        if "company_mentions" in fields:
+            dictionary = get_company_dictionary()
+            for row, (title, description) in zip(projected, texts):
+                row["company_mentions"] = dictionary.extract_mentions(title, description)
+        return projected
+
+    async def search_company_news_projected(
+        self, request: CompanyNewsRequest, fields: Sequence[str]
+    ) -> Tuple[dict, List[ArticleRecord]]:
+        """기업 뉴스 검색 (필드 선택). (응답 딕셔너리, 수집용 레코드 목록)을 반환"""
+        try:
+            data = await self.fetch_page(request.company_name, request.display, request.start)
+            raw_items = data.get("items", [])
+            return {
+                "company": request.company_name,
+                "total": data.get("total", 0),
+                "start": data.get("start", 1),
+                "display": data.get("display", 10),
+                "items": await asyncio.to_thread(self.project_raw_items, raw_items, fields),
+            }, self.raw_records(raw_items)
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"서버 오류가 발생했습니다: {str(e)}"
+            )
+
+    async def search_company_news(self, request: CompanyNewsRequest) -> NewsResponse:
+        """기업 뉴스 검색"""
+        try:
+            data = await self.fetch_page(request.company_name, request.display, request.start)
+
             # 뉴스 아이템들을 NewsItem 모델로 변환
-            news_items = []
-            for item in data.get("items", []):
-                news_item = NewsItem(
-                    title=self._clean_html_tags(item.get("title", "")),
-                    originallink=item.get("originallink", ""),
-                    link=item.get("link", ""),
-                    description=self._clean_html_tags(item.get("description", "")),
-                    pubDate=item.get("pubDate", ""),
-                    source="naver"
-                )
-                news_items.append(news_item)
-            
+            news_items = await asyncio.to_thread(self.build_items, data.get("items", []))
+
             return NewsResponse(
                 company=request.company_name,
                 total=data.get("total", 0),
@@ -70,14 +254,11 @@ class NaverNewsService:
                 display=data.get("display", 10),
                 items=news_items
             )
-            
-        except requests.exceptions.RequestException as e:
-            raise HTTPException(
-                status_code=500, 
-                detail=f"네이버 API 호출 중 오류가 발생했습니다: {str(e)}"
-            )
+
+        except HTTPException:
+            raise
         except Exception as e:
             raise HTTPException(
-                status_code=500, 
+                status_code=500,
                 detail=f"서버 오류가 발생했습니다: {str(e)}"
             )
@@ -0,0 +1,83 @@
+"""
+응답 필드 선택 (fields=, profile=)
+"""
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from fastapi import HTTPException
+from ..models.news import NewsItem, DeepSearchNewsItem, StoredArticle
+
+
+# 아이템 종류별 선택 가능한 필드
+ITEM_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "naver": tuple(NewsItem.model_fields),
+    "deepsearch": tuple(DeepSearchNewsItem.model_fields),
+    "stored": tuple(StoredArticle.model_fields),
+}
+
+# 아이템 밖의 응답 필드 중 fields=로 고를 수 있는 것 (필드를 선택하면 고른 것만 응답에 포함)
+RESPONSE_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "naver": ("total",),
+    "deepsearch": ("total",),
+    "stored": (),
+}
+
+# 이름 있는 필드 묶음 (None이면 모든 필드)
+PROFILES: Dict[str, Optional[Dict[str, Tuple[str, ...]]]] = {
+    "minimal": {
+        "naver": ("title", "link", "pubDate"),
+        "deepsearch": ("title", "url", "published_at"),
+        "stored": ("title", "url", "published_at"),
+    },
+    "full": None,
+}
+
+
+def resolve_fields(fields: Optional[str], profile: Optional[str], kind: str) -> Optional[Tuple[str, ...]]:
+    """
+    요청한 아이템 필드 목록 반환 (None이면 필드 선택 없이 전체 응답)
+
+    fields는 쉼표로 구분한 필드 이름(아이템 필드와 total 같은 응답 필드)이며, profile과 함께 주면 fields가 우선합니다.
+    """
+    if fields:
+        names = tuple(dict.fromkeys(name.strip() for name in fields.split(",") if name.strip()))
+        allowed = ITEM_FIELDS[kind] + RESPONSE_FIELDS[kind]
+        unknown = [name for name in names if name not in allowed]
+        if unknown:
+            raise HTTPException(
+                status_code=400,
+                detail=f"지원하지 않는 필드입니다: {', '.join(unknown)} (가능한 필드: {', '.join(allowed)})"
+            )
+        return names or None
+    if profile:
+        if profile not in PROFILES:
+            raise HTTPException(
+                status_code=400,
+                detail=f"지원하지 않는 profile입니다: {profile} (가능한 profile: {', '.join(PROFILES)})"
+            )
+        selected = PROFILES[profile]
+        return selected[kind] if selected else None
+    return None
+
+
+def item_fields(fields: Sequence[str], kind: str) -> Tuple[str, ...]:
+    """선택한 필드 중 아이템 필드만 반환"""
+    return tuple(field for field in fields if field in ITEM_FIELDS[kind])
+
+
+def project_content(content: dict, fields: Sequence[str], kind: str) -> dict:
+    """응답 딕셔너리에서 선택하지 않은 응답 필드(total 등)를 뺌"""
+    for name in RESPONSE_FIELDS[kind]:
+        if name not in fields:
+            content.pop(name, None)
+    return content
+
+
+def project_items(items: Iterable, fields: Sequence[str]) -> List[dict]:
+    """모델(또는 딕셔너리) 아이템에서 요청한 필드만 꺼냄 (model_dump 없이 속성만 읽음)"""
+    projected = []
+    for item in items:
+        if isinstance(item, dict):
+            projected.append({field: item.get(field) for field in fields})
+        else:
+            projected.append({field: getattr(item, field) for field in fields})
+    return projected
@@ -0,0 +1,115 @@
+"""
+기업 별칭 검색 계획 서비스
+"""
+import asyncio
+from email.utils import parsedate_to_datetime
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from fastapi import HTTPException
+from ..core.settings import settings
+from ..models.news import NewsResponse, CompanyNewsRequest
+from .naver_news import NAVER_MAX_DISPLAY, NAVER_MAX_START, NaverNewsService
+from .company_dictionary import CompanyDictionary, get_company_dictionary
+from .enrichment import ArticleRecord
+
+
+def _published_timestamp(raw_item: dict) -> float:
+    """정렬용 발행 시각 (파싱 실패 시 0)"""
+    try:
+        return parsedate_to_datetime(raw_item.get("pubDate", "")).timestamp()
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class CompanyQueryPlanner:
+    """
+    기업 별칭 검색 계획 클래스
+
+    기업명을 사전의 별칭 집합(기업명, 별칭, 종목코드)으로 확장해 네이버에 동시에 질의하고,
+    결과를 URL 기준으로 합쳐 하나의 목록으로 반환합니다. 페이지(start, display)는 합친 순위에서
+    자르므로, 검색어마다 1번부터 start+display-1번째 결과까지 가져옵니다. 캐시 키는 검색어 단위이므로
+    별칭을 공유하는 기업들은 같은 캐시 항목을 재사용합니다.
+    """
+
+    def __init__(
+        self,
+        naver_service: Optional[NaverNewsService] = None,
+        dictionary: Optional[CompanyDictionary] = None
+    ):
+        self.naver_service = naver_service or NaverNewsService()
+        self.dictionary = dictionary or get_company_dictionary()
+        self.max_queries = settings.query_planner_max_queries
+
+    def expand(self, company_name: str) -> List[str]:
+        """기업명을 검색어 목록으로 확장 (사전에 없으면 입력값만 사용)"""
+        entry = self.dictionary.get(company_name)
+        if entry is None:
+            return [company_name]
+        queries = [company_name, entry["name"], *entry.get("aliases", [])]
+        if entry.get("ticker"):
+            queries.append(entry["ticker"])
+        return list(dict.fromkeys(query for query in queries if query))[:self.max_queries]
+
+    async def _merged_page(self, request: CompanyNewsRequest) -> Tuple[int, List[dict]]:
+        """별칭 검색 결과를 합쳐 최신순으로 정렬한 페이지의 (전체 건수, 원본 아이템 목록) 반환"""
+        queries = self.expand(request.company_name)
+        # 검색어별 최신순 상위 depth개의 합집합에 합친 순위의 상위 depth개가 모두 들어 있음
+        depth = min(request.start + request.display - 1, NAVER_MAX_START + NAVER_MAX_DISPLAY - 1)
+        results = await asyncio.gather(
+            *(self.naver_service.fetch_page(query, depth, 1) for query in queries),
+            return_exceptions=True
+        )
+
+        pages = [result for result in results if not isinstance(result, BaseException)]
+        if not pages:
+            error = results[0]
+            if isinstance(error, HTTPException):
+                raise error
+            raise HTTPException(status_code=500, detail=f"서버 오류가 발생했습니다: {str(error)}")
+
+        # URL 기준 중복 제거 (여러 별칭에서 찾은 기사일수록 우선)
+        merged: Dict[str, dict] = {}
+        query_hits: Dict[str, int] = {}
+        for page in pages:
+            for raw_item in page.get("items", []):
+                url = raw_item.get("originallink") or raw_item.get("link", "")
+                if not url:
+                    continue
+                merged.setdefault(url, raw_item)
+                query_hits[url] = query_hits.get(url, 0) + 1
+
+        ranked = sorted(
+            merged.items(),
+            key=lambda pair: (_published_timestamp(pair[1]), query_hits[pair[0]]),
+            reverse=True
+        )
+        offset = request.start - 1
+        selected = ranked[offset:offset + request.display]
+        return max(page.get("total", 0) for page in pages), [raw_item for _, raw_item in selected]
+
+    async def search_company_news(self, request: CompanyNewsRequest) -> NewsResponse:
+        """별칭 검색 결과를 합쳐 최신순으로 정렬한 뉴스 목록 반환"""
+        total, raw_items = await self._merged_page(request)
+        news_items = await asyncio.to_thread(self.naver_service.build_items, raw_items)
+
+        return NewsResponse(
+            company=request.company_name,
+            total=total,
+            start=request.start,
+            display=len(news_items),
+            items=news_items
+        )
+
+    async def search_company_news_projected(
+        self, request: CompanyNewsRequest, fields: Sequence[str]
+    ) -> Tuple[dict, List[ArticleRecord]]:
+        """별칭 검색 (필드 선택). (응답 딕셔너리, 수집용 레코드 목록)을 반환"""
+        total, raw_items = await self._merged_page(request)
+        items = await asyncio.to_thread(self.naver_service.project_raw_items, raw_items, fields)
+        return {
+            "company": request.company_name,
+            "total": total,
+            "start": request.start,
+            "display": len(items),
+            "items": items,
+        }, self.naver_service.raw_records(raw_items)
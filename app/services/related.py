@@ -0,0 +1,441 @@
+"""
+관련 기사 서비스 (해시 TF-IDF 벡터 행렬의 코사인 유사도 검색)
+"""
+import asyncio
+import fcntl
+import json
+import os
+import threading
+import time
+import zlib
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ..core.settings import settings
+from ..utils.dates import epoch_seconds
+from ..utils.text import compact_text
+from .article_store import ArticleStore, get_article_store
+from .ingestion import add_article_listener, remove_article_listener
+
+
+# 문서 빈도(df)를 세는 토큰 해시 공간 (crc32 하위 20비트)
+_DF_BITS = 20
+_DF_MASK = (1 << _DF_BITS) - 1
+
+# 청크마다 열 하나씩 파일로 두는 행 메타데이터 (필터 비교가 연속 메모리에서 이루어지도록)
+_META_COLUMNS = {"id": np.int64, "company": np.int32, "published": np.int64}
+
+
+def token_hashes(text: str) -> Tuple[np.ndarray, np.ndarray]:
+    """공백/기호를 뺀 소문자 텍스트의 문자 bigram을 crc32로 바꿔 (고유 해시, 등장 횟수) 반환"""
+    text = compact_text(text)
+    if len(text) < 2:
+        grams = Counter([text] if text else [])
+    else:
+        grams = Counter(text[i:i + 2] for i in range(len(text) - 1))
+    hashes = np.fromiter((zlib.crc32(gram.encode("utf-8")) for gram in grams), dtype=np.uint32, count=len(grams))
+    counts = np.fromiter(grams.values(), dtype=np.float32, count=len(grams))
+    return hashes, counts
+
+
+class RelatedArticleIndex:
+    """
+    관련 기사 색인 클래스
+
+    저장된 기사(제목+설명)마다 문자 bigram의 TF-IDF 가중치를 부호 있는 특성 해싱으로 RELATED_DIMENSIONS 차원에
+    모은 뒤 L2 정규화한 float32 벡터를 만들어, RELATED_CHUNK_ROWS행씩 청크 파일(np.memmap)에 추가만 합니다.
+    조회는 청크마다 (질의 x 차원) @ (차원 x 행) 행렬 곱으로 코사인 유사도를 한 번에 구하고, 기업/기간 조건은
+    행 메타데이터 마스크로 걸러 argpartition으로 상위 K개만 남깁니다. 저장소의 기사 id 순서로 색인하므로
+    재시작하면 마지막으로 색인한 id 다음부터 이어서 채웁니다.
+
+    색인 디렉터리에는 한 프로세스만 쓸 수 있습니다(파일 잠금). 잠금을 얻지 못한 프로세스(여러 API 워커,
+    수집 워커와 함께 실행되는 읽기 전용 API)는 조회 때 상태 파일이 바뀌었으면 새 행을 다시 읽습니다.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        store: Optional[ArticleStore] = None,
+        dimensions: Optional[int] = None,
+        chunk_rows: Optional[int] = None
+    ):
+        self.path = path or settings.related_index_path
+        self.store = store or get_article_store()
+        self.dimensions = dimensions or settings.related_dimensions
+        self.chunk_rows = chunk_rows or settings.related_chunk_rows
+        self.batch_size = settings.related_sync_batch_size
+
+        self.writer = False
+        self.rows = 0
+        self.last_id = 0
+        self.documents = 0
+        self.companies: List[str] = []
+        self._company_codes: Dict[str, int] = {}
+        self._df = np.zeros(1 << _DF_BITS, dtype=np.int32)
+        # 청크마다 {"vectors": (행 x 차원), "id"/"company"/"published": (행,)} memmap
+        self._chunks: List[Dict[str, np.memmap]] = []
+        # 다 찬 청크의 발행 시각 (최소, 최대), 기간 조건에 해당하지 않는 청크를 건너뛰는 데 사용
+        self._bounds: Dict[int, Tuple[int, int]] = {}
+        self._state_mtime = None
+        self._lock_file = None
+        # 조회 스레드가 일관된 (행 수, 청크 목록)을 보도록 보호
+        self._lock = threading.Lock()
+        self._sync_lock = asyncio.Lock()
+        self._dirty = False
+        self._task: Optional[asyncio.Task] = None
+        self._started = False
+
+    # 파일 경로
+
+    def _file(self, name: str) -> str:
+        return os.path.join(self.path, name)
+
+    def _chunk_file(self, column: str, chunk: int) -> str:
+        return self._file(f"{column}-{chunk:05d}.bin")
+
+    # 열기/상태 저장
+
+    def open(self) -> bool:
+        """색인 디렉터리를 열고 쓰기 잠금을 얻었는지 반환"""
+        os.makedirs(self.path, exist_ok=True)
+        if self._lock_file is None:
+            self._lock_file = open(self._file("index.lock"), "a+")
+            try:
+                fcntl.flock(self._lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                self.writer = True
+            except OSError:
+                self.writer = False
+        self._load_state(force=True)
+        return self.writer
+
+    def close(self):
+        with self._lock:
+            self._chunks, self._bounds = [], {}
+        if self._lock_file is not None:
+            self._lock_file.close()
+            self._lock_file = None
+            self.writer = False
+
+    def _load_state(self, force: bool = False):
+        """상태 파일이 바뀌었으면 문서 빈도와 청크 파일을 다시 읽음"""
+        try:
+            mtime = os.stat(self._file("state.json")).st_mtime_ns
+        except FileNotFoundError:
+            return
+        if not force and mtime == self._state_mtime:
+            return
+        with open(self._file("state.json"), encoding="utf-8") as f:
+            state = json.load(f)
+        if state["dimensions"] != self.dimensions or state["chunk_rows"] != self.chunk_rows:
+            if not self.writer:
+                print("관련 기사 색인의 차원/청크 크기가 설정과 달라 읽지 않습니다.")
+                return
+            # 설정이 바뀌면 처음부터 다시 색인
+            self._reset()
+            return
+        df = np.load(self._file("df.npy"))
+        with self._lock:
+            if state["rows"] < self.rows:
+                # 쓰기 프로세스가 색인을 다시 만들었으면 청크 파일도 새로 열기
+                self._chunks, self._bounds = [], {}
+            self.rows = state["rows"]
+            self.last_id = state["last_id"]
+            self.documents = state["documents"]
+            self.companies = state["companies"]
+            self._company_codes = {name: code for code, name in enumerate(self.companies)}
+            self._df = df
+            chunks = -(-self.rows // self.chunk_rows)
+            for chunk in range(len(self._chunks), chunks):
+                self._map_chunk(chunk)
+        self._state_mtime = mtime
+
+    def _map_chunk(self, chunk: int, create: bool = False):
+        columns = {"vectors": (np.float32, (self.chunk_rows, self.dimensions))}
+        columns.update((name, (dtype, (self.chunk_rows,))) for name, dtype in _META_COLUMNS.items())
+        mode = "r+" if self.writer else "r"
+        maps = {}
+        for name, (dtype, shape) in columns.items():
+            file = self._chunk_file(name, chunk)
+            if create:
+                # 청크 크기만큼 미리 잡아 둔(sparse) 파일에 행을 채워 나감
+                with open(file, "wb") as f:
+                    f.truncate(int(np.prod(shape)) * np.dtype(dtype).itemsize)
+            maps[name] = np.memmap(file, dtype=dtype, mode=mode, shape=shape)
+        self._chunks.append(maps)
+
+    def _save_state(self):
+        """청크를 디스크에 내린 뒤 문서 빈도와 상태 파일을 원자적으로 교체 (읽는 프로세스는 상태 파일 기준)"""
+        for maps in self._chunks:
+            for column in maps.values():
+                column.flush()
+        with open(self._file("df.npy.tmp"), "wb") as f:
+            np.save(f, self._df)
+        os.replace(self._file("df.npy.tmp"), self._file("df.npy"))
+        state = {
+            "dimensions": self.dimensions, "chunk_rows": self.chunk_rows, "rows": self.rows,
+            "last_id": self.last_id, "documents": self.documents, "companies": self.companies,
+        }
+        with open(self._file("state.json.tmp"), "w", encoding="utf-8") as f:
+            json.dump(state, f, ensure_ascii=False)
+        os.replace(self._file("state.json.tmp"), self._file("state.json"))
+        self._state_mtime = os.stat(self._file("state.json")).st_mtime_ns
+
+    def _reset(self):
+        """색인을 비우고 처음부터 다시 채우도록 초기화 (쓰기 프로세스 전용)"""
+        with self._lock:
+            self._chunks, self._bounds = [], {}
+            self.rows = self.last_id = self.documents = 0
+            self.companies, self._company_codes = [], {}
+            self._df = np.zeros(1 << _DF_BITS, dtype=np.int32)
+        for name in os.listdir(self.path):
+            if name.startswith(tuple(f"{column}-" for column in ("vectors", *_META_COLUMNS))):
+                os.remove(self._file(name))
+        self._save_state()
+
+    # 벡터화
+
+    def _weights(self, hashes: np.ndarray, counts: np.ndarray) -> np.ndarray:
+        """부호 있는 해싱으로 모은 TF-IDF 벡터 (L2 정규화)"""
+        df = self._df[hashes & _DF_MASK]
+        idf = np.log((1.0 + self.documents) / (1.0 + df)) + 1.0
+        weights = (1.0 + np.log(counts)) * idf
+        # 차원과 부호는 df 버킷과 겹치지 않는 상위 비트에서
+        signs = np.where(hashes >> 31, -1.0, 1.0)
+        vector = np.bincount((hashes >> _DF_BITS) % self.dimensions, weights=weights * signs,
+                             minlength=self.dimensions).astype(np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    def vectorize(self, title: str, description: str) -> np.ndarray:
+        """현재 문서 빈도 기준의 질의 벡터"""
+        return self._weights(*token_hashes(f"{title} {description}"))
+
+    def _company_code(self, company: str) -> int:
+        code = self._company_codes.get(company)
+        if code is None:
+            code = len(self.companies)
+            self.companies.append(company)
+            self._company_codes[company] = code
+        return code
+
+    def append(self, ids: np.ndarray, companies: np.ndarray, published: np.ndarray, vectors: np.ndarray):
+        """벡터 행을 청크 끝에 추가 (쓰기 프로세스 전용, 상태 저장은 호출자가)"""
+        offset = 0
+        while offset < len(ids):
+            chunk, row = divmod(self.rows, self.chunk_rows)
+            if chunk == len(self._chunks):
+                with self._lock:
+                    self._map_chunk(chunk, create=True)
+            count = min(len(ids) - offset, self.chunk_rows - row)
+            maps = self._chunks[chunk]
+            for name, values in (("vectors", vectors), ("id", ids), ("company", companies), ("published", published)):
+                maps[name][row:row + count] = values[offset:offset + count]
+            with self._lock:
+                self.rows += count
+            offset += count
+
+    def index_articles(self, articles: List[dict]):
+        """저장소에서 id 순서로 읽은 기사들을 색인 (문서 빈도를 먼저 반영한 뒤 벡터화)"""
+        if not articles:
+            return
+        tokens = [token_hashes(f"{article['title']} {article['description']}") for article in articles]
+        for hashes, _ in tokens:
+            np.add.at(self._df, hashes & _DF_MASK, 1)
+        self.documents += len(articles)
+        vectors = np.stack([self._weights(hashes, counts) for hashes, counts in tokens])
+        ids = np.array([article["id"] for article in articles], dtype=np.int64)
+        companies = np.array([self._company_code(article["company"]) for article in articles], dtype=np.int32)
+        published = np.array([epoch_seconds(article["published_at"]) or 0 for article in articles], dtype=np.int64)
+        self.append(ids, companies, published, vectors)
+        self.last_id = int(ids[-1])
+        self._save_state()
+
+    # 저장소 추종
+
+    def sync_once(self) -> int:
+        """마지막으로 색인한 id 이후의 기사를 최대 batch_size개 색인하고 색인한 수를 반환"""
+        if self.store.last_id() < self.last_id:
+            # 저장소가 새로 만들어졌으면 처음부터
+            print("기사 저장소가 바뀌어 관련 기사 색인을 다시 만듭니다.")
+            self._reset()
+        articles = self.store.articles_after(None, self.last_id, self.batch_size)
+        self.index_articles(articles)
+        return len(articles)
+
+    async def sync(self):
+        """저장소에 쌓인 새 기사를 모두 색인 (진행 중이면 끝난 뒤 한 번 더)"""
+        self._dirty = True
+        if self._sync_lock.locked():
+            return
+        async with self._sync_lock:
+            while self._dirty:
+                self._dirty = False
+                try:
+                    while await asyncio.to_thread(self.sync_once) >= self.batch_size:
+                        pass
+                except Exception as e:
+                    print(f"관련 기사 색인 중 오류가 발생했습니다: {str(e)}")
+
+    async def on_new_articles(self, company: str, articles: List[dict]):
+        """수집 리스너: 새 기사가 저장되면 저장소에서 이어서 색인"""
+        await self.sync()
+
+    async def start(self):
+        """색인을 열고, 쓰기 잠금을 얻었으면 밀린 기사를 백그라운드에서 색인하고 새 기사 리스너 등록"""
+        if self._started:
+            return
+        self._started = True
+        writer = await asyncio.to_thread(self.open)
+        if writer:
+            add_article_listener(self.on_new_articles)
+            # 처음 색인은 오래 걸릴 수 있으므로 시작을 막지 않음
+            self._task = asyncio.create_task(self.sync())
+
+    def stop(self):
+        """새 기사 리스너 해제, 색인 닫기"""
+        remove_article_listener(self.on_new_articles)
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self.close()
+        self._started = False
+
+    # 조회
+
+    def _published_bounds(self, chunk: int, maps: Dict[str, np.memmap], count: int) -> Tuple[int, int]:
+        """청크 행들의 발행 시각 (최소, 최대), 다 찬 청크는 더 바뀌지 않으므로 기억해 둠"""
+        bounds = self._bounds.get(chunk)
+        if bounds is None:
+            published = maps["published"][:count]
+            bounds = (int(published.min()), int(published.max()))
+            if count == self.chunk_rows:
+                self._bounds[chunk] = bounds
+        return bounds
+
+    def search(
+        self,
+        queries: np.ndarray,
+        k: int,
+        company: Optional[str] = None,
+        since: Optional[float] = None
+    ) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """
+        질의 벡터(질의 수 x 차원)마다 코사인 유사도 상위 k개의 (기사 id, 점수)를 점수 내림차순으로 반환
+
+        company/since가 주어지면 그 기업의 행, since(epoch 초) 이후 발행된 행만 후보로 삼습니다.
+        """
+        if not self.writer:
+            self._load_state()
+        with self._lock:
+            rows = self.rows
+            chunks = list(self._chunks)
+            code = self._company_codes.get(company) if company is not None else None
+        queries = np.ascontiguousarray(queries, dtype=np.float32)
+        best_scores = np.full((len(queries), 0), -np.inf, dtype=np.float32)
+        best_ids = np.zeros((len(queries), 0), dtype=np.int64)
+        if company is not None and code is None:
+            return [(ids, scores) for ids, scores in zip(best_ids, best_scores)]
+
+        for chunk, maps in enumerate(chunks):
+            count = min(self.chunk_rows, rows - chunk * self.chunk_rows)
+            if count <= 0:
+                break
+            mask = None
+            if since is not None:
+                low, high = self._published_bounds(chunk, maps, count)
+                if high < since:
+                    continue
+                if low < since:
+                    mask = maps["published"][:count] >= since
+            if code is not None:
+                same = maps["company"][:count] == code
+                mask = same if mask is None else mask & same
+
+            ids = maps["id"][:count]
+            if mask is None:
+                scores = queries @ maps["vectors"][:count].T
+            else:
+                selected = np.flatnonzero(mask)
+                if not len(selected):
+                    continue
+                if len(selected) * 2 < count:
+                    # 조건에 맞는 행이 적으면 그 행만 모아서 곱함
+                    scores = queries @ maps["vectors"][selected].T
+                else:
+                    scores = (queries @ maps["vectors"][:count].T)[:, selected]
+                ids = ids[selected]
+
+            candidates = scores.shape[1]
+            if candidates > k:
+                top = np.argpartition(scores, candidates - k, axis=1)[:, candidates - k:]
+                scores = np.take_along_axis(scores, top, axis=1)
+            else:
+                top = np.broadcast_to(np.arange(candidates), scores.shape)
+            # 지금까지의 상위 k개와 합쳐 다시 상위 k개만
+            best_scores = np.concatenate([best_scores, scores], axis=1)
+            best_ids = np.concatenate([best_ids, np.asarray(ids)[top]], axis=1)
+            if best_scores.shape[1] > k:
+                keep = np.argpartition(best_scores, best_scores.shape[1] - k, axis=1)[:, -k:]
+                best_scores = np.take_along_axis(best_scores, keep, axis=1)
+                best_ids = np.take_along_axis(best_ids, keep, axis=1)
+
+        results = []
+        for ids, scores in zip(best_ids, best_scores):
+            order = np.argsort(-scores, kind="stable")
+            results.append((ids[order], scores[order]))
+        return results
+
+    def related(
+        self,
+        url: str,
+        limit: int = 10,
+        company: Optional[str] = None,
+        days: Optional[float] = None
+    ) -> Optional[List[dict]]:
+        """
+        저장된 기사와 내용이 비슷한 기사 목록 (유사도 순, 기사가 없으면 None)
+
+        같은 기사가 여러 기업 검색으로 저장되어 있으면 한 번만 반환합니다.
+        """
+        article = self.store.get_article(url)
+        if article is None:
+            return None
+        query = self.vectorize(article["title"], article["description"])[None, :]
+        since = time.time() - days * 86400 if days is not None else None
+
+        k = limit * 4 + 1
+        while True:
+            ids, scores = self.search(query, k, company, since)[0]
+            found = {item["id"]: item for item in self.store.articles_by_ids(ids.tolist())}
+            items, seen = [], {url}
+            for article_id, score in zip(ids.tolist(), scores.tolist()):
+                item = found.get(article_id)
+                if item is None or item["url"] in seen:
+                    continue
+                seen.add(item["url"])
+                items.append(dict(item, score=round(score, 4)))
+                if len(items) == limit:
+                    return items
+            # 중복 기사가 많아 모자라면 후보를 늘려 다시
+            if len(ids) < k or k >= self.rows:
+                return items
+            k *= 4
+
+    def stats(self) -> dict:
+        return {
+            "writer": self.writer, "rows": self.rows, "last_id": self.last_id,
+            "chunks": len(self._chunks), "dimensions": self.dimensions,
+        }
+
+
+_index: Optional[RelatedArticleIndex] = None
+
+
+def get_related_index() -> RelatedArticleIndex:
+    """전역 관련 기사 색인 인스턴스 반환"""
+    global _index
+    if _index is None:
+        _index = RelatedArticleIndex()
+    return _index
@@ -0,0 +1,154 @@
+"""
+로컬 감정 분석 서비스 (한국어 금융 뉴스 사전 기반)
+"""
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from ..core.settings import settings
+
+
+# 어간 -> 가중치. 어절은 가장 긴 어간 접두어로 매칭합니다 (예: "급등세로" -> "급등").
+POSITIVE_TERMS = {
+    "상승": 1.0, "급등": 2.0, "강세": 1.0, "반등": 1.0, "호조": 1.5, "호실적": 2.0, "흑자": 1.5,
+    "최대": 0.5, "최고": 0.5, "신고가": 1.5, "성장": 1.0, "증가": 0.5, "개선": 1.0, "확대": 0.5,
+    "수주": 1.0, "계약": 0.5, "돌파": 1.0, "기대": 0.5, "긍정": 1.0, "호재": 2.0, "상향": 1.0,
+    "매수": 0.5, "배당": 0.5, "혁신": 0.5, "선정": 0.5, "수상": 0.5, "회복": 1.0, "견조": 1.0,
+    "순항": 1.0, "신기록": 1.5, "흥행": 1.0, "인수": 0.3, "투자유치": 1.0,
+    "surge": 1.5, "gain": 1.0, "rally": 1.0, "beat": 1.0, "upgrade": 1.0, "record": 0.5,
+    "growth": 1.0, "profit": 0.5,
+}
+NEGATIVE_TERMS = {
+    "하락": -1.0, "급락": -2.0, "약세": -1.0, "폭락": -2.5, "부진": -1.5, "적자": -1.5, "손실": -1.5,
+    "감소": -0.5, "악화": -1.5, "우려": -1.0, "위기": -1.5, "리스크": -1.0, "하향": -1.0, "매도": -0.5,
+    "소송": -1.0, "제재": -1.5, "과징금": -1.5, "벌금": -1.5, "리콜": -1.5, "결함": -1.5, "사고": -1.5,
+    "파업": -1.5, "횡령": -2.0, "배임": -2.0, "압수수색": -2.0, "기소": -1.5, "부도": -2.5,
+    "파산": -2.5, "상장폐지": -2.5, "감자": -1.5, "신저가": -1.5, "충격": -1.0, "악재": -2.0,
+    "쇼크": -1.5, "철회": -1.0, "중단": -1.0, "경고": -1.0, "둔화": -1.0, "침체": -1.5,
+    "plunge": -2.0, "drop": -1.0, "loss": -1.0, "downgrade": -1.0, "lawsuit": -1.0, "recall": -1.5,
+    "fraud": -2.0, "miss": -1.0,
+}
+LEXICON: Dict[str, float] = {**POSITIVE_TERMS, **NEGATIVE_TERMS}
+
+# 바로 뒤 어절이 이 접두어로 시작하면 앞 어절의 극성을 뒤집습니다 ("상승하지 않았다")
+_NEGATION_PREFIXES = ("않", "못", "없", "아니")
+_TOKEN_PATTERN = re.compile(r"[가-힣]+|[a-z]+")
+
+
+def content_hash(title: str, description: str) -> str:
+    """기사 내용 해시 (감정 점수 캐시 키)"""
+    return hashlib.blake2b(f"{title}\x00{description}".encode("utf-8"), digest_size=16).hexdigest()
+
+
+class SentimentScorer:
+    """
+    사전 기반 감정 분석 클래스
+
+    배치 단위로 점수를 계산합니다. 배치 안의 고유 어절만 한 번씩 사전에서 가중치를 찾고
+    (어절별 가중치는 다시 캐시), 기사 점수는 어절 가중치의 합으로 계산합니다.
+    같은 내용의 기사는 내용 해시로 캐시된 결과를 재사용합니다.
+    """
+
+    def __init__(self, lexicon: Optional[Dict[str, float]] = None, cache_size: Optional[int] = None,
+                 threshold: float = 1.0):
+        self.lexicon = lexicon or LEXICON
+        self.cache_size = cache_size or settings.sentiment_cache_size
+        self.threshold = threshold
+        self._max_stem = max(len(term) for term in self.lexicon)
+        # 어절별 가중치 캐시 (여러 스레드의 배치가 공유하므로 _lock으로 보호)
+        self._token_weights: Dict[str, float] = {}
+        self._token_cache_size = 200_000
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _token_weight(self, token: str) -> float:
+        """어절의 가장 긴 어간 접두어 가중치"""
+        for length in range(min(len(token), self._max_stem), 1, -1):
+            weight = self.lexicon.get(token[:length])
+            if weight is not None:
+                return weight
+        return 0.0
+
+    def _label(self, score: float) -> str:
+        if score >= self.threshold:
+            return "positive"
+        if score <= -self.threshold:
+            return "negative"
+        return "neutral"
+
+    def score_texts(self, texts: Sequence[str]) -> List[float]:
+        """텍스트 배치의 감정 점수 계산"""
+        tokenized = [_TOKEN_PATTERN.findall(text.lower()) for text in texts]
+
+        # 배치의 고유 어절에 대해서만 가중치 조회 (공유 캐시에서 배치 전용 딕셔너리로 복사해 사용)
+        unique = {token for tokens in tokenized for token in tokens}
+        with self._lock:
+            cached = self._token_weights
+            weights = {token: cached[token] for token in unique if token in cached}
+        missing = {token: self._token_weight(token) for token in unique if token not in weights}
+        if missing:
+            weights.update(missing)
+            with self._lock:
+                if len(self._token_weights) + len(missing) > self._token_cache_size:
+                    self._token_weights.clear()
+                self._token_weights.update(missing)
+
+        scores = []
+        for tokens in tokenized:
+            values = [weights[token] for token in tokens]
+            score = 0.0
+            for i, value in enumerate(values):
+                if value and i + 1 < len(tokens) and tokens[i + 1].startswith(_NEGATION_PREFIXES):
+                    value = -value
+                score += value
+            scores.append(score)
+        return scores
+
+    def score_batch(self, documents: Iterable[tuple]) -> List[str]:
+        """(제목, 설명) 배치의 감정 레이블 반환 (캐시된 문서는 다시 계산하지 않음)"""
+        documents = list(documents)
+        keys = [content_hash(title, description) for title, description in documents]
+        labels: List[Optional[str]] = [None] * len(documents)
+
+        with self._lock:
+            for i, key in enumerate(keys):
+                label = self._cache.get(key)
+                if label is not None:
+                    self._cache.move_to_end(key)
+                    labels[i] = label
+
+        pending = [i for i, label in enumerate(labels) if label is None]
+        if pending:
+            # 제목은 설명보다 두 번 반영
+            texts = [f"{documents[i][0]} {documents[i][0]} {documents[i][1]}" for i in pending]
+            scores = self.score_texts(texts)
+            with self._lock:
+                for i, score in zip(pending, scores):
+                    label = labels[i] = self._label(score)
+                    self._cache[keys[i]] = label
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+        return labels
+
+    def score_items(self, items: Sequence) -> None:
+        """sentiment가 비어 있는 뉴스 아이템에 감정 레이블을 채웁니다."""
+        targets = [item for item in items if not getattr(item, "sentiment", None)]
+        if not targets:
+            return
+        labels = self.score_batch((item.title, item.description) for item in targets)
+        for item, label in zip(targets, labels):
+            item.sentiment = label
+
+
+_scorer: Optional[SentimentScorer] = None
+
+
+def get_sentiment_scorer() -> SentimentScorer:
+    """전역 감정 분석기 인스턴스 반환"""
+    global _scorer
+    if _scorer is None:
+        _scorer = SentimentScorer()
+    return _scorer
@@ -0,0 +1,92 @@
+"""
+기사 저장소 추종 서비스 (읽기 전용 API 워커용)
+"""
+import asyncio
+from typing import Dict, List, Optional
+
+from ..core.settings import settings
+from .article_store import ArticleStore, get_article_store
+from .ingestion import notify_article_listeners
+
+
+class StoreFollower:
+    """
+    기사 저장소 추종 클래스
+
+    API 워커가 수집하지 않는 읽기 전용 모드에서, 수집 워커가 저장한 새 기사를 id 순서로 따라 읽어
+    새 기사 리스너(뉴스량 집계, 급상승 탐지 등 워커 메모리의 읽기 모델)에 전달합니다.
+    mark()로 잡은 위치 이후 저장된 기사부터 전달하며, 그 이전 기사는 각 리스너가 시작할 때 저장소에서 읽습니다.
+    위치는 리스너들이 초기 적재를 하기 전에 잡아야 적재 도중 저장된 기사를 놓치지 않습니다
+    (적재와 겹쳐 다시 전달되는 기사는 각 리스너가 적재한 마지막 id 또는 URL로 건너뜀).
+
+    수집하는 API 워커(API_READ_ONLY=false)에서는 실행하지 않으므로, 워커가 여러 개면 각 워커의 읽기 모델에는
+    그 워커가 수집한 기사만 실시간으로 반영됩니다 (다른 워커의 기사는 재시작 시 적재). 워커 사이의 읽기 모델을
+    맞추려면 수집 워커와 읽기 전용 API 워커로 나눠 실행합니다.
+    """
+
+    def __init__(self, store: Optional[ArticleStore] = None):
+        self.store = store or get_article_store()
+        self.interval = settings.store_follow_interval
+        self.batch_size = settings.store_follow_batch_size
+        self.last_id = 0
+        self.delivered = 0
+        self._marked = False
+        self._task: Optional[asyncio.Task] = None
+
+    async def mark(self):
+        """추종을 시작할 위치(지금까지 저장된 마지막 id)를 잡음"""
+        if not self._marked:
+            self.last_id = await asyncio.to_thread(self.store.last_id)
+            self._marked = True
+
+    async def start(self):
+        """mark()로 잡은 위치(잡지 않았으면 현재 위치)부터 추종 시작"""
+        if self._task is not None:
+            return
+        await self.mark()
+        self._task = asyncio.create_task(self._run())
+
+    def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def poll_once(self) -> int:
+        """last_id 이후 저장된 기사를 최대 batch_size개 전달하고 전달한 수를 반환"""
+        articles = await asyncio.to_thread(self.store.articles_after, None, self.last_id, self.batch_size)
+        if not articles:
+            return 0
+        by_company: Dict[str, List[dict]] = {}
+        for article in articles:
+            by_company.setdefault(article["company"], []).append(article)
+        for company, company_articles in by_company.items():
+            await notify_article_listeners(company, company_articles)
+        self.last_id = articles[-1]["id"]
+        self.delivered += len(articles)
+        return len(articles)
+
+    async def _run(self):
+        while True:
+            try:
+                # 한 번에 다 읽지 못했으면 쉬지 않고 이어서 읽음
+                if await self.poll_once() >= self.batch_size:
+                    continue
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"기사 저장소 추종 중 오류가 발생했습니다: {str(e)}")
+            await asyncio.sleep(self.interval)
+
+    def stats(self) -> dict:
+        return {"last_id": self.last_id, "delivered": self.delivered}
+
+
+_follower: Optional[StoreFollower] = None
+
+
+def get_store_follower() -> StoreFollower:
+    """전역 저장소 추종기 인스턴스 반환"""
+    global _follower
+    if _follower is None:
+        _follower = StoreFollower()
+    return _follower
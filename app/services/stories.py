@@ -0,0 +1,247 @@
+"""
+기사 묶음(스토리) 서비스 (MinHash/LSH 온라인 클러스터링)
+"""
+import asyncio
+import heapq
+import time
+import zlib
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from typing import Deque, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from ..core.settings import settings
+from ..utils.dates import epoch_seconds
+from ..utils.text import compact_text
+from .article_store import ArticleStore, get_article_store
+from .ingestion import add_article_listener, remove_article_listener
+
+
+# 스토리마다 응답에 보여주는 최근 기사 수
+_RECENT_ARTICLES = 5
+
+
+def _iso(seconds: float) -> str:
+    return datetime.fromtimestamp(seconds, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def shingles(text: str, size: int) -> Set[str]:
+    """공백/기호를 뺀 소문자 텍스트의 문자 n-gram 집합 (한국어는 어절 경계보다 문자 단위가 안정적)"""
+    text = compact_text(text)
+    if len(text) <= size:
+        return {text} if text else set()
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+class MinHasher:
+    """
+    MinHash 서명 계산
+
+    shingle을 32비트 해시(crc32)로 바꾼 뒤 num_perm개의 multiply-shift 해시
+    ((a*x + b) mod 2^64) >> 32 의 최솟값을 서명으로 씁니다. 두 서명에서 같은 자리의 비율이
+    두 shingle 집합의 Jaccard 유사도의 추정값입니다.
+    """
+
+    def __init__(self, num_perm: int, seed: int = 1):
+        rng = np.random.default_rng(seed)
+        self.a = rng.integers(1, 2 ** 63, num_perm, dtype=np.uint64) | np.uint64(1)
+        self.b = rng.integers(0, 2 ** 63, num_perm, dtype=np.uint64)
+
+    def signature(self, items: Set[str]) -> np.ndarray:
+        hashes = np.fromiter((zlib.crc32(item.encode("utf-8")) for item in items), dtype=np.uint64, count=len(items))
+        # uint64 곱셈은 2^64로 나눈 나머지로 넘침
+        values = (self.a[:, None] * hashes[None, :] + self.b[:, None]) >> np.uint64(32)
+        return values.min(axis=1).astype(np.uint32)
+
+
+class Story:
+    """기업 하나의 기사 묶음"""
+
+    def __init__(self, story_id: int, company: str, headline: str, url: str, published: float):
+        self.story_id = story_id
+        self.company = company
+        self.headline = headline
+        self.url = url
+        self.first_seen = published
+        self.last_seen = published
+        self.count = 0
+        self.urls: Set[str] = set()
+        self.band_keys: Set[Tuple[str, int, bytes]] = set()
+        self.signatures: Deque[np.ndarray] = deque(maxlen=settings.story_recent_signatures)
+        self.recent: Deque[dict] = deque(maxlen=_RECENT_ARTICLES)
+
+    def to_dict(self) -> dict:
+        return {
+            "story_id": self.story_id,
+            "headline": self.headline,
+            "url": self.url,
+            "count": self.count,
+            "first_seen": _iso(self.first_seen),
+            "last_seen": _iso(self.last_seen),
+            "articles": list(reversed(self.recent)),
+        }
+
+
+class StoryClusterer:
+    """
+    기사 묶음(스토리) 온라인 클러스터링 클래스
+
+    새 기사마다 제목+설명의 문자 shingle로 MinHash 서명을 만들고, 서명을 bands개 구간으로 나눈
+    LSH 버킷에서 같은 기업의 후보 스토리를 찾습니다. 후보 중 발행 시각이 스토리의 처음/마지막 기사에서
+    STORY_WINDOW_HOURS 안에 있고 최근 기사 서명과의 추정 유사도가 임계값 이상인 스토리에 넣고,
+    없으면 새 스토리를 시작합니다. 비교 대상은 버킷에서 찾은 후보뿐이므로 기사 하나의 처리 비용은
+    저장된 기사 수와 무관합니다. 마지막 기사 이후 STORY_RETENTION_HOURS가 지난 스토리는 정리합니다.
+    """
+
+    def __init__(
+        self,
+        store: Optional[ArticleStore] = None,
+        threshold: Optional[float] = None,
+        window_hours: Optional[float] = None,
+        retention_hours: Optional[float] = None
+    ):
+        self.store = store or get_article_store()
+        self.threshold = threshold or settings.story_similarity_threshold
+        self.window = (window_hours or settings.story_window_hours) * 3600
+        self.retention = (retention_hours or settings.story_retention_hours) * 3600
+        self.shingle_size = settings.story_shingle_size
+        self.bands = settings.story_lsh_bands
+        self.rows = settings.story_lsh_rows
+        self.hasher = MinHasher(self.bands * self.rows)
+
+        self._stories: Dict[int, Story] = {}
+        self._by_company: Dict[str, Set[int]] = {}
+        self._buckets: Dict[Tuple[str, int, bytes], Set[int]] = {}
+        self._assigned: Dict[Tuple[str, str], int] = {}
+        # (마지막 기사 시각, 스토리 id) 최소 힙. 스토리가 갱신되면 이전 항목은 꺼낼 때 무시
+        self._expiry: List[Tuple[float, int]] = []
+        self._clock = 0.0
+        self._next_id = 1
+        self._started = False
+
+    def _band_keys(self, company: str, signature: np.ndarray) -> List[Tuple[str, int, bytes]]:
+        return [
+            (company, band, signature[band * self.rows:(band + 1) * self.rows].tobytes())
+            for band in range(self.bands)
+        ]
+
+    def _similarity(self, story: Story, signature: np.ndarray) -> float:
+        return max(float(np.mean(member == signature)) for member in story.signatures)
+
+    def _find_story(self, band_keys, signature: np.ndarray, published: float) -> Optional[Story]:
+        candidates: Set[int] = set()
+        for key in band_keys:
+            candidates.update(self._buckets.get(key, ()))
+
+        best, best_score = None, self.threshold
+        for story_id in candidates:
+            story = self._stories[story_id]
+            if not story.first_seen - self.window <= published <= story.last_seen + self.window:
+                continue
+            score = self._similarity(story, signature)
+            if score >= best_score:
+                best, best_score = story, score
+        return best
+
+    def _prune(self):
+        """마지막 기사 이후 보관 기간이 지난 스토리 정리 (가장 오래된 것부터)"""
+        horizon = self._clock - self.retention
+        while self._expiry and self._expiry[0][0] < horizon:
+            last_seen, story_id = heapq.heappop(self._expiry)
+            story = self._stories.get(story_id)
+            if story is None or story.last_seen != last_seen:
+                continue
+            del self._stories[story_id]
+            self._by_company[story.company].discard(story_id)
+            for key in story.band_keys:
+                bucket = self._buckets.get(key)
+                if bucket is not None:
+                    bucket.discard(story_id)
+                    if not bucket:
+                        del self._buckets[key]
+            for url in story.urls:
+                self._assigned.pop((story.company, url), None)
+
+    def add(self, company: str, url: str, title: str, description: str, published_at: str) -> Optional[int]:
+        """기사 하나를 스토리에 배정하고 스토리 id를 반환 (보관 기간보다 오래된 기사는 None)"""
+        assigned = self._assigned.get((company, url))
+        if assigned is not None:
+            return assigned
+
+        published = epoch_seconds(published_at)
+        if published is None:
+            published = time.time()
+        self._clock = max(self._clock, published)
+        if published < self._clock - self.retention:
+            return None
+
+        items = shingles(f"{title} {description}", self.shingle_size)
+        if not items:
+            return None
+        signature = self.hasher.signature(items)
+        band_keys = self._band_keys(company, signature)
+
+        story = self._find_story(band_keys, signature, published)
+        if story is None:
+            story = Story(self._next_id, company, title, url, published)
+            self._next_id += 1
+            self._stories[story.story_id] = story
+            self._by_company.setdefault(company, set()).add(story.story_id)
+
+        story.count += 1
+        story.urls.add(url)
+        story.first_seen = min(story.first_seen, published)
+        story.last_seen = max(story.last_seen, published)
+        story.signatures.append(signature)
+        story.recent.append({"url": url, "title": title, "published_at": published_at})
+        for key in band_keys:
+            if key not in story.band_keys:
+                story.band_keys.add(key)
+                self._buckets.setdefault(key, set()).add(story.story_id)
+        self._assigned[(company, url)] = story.story_id
+        heapq.heappush(self._expiry, (story.last_seen, story.story_id))
+
+        self._prune()
+        return story.story_id
+
+    async def on_new_articles(self, company: str, articles: List[dict]):
+        """수집 리스너: 새로 저장된 기사를 스토리에 배정"""
+        for article in articles:
+            self.add(company, article["url"], article["title"], article["description"], article["published_at"])
+
+    async def start(self):
+        """보관 기간 안의 저장된 기사로 스토리를 만들고 새 기사 리스너 등록"""
+        if self._started:
+            return
+        self._started = True
+        add_article_listener(self.on_new_articles)
+        since = (datetime.now(timezone.utc) - timedelta(seconds=self.retention)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        rows = await asyncio.to_thread(lambda: list(self.store.iter_texts_since(since)))
+        for company, url, title, description, published_at in rows:
+            self.add(company, url, title, description, published_at)
+
+    def stop(self):
+        """새 기사 리스너 해제"""
+        remove_article_listener(self.on_new_articles)
+        self._started = False
+
+    def stories(self, company: str, limit: int = 20, min_articles: int = 1) -> List[dict]:
+        """기업의 스토리 목록 (마지막 기사가 최근인 순)"""
+        stories = [
+            self._stories[story_id] for story_id in self._by_company.get(company, ())
+            if self._stories[story_id].count >= min_articles
+        ]
+        stories = heapq.nlargest(limit, stories, key=lambda story: (story.last_seen, story.count))
+        return [story.to_dict() for story in stories]
+
+
+_clusterer: Optional[StoryClusterer] = None
+
+
+def get_story_clusterer() -> StoryClusterer:
+    """전역 스토리 클러스터링 인스턴스 반환"""
+    global _clusterer
+    if _clusterer is None:
+        _clusterer = StoryClusterer()
+    return _clusterer
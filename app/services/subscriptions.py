@@ -0,0 +1,148 @@
+"""
+실시간 뉴스 구독 서비스 (WebSocket)
+"""
+import asyncio
+from collections import OrderedDict
+from typing import Dict, List, Optional, Set
+
+from fastapi import HTTPException
+from ..core.settings import settings
+from ..models.news import NewsItem
+from .naver_news import NaverNewsService
+from .ingestion import IngestionService
+
+
+class Subscriber:
+    """
+    구독자 한 명 (WebSocket 연결 하나)
+
+    전송 대기열은 크기가 제한되어 있어 느린 클라이언트 때문에 폴러가 막히지 않습니다.
+    대기열이 가득 차면 가장 오래된 메시지를 버리고, 버린 메시지가 너무 많으면 연결을 끊습니다.
+    """
+
+    def __init__(self):
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=settings.ws_queue_size)
+        self.companies: Set[str] = set()
+        self.dropped = 0
+        self.closed = asyncio.Event()
+
+    def offer(self, message: dict):
+        """메시지를 대기열에 넣습니다 (막히지 않음)"""
+        if self.closed.is_set():
+            return
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+            if self.dropped > settings.ws_max_dropped_messages:
+                self.closed.set()
+                return
+        self.queue.put_nowait(message)
+
+
+class CompanyPoller:
+    """기업 하나에 대한 공유 폴러 (구독자 수와 무관하게 업스트림 폴링은 하나)"""
+
+    def __init__(self, company: str):
+        self.company = company
+        self.subscribers: Set[Subscriber] = set()
+        self.seen: "OrderedDict[str, None]" = OrderedDict()
+        self.task: Optional[asyncio.Task] = None
+
+    def _remember(self, url: str) -> bool:
+        """처음 보는 URL이면 True"""
+        if url in self.seen:
+            return False
+        self.seen[url] = None
+        while len(self.seen) > settings.ws_seen_limit:
+            self.seen.popitem(last=False)
+        return True
+
+    def new_items(self, items: List[NewsItem]) -> List[NewsItem]:
+        """처음 보는 기사만 반환 (오래된 순)"""
+        return [item for item in reversed(items) if self._remember(item.originallink or item.link)]
+
+
+class SubscriptionHub:
+    """기업별 폴러와 구독자를 관리하는 클래스"""
+
+    def __init__(self):
+        self._pollers: Dict[str, CompanyPoller] = {}
+        # 폴러가 띄운 수집 작업 (참조를 잡아 두지 않으면 실행 중에 가비지 컬렉션될 수 있음)
+        self._ingest_tasks: Set[asyncio.Task] = set()
+
+    def subscribe(self, subscriber: Subscriber, company: str):
+        """기업 구독 (첫 구독자가 생기면 폴러 시작)"""
+        if company in subscriber.companies:
+            return
+        subscriber.companies.add(company)
+        poller = self._pollers.get(company)
+        if poller is None:
+            poller = self._pollers[company] = CompanyPoller(company)
+            poller.task = asyncio.create_task(self._run_poller(poller))
+        poller.subscribers.add(subscriber)
+
+    def unsubscribe(self, subscriber: Subscriber, company: str):
+        """기업 구독 해제 (마지막 구독자가 떠나면 폴러 종료)"""
+        subscriber.companies.discard(company)
+        poller = self._pollers.get(company)
+        if poller is None:
+            return
+        poller.subscribers.discard(subscriber)
+        if not poller.subscribers:
+            del self._pollers[company]
+            poller.task.cancel()
+
+    def remove(self, subscriber: Subscriber):
+        """연결 종료 시 모든 구독 해제"""
+        for company in list(subscriber.companies):
+            self.unsubscribe(subscriber, company)
+
+    def stats(self) -> dict:
+        """폴러/구독자 현황"""
+        return {
+            "pollers": len(self._pollers),
+            "subscriptions": {company: len(poller.subscribers) for company, poller in self._pollers.items()},
+        }
+
+    async def _run_poller(self, poller: CompanyPoller):
+        """주기적으로 최신 뉴스를 가져와 새 기사만 구독자들에게 전달"""
+        naver_service = NaverNewsService()
+        ingestion_service = IngestionService()
+        first_poll = True
+        while True:
+            try:
+                data = await naver_service.refresh_page(poller.company, settings.ws_poll_display, 1)
+                items = await asyncio.to_thread(naver_service.build_items, data.get("items", []))
+                new_items = poller.new_items(items)
+                # 첫 폴링은 기준점만 잡고 이후 새로 올라온 기사만 전달
+                if new_items and not first_poll:
+                    message = {
+                        "type": "articles",
+                        "company": poller.company,
+                        "items": [item.model_dump() for item in new_items],
+                    }
+                    for subscriber in list(poller.subscribers):
+                        subscriber.offer(message)
+                    if not settings.api_read_only:
+                        task = asyncio.create_task(ingestion_service.ingest_and_enrich(poller.company, new_items))
+                        self._ingest_tasks.add(task)
+                        task.add_done_callback(self._ingest_tasks.discard)
+                first_poll = False
+            except asyncio.CancelledError:
+                raise
+            except HTTPException as e:
+                print(f"구독 폴링 중 오류가 발생했습니다 ({poller.company}): {e.detail}")
+            except Exception as e:
+                print(f"구독 폴링 중 오류가 발생했습니다 ({poller.company}): {str(e)}")
+            await asyncio.sleep(settings.ws_poll_interval)
+
+
+_hub: Optional[SubscriptionHub] = None
+
+
+def get_subscription_hub() -> SubscriptionHub:
+    """전역 구독 허브 인스턴스 반환"""
+    global _hub
+    if _hub is None:
+        _hub = SubscriptionHub()
+    return _hub
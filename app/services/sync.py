@@ -0,0 +1,70 @@
+"""
+클라이언트 증분 동기화 서비스 (저장 순서 기준 sync token)
+"""
+import asyncio
+import base64
+import json
+from typing import Optional, Tuple
+
+from fastapi import HTTPException
+from .article_store import ArticleStore, get_article_store
+
+
+def encode_token(company: str, last_id: int) -> str:
+    """기업명과 마지막으로 받은 기사 id를 불투명한 sync token 문자열로 변환"""
+    raw = json.dumps([company, last_id], ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_token(token: str) -> Tuple[str, int]:
+    """sync token을 (기업명, 마지막 기사 id)로 변환"""
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        company, last_id = json.loads(raw)
+        if not isinstance(company, str) or not isinstance(last_id, int) or last_id < 0:
+            raise ValueError
+        return company, last_id
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="올바르지 않은 sync token입니다.")
+
+
+class SyncService:
+    """
+    기업별 증분 동기화 서비스 클래스
+
+    sync token은 클라이언트가 마지막으로 받은 기사의 저장소 id입니다. 저장소 id는 재사용되지 않으므로
+    서버를 재시작해도 토큰이 유효하며, 새 기사가 없으면 빈 목록과 같은 토큰을 돌려줍니다.
+    """
+
+    def __init__(self, store: Optional[ArticleStore] = None):
+        self.store = store or get_article_store()
+
+    def _sync(self, company: str, last_id: int, limit: int) -> dict:
+        # 다음 페이지 존재 여부를 알기 위해 하나 더 조회
+        articles = self.store.articles_after(company, last_id, limit + 1)
+        reset = False
+        if not articles and last_id > self.store.last_id():
+            # 저장소가 새로 만들어져 토큰이 가리키는 기사가 없음: 처음부터 다시 동기화
+            reset = True
+            last_id = 0
+            articles = self.store.articles_after(company, 0, limit + 1)
+        has_more = len(articles) > limit
+        articles = articles[:limit]
+        if articles:
+            last_id = articles[-1]["id"]
+        return {
+            "company": company,
+            "items": articles,
+            "next_token": encode_token(company, last_id),
+            "has_more": has_more,
+            "reset": reset,
+        }
+
+    async def sync(self, company: str, limit: int, token: Optional[str] = None) -> dict:
+        """token 이후 저장된 기사와 다음 token 반환 (token이 없으면 처음부터)"""
+        last_id = 0
+        if token:
+            token_company, last_id = decode_token(token)
+            if token_company != company:
+                raise HTTPException(status_code=400, detail="다른 기업의 sync token입니다.")
+        return await asyncio.to_thread(self._sync, company, last_id, limit)
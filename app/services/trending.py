@@ -0,0 +1,254 @@
+"""
+급상승 기업 탐지 서비스 (스트리밍 빈도 스케치)
+"""
+import asyncio
+import hashlib
+import json
+import math
+import time
+from collections import OrderedDict, deque
+from datetime import datetime, timezone
+from typing import Deque, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from ..core.settings import settings
+from ..utils.dates import epoch_seconds
+from .article_store import ArticleStore, get_article_store
+from .ingestion import add_article_listener, remove_article_listener
+
+
+class CountMinSketch:
+    """
+    Count-Min 스케치
+
+    depth x width 카운터 배열 하나로 임의 개수의 키 빈도를 과대 추정 방향으로 근사합니다.
+    스케치끼리 더하고 뺄 수 있어(선형) 여러 시간 창의 합계를 하나의 스케치로 유지할 수 있습니다.
+    """
+
+    def __init__(self, width: int, depth: int):
+        self.width = width
+        self.depth = depth
+        self.table = np.zeros((depth, width), dtype=np.int64)
+        self._rows = np.arange(depth)
+
+    def _columns(self, key: str) -> np.ndarray:
+        # 128비트 해시 하나를 두 해시로 나눠 행마다 h1 + i*h2 (double hashing)
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return np.array([(h1 + i * h2) % self.width for i in range(self.depth)])
+
+    def add(self, key: str, count: int = 1):
+        self.table[self._rows, self._columns(key)] += count
+
+    def estimate(self, key: str) -> int:
+        return int(self.table[self._rows, self._columns(key)].min())
+
+    def merge(self, other: "CountMinSketch", sign: int = 1):
+        self.table += sign * other.table
+
+
+class SpaceSaving:
+    """
+    Space-Saving 상위 K 추적
+
+    최대 capacity개의 후보만 보관하며, 가득 차면 가장 작은 카운터를 새 키에 넘겨줍니다.
+    실제 빈도가 N/capacity를 넘는 키는 반드시 후보에 남습니다.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.counts: Dict[str, int] = {}
+
+    def add(self, key: str, count: int = 1):
+        if key in self.counts:
+            self.counts[key] += count
+        elif len(self.counts) < self.capacity:
+            self.counts[key] = count
+        else:
+            smallest = min(self.counts, key=self.counts.get)
+            self.counts[key] = self.counts.pop(smallest) + count
+
+    def candidates(self) -> List[str]:
+        return list(self.counts)
+
+
+class TrendDetector:
+    """
+    기업 언급 급상승 탐지 클래스
+
+    수집된 기사의 company_mentions를 현재 시간 창의 Count-Min 스케치와 Space-Saving 후보에 반영하고,
+    지난 시간 창들의 스케치 합계를 기준선으로 삼아 후보별 급상승 점수를 계산합니다.
+    메모리는 (기준선 창 수 + 2)개의 스케치와 고정 크기 후보/URL 목록으로 제한되어
+    등장하는 기업 수와 무관합니다. 시작 시 저장된 기사를 발행 시각의 시간 창에 채워 재시작 직후에도
+    기준선과 현재 창을 갖고 시작합니다.
+    """
+
+    def __init__(
+        self,
+        window_seconds: Optional[float] = None,
+        baseline_windows: Optional[int] = None,
+        width: Optional[int] = None,
+        depth: Optional[int] = None,
+        top_k: Optional[int] = None,
+        store: Optional[ArticleStore] = None
+    ):
+        self.window_seconds = window_seconds or settings.trending_window_seconds
+        self.baseline_windows = baseline_windows or settings.trending_baseline_windows
+        self.width = width or settings.trending_sketch_width
+        self.depth = depth or settings.trending_sketch_depth
+        self.top_k = top_k or settings.trending_top_k
+        self.min_count = settings.trending_min_count
+        # 시작할 때 처음 사용 (생성만으로 저장소를 열지 않음)
+        self.store = store
+
+        # 첫 기사(또는 조회) 시각의 창에서 시작
+        self._window: Optional[int] = None
+        self._current = CountMinSketch(self.width, self.depth)
+        self._candidates = SpaceSaving(self.top_k)
+        self._history: Deque[CountMinSketch] = deque()
+        self._baseline = CountMinSketch(self.width, self.depth)
+        # 여러 기업 검색 결과에 같은 기사가 저장되어도 한 번만 집계
+        self._seen_urls: "OrderedDict[str, None]" = OrderedDict()
+        self._seen_limit = settings.trending_seen_urls
+        self._started = False
+
+    def _window_index(self, now: float) -> int:
+        return int(now // self.window_seconds)
+
+    def _rotate(self, now: float):
+        """시간 창이 바뀌었으면 현재 스케치를 기준선으로 넘김 (비어 있던 창도 기준선에 포함)"""
+        window = self._window_index(now)
+        if self._window is None:
+            self._window = window
+        # 늦게 도착한 과거 시각은 현재 창에 반영 (창을 되돌리면 현재 창이 지워짐)
+        if window <= self._window:
+            return
+        elapsed = min(window - self._window, self.baseline_windows + 1)
+        for i in range(elapsed):
+            sketch = self._current if i == 0 else CountMinSketch(self.width, self.depth)
+            self._history.append(sketch)
+            self._baseline.merge(sketch)
+            if len(self._history) > self.baseline_windows:
+                self._baseline.merge(self._history.popleft(), sign=-1)
+        self._window = window
+        self._current = CountMinSketch(self.width, self.depth)
+        # 지난 창의 후보를 카운터 0으로 이어받음 (새 창에서 언급되지 않으면 새 후보에게 먼저 밀려남)
+        previous = self._candidates
+        self._candidates = SpaceSaving(self.top_k)
+        self._candidates.counts = dict.fromkeys(previous.candidates(), 0)
+
+    def _first_seen(self, url: str) -> bool:
+        if url in self._seen_urls:
+            return False
+        self._seen_urls[url] = None
+        while len(self._seen_urls) > self._seen_limit:
+            self._seen_urls.popitem(last=False)
+        return True
+
+    def add_mentions(self, mentions: List[str], now: Optional[float] = None):
+        """기사 하나의 언급 기업들을 반영"""
+        self._rotate(time.time() if now is None else now)
+        for company in dict.fromkeys(mentions):
+            self._current.add(company)
+            self._candidates.add(company)
+
+    async def on_new_articles(self, company: str, articles: List[dict]):
+        """수집 리스너: 새로 저장된 기사의 언급 기업 반영"""
+        for article in articles:
+            if self._first_seen(article["url"]):
+                self.add_mentions(article.get("company_mentions") or [company])
+
+    def seed(self, rows: Iterable[tuple], now: Optional[float] = None):
+        """
+        저장된 기사 (company, url, published_at, company_mentions)를 발행 시각의 시간 창에 반영
+
+        기준선 범위 안의 지난 창은 기준선 스케치에, 현재 창(또는 미래 시각)은 현재 스케치와 후보에 더합니다.
+        """
+        now = time.time() if now is None else now
+        self._rotate(now)
+        first_window = self._window - self.baseline_windows
+        past: Dict[int, CountMinSketch] = {}
+        for company, url, published_at, mentions in rows:
+            timestamp = epoch_seconds(published_at)
+            if timestamp is None:
+                continue
+            window = min(self._window_index(timestamp), self._window)
+            if window < first_window or not self._first_seen(url):
+                continue
+            companies = dict.fromkeys(json.loads(mentions) if mentions else [company])
+            if window == self._window:
+                for name in companies:
+                    self._current.add(name)
+                    self._candidates.add(name)
+            else:
+                sketch = past.setdefault(window, CountMinSketch(self.width, self.depth))
+                for name in companies:
+                    sketch.add(name)
+        if not past:
+            return
+        # 기준선을 지난 baseline_windows개 창으로 채움 (기사가 없던 창도 포함, history[-1]이 바로 앞 창)
+        while len(self._history) < self.baseline_windows:
+            self._history.appendleft(CountMinSketch(self.width, self.depth))
+        for window, sketch in past.items():
+            self._history[window - first_window].merge(sketch)
+            self._baseline.merge(sketch)
+
+    async def start(self):
+        """저장된 기사로 지난 시간 창들을 채우고 새 기사 리스너 등록"""
+        if self._started:
+            return
+        self._started = True
+        # 적재 중 들어온 새 기사도 놓치지 않도록 리스너를 먼저 등록 (겹치는 기사는 URL로 한 번만 집계)
+        add_article_listener(self.on_new_articles)
+        store = self.store or get_article_store()
+        since = datetime.fromtimestamp(
+            (self._window_index(time.time()) - self.baseline_windows) * self.window_seconds, timezone.utc
+        ).strftime("%Y-%m-%dT%H:%M:%SZ")
+        rows = await asyncio.to_thread(
+            lambda: list(store.iter_published_since(since, ("company", "url", "published_at", "company_mentions")))
+        )
+        self.seed(rows)
+
+    def stop(self):
+        remove_article_listener(self.on_new_articles)
+        self._started = False
+
+    def trending(self, limit: int = 10, now: Optional[float] = None) -> List[dict]:
+        """
+        급상승 점수 상위 기업
+
+        점수는 (현재 창 언급 수 - 기준선 평균) / sqrt(기준선 평균 + 1)로,
+        평소 자주 언급되는 기업보다 평소보다 갑자기 많이 언급된 기업을 위로 올립니다.
+        """
+        self._rotate(time.time() if now is None else now)
+        windows = len(self._history)
+        results = []
+        for company in self._candidates.candidates():
+            count = self._current.estimate(company)
+            if count < self.min_count:
+                continue
+            baseline = self._baseline.estimate(company) / windows if windows else 0.0
+            score = (count - baseline) / math.sqrt(baseline + 1)
+            if score <= 0:
+                continue
+            results.append({
+                "company": company,
+                "count": count,
+                "baseline": round(baseline, 2),
+                "score": round(score, 3),
+            })
+        results.sort(key=lambda row: (-row["score"], -row["count"], row["company"]))
+        return results[:limit]
+
+
+_detector: Optional[TrendDetector] = None
+
+
+def get_trend_detector() -> TrendDetector:
+    """전역 급상승 탐지 인스턴스 반환"""
+    global _detector
+    if _detector is None:
+        _detector = TrendDetector()
+    return _detector
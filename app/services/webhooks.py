@@ -0,0 +1,395 @@
+"""
+웹훅 구독 및 전달 서비스
+"""
+import asyncio
+import fcntl
+import json
+import os
+import random
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Set
+
+import requests
+from requests.adapters import HTTPAdapter
+from ..core.settings import settings
+from .ingestion import add_article_listener, remove_article_listener
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS webhook_subscriptions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    target_url TEXT NOT NULL,
+    companies TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS webhook_outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    subscription_id INTEGER NOT NULL,
+    payload TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL,
+    last_error TEXT,
+    dead INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_webhook_outbox_pending ON webhook_outbox (subscription_id, dead, id);
+"""
+
+
+class WebhookStore:
+    """웹훅 구독과 전달 대기 배치(outbox) 저장소 (SQLite)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._connection().executescript(_SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def add_subscription(self, target_url: str, companies: List[str]) -> dict:
+        cursor = self._connection().execute(
+            "INSERT INTO webhook_subscriptions (target_url, companies, created_at) VALUES (?, ?, ?)",
+            (target_url, json.dumps(companies, ensure_ascii=False), time.time())
+        )
+        return {"id": cursor.lastrowid, "target_url": target_url, "companies": companies}
+
+    def delete_subscription(self, subscription_id: int) -> bool:
+        conn = self._connection()
+        cursor = conn.execute("DELETE FROM webhook_subscriptions WHERE id = ?", (subscription_id,))
+        conn.execute("DELETE FROM webhook_outbox WHERE subscription_id = ?", (subscription_id,))
+        return cursor.rowcount > 0
+
+    def subscriptions(self) -> List[dict]:
+        rows = self._connection().execute(
+            "SELECT s.id, s.target_url, s.companies, "
+            "(SELECT COUNT(*) FROM webhook_outbox o WHERE o.subscription_id = s.id AND o.dead = 0) "
+            "FROM webhook_subscriptions s ORDER BY s.id"
+        )
+        return [
+            {"id": row[0], "target_url": row[1], "companies": json.loads(row[2]), "pending_batches": row[3]}
+            for row in rows
+        ]
+
+    def enqueue(self, subscription_id: int, payload: dict) -> int:
+        cursor = self._connection().execute(
+            "INSERT INTO webhook_outbox (subscription_id, payload, next_attempt_at, created_at) VALUES (?, ?, ?, ?)",
+            (subscription_id, json.dumps(payload, ensure_ascii=False), time.time(), time.time())
+        )
+        return cursor.lastrowid
+
+    def next_batch(self, subscription_id: int) -> Optional[tuple]:
+        """가장 오래된 미전달 배치 (id, payload, attempts, next_attempt_at)"""
+        return self._connection().execute(
+            "SELECT id, payload, attempts, next_attempt_at FROM webhook_outbox "
+            "WHERE subscription_id = ? AND dead = 0 ORDER BY id LIMIT 1",
+            (subscription_id,)
+        ).fetchone()
+
+    def pending_subscription_ids(self) -> List[int]:
+        return [row[0] for row in self._connection().execute(
+            "SELECT DISTINCT subscription_id FROM webhook_outbox WHERE dead = 0"
+        )]
+
+    def mark_delivered(self, batch_id: int):
+        self._connection().execute("DELETE FROM webhook_outbox WHERE id = ?", (batch_id,))
+
+    def mark_failed(self, batch_id: int, attempts: int, next_attempt_at: float, error: str, dead: bool):
+        self._connection().execute(
+            "UPDATE webhook_outbox SET attempts = ?, next_attempt_at = ?, last_error = ?, dead = ? WHERE id = ?",
+            (attempts, next_attempt_at, error[:500], int(dead), batch_id)
+        )
+
+
+class WebhookDispatcher:
+    """
+    웹훅 전달 클래스
+
+    새 기사는 구독별로 짧은 시간(batch window) 동안 모은 뒤 한 배치로 outbox에 저장하고 전달합니다.
+    구독마다 독립된 전달 작업이 순서대로 배치를 보내므로 느린 수신자가 다른 수신자를 지연시키지 않으며,
+    실패한 배치는 지수 백오프로 재시도합니다. outbox에 저장된 배치는 재시작 후에도 이어서 전달됩니다.
+
+    여러 프로세스가 같은 outbox를 쓸 때 전달은 잠금 파일을 얻은 프로세스 하나만 맡고(중복 전달 방지),
+    나머지는 배치를 outbox에 저장만 합니다. 모든 프로세스가 주기적으로 저장소의 구독을 다시 읽으며,
+    전달 담당 프로세스는 이때 다른 프로세스가 저장한 배치도 전달합니다. 전달 담당 프로세스가 종료되면
+    다른 프로세스가 잠금을 이어받습니다.
+    """
+
+    def __init__(self, store: Optional[WebhookStore] = None):
+        self.store = store or WebhookStore(settings.webhook_store_path)
+        self.batch_window = settings.webhook_batch_window
+        self.max_batch_size = settings.webhook_max_batch_size
+        self.max_attempts = settings.webhook_max_attempts
+        self.backoff_base = settings.webhook_backoff_base
+        self.backoff_max = settings.webhook_backoff_max
+        self.timeout = settings.webhook_timeout
+        self.refresh_interval = settings.webhook_refresh_interval
+
+        self._executor = ThreadPoolExecutor(max_workers=settings.webhook_concurrency, thread_name_prefix="webhook")
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=settings.webhook_concurrency, pool_maxsize=settings.webhook_concurrency)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+        self._by_company: Dict[str, Set[int]] = {}
+        self._subscriptions: Dict[int, dict] = {}
+        self._buffers: Dict[int, List[dict]] = {}
+        self._flush_handles: Dict[int, asyncio.TimerHandle] = {}
+        self._deliveries: Dict[int, asyncio.Task] = {}
+        # 전달 작업이 outbox를 조회한 뒤 새로 저장된 배치가 있는 구독
+        self._wakeups: Set[int] = set()
+        self._lock_file = None
+        self.deliverer = False
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._started = False
+
+    # 구독 관리
+
+    def _index(self, subscription: dict):
+        self._subscriptions[subscription["id"]] = subscription
+        for company in subscription["companies"]:
+            self._by_company.setdefault(company, set()).add(subscription["id"])
+
+    def _unindex(self, subscription_id: int):
+        subscription = self._subscriptions.pop(subscription_id, None)
+        if subscription is None:
+            return
+        for company in subscription["companies"]:
+            ids = self._by_company.get(company)
+            if ids:
+                ids.discard(subscription_id)
+                if not ids:
+                    del self._by_company[company]
+
+    async def subscribe(self, target_url: str, companies: List[str]) -> dict:
+        subscription = await asyncio.to_thread(self.store.add_subscription, target_url, list(dict.fromkeys(companies)))
+        self._index(subscription)
+        return dict(subscription, pending_batches=0)
+
+    def _forget(self, subscription_id: int):
+        """구독의 메모리 상태(색인, 버퍼, 전달 작업) 정리"""
+        self._unindex(subscription_id)
+        self._buffers.pop(subscription_id, None)
+        handle = self._flush_handles.pop(subscription_id, None)
+        if handle is not None:
+            handle.cancel()
+        task = self._deliveries.pop(subscription_id, None)
+        if task is not None:
+            task.cancel()
+
+    async def unsubscribe(self, subscription_id: int) -> bool:
+        self._forget(subscription_id)
+        return await asyncio.to_thread(self.store.delete_subscription, subscription_id)
+
+    async def reload_subscriptions(self):
+        """다른 프로세스에서 추가/삭제한 구독을 반영하고, 전달 담당이면 outbox에 남은 배치 전달"""
+        subscriptions = await asyncio.to_thread(self.store.subscriptions)
+        current = {subscription["id"]: subscription for subscription in subscriptions}
+        for subscription_id in list(self._subscriptions):
+            if subscription_id not in current:
+                self._forget(subscription_id)
+        for subscription_id, subscription in current.items():
+            if subscription_id not in self._subscriptions:
+                self._index(subscription)
+        if not self.deliverer:
+            return
+        for subscription_id in await asyncio.to_thread(self.store.pending_subscription_ids):
+            self._ensure_delivery(subscription_id)
+
+    async def subscriptions(self) -> List[dict]:
+        return await asyncio.to_thread(self.store.subscriptions)
+
+    # 수명 주기
+
+    def _acquire_delivery_lock(self) -> bool:
+        """전달 담당 잠금을 얻었는지 반환 (이미 얻었으면 True)"""
+        if self._lock_file is None:
+            lock_file = open(self.store.path + ".lock", "a+")
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                lock_file.close()
+                return False
+            self._lock_file = lock_file
+        return True
+
+    def _release_delivery_lock(self):
+        if self._lock_file is not None:
+            self._lock_file.close()
+            self._lock_file = None
+
+    async def _refresh_loop(self):
+        """주기적으로 구독을 다시 읽고, 전달 담당 프로세스가 없으면 잠금을 이어받음"""
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            try:
+                if not self.deliverer:
+                    self.deliverer = await asyncio.to_thread(self._acquire_delivery_lock)
+                await self.reload_subscriptions()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"웹훅 구독을 다시 읽는 중 오류가 발생했습니다: {str(e)}")
+
+    async def start(self):
+        """구독을 불러오고, 전달 담당이면 남아 있던 outbox 배치 전달을 재개하며, 새 기사 리스너를 등록"""
+        if self._started:
+            return
+        self._started = True
+        self._semaphore = asyncio.Semaphore(settings.webhook_concurrency)
+        self.deliverer = await asyncio.to_thread(self._acquire_delivery_lock)
+        await self.reload_subscriptions()
+        add_article_listener(self.on_new_articles)
+        if self.refresh_interval > 0:
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self):
+        """모아 둔 기사를 outbox에 저장하고 전달 작업 중단 (재시작 후 이어서 전달)"""
+        remove_article_listener(self.on_new_articles)
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+        for handle in self._flush_handles.values():
+            handle.cancel()
+        self._flush_handles.clear()
+        for subscription_id in list(self._buffers):
+            await self._persist_buffer(subscription_id)
+        for task in self._deliveries.values():
+            task.cancel()
+        self._deliveries.clear()
+        self._release_delivery_lock()
+        self.deliverer = False
+        self._started = False
+
+    # 배치 구성
+
+    async def on_new_articles(self, company: str, articles: List[dict]):
+        """새 기사를 구독별 버퍼에 추가"""
+        for article in articles:
+            companies = {company, *(article.get("company_mentions") or [])}
+            targets = set()
+            for name in companies:
+                targets.update(self._by_company.get(name, ()))
+            for subscription_id in targets:
+                buffer = self._buffers.setdefault(subscription_id, [])
+                buffer.append(article)
+                if len(buffer) >= self.max_batch_size:
+                    self._schedule_flush(subscription_id, 0)
+                else:
+                    self._schedule_flush(subscription_id, self.batch_window)
+
+    def _schedule_flush(self, subscription_id: int, delay: float):
+        handle = self._flush_handles.get(subscription_id)
+        if handle is not None:
+            if delay > 0:
+                return
+            handle.cancel()
+        loop = asyncio.get_running_loop()
+        self._flush_handles[subscription_id] = loop.call_later(
+            delay, lambda: asyncio.ensure_future(self._flush(subscription_id))
+        )
+
+    async def _flush(self, subscription_id: int):
+        self._flush_handles.pop(subscription_id, None)
+        await self._persist_buffer(subscription_id)
+        if self.deliverer:
+            self._ensure_delivery(subscription_id)
+
+    async def _persist_buffer(self, subscription_id: int):
+        articles = self._buffers.pop(subscription_id, None)
+        if not articles or subscription_id not in self._subscriptions:
+            return
+        # URL 기준 중복 제거 후 최대 배치 크기로 나눔
+        articles = list({article["url"]: article for article in articles}.values())
+        for i in range(0, len(articles), self.max_batch_size):
+            payload = {
+                "subscription_id": subscription_id,
+                "articles": [
+                    {
+                        key: article.get(key) for key in (
+                            "url", "company", "source", "title", "description", "published_at",
+                            "sentiment", "company_mentions"
+                        )
+                    }
+                    for article in articles[i:i + self.max_batch_size]
+                ],
+            }
+            await asyncio.to_thread(self.store.enqueue, subscription_id, payload)
+
+    # 전달
+
+    def _ensure_delivery(self, subscription_id: int):
+        task = self._deliveries.get(subscription_id)
+        if task is None or task.done():
+            self._deliveries[subscription_id] = asyncio.create_task(self._deliver_loop(subscription_id))
+        else:
+            self._wakeups.add(subscription_id)
+
+    def _post(self, target_url: str, payload: str) -> Optional[str]:
+        """배치 전송 (블로킹). 실패 시 오류 메시지 반환"""
+        try:
+            response = self._session.post(
+                target_url,
+                data=payload.encode("utf-8"),
+                headers={"Content-Type": "application/json"},
+                timeout=self.timeout
+            )
+            if response.status_code >= 300:
+                return f"HTTP {response.status_code}"
+            return None
+        except requests.exceptions.RequestException as e:
+            return str(e)
+
+    async def _deliver_loop(self, subscription_id: int):
+        """구독 하나의 outbox를 오래된 순서로 전달 (outbox가 비면 종료)"""
+        loop = asyncio.get_running_loop()
+        while True:
+            self._wakeups.discard(subscription_id)
+            subscription = self._subscriptions.get(subscription_id)
+            batch = await asyncio.to_thread(self.store.next_batch, subscription_id)
+            if batch is None and subscription_id in self._wakeups:
+                continue
+            if batch is None or subscription is None:
+                self._deliveries.pop(subscription_id, None)
+                return
+            batch_id, payload, attempts, next_attempt_at = batch
+
+            wait = next_attempt_at - time.time()
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+            async with self._semaphore:
+                error = await loop.run_in_executor(self._executor, self._post, subscription["target_url"], payload)
+
+            if error is None:
+                await asyncio.to_thread(self.store.mark_delivered, batch_id)
+                continue
+
+            attempts += 1
+            dead = attempts >= self.max_attempts
+            delay = min(self.backoff_max, self.backoff_base * (2 ** (attempts - 1)))
+            delay *= random.uniform(0.8, 1.2)
+            await asyncio.to_thread(self.store.mark_failed, batch_id, attempts, time.time() + delay, error, dead)
+            if dead:
+                print(f"웹훅 배치 전달을 포기합니다 (구독 {subscription_id}, 배치 {batch_id}): {error}")
+
+
+_dispatcher: Optional[WebhookDispatcher] = None
+
+
+def get_webhook_dispatcher() -> WebhookDispatcher:
+    """전역 웹훅 전달기 인스턴스 반환"""
+    global _dispatcher
+    if _dispatcher is None:
+        _dispatcher = WebhookDispatcher()
+    return _dispatcher
@@ -0,0 +1,119 @@
+"""
+Aho-Corasick 다중 패턴 매칭
+"""
+from collections import deque
+from typing import Dict, Hashable, List, Set, Tuple
+
+
+class AhoCorasick:
+    """
+    Aho-Corasick 오토마톤
+
+    패턴 추가는 트라이에 새 경로만 붙이고, 삭제는 출력 목록에서만 제거합니다.
+    실패 링크는 변경이 있을 때 다음 검색 직전에 한 번만 다시 연결하므로
+    사전이 바뀌어도 전체 트라이를 새로 만들지 않습니다.
+    검색 비용은 사전 크기와 무관하게 텍스트 길이와 매칭 수에 비례합니다.
+    """
+
+    def __init__(self):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._depth: List[int] = [0]
+        # 노드에서 끝나는 패턴 값들
+        self._outputs: List[Set[Hashable]] = [set()]
+        # 실패 링크를 따라가며 처음 만나는 출력 노드 (없으면 -1)
+        self._dict_link: List[int] = [-1]
+        self._patterns: Dict[str, Set[Hashable]] = {}
+        self._dirty = False
+
+    def __len__(self) -> int:
+        return len(self._patterns)
+
+    def _new_node(self, depth: int) -> int:
+        self._goto.append({})
+        self._fail.append(0)
+        self._depth.append(depth)
+        self._outputs.append(set())
+        self._dict_link.append(-1)
+        return len(self._goto) - 1
+
+    def _find_node(self, pattern: str) -> int:
+        node = 0
+        for char in pattern:
+            node = self._goto[node].get(char, -1)
+            if node < 0:
+                return -1
+        return node
+
+    def add(self, pattern: str, value: Hashable):
+        """패턴 추가 (같은 패턴에 여러 값을 연결할 수 있음)"""
+        if not pattern:
+            return
+        node = 0
+        for char in pattern:
+            child = self._goto[node].get(char)
+            if child is None:
+                child = self._new_node(self._depth[node] + 1)
+                self._goto[node][char] = child
+                self._dirty = True
+            node = child
+        if value not in self._outputs[node]:
+            if not self._outputs[node]:
+                # 새 출력 노드가 생기면 사전 링크가 바뀜
+                self._dirty = True
+            self._outputs[node].add(value)
+        self._patterns.setdefault(pattern, set()).add(value)
+
+    def remove(self, pattern: str, value: Hashable):
+        """패턴과 값의 연결 제거 (트라이 노드는 남겨둠)"""
+        values = self._patterns.get(pattern)
+        if not values or value not in values:
+            return
+        values.discard(value)
+        if not values:
+            del self._patterns[pattern]
+        node = self._find_node(pattern)
+        self._outputs[node].discard(value)
+        if not self._outputs[node]:
+            self._dirty = True
+
+    def _relink(self):
+        """BFS로 실패 링크와 사전 링크를 다시 연결"""
+        goto, fail, outputs, dict_link = self._goto, self._fail, self._outputs, self._dict_link
+        queue = deque()
+        for child in goto[0].values():
+            fail[child] = 0
+            dict_link[child] = -1
+            queue.append(child)
+        while queue:
+            node = queue.popleft()
+            for char, child in goto[node].items():
+                state = fail[node]
+                while state and char not in goto[state]:
+                    state = fail[state]
+                target = goto[state].get(char, 0)
+                fail[child] = target if target != child else 0
+                dict_link[child] = fail[child] if outputs[fail[child]] else dict_link[fail[child]]
+                queue.append(child)
+        self._dirty = False
+
+    def iter_matches(self, text: str):
+        """(시작 위치, 끝 위치, 값)을 텍스트 순서대로 생성"""
+        if self._dirty:
+            self._relink()
+        goto, fail, outputs, dict_link, depth = self._goto, self._fail, self._outputs, self._dict_link, self._depth
+        node = 0
+        for end, char in enumerate(text, 1):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            match = node if outputs[node] else dict_link[node]
+            while match > 0:
+                start = end - depth[match]
+                for value in outputs[match]:
+                    yield start, end, value
+                match = dict_link[match]
+
+    def find_all(self, text: str) -> List[Tuple[int, int, Hashable]]:
+        """모든 매칭 목록"""
+        return list(self.iter_matches(text))
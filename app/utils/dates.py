@@ -0,0 +1,36 @@
+"""
+발행일시 파싱
+"""
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+
+# 저장소에 저장하는 발행일시 형식 (UTC ISO 8601)
+ISO_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+
+def parse_datetime(value: str) -> Optional[datetime]:
+    """RFC 822(네이버, RSS) 또는 ISO 8601(Atom, DeepSearch) 날짜를 시간대가 있는 datetime으로 변환 (시간대가 없으면 UTC, 실패 시 None)"""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def epoch_seconds(published_at: str) -> Optional[float]:
+    """저장소의 UTC ISO 발행일시를 epoch 초로 변환"""
+    try:
+        parsed = datetime.strptime(published_at, ISO_FORMAT)
+    except (TypeError, ValueError):
+        return None
+    return parsed.replace(tzinfo=timezone.utc).timestamp()
@@ -0,0 +1,62 @@
+"""
+한글 자모 분해
+"""
+
+_SYLLABLE_BASE = 0xAC00
+_SYLLABLE_LAST = 0xD7A3
+
+_CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+_JONGSEONG = ("", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ", "ㄽ", "ㄾ", "ㄿ", "ㅀ",
+              "ㅁ", "ㅂ", "ㅄ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ")
+
+# 겹받침과 이중 모음은 입력 순서대로 나눔 (입력 중인 "삼성젅"이 "삼성전자"의 앞부분과 맞도록)
+_COMPOUND = {
+    "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ", "ㄼ": "ㄹㅂ", "ㄽ": "ㄹㅅ",
+    "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ", "ㅄ": "ㅂㅅ",
+    "ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ", "ㅝ": "ㅜㅓ", "ㅞ": "ㅜㅔ", "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ",
+}
+
+
+def _split(jamo: str) -> str:
+    return _COMPOUND.get(jamo, jamo)
+
+
+def to_jamo(text: str) -> str:
+    """
+    완성형 한글을 입력 순서의 호환 자모열로 분해 (그 밖의 문자는 소문자로 유지)
+
+    예: "삼성" → "ㅅㅏㅁㅅㅓㅇ", "닭" → "ㄷㅏㄹㄱ"
+    """
+    result = []
+    for char in text.lower():
+        code = ord(char)
+        if _SYLLABLE_BASE <= code <= _SYLLABLE_LAST:
+            offset = code - _SYLLABLE_BASE
+            result.append(_CHOSEONG[offset // 588])
+            result.append(_split(_JUNGSEONG[offset % 588 // 28]))
+            result.append(_split(_JONGSEONG[offset % 28]))
+        else:
+            result.append(_split(char))
+    return "".join(result)
+
+
+def to_choseong(text: str) -> str:
+    """
+    완성형 한글의 초성만 남김 (그 밖의 문자는 소문자로 유지)
+
+    예: "삼성전자" → "ㅅㅅㅈㅈ"
+    """
+    result = []
+    for char in text.lower():
+        code = ord(char)
+        if _SYLLABLE_BASE <= code <= _SYLLABLE_LAST:
+            result.append(_CHOSEONG[(code - _SYLLABLE_BASE) // 588])
+        else:
+            result.append(char)
+    return "".join(result)
+
+
+def is_choseong_query(text: str) -> bool:
+    """자음만으로 된 입력인지 (초성 검색)"""
+    return bool(text) and all(char in _CHOSEONG for char in text if not char.isspace())
@@ -0,0 +1,12 @@
+"""
+토큰화용 텍스트 정규화
+"""
+import re
+
+
+_NON_WORD = re.compile(r"[^0-9a-z가-힣]+")
+
+
+def compact_text(text: str) -> str:
+    """소문자로 바꾸고 공백/기호를 뺀 텍스트 (영문, 숫자, 완성형 한글만 남김)"""
+    return _NON_WORD.sub("", text.lower())
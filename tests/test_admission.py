@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+요청 수용 제어(부하 차단) 테스트
+"""
+import asyncio
+import time
+
+import httpx
+from fastapi import BackgroundTasks, FastAPI
+
+from app.core.admission import AdaptiveLimiter, AdmissionController, AdmissionControlMiddleware
+from app.core.routes import UNMATCHED_ROUTE
+
+
+def _create_app(limiter: AdaptiveLimiter) -> FastAPI:
+    """느린 엔드포인트 하나와 헬스 체크를 가진 테스트 앱"""
+    app = FastAPI()
+
+    @app.get("/api/v1/news/slow/{company_name}")
+    async def slow(company_name: str):
+        await asyncio.sleep(0.05)
+        return {"company": company_name}
+
+    @app.get("/api/v1/health/")
+    async def health():
+        return {"status": "healthy"}
+
+    controller = AdmissionController()
+    controller._limiters["/api/v1/news/slow/{company_name}"] = limiter
+    app.add_middleware(AdmissionControlMiddleware, controller=controller)
+    return app
+
+
+async def _timed_get(client: httpx.AsyncClient, url: str):
+    started = time.perf_counter()
+    response = await client.get(url)
+    return response, time.perf_counter() - started
+
+
+def test_overload_sheds_fast():
+    """과부하 시 일부 요청은 정상 속도로 처리하고 나머지는 즉시 503으로 거절하는지 테스트"""
+    print("=== 과부하 차단 테스트 ===")
+
+    limiter = AdaptiveLimiter(limit=10, min_limit=2, max_limit=50, queue_size=10, queue_timeout=0.2,
+                              target_latency=1.0)
+    app = _create_app(limiter)
+
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await asyncio.gather(*[
+                _timed_get(client, f"/api/v1/news/slow/기업{i % 7}") for i in range(200)
+            ])
+
+    results = asyncio.run(run())
+    ok = [elapsed for response, elapsed in results if response.status_code == 200]
+    rejected = [(response, elapsed) for response, elapsed in results if response.status_code == 503]
+
+    print(f"✅ 처리 {len(ok)}건 (최대 {max(ok) * 1000:.0f}ms), 거절 {len(rejected)}건")
+    assert len(ok) >= 20
+    assert len(ok) + len(rejected) == 200
+    assert rejected
+    assert all(response.headers["retry-after"] for response, _ in rejected)
+    # 거절은 대기 시간 한도 안에 끝남
+    assert max(elapsed for _, elapsed in rejected) < 0.5
+    assert limiter.in_flight == 0
+
+
+def test_health_is_exempt():
+    """헬스 체크는 한도와 무관하게 처리되는지 테스트"""
+    print("\n=== 헬스 체크 예외 테스트 ===")
+
+    limiter = AdaptiveLimiter(limit=1, min_limit=1, max_limit=1, queue_size=0, queue_timeout=0.1,
+                              target_latency=1.0)
+    app = _create_app(limiter)
+
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await asyncio.gather(*[client.get("/api/v1/health/") for _ in range(50)])
+
+    responses = asyncio.run(run())
+    print(f"✅ 헬스 체크 {len(responses)}건 모두 200")
+    assert all(response.status_code == 200 for response in responses)
+
+
+def test_aimd_adjusts_limit():
+    """느린 응답에 한도를 줄이고 빠른 응답에 다시 늘리는지 테스트"""
+    print("\n=== AIMD 한도 조정 테스트 ===")
+
+    async def run():
+        limiter = AdaptiveLimiter(limit=20, min_limit=2, max_limit=40, queue_size=0, queue_timeout=0.1,
+                                  target_latency=0.01)
+        assert await limiter.acquire()
+        limiter.release(latency=1.0)
+        decreased = limiter.limit
+
+        for _ in range(200):
+            acquired = [await limiter.acquire() for _ in range(int(limiter.limit))]
+            assert all(acquired)
+            for _ in acquired:
+                limiter.release(latency=0.0)
+        return decreased, limiter.limit
+
+    decreased, increased = asyncio.run(run())
+    print(f"✅ 한도 20 → {decreased:.1f} → {increased:.1f}")
+    assert decreased == 18
+    assert increased > decreased
+
+
+class _RecordingLimiter(AdaptiveLimiter):
+    """release 호출과 응답 시간을 기록하는 한도"""
+
+    def __init__(self):
+        super().__init__(limit=1, min_limit=1, max_limit=1, queue_size=0, queue_timeout=0.1, target_latency=1.0)
+        self.latencies = []
+
+    def release(self, latency: float):
+        self.latencies.append(latency)
+        super().release(latency)
+
+
+async def _call(app, path: str):
+    """ASGI 앱을 직접 호출 (응답 후 백그라운드 작업까지 끝날 때까지 기다림)"""
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET", "scheme": "http",
+        "path": path, "raw_path": path.encode(), "query_string": b"", "root_path": "", "headers": [],
+        "client": ("127.0.0.1", 1), "server": ("test", 80),
+    }
+    await app(scope, receive, send)
+
+
+def test_slot_released_when_response_sent():
+    """응답 본문을 다 보내면 백그라운드 작업을 기다리지 않고 슬롯을 한 번만 반환하는지 테스트"""
+    print("\n=== 응답 후 슬롯 반환 테스트 ===")
+
+    limiter = _RecordingLimiter()
+    in_flight_in_background = []
+    app = FastAPI()
+
+    async def background_work():
+        await asyncio.sleep(0.1)
+        in_flight_in_background.append(limiter.in_flight)
+
+    async def failing_background_work():
+        raise RuntimeError("백그라운드 작업 실패")
+
+    @app.get("/api/v1/news/ingest/{company_name}")
+    async def ingest(company_name: str, background_tasks: BackgroundTasks):
+        background_tasks.add_task(background_work)
+        return {"company": company_name}
+
+    @app.get("/api/v1/news/failing/{company_name}")
+    async def failing(company_name: str, background_tasks: BackgroundTasks):
+        background_tasks.add_task(failing_background_work)
+        return {"company": company_name}
+
+    controller = AdmissionController()
+    controller._limiters["/api/v1/news/ingest/{company_name}"] = limiter
+    controller._limiters["/api/v1/news/failing/{company_name}"] = limiter
+    app.add_middleware(AdmissionControlMiddleware, controller=controller)
+
+    async def run():
+        started = time.perf_counter()
+        await _call(app, "/api/v1/news/ingest/samsung")
+        total = time.perf_counter() - started
+        try:
+            await _call(app, "/api/v1/news/failing/samsung")
+        except RuntimeError:
+            pass
+        return total
+
+    total = asyncio.run(run())
+    print(f"✅ 전체 {total * 1000:.0f}ms, 기록된 응답 시간 {[round(latency * 1000) for latency in limiter.latencies]}ms")
+    # 백그라운드 작업 중에는 슬롯이 이미 반환됨
+    assert in_flight_in_background == [0]
+    assert limiter.latencies[0] < 0.1 <= total
+    # 응답 후 백그라운드 작업이 실패해도 슬롯은 한 번만 반환
+    assert len(limiter.latencies) == 2 and limiter.in_flight == 0
+
+
+def test_unmatched_routes_share_one_limiter():
+    """라우트가 없는 경로는 하나의 키로, 메서드만 다른 경로는 라우트 템플릿으로 묶는지 테스트"""
+    print("\n=== 라우트 없는 경로 테스트 ===")
+
+    controller = AdmissionController()
+    app = FastAPI()
+
+    @app.get("/api/v1/news/company/{company_name}")
+    async def company(company_name: str):
+        return {"company": company_name}
+
+    app.add_middleware(AdmissionControlMiddleware, controller=controller)
+
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            responses = [await client.get(f"/api/v1/scan/{i}") for i in range(20)]
+            responses.append(await client.post("/api/v1/news/company/samsung"))
+            responses.append(await client.get("/api/v1/news/company/samsung"))
+            return [response.status_code for response in responses]
+
+    statuses = asyncio.run(run())
+    routes = controller.stats()
+    print(f"✅ 한도 항목 {sorted(routes)}")
+    assert statuses == [404] * 20 + [405, 200]
+    assert set(routes) == {UNMATCHED_ROUTE, "/api/v1/news/company/{company_name}"}
+    assert routes[UNMATCHED_ROUTE]["admitted"] == 20
+
+
+def main():
+    """메인 테스트 함수"""
+    print("요청 수용 제어 테스트를 시작합니다...\n")
+
+    test_overload_sheds_fast()
+    test_health_is_exempt()
+    test_aimd_adjusts_limit()
+    test_slot_released_when_response_sent()
+    test_unmatched_routes_share_one_limiter()
+
+    print("\n=== 테스트 완료 ===")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+뉴스량/감정 집계 테스트
+"""
+import asyncio
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+from app.services.aggregation import NewsAggregator
+from app.services.article_store import ArticleStore
+
+
+def _iso(dt: datetime) -> str:
+    return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def test_hourly_and_daily_buckets():
+    """시간/일 단위 집계 테스트 (감정 분포, 언론사 수)"""
+    print("=== 시간 버킷 집계 테스트 ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        aggregator = NewsAggregator(ArticleStore(os.path.join(tmp, "news.db")), retention_days=30)
+        now = datetime.now(timezone.utc)
+        aggregator.add("삼성전자", "https://www.news-a.com/1", _iso(now), "positive")
+        aggregator.add("삼성전자", "https://news-a.com/2", _iso(now), "negative")
+        aggregator.add("삼성전자", "https://news-b.com/3", _iso(now - timedelta(hours=3)), None)
+        aggregator.add("삼성전자", "https://news-b.com/4", _iso(now - timedelta(days=40)), "positive")
+
+        hourly = aggregator.query("삼성전자", days=1, interval="hour")
+        daily = aggregator.query("삼성전자", days=7, interval="day")
+
+    print(f"✅ 최근 1일: {hourly['total']}건, 감정 {hourly['sentiment']}, 언론사 {hourly['outlets']}곳")
+    assert len(hourly["buckets"]) == 24
+    assert hourly["total"] == 3
+    assert hourly["sentiment"] == {"positive": 1, "negative": 1, "neutral": 1}
+    assert hourly["outlets"] == 2
+    assert hourly["buckets"][-1]["count"] == 2
+    assert hourly["buckets"][-1]["outlets"] == 1
+
+    assert len(daily["buckets"]) == 7
+    assert daily["total"] == 3
+
+
+def test_start_loads_store_and_listens():
+    """시작 시 저장된 기사 적재 및 새 기사 반영 테스트 (적재한 기사가 리스너로 다시 와도 한 번만 집계)"""
+    print("\n=== 저장소 적재 테스트 ===")
+
+    async def run():
+        with tempfile.TemporaryDirectory() as tmp:
+            store = ArticleStore(os.path.join(tmp, "news.db"))
+            now = _iso(datetime.now(timezone.utc))
+            stored = store.add_articles("LG전자", [
+                {"url": f"https://news.com/{i}", "source": "naver", "title": "t", "description": "d",
+                 "published_at": now, "sentiment": "positive"}
+                for i in range(5)
+            ])
+            aggregator = NewsAggregator(store, retention_days=30)
+            await aggregator.start()
+            try:
+                # 적재와 겹친 리스너 호출(이미 적재한 기사)과 적재 이후 저장된 기사
+                await aggregator.on_new_articles("LG전자", [
+                    stored[0],
+                    {"id": stored[-1]["id"] + 1, "url": "https://news.com/new", "published_at": now, "sentiment": "negative"}
+                ])
+                return aggregator.query("LG전자", days=1)
+            finally:
+                aggregator.stop()
+
+    result = asyncio.run(run())
+    print(f"✅ 적재 후 {result['total']}건")
+    assert result["total"] == 6
+    assert result["sentiment"]["negative"] == 1
+
+
+def test_query_speed():
+    """기사 수와 무관한 조회 속도 테스트"""
+    print("\n=== 조회 속도 테스트 ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        aggregator = NewsAggregator(ArticleStore(os.path.join(tmp, "news.db")), retention_days=30)
+        now = datetime.now(timezone.utc)
+        for i in range(100000):
+            published = now - timedelta(minutes=i % (29 * 24 * 60))
+            aggregator.add("삼성전자", f"https://news{i % 50}.com/{i}", _iso(published), "neutral")
+
+        started = time.perf_counter()
+        result = aggregator.query("삼성전자", days=30, interval="hour")
+        elapsed = (time.perf_counter() - started) * 1000
+
+    print(f"✅ 10만 건 30일 시간별 집계: {elapsed:.1f}ms")
+    assert result["total"] == 100000
+    assert elapsed < 200
+
+
+def main():
+    """메인 테스트 함수"""
+    print("뉴스량/감정 집계 테스트를 시작합니다...\n")
+
+    test_hourly_and_daily_buckets()
+    test_start_loads_store_and_listens()
+    test_query_speed()
+
+    print("\n=== 테스트 완료 ===")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+기사 본문 수집기 테스트 (로컬 HTTP 서버 사용)
+"""
+import asyncio
+import http.server
+import threading
+import time
+
+from app.services.article_fetcher import ArticleFetcher, extract_article_text
+
+
+ARTICLE_HTML = """
+<html><head><script>var tracking = 1;</script></head>
+<body>
+<nav><a href="/">홈</a> <a href="/economy">경제</a></nav>
+<article>
+  <h1>삼성전자 3분기 실적 발표</h1>
+  <p>삼성전자가 3분기 실적을 발표했다. 영업이익은 전년 대비 크게 증가했으며 반도체 부문이 실적을 견인했다.</p>
+  <p><a href="/related/1">관련기사 삼성전자 주가 급등</a> <a href="/related/2">관련기사 반도체 업황 회복 기대</a></p>
+  <p>회사 측은 4분기에도 메모리 수요가 견조할 것으로 전망한다고 밝혔다.</p>
+</article>
+<footer>Copyright 뉴스통신사. 무단 전재 및 재배포 금지. 모든 권리 보유.</footer>
+</body></html>
+""".encode("utf-8")
+
+
+# Content-Type에 charset이 없는 EUC-KR 문서 (<meta charset>으로만 문자셋을 알림)
+EUC_KR_HTML = ARTICLE_HTML.decode("utf-8").replace(
+    "<head>", '<head><meta http-equiv="Content-Type" content="text/html; charset=euc-kr">'
+).encode("euc-kr")
+
+
+class _ArticleHandler(http.server.BaseHTTPRequestHandler):
+    """모든 경로에 같은 기사 HTML을 반환하는 핸들러 (요청 경로와 시각을 기록)"""
+
+    requests = []
+
+    def do_GET(self):
+        _ArticleHandler.requests.append((self.path, time.perf_counter()))
+        self.send_response(200)
+        body = ARTICLE_HTML
+        if self.path.startswith("/bad-charset"):
+            # 알 수 없는 문자셋으로 디코딩 오류를 일으키는 경로
+            content_type = "text/html; charset=x-unknown"
+        elif self.path.startswith("/euc-kr"):
+            content_type, body = "text/html", EUC_KR_HTML
+        elif self.path.startswith("/no-charset"):
+            content_type = "text/html"
+        else:
+            content_type = "text/html; charset=utf-8"
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _start_server():
+    """로컬 HTTP 서버 시작"""
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _ArticleHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def test_extract_article_text():
+    """본문 추출 테스트 (메뉴, 스크립트, 링크 목록 제거)"""
+    print("=== 본문 추출 테스트 ===")
+    
+    text = extract_article_text(ARTICLE_HTML.decode("utf-8"))
+    print(text)
+    
+    assert "영업이익은 전년 대비" in text
+    assert "메모리 수요" in text
+    assert "tracking" not in text
+    assert "관련기사" not in text
+    assert "Copyright" not in text
+
+
+def test_fetch_many():
+    """로컬 서버에서 여러 기사를 동시에 수집하는 테스트"""
+    print("\n=== 동시 수집 테스트 ===")
+    
+    server = _start_server()
+    try:
+        base_url = f"http://127.0.0.1:{server.server_address[1]}"
+        urls = [f"{base_url}/article/{i}" for i in range(200)]
+        fetcher = ArticleFetcher(concurrency=32, per_host=8, crawl_delay=0.0, timeout=5.0)
+        
+        started = time.perf_counter()
+        bodies = asyncio.run(fetcher.fetch_many(urls))
+        elapsed = time.perf_counter() - started
+        
+        print(f"✅ {len(bodies)}개 기사 수집: {elapsed:.2f}초 ({len(bodies) / elapsed:.0f} pages/s)")
+        assert len(bodies) == len(urls)
+        assert all("메모리 수요" in body for body in bodies.values())
+    finally:
+        server.shutdown()
+
+
+def test_crawl_delay():
+    """같은 호스트에 대한 요청 간격 테스트"""
+    print("\n=== crawl delay 테스트 ===")
+    
+    server = _start_server()
+    try:
+        base_url = f"http://127.0.0.1:{server.server_address[1]}"
+        urls = [f"{base_url}/article/{i}" for i in range(5)]
+        fetcher = ArticleFetcher(concurrency=8, per_host=8, crawl_delay=0.05, timeout=5.0)
+        
+        started = time.perf_counter()
+        asyncio.run(fetcher.fetch_many(urls))
+        elapsed = time.perf_counter() - started
+        
+        print(f"✅ 5개 기사 수집: {elapsed:.2f}초")
+        assert elapsed >= 0.2
+    finally:
+        server.shutdown()
+
+
+def test_fetch_many_skips_failed_urls():
+    """URL 하나에서 예상치 못한 오류가 나도 나머지 본문은 반환되는지 테스트"""
+    print("\n=== 실패 URL 격리 테스트 ===")
+    
+    server = _start_server()
+    try:
+        base_url = f"http://127.0.0.1:{server.server_address[1]}"
+        urls = [f"{base_url}/article/1", f"{base_url}/bad-charset/1", f"{base_url}/article/2"]
+        fetcher = ArticleFetcher(concurrency=4, per_host=4, crawl_delay=0.0, timeout=5.0)
+        
+        bodies = asyncio.run(fetcher.fetch_many(urls))
+        
+        print(f"✅ {sorted(bodies)}")
+        assert sorted(bodies) == [urls[0], urls[2]]
+    finally:
+        server.shutdown()
+
+
+def test_korean_pages_without_charset_header():
+    """Content-Type에 charset이 없는 한글 문서를 <meta charset> 또는 내용 추정으로 디코딩하는지 테스트"""
+    print("\n=== 문자셋 없는 한글 문서 테스트 ===")
+
+    server = _start_server()
+    try:
+        base_url = f"http://127.0.0.1:{server.server_address[1]}"
+        urls = [f"{base_url}/euc-kr/1", f"{base_url}/no-charset/1"]
+        fetcher = ArticleFetcher(concurrency=4, per_host=4, crawl_delay=0.0, timeout=5.0)
+
+        bodies = asyncio.run(fetcher.fetch_many(urls))
+
+        print(f"✅ {[body[:20] for body in bodies.values()]}")
+        assert len(bodies) == 2
+        assert all("영업이익은 전년 대비" in body for body in bodies.values())
+    finally:
+        server.shutdown()
+
+
+def test_busy_host_does_not_block_others():
+    """한 호스트에 몰린 요청이 crawl delay를 기다리는 동안 다른 호스트 요청이 먼저 처리되고, 끝나면 호스트 상태를 정리하는지 테스트"""
+    print("\n=== 호스트 간 막힘 테스트 ===")
+
+    server = _start_server()
+    try:
+        port = server.server_address[1]
+        # 같은 서버를 두 호스트 이름으로 요청
+        urls = [f"http://127.0.0.1:{port}/article/{i}" for i in range(5)] + [f"http://localhost:{port}/other/1"]
+        fetcher = ArticleFetcher(concurrency=2, per_host=4, crawl_delay=0.2, timeout=5.0)
+        _ArticleHandler.requests = []
+
+        started = time.perf_counter()
+        bodies = asyncio.run(fetcher.fetch_many(urls))
+        other = next(at for path, at in _ArticleHandler.requests if path == "/other/1") - started
+        hosts = dict(fetcher._hosts)
+        time.sleep(0.25)
+        asyncio.run(fetcher.fetch_many([]))
+
+        print(f"✅ 다른 호스트 요청 {other * 1000:.0f}ms, 끝난 뒤 호스트 상태 {len(hosts)} → {len(fetcher._hosts)}")
+        assert len(bodies) == 6
+        assert other < 0.15
+        # 요청 간격이 남은 호스트만 남고, 간격이 지나면 정리
+        assert set(hosts) == {f"127.0.0.1:{port}"}
+        assert fetcher._hosts == {}
+    finally:
+        server.shutdown()
+
+
+def main():
+    """메인 테스트 함수"""
+    print("기사 본문 수집기 테스트를 시작합니다...\n")
+    
+    test_extract_article_text()
+    test_fetch_many()
+    test_crawl_delay()
+    test_fetch_many_skips_failed_urls()
+    test_korean_pages_without_charset_header()
+    test_busy_host_does_not_block_others()
+    
+    print("\n=== 테스트 완료 ===")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+기업명 자동 완성 테스트 (자모 접두사 색인)
+"""
+import asyncio
+import json
+import os
+import tempfile
+import time
+
+import httpx
+
+from app.main import app
+from app.api.v1.endpoints import news
+from app.services.article_store import ArticleStore
+from app.services.autocomplete import CompanyAutocomplete
+from app.services.company_dictionary import CompanyDictionary
+from app.utils.hangul import to_choseong, to_jamo
+
+
+COMPANIES = [
+    {"name": "삼성전자", "aliases": ["Samsung Electronics"], "ticker": "005930"},
+    {"name": "삼성바이오로직스", "aliases": ["삼바"], "ticker": "207940"},
+    {"name": "삼성SDI", "aliases": [], "ticker": "006400"},
+    {"name": "현대자동차", "aliases": ["현대차"], "ticker": "005380"},
+]
+
+
+def _autocomplete(tmp: str) -> CompanyAutocomplete:
+    path = os.path.join(tmp, "companies.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(COMPANIES, f, ensure_ascii=False)
+    return CompanyAutocomplete(
+        dictionary=CompanyDictionary(path), store=ArticleStore(os.path.join(tmp, "news.db"))
+    )
+
+
+def _names(items: list) -> list:
+    return [item["name"] for item in items]
+
+
+def test_jamo_decomposition():
+    """자모 분해와 초성 추출 테스트"""
+    print("=== 자모 분해 테스트 ===")
+
+    print(f"✅ 삼성 → {to_jamo('삼성')}, 닭 → {to_jamo('닭')}, 삼성전자 → {to_choseong('삼성전자')}")
+    assert to_jamo("삼성") == "ㅅㅏㅁㅅㅓㅇ"
+    # 겹받침/이중 모음은 입력 순서대로 나뉨
+    assert to_jamo("닭") == "ㄷㅏㄹㄱ" and to_jamo("과") == "ㄱㅗㅏ"
+    assert to_jamo("SDI") == "sdi"
+    assert to_choseong("삼성전자") == "ㅅㅅㅈㅈ"
+
+
+def test_prefix_matching_while_typing():
+    """조합 중인 글자, 별칭, 종목코드, 초성 입력으로 후보를 찾는지 테스트"""
+    print("\n=== 입력 중 접두사 테스트 ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        autocomplete = _autocomplete(tmp)
+        typing = {query: _names(autocomplete.suggest(query)) for query in ("삼서", "삼성젅", "삼성ㅈ", "ㅅㅅㅈ", "현대ㅊ")}
+        alias = autocomplete.suggest("삼ㅂ")
+        ticker = autocomplete.suggest("0059")
+        english = autocomplete.suggest("samsung")
+        none = autocomplete.suggest("카카오")
+
+    print(f"✅ {typing}")
+    assert set(typing["삼서"]) == {"삼성전자", "삼성바이오로직스", "삼성SDI"}
+    assert typing["삼성젅"] == ["삼성전자"]
+    assert typing["삼성ㅈ"] == ["삼성전자"]
+    assert typing["ㅅㅅㅈ"] == ["삼성전자"]
+    assert typing["현대ㅊ"] == ["현대자동차"]
+    assert alias == [{"name": "삼성바이오로직스", "matched": "삼바", "volume": 0.0}]
+    assert _names(ticker) == ["삼성전자"] and _names(english) == ["삼성전자"]
+    assert none == []
+
+
+def test_ranking_by_recent_volume():
+    """최근 뉴스량이 많은 기업이 먼저 오고, 기사에서 관찰된 새 기업명도 후보가 되는지 테스트"""
+    print("\n=== 뉴스량 순위 테스트 ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        autocomplete = _autocomplete(tmp)
+        now = time.time()
+        stamp = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now))
+        old = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now - 10 * 86400))
+
+        articles = [
+            {"url": f"https://news.com/sdi/{i}", "company_mentions": ["삼성SDI"], "published_at": stamp}
+            for i in range(3)
+        ] + [
+            # 오래된 기사는 반감기만큼 감쇠
+            {"url": f"https://news.com/old/{i}", "company_mentions": ["삼성전자"], "published_at": old}
+            for i in range(20)
+        ] + [
+            {"url": "https://news.com/new", "company_mentions": ["삼성중공업"], "published_at": stamp},
+        ]
+        asyncio.run(autocomplete.on_new_articles("삼성SDI", articles))
+        # 같은 기사가 다른 기업 검색으로 다시 저장되어도 한 번만 집계
+        asyncio.run(autocomplete.on_new_articles("삼성전자", articles[:1]))
+
+        ranked = autocomplete.suggest("삼성", limit=10)
+
+        app.dependency_overrides[news.get_company_autocomplete] = lambda: autocomplete
+
+        async def run():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                ok = await client.get("/api/v1/news/autocomplete", params={"q": "삼성", "limit": 2})
+                bad = await client.get("/api/v1/news/autocomplete", params={"q": "삼성", "limit": 0})
+                return ok, bad
+
+        try:
+            ok, bad = asyncio.run(run())
+        finally:
+            app.dependency_overrides.clear()
+
+        started = time.perf_counter()
+        for _ in range(1000):
+            autocomplete.suggest("ㅅ")
+        per_lookup = (time.perf_counter() - started) / 1000
+
+    print(f"✅ {ranked}, 조회당 {per_lookup * 1e6:.0f}us")
+    assert _names(ranked)[:2] == ["삼성SDI", "삼성전자"]
+    # 삼성SDI: 언급 기사 3건 + 삼성SDI 검색으로 저장된 새 기사 1건 (다시 저장된 기사는 중복 집계하지 않음)
+    assert 3.9 < ranked[0]["volume"] < 4.1
+    assert "삼성중공업" in _names(ranked)
+    assert _names(ranked)[-1] == "삼성바이오로직스"
+    assert ok.status_code == 200 and bad.status_code == 400
+    assert [item["name"] for item in ok.json()["items"]] == ["삼성SDI", "삼성전자"]
+    assert per_lookup < 0.001
+
+
+def main():
+    """메인 테스트 함수"""
+    print("기업명 자동 완성 테스트를 시작합니다...\n")
+
+    test_jamo_decomposition()
+    test_prefix_matching_while_typing()
+    test_ranking_by_recent_volume()
+
+    print("\n=== 테스트 완료 ===")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+공유 캐시 백엔드 테스트 (SQLite, Redis)
+"""
+import asyncio
+import importlib.util
+import multiprocessing
+import os
+import tempfile
+import time
+
+from app.core.cache import ResponseCache
+from app.core.cache_backends import RedisCacheBackend, SQLiteCacheBackend, create_cache_backend
+from app.core.settings import settings
+
+
+def test_sqlite_entries_shared_between_instances():
+    """같은 파일을 연 두 백엔드(워커)가 항목을 공유하고, 만료/삭제/개수 제한이 적용되는지 테스트"""
+    print("=== SQLite 항목 공유 테스트 ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "cache.db")
+        first = SQLiteCacheBackend(path, max_entries=50)
+        second = SQLiteCacheBackend(path, max_entries=50)
+
+        first.set("naver:삼성전자", {"items": [{"title": "삼성전자 기사"}]}, ttl=60)
+        shared = second.get("naver:삼성전자")
+        first.set("short", [1, 2, 3], ttl=0.05)
+        before_expiry = second.get("short")
+        time.sleep(0.1)
+        after_expiry = second.get("short")
+        second.delete("naver:삼성전자")
+        deleted = first.get("naver:삼성전자")
+
+        # 100번 쓸 때마다(앞의 두 번 포함) 만료된 항목과 한도를 넘는 항목(만료가 가까운 순) 정리
+        for i in range(98):
+            first.set(f"key{i}", i, ttl=60 + i)
+        size = second.size()
+        oldest, newest = second.get("key0"), second.get("key97")
+
+    print(f"✅ 공유 {shared}, 만료 전 {before_expiry} → 후 {after_expiry}, 정리 후 {size}개")
+    assert shared == {"items": [{"title": "삼성전자 기사"}]}
+    assert before_expiry == [1, 2, 3] and after_expiry is None
+    assert deleted is None
+    assert size == 50
+    assert oldest is None and newest == 97
+
+
+def test_sqlite_lock_rows():
+    """잠금 행으로 한 워커만 로드하고, 만료된 잠금은 다른 워커가 가져가는지 테스트"""
+    print("\n=== SQLite 잠금 행 테스트 ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "cache.db")
+        first = SQLiteCacheBackend(path, max_entries=50)
+        second = SQLiteCacheBackend(path, max_entries=50)
+
+        token = first.acquire_lock("naver:삼성전자", ttl=30)
+        contended = second.acquire_lock("naver:삼성전자", ttl=30)
+        other_key = second.acquire_lock("naver:LG전자", ttl=30)
+        first.release_lock("naver:삼성전자", token)
+        after_release = second.acquire_lock("naver:삼성전자", ttl=30)
+
+        # 잠금을 잡은 워커가 죽어 풀지 못한 잠금은 만료 후 다른 워커가 가져감
+        stale = first.acquire_lock("stale", ttl=0.05)
+        time.sleep(0.1)
+        takeover = second.acquire_lock("stale", ttl=30)
+        # 늦게 깨어난 이전 소유자는 다른 토큰의 잠금을 풀지 못함
+        first.release_lock("stale", stale)
+        still_held = first.acquire_lock("stale", ttl=30)
+
+    print(f"✅ 경합 {contended}, 해제 후 {bool(after_release)}, 만료 후 인계 {bool(takeover)}")
+    assert token and contended is None and other_key
+    assert after_release and after_release != token
+    assert stale and takeover and takeover != stale
+    assert still_held is None
+
+
+def _load_in_worker(path: str, counter: str, results):
+    """다른 프로세스의 워커: 같은 SQLite 파일로 get_or_load"""
+    cache = ResponseCache(SQLiteCacheBackend(path, max_entries=50))
+
+    async def loader():
+        with open(counter, "a") as f:
+            f.write("x")
+        await asyncio.sleep(0.3)
+        return {"loaded_by": os.getpid()}
+
+    results.put(asyncio.run(cache.get_or_load("naver:삼성전자", loader, ttl=60)))
+
+
+def test_single_flight_across_processes():
+    """여러 프로세스가 같은 키를 동시에 요청해도 업스트림 로드는 한 번만 하는지 테스트"""
+    print("\n=== 프로세스 간 single-flight 테스트 ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "cache.db")
+        counter = os.path.join(tmp, "loads")
+        SQLiteCacheBackend(path, max_entries=50)
+
+        context = multiprocessing.get_context("fork")
+        results = context.Queue()
+        workers = [context.Process(target=_load_in_worker, args=(path, counter, results)) for _ in range(4)]
+        for worker in workers:
+            worker.start()
+        values = [results.get(timeout=30) for _ in workers]
+        for worker in workers:
+            worker.join()
+        with open(counter) as f:
+            loads = len(f.read())
+
+    print(f"✅ 프로세스 4개, 로드 {loads}회, 결과 {values}")
+    assert loads == 1
+    assert len({value["loaded_by"] for value in values}) == 1
+
+
+class _FakeRedis:
+    """RedisCacheBackend가 쓰는 명령만 흉내 내는 대역 (만료는 px 밀리초)"""
+
+    def __init__(self):
+        self.data = {}
+
+    def _alive(self, key):
+        entry = self.data.get(key)
+        if entry is not None and entry[1] <= time.time():
+            del self.data[key]
+            entry = None
+        return entry
+
+    def get(self, key):
+        entry = self._alive(key)
+        return entry[0] if entry else None
+
+    def set(self, key, value, px=None, nx=False):
+        if nx and self._alive(key):
+            return None
+        self.data[key] = (value if isinstance(value, bytes) else str(value).encode(), time.time() + px / 1000)
+        return True
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+    def eval(self, script, numkeys, key, token):
+        if self.get(key) == token.encode():
+            self.delete(key)
+            return 1
+        return 0
+
+    def dbsize(self):
+        return len(self.data)
+
+
+def test_redis_backend():
+    """Redis 백엔드의 키 접두어, 만료, 토큰 확인 잠금 해제와 패키지가 없을 때의 오류 테스트"""
+    print("\n=== Redis 백엔드 테스트 ===")
+
+    backend = RedisCacheBackend.__new__(RedisCacheBackend)
+    backend.prefix = "test:"
+    backend._client = _FakeRedis()
+
+    backend.set("naver:삼성전자", {"total": 1}, ttl=60)
+    value = backend.get("naver:삼성전자")
+    backend.set("short", 1, ttl=0.01)
+    time.sleep(0.05)
+    expired = backend.get("short")
+    token = backend.acquire_lock("naver:삼성전자", ttl=30)
+    contended = backend.acquire_lock("naver:삼성전자", ttl=30)
+    backend.release_lock("naver:삼성전자", "other-token")
+    still_held = backend.acquire_lock("naver:삼성전자", ttl=30)
+    backend.release_lock("naver:삼성전자", token)
+    after_release = backend.acquire_lock("naver:삼성전자", ttl=30)
+
+    print(f"✅ {value}, 키 {sorted(backend._client.data)}")
+    assert value == {"total": 1} and expired is None
+    assert "test:naver:삼성전자" in backend._client.data
+    assert token and contended is None and still_held is None and after_release
+
+    if importlib.util.find_spec("redis") is None:
+        try:
+            create_cache_backend("redis", settings)
+        except RuntimeError as e:
+            assert "pip install redis" in str(e)
+        else:
+            raise AssertionError("redis 패키지 없이 Redis 백엔드가 만들어졌습니다")
+
+
+def main():
+    """메인 테스트 함수"""
+    print("공유 캐시 백엔드 테스트를 시작합니다...\n")
+
+    test_sqlite_entries_shared_between_instances()
+    test_sqlite_lock_rows()
+    test_single_flight_across_processes()
+    test_redis_backend()
+
+    print("\n=== 테스트 완료 ===")
+
+
+if __name__ == "__main__":
+    main()
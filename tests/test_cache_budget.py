@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+응답 캐시 메모리 한도(바이트 단위)와 TinyLFU 입장 판단 테스트
+"""
+import time
+
+from app.core.cache import ResponseCache
+from app.core.cache_backends import MemoryCacheBackend, estimate_size
+
+
+def _page(query: str, count: int) -> dict:
+    """네이버 응답 형태의 값 (count개 아이템)"""
+    return {
+        "total": count,
+        "items": [
+            {"title": f"{query} 기사 {i}", "link": f"https://n.news.naver.com/{query}/{i}", "description": "설명" * 20}
+            for i in range(count)
+        ],
+    }
+
+
+def _lookup(backend: MemoryCacheBackend, key: str, value: dict):
+    """get_or_load처럼 조회 후 미스면 저장"""
+    if backend.get(key) is None:
+        backend.set(key, value, 300)
+
+
+def test_resident_bytes_stay_within_budget():
+    """크기가 크게 다른 항목들을 넣어도 추정 메모리가 한도를 넘지 않는지 테스트"""
+    print("=== 바이트 한도 테스트 ===")
+
+    large, small = _page("large", 100), _page("small", 5)
+    budget = estimate_size(large) * 3
+    backend = MemoryCacheBackend(max_entries=10000, max_bytes=budget)
+
+    # 같은 페이지를 두 번씩 조회하는 클라이언트 (처음 보는 키가 아니므로 입장)
+    for i in range(50):
+        for _ in range(2):
+            _lookup(backend, f"large:{i}", large)
+            _lookup(backend, f"small:{i}", small)
+            assert backend.resident_bytes <= budget
+
+    stats = ResponseCache(backend).stats()
+    print(f"✅ 항목 {stats['entries']}개, {stats['resident_bytes']}/{budget}B, 퇴출 {stats['evictions']}")
+    assert stats["resident_bytes"] == backend.resident_bytes > 0
+    assert stats["evictions"]["capacity"] > 0
+
+    for key in list(backend._entries):
+        backend.delete(key)
+    assert backend.resident_bytes == 0 and backend.size() == 0
+
+    # 한도보다 큰 항목은 받지 않음
+    tiny = MemoryCacheBackend(max_entries=100, max_bytes=1000)
+    tiny.set("large", large, 300)
+    assert tiny.get("large") is None and tiny.rejected == 1
+
+
+def test_one_off_queries_do_not_flush_hot_entries():
+    """한 번씩만 조회되는 키가 쏟아져도 자주 조회되는 항목이 남는지 테스트"""
+    print("\n=== 입장 판단 테스트 ===")
+
+    value = _page("hot", 20)
+    backend = MemoryCacheBackend(max_entries=10000, max_bytes=estimate_size(value) * 12)
+
+    hot_keys = [f"hot:{i}" for i in range(8)]
+    for _ in range(5):
+        for key in hot_keys:
+            _lookup(backend, key, value)
+
+    for i in range(500):
+        _lookup(backend, f"once:{i}", value)
+
+    survivors = [key for key in hot_keys if key in backend._entries]
+    print(f"✅ 자주 조회된 항목 {len(survivors)}/{len(hot_keys)}개 유지, 입장 거절 {backend.rejected}회")
+    assert survivors == hot_keys
+    assert backend.rejected > 0
+
+    # 두 번 이상 조회되기 시작한 새 키는 다시 들어올 수 있음
+    for _ in range(8):
+        _lookup(backend, "rising", value)
+    assert "rising" in backend._entries
+
+
+def test_expired_entries_are_evicted_first():
+    """만료된 항목은 입장 판단 없이 먼저 정리되고 퇴출 사유가 expired로 기록되는지 테스트"""
+    print("\n=== 만료 항목 정리 테스트 ===")
+
+    value = _page("page", 10)
+    backend = MemoryCacheBackend(max_entries=4)
+    for i in range(4):
+        for _ in range(3):
+            backend.get(f"old:{i}")
+        backend.set(f"old:{i}", value, 0.01)
+    time.sleep(0.02)
+
+    backend.set("new", value, 300)
+
+    print(f"✅ 퇴출 {backend.evictions}")
+    assert backend.get("new") is not None
+    assert backend.evictions["expired"] >= 1 and backend.evictions["capacity"] == 0
+
+
+def main():
+    """메인 테스트 함수"""
+    print("응답 캐시 메모리 한도 테스트를 시작합니다...\n")
+
+    test_resident_bytes_stay_within_budget()
+    test_one_off_queries_do_not_flush_hot_entries()
+    test_expired_entries_are_evicted_first()
+
+    print("\n=== 테스트 완료 ===")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+응답 캐시 스냅샷 테스트 (mmap 로드, 워커별 조각 파일)
+"""
+import os
+import tempfile
+import time
+
+from app.core.cache_backends import MemoryCacheBackend
+from app.core.cache_snapshot import SnapshotReader, key_hash, snapshot_paths, write_snapshot
+
+
+def _entries(count: int, ttl: float = 60.0) -> list:
+    now = time.time()
+    return [(f"naver:기업{i}", now + ttl, {"items": [{"title": f"기사 {i}"}], "total": i}) for i in range(count)]
+
+
+def test_round_trip_and_misses():
+    """저장한 항목을 mmap으로 다시 읽고, 없는 키(해시 범위 앞/뒤/사이)는 None인지 테스트"""
+    print("=== 스냅샷 왕복 테스트 ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "cache.snapshot")
+        entries = _entries(200)
+        count = write_snapshot(path, entries)
+        reader = SnapshotReader(path)
+        found = [reader.get(key) for key, _, _ in entries]
+        iterated = {key for key, _, _ in reader}
+
+        misses = [f"없는키{i}" for i in range(5000)]
+        hashes = sorted(key_hash(key) for key, _, _ in entries)
+        below = next(key for key in misses if key_hash(key) < hashes[0])
+        above = next(key for key in misses if key_hash(key) > hashes[-1])
+        missed = [reader.get(key) for key in misses]
+        reader.close()
+
+    print(f"✅ {count}개 저장, 앞/뒤 범위 밖 키 {below}, {above}")
+    assert count == 200 and reader.count == 200
+    assert all(entry is not None and entry[1] == value for entry, (_, _, value) in zip(found, entries))
+    assert iterated == {key for key, _, _ in entries}
+    assert all(entry is None for entry in missed)
+
+
+def test_expired_entries_dropped():
+    """저장 시 이미 만료된 항목은 버리고, 저장 후 만료된 항목은 조회/순회에서 빠지는지 테스트"""
+    print("\n=== 만료 항목 테스트 ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "cache.snapshot")
+        now = time.time()
+        count = write_snapshot(path, [
+            ("expired", now - 1, 1),
+            ("soon", now + 0.05, 2),
+            ("later", now + 60, 3),
+        ])
+        reader = SnapshotReader(path)
+        before = reader.get("soon")
+        time.sleep(0.1)
+        after = reader.get("soon")
+        remaining = [key for key, _, _ in reader]
+        reader.close()
+
+    print(f"✅ {count}개 저장, 만료 전 {before} → 후 {after}")
+    assert count == 2
+    assert before is not None and before[1] == 2
+    assert after is None
+    assert remaining == ["later"]
+
+
+def test_truncated_or_corrupt_file_ignored():
+    """빈 파일, 잘린 파일, 다른 형식, 손상된 항목을 무시하는지 테스트"""
+    print("\n=== 손상된 스냅샷 테스트 ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "cache.snapshot")
+        write_snapshot(path, _entries(20))
+        with open(path, "rb") as f:
+            data = f.read()
+
+        results = {}
+        for name, content in {
+            "empty": b"",
+            "header_only": data[:10],
+            "truncated": data[:len(data) - 5],
+            "bad_magic": b"XXXX" + data[4:],
+        }.items():
+            broken = os.path.join(tmp, name)
+            with open(broken, "wb") as f:
+                f.write(content)
+            results[name] = SnapshotReader.open(broken)
+
+        # 데이터 영역 손상: 열리기는 하지만 손상된 항목은 없는 것으로 처리
+        corrupt = os.path.join(tmp, "corrupt")
+        with open(corrupt, "wb") as f:
+            f.write(data[:-200] + b"\xff" * 200)
+        reader = SnapshotReader.open(corrupt)
+        lookups = [reader.get(key) for key, _, _ in _entries(20)]
+        iterated = list(reader)
+        reader.close()
+
+        backend = MemoryCacheBackend(100)
+        with open(path, "wb") as f:
+            f.write(data[:len(data) // 2])
+        loaded = backend.load_snapshot(path)
+
+    print(f"✅ {results}, 손상 후 조회 가능 {sum(entry is not None for entry in lookups)}/20")
+    assert all(reader is None for reader in results.values())
+    assert 0 < sum(entry is not None for entry in lookups) < 20
+    assert len(iterated) == sum(entry is not None for entry in lookups)
+    assert loaded is False
+
+
+def test_workers_write_separate_shards():
+    """워커마다 자기 조각 파일에 저장하고, 다음 시작 때 모든 워커의 항목을 읽는지 테스트"""
+    print("\n=== 워커별 조각 파일 테스트 ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "cache.snapshot")
+        first, second = MemoryCacheBackend(100), MemoryCacheBackend(100)
+        first.set("naver:삼성전자", {"total": 1}, ttl=60)
+        second.set("naver:LG전자", {"total": 2}, ttl=60)
+        # 두 워커가 차례로 종료하면서 저장
+        first.save_snapshot(path)
+        second.save_snapshot(path)
+        shards = [os.path.basename(shard) for shard in snapshot_paths(path)]
+
+        # 재시작: 잠금이 풀린 뒤 새 워커가 두 조각을 모두 읽음
+        first._shard_lock.close()
+        second._shard_lock.close()
+        restarted = MemoryCacheBackend(100)
+        restarted.load_snapshot(path)
+        values = restarted.get("naver:삼성전자"), restarted.get("naver:LG전자")
+        restarted.delete("naver:LG전자")
+        deleted = restarted.get("naver:LG전자")
+        restarted.save_snapshot(path)
+        reclaimed = restarted._shard
+
+    print(f"✅ 조각 {shards}, 재시작 후 {values}")
+    assert shards == ["cache.snapshot.0", "cache.snapshot.1"]
+    assert values == ({"total": 1}, {"total": 2})
+    assert deleted is None
+    assert os.path.basename(reclaimed) == "cache.snapshot.0"
+
+
+def main():
+    """메인 테스트 함수"""
+    print("응답 캐시 스냅샷 테스트를 시작합니다...\n")
+
+    test_round_trip_and_misses()
+    test_expired_entries_dropped()
+    test_truncated_or_corrupt_file_ignored()
+    test_workers_write_separate_shards()
+
+    print("\n=== 테스트 완료 ===")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+기업 언급 추출 테스트 (Aho-Corasick 기업 사전)
+"""
+import json
+import os
+import tempfile
+
+from app.services.company_dictionary import CompanyDictionary
+from app.utils.aho_corasick import AhoCorasick
+
+
+COMPANIES = [
+    {"name": "삼성전자", "aliases": ["Samsung Electronics", "삼성"], "ticker": "005930"},
+    {"name": "현대자동차", "aliases": ["현대차"], "ticker": "005380"},
+    {"name": "KT", "aliases": [], "ticker": "030200"},
+]
+
+
+def _make_dictionary() -> CompanyDictionary:
+    """임시 사전 파일로 기업 사전 생성"""
+    path = os.path.join(tempfile.mkdtemp(), "companies.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(COMPANIES, f, ensure_ascii=False)
+    return CompanyDictionary(path)
+
+
+def test_aho_corasick_overlapping():
+    """겹치는 패턴 매칭 테스트"""
+    print("=== Aho-Corasick 매칭 테스트 ===")
+    
+    automaton = AhoCorasick()
+    for pattern in ("he", "she", "his", "hers"):
+        automaton.add(pattern, pattern)
+    
+    matches = sorted(automaton.find_all("ushers"))
+    print(matches)
+    assert matches == [(1, 4, "she"), (2, 4, "he"), (2, 6, "hers")]
+    
+    # 삭제 후 추가해도 실패 링크가 다시 연결되어야 함
+    automaton.remove("she", "she")
+    automaton.add("sh", "sh")
+    assert sorted(automaton.find_all("ushers")) == [(1, 3, "sh"), (2, 4, "he"), (2, 6, "hers")]
+
+
+def test_extract_mentions():
+    """별칭, 종목코드, 단어 경계 처리 테스트"""
+    print("\n=== 기업 언급 추출 테스트 ===")
+    
+    dictionary = _make_dictionary()
+    mentions = dictionary.extract_mentions(
+        "삼성전자가 현대차와 협력",
+        "Samsung Electronics(005930) 주가 상승, KTX 증편"
+    )
+    print(mentions)
+    assert mentions == ["삼성전자", "현대자동차"]
+    
+    # 가장 긴 후보 우선: "삼성전자"의 "삼성"은 별도로 세지 않음
+    assert dictionary.extract_mentions("삼성전자 실적") == ["삼성전자"]
+    assert dictionary.extract_mentions("KT 실적 발표") == ["KT"]
+
+
+def test_dictionary_update():
+    """사전 변경이 오토마톤에 반영되는지 테스트"""
+    print("\n=== 기업 사전 변경 테스트 ===")
+    
+    dictionary = _make_dictionary()
+    dictionary.upsert({"name": "네이버", "aliases": ["NAVER"], "ticker": "035420"})
+    assert dictionary.extract_mentions("NAVER 신규 서비스") == ["네이버"]
+    
+    dictionary.remove("KT")
+    assert dictionary.extract_mentions("KT 실적 발표") == []
+    assert dictionary.get("035420")["name"] == "네이버"
+
+
+def main():
+    """메인 테스트 함수"""
+    print("기업 언급 추출 테스트를 시작합니다...\n")
+    
+    test_aho_corasick_overlapping()
+    test_extract_mentions()
+    test_dictionary_update()
+    
+    print("\n=== 테스트 완료 ===")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+요청 처리 시간 예산(deadline) 테스트
+"""
+import asyncio
+import http.server
+import threading
+import time
+
+import httpx
+from fastapi import BackgroundTasks, FastAPI, HTTPException
+
+from app.core import deadline
+from app.core.cache import ResponseCache
+from app.core.cache_backends import MemoryCacheBackend
+from app.core.deadline import DeadlineMiddleware, DeadlineStats
+from app.core.routes import UNMATCHED_ROUTE
+from app.services.naver_news import NaverNewsService
+
+
+def _create_app(events: list) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/api/v1/news/hang")
+    async def hang():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            events.append("cancelled")
+            raise
+
+    @app.get("/api/v1/news/fast")
+    async def fast(background_tasks: BackgroundTasks):
+        async def after_response():
+            await asyncio.sleep(0.3)
+            events.append("background done")
+        background_tasks.add_task(after_response)
+        return {"remaining": deadline.remaining()}
+
+    app.add_middleware(DeadlineMiddleware)
+    return app
+
+
+def test_middleware_budget():
+    """예산 초과 시 504, 응답 후 백그라운드 작업은 취소하지 않는지 테스트"""
+    print("=== 예산 미들웨어 테스트 ===")
+
+    events = []
+    app = _create_app(events)
+
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            started = time.perf_counter()
+            hung = await client.get("/api/v1/news/hang", headers={"X-Request-Timeout": "0.2"})
+            elapsed = time.perf_counter() - started
+            fast = await client.get("/api/v1/news/fast", headers={"X-Request-Timeout": "0.2"})
+            return hung, elapsed, fast
+
+    hung, elapsed, fast = asyncio.run(run())
+    print(f"✅ 504 응답 {elapsed * 1000:.0f}ms, 이벤트 {events}")
+    assert hung.status_code == 504
+    assert elapsed < 1.0
+    assert "cancelled" in events
+    assert fast.status_code == 200
+    assert 0 < fast.json()["remaining"] <= 0.2
+    assert "x-budget-remaining-ms" in fast.headers
+    assert "background done" in events
+
+
+def test_upstream_timeout_clamped():
+    """업스트림 timeout이 남은 예산으로 줄어들고, 예산이 없으면 호출하지 않는지 테스트"""
+    print("\n=== 업스트림 timeout 테스트 ===")
+
+    assert deadline.upstream_timeout(5.0) == 5.0
+    token = deadline.start(0.5)
+    try:
+        assert deadline.upstream_timeout(5.0) <= 0.5
+    finally:
+        deadline.reset(token)
+
+    token = deadline.start(-1)
+    try:
+        deadline.upstream_timeout(5.0)
+        raise AssertionError("예산이 없는데 업스트림 호출이 허용되었습니다")
+    except HTTPException as e:
+        assert e.status_code == 504
+    finally:
+        deadline.reset(token)
+    print("✅ timeout = min(기본값, 남은 예산)")
+
+
+class _HangingHandler(http.server.BaseHTTPRequestHandler):
+    """응답하지 않는 업스트림"""
+
+    def do_GET(self):
+        time.sleep(3)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_hung_upstream_released_at_deadline():
+    """응답하지 않는 네이버 API 호출이 예산 안에 끝나는지 테스트"""
+    print("\n=== 응답 없는 업스트림 테스트 ===")
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _HangingHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        service = NaverNewsService()
+        service.api_url = f"http://127.0.0.1:{server.server_address[1]}/v1/search/news.json"
+        service.client_id = service.client_secret = "test"
+
+        token = deadline.start(0.3)
+        started = time.perf_counter()
+        try:
+            service._request_page("삼성전자", 10, 1)
+            raise AssertionError("응답 없는 업스트림이 성공했습니다")
+        except HTTPException as e:
+            assert e.status_code == 504
+        finally:
+            deadline.reset(token)
+        elapsed = time.perf_counter() - started
+    finally:
+        server.shutdown()
+
+    print(f"✅ {elapsed * 1000:.0f}ms 만에 504")
+    assert elapsed < 1.0
+
+
+def test_coalesced_waiter_uses_own_budget():
+    """합쳐진 요청은 자기 예산만큼만 기다리고, 먼저 온 요청의 로드는 계속되는지 테스트"""
+    print("\n=== 합쳐진 요청 예산 테스트 ===")
+
+    cache = ResponseCache(MemoryCacheBackend(100))
+
+    async def slow_loader():
+        await asyncio.sleep(0.3)
+        return {"items": []}
+
+    async def waiter():
+        await asyncio.sleep(0.01)
+        token = deadline.start(0.05)
+        try:
+            await cache.get_or_load("key", slow_loader, ttl=60)
+        except HTTPException as e:
+            return e.status_code
+        finally:
+            deadline.reset(token)
+
+    async def run():
+        return await asyncio.gather(cache.get_or_load("key", slow_loader, ttl=60), waiter())
+
+    leader, waiter_status = asyncio.run(run())
+    print(f"✅ 먼저 온 요청 {leader}, 합쳐진 요청 {waiter_status}")
+    assert leader == {"items": []}
+    assert waiter_status == 504
+
+
+def test_unmatched_routes_share_stats():
+    """라우트가 없는 경로의 예산 통계는 경로마다가 아니라 하나의 항목에 모이는지 테스트"""
+    print("\n=== 라우트 없는 경로 통계 테스트 ===")
+
+    app = _create_app([])
+    saved, deadline.deadline_stats = deadline.deadline_stats, DeadlineStats()
+
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            for i in range(20):
+                await client.get(f"/api/v1/scan/{i}", headers={"X-Request-Timeout": "1"})
+            await client.get("/api/v1/news/fast", headers={"X-Request-Timeout": "1"})
+
+    try:
+        asyncio.run(run())
+        routes = deadline.deadline_stats.snapshot()["routes"]
+    finally:
+        deadline.deadline_stats = saved
+
+    print(f"✅ 통계 항목 {routes}")
+    assert set(routes) == {UNMATCHED_ROUTE, "/api/v1/news/fast"}
+    assert routes[UNMATCHED_ROUTE]["requests"] == 20
+
+
+def main():
+    """메인 테스트 함수"""
+    print("요청 처리 시간 예산 테스트를 시작합니다...\n")
+
+    test_middleware_budget()
+    test_upstream_timeout_clamped()
+    test_hung_upstream_released_at_deadline()
+    test_coalesced_waiter_uses_own_budget()
+    test_unmatched_routes_share_stats()
+
+    print("\n=== 테스트 완료 ===")
+
+
+if __name__ == "__main__":
+    main()
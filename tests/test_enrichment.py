@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+기사 보강 파이프라인 테스트
+"""
+import asyncio
+import os
+import tempfile
+import time
+
+from app.core.settings import settings
+from app.services.article_store import ArticleStore
+from app.services.enrichment import EnrichmentPipeline, enrich_batch
+from app.services.ingestion import IngestionService
+from app.services.sentiment import get_sentiment_scorer
+
+
+def _records(company: str, count: int, start: int = 0) -> list:
+    return [
+        (
+            f"https://news.com/{company}/{i}", "naver", f"<b>{company}</b> 실적 발표 {i}",
+            f"{company} 영업이익 &quot;증가&quot; {i}", "Mon, 01 Jan 2024 09:00:00 +0900", None, None
+        )
+        for i in range(start, start + count)
+    ]
+
+
+def test_enrich_batch_cleans_and_dedups():
+    """HTML 정리, 발행일시 정규화, 중복 제거, 감정/기업 언급 보강 테스트"""
+    print("=== 배치 보강 테스트 ===")
+
+    records = _records("삼성전자", 2)
+    duplicate_url = records[0]
+    # 다른 URL로 배포된 같은 내용의 기사
+    duplicate_content = ("https://other.com/1",) + records[1][1:]
+    provided = ("https://news.com/x", "deepsearch", "LG전자 신제품", "설명", "2024-01-01T00:00:00Z",
+                "positive", ["LG전자"])
+
+    groups = enrich_batch([[*records, duplicate_url, duplicate_content], [provided]])
+
+    first, second = groups
+    print(f"✅ {len(first)}건, {first[0]}")
+    assert len(first) == 2 and len(second) == 1
+    url, source, title, description, published_at, sentiment, mentions = first[0]
+    assert title == "삼성전자 실적 발표 0"
+    assert description == '삼성전자 영업이익 "증가" 0'
+    assert published_at == "2024-01-01T00:00:00Z"
+    assert sentiment == get_sentiment_scorer().score_batch([(title, description)])[0]
+    assert "삼성전자" in mentions
+    # 제공자가 준 감정은 유지하고 기업 언급은 합침
+    assert second[0][5] == "positive"
+    assert second[0][6][0] == "LG전자" and len(set(second[0][6])) == len(second[0][6])
+
+
+def test_pipeline_process_pool():
+    """프로세스 풀에서 보강하여 저장하고, 보강 중에도 이벤트 루프가 막히지 않는지 테스트"""
+    print("\n=== 프로세스 풀 파이프라인 테스트 ===")
+
+    fetch_enabled = settings.article_fetch_enabled
+    settings.article_fetch_enabled = False
+
+    async def run():
+        with tempfile.TemporaryDirectory() as tmp:
+            service = IngestionService(store=ArticleStore(os.path.join(tmp, "news.db")))
+            pipeline = EnrichmentPipeline(workers=1)
+            pipeline.start()
+            try:
+                # 워커 프로세스 준비
+                await pipeline.submit(service.store, "삼성전자", _records("삼성전자", 1, start=-1))
+
+                lags = []
+                stop = asyncio.Event()
+
+                async def ticker():
+                    while not stop.is_set():
+                        started = time.perf_counter()
+                        await asyncio.sleep(0)
+                        lags.append(time.perf_counter() - started)
+                        await asyncio.sleep(0.001)
+
+                ticking = asyncio.create_task(ticker())
+                results = await asyncio.gather(
+                    pipeline.submit(service.store, "삼성전자", _records("삼성전자", 3000)),
+                    pipeline.submit(service.store, "LG전자", _records("LG전자", 3000)),
+                    pipeline.submit(service.store, "삼성전자", _records("삼성전자", 10)),
+                )
+                stop.set()
+                await ticking
+                return [len(added) for added in results], max(lags), pipeline.stats()
+            finally:
+                await pipeline.stop()
+
+    try:
+        counts, max_lag, stats = asyncio.run(run())
+    finally:
+        settings.article_fetch_enabled = fetch_enabled
+
+    print(f"✅ 저장 {counts}, 최대 루프 지연 {max_lag * 1000:.2f}ms, {stats}")
+    # 세 번째 작업은 첫 번째 작업과 같은 기사라 새로 저장되지 않음
+    assert counts == [3000, 3000, 0]
+    assert stats["records"] == 6011
+    assert max_lag < 0.05
+
+
+def test_pipeline_backpressure():
+    """보강이 밀리면 대기열 크기를 넘겨 쌓지 않고 제출하는 쪽이 기다리는지 테스트"""
+    print("\n=== 대기열 backpressure 테스트 ===")
+
+    queue_size = settings.enrichment_queue_size
+    settings.enrichment_queue_size = 2
+
+    async def run():
+        with tempfile.TemporaryDirectory() as tmp:
+            store = ArticleStore(os.path.join(tmp, "news.db"))
+            pipeline = EnrichmentPipeline(workers=0)
+            pipeline.batch_size = 1
+            release = asyncio.Event()
+            enrich = pipeline._enrich
+
+            async def slow_enrich(groups):
+                await release.wait()
+                return await enrich(groups)
+
+            pipeline._enrich = slow_enrich
+            pipeline.start()
+            try:
+                submits = [
+                    asyncio.create_task(pipeline.submit(store, "삼성전자", _records("삼성전자", 1, start=i)))
+                    for i in range(10)
+                ]
+                await asyncio.sleep(0.1)
+                stalled = pipeline.stats()
+                release.set()
+                added = await asyncio.gather(*submits)
+                return stalled, sum(len(a) for a in added)
+            finally:
+                await pipeline.stop()
+
+    try:
+        stalled, total = asyncio.run(run())
+    finally:
+        settings.enrichment_queue_size = queue_size
+
+    print(f"✅ 밀린 상태 {stalled}, 저장 {total}건")
+    assert stalled["queued"] <= 2 and stalled["in_flight_batches"] <= 2
+    assert total == 10
+
+
+def main():
+    """메인 테스트 함수"""
+    print("기사 보강 파이프라인 테스트를 시작합니다...\n")
+
+    test_enrich_batch_cleans_and_dedups()
+    test_pipeline_process_pool()
+    test_pipeline_backpressure()
+
+    print("\n=== 테스트 완료 ===")
+
+
+if __name__ == "__main__":
+    main()
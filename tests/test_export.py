@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+기사 내보내기 테스트
+"""
+import csv
+import io
+import json
+import os
+import tempfile
+
+from app.export import main as export_main, _write_checkpoint
+from app.services.article_store import ArticleStore
+from app.services.export import parquet_available, stream_export
+
+
+def _fill_store(path: str, count: int) -> ArticleStore:
+    store = ArticleStore(path)
+    for company in ("삼성전자", "LG전자"):
+        store.add_articles(company, [
+            {
+                "url": f"https://news.com/{company}/{i}",
+                "source": "naver",
+                "title": f"{company} 기사 {i}",
+                "description": "설명, \"따옴표\" 포함",
+                "published_at": f"2024-01-{i % 28 + 1:02d}T00:00:00Z",
+                "sentiment": "neutral",
+                "company_mentions": [company],
+            }
+            for i in range(count)
+        ])
+    return store
+
+
+def test_stream_formats():
+    """NDJSON/CSV/Parquet 스트리밍 및 필터 테스트"""
+    print("=== 형식별 내보내기 테스트 ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = _fill_store(os.path.join(tmp, "news.db"), 100)
+
+        ndjson = b"".join(stream_export(store, "ndjson", company="삼성전자", chunk_size=7))
+        rows = [json.loads(line) for line in ndjson.decode("utf-8").splitlines()]
+        assert len(rows) == 100
+        assert rows[0]["company_mentions"] == ["삼성전자"]
+        assert [row["id"] for row in rows] == sorted(row["id"] for row in rows)
+
+        ranged = b"".join(stream_export(store, "ndjson", since="2024-01-01T00:00:00Z", until="2024-01-02T00:00:00Z"))
+        assert len(ranged.splitlines()) == 8
+
+        resumed = b"".join(stream_export(store, "csv", company="삼성전자", after_id=rows[49]["id"], chunk_size=7))
+        csv_rows = list(csv.reader(io.StringIO(resumed.decode("utf-8"))))
+        assert len(csv_rows) == 50
+        assert int(csv_rows[0][0]) == rows[50]["id"]
+
+        print(f"✅ NDJSON {len(rows)}행, 이어받은 CSV {len(csv_rows)}행")
+
+        if parquet_available():
+            import pyarrow.parquet as pq
+            data = b"".join(stream_export(store, "parquet", chunk_size=30))
+            table = pq.read_table(io.BytesIO(data))
+            assert table.num_rows == 200
+            assert table.column("company_mentions")[0].as_py() in (["삼성전자"], ["LG전자"])
+            print(f"✅ Parquet {table.num_rows}행")
+
+
+def test_cli_resume():
+    """CLI가 중단된 지점에서 이어서 내보내는지 테스트"""
+    print("\n=== CLI 이어받기 테스트 ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "news.db")
+        _fill_store(db_path, 50)
+        output = os.path.join(tmp, "out.ndjson")
+
+        assert export_main(["--output", output, "--store", db_path, "--chunk-size", "10"]) == 0
+        with open(output, "rb") as f:
+            complete = f.read()
+
+        # 30행까지 쓴 뒤 일부만 쓰다가 중단된 상황 재현
+        lines = complete.splitlines(keepends=True)
+        partial = b"".join(lines[:30])
+        with open(output, "wb") as f:
+            f.write(partial + lines[30][:10])
+        _write_checkpoint(output, json.loads(lines[29])["id"], len(partial))
+
+        assert export_main(["--output", output, "--store", db_path, "--chunk-size", "10", "--resume"]) == 0
+        with open(output, "rb") as f:
+            resumed = f.read()
+
+    print(f"✅ 이어받은 결과 {len(resumed.splitlines())}행")
+    assert resumed == complete
+
+
+def test_cli_resume_csv_without_file():
+    """체크포인트만 남고 CSV 파일이 없으면 헤더부터 다시 쓰는지 테스트"""
+    print("\n=== CSV 파일 없이 이어받기 테스트 ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "news.db")
+        _fill_store(db_path, 10)
+        output = os.path.join(tmp, "out.csv")
+        _write_checkpoint(output, 5, 1234)
+
+        assert export_main(["--output", output, "--store", db_path, "--format", "csv", "--resume"]) == 0
+        with open(output, encoding="utf-8", newline="") as f:
+            rows = list(csv.reader(f))
+
+    print(f"✅ 헤더 {rows[0][:3]}, {len(rows) - 1}행")
+    assert rows[0][0] == "id"
+    assert [int(row[0]) for row in rows[1:]] == list(range(6, 21))
+
+
+def main():
+    """메인 테스트 함수"""
+    print("기사 내보내기 테스트를 시작합니다...\n")
+
+    test_stream_formats()
+    test_cli_resume()
+    test_cli_resume_csv_without_file()
+
+    print("\n=== 테스트 완료 ===")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+RSS/Atom 피드 뉴스 서비스 테스트 (로컬 HTTP 서버 사용)
+"""
+import asyncio
+import http.server
+import threading
+import time
+
+from app.models.news import FeedNewsRequest
+from app.services import feed_news
+from app.services.feed_news import FeedNewsService, FeedState, parse_feed_stream
+
+
+RSS_FEED = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel><title>경제 뉴스</title>
+<item>
+  <title>삼성전자 3분기 실적 발표</title>
+  <link>https://news.example.com/rss/1</link>
+  <description>&lt;b&gt;삼성전자&lt;/b&gt;가 3분기 실적을 발표했다.</description>
+  <pubDate>Mon, 07 Oct 2024 09:00:00 +0900</pubDate>
+</item>
+<item>
+  <title>LG전자 신제품 공개</title>
+  <link>https://news.example.com/rss/2</link>
+  <description>LG전자가 신제품을 공개했다.</description>
+  <pubDate>Mon, 07 Oct 2024 10:00:00 +0900</pubDate>
+</item>
+</channel></rss>
+""".encode("utf-8")
+
+ATOM_FEED = """<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom"><title>산업 뉴스</title>
+<entry>
+  <title>삼성전자 반도체 투자 확대</title>
+  <link rel="alternate" href="https://news.example.com/atom/1"/>
+  <link rel="enclosure" href="https://news.example.com/atom/1.jpg"/>
+  <summary>삼성전자가 반도체 투자를 확대한다.</summary>
+  <updated>2024-10-07T03:00:00Z</updated>
+</entry>
+</feed>
+""".encode("utf-8")
+
+FEEDS = {"/rss": (RSS_FEED, '"rss-v1"'), "/atom": (ATOM_FEED, '"atom-v1"')}
+
+
+class _FeedHandler(http.server.BaseHTTPRequestHandler):
+    """ETag가 같으면 304를 반환하는 피드 핸들러"""
+
+    requests = []
+
+    def do_GET(self):
+        if self.path == "/slow":
+            time.sleep(0.5)
+            body, etag = FEEDS["/rss"]
+        else:
+            body, etag = FEEDS[self.path]
+        if self.headers.get("If-None-Match") == etag:
+            _FeedHandler.requests.append((self.path, 304))
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        _FeedHandler.requests.append((self.path, 200))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/xml; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _start_server():
+    """로컬 HTTP 서버 시작"""
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _FeedHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def test_parse_rss_and_atom_stream():
+    """작은 청크로 나눠 넣어도 RSS/Atom 항목을 정규화하는지 테스트"""
+    print("=== 피드 스트리밍 파싱 테스트 ===")
+
+    rss = parse_feed_stream(RSS_FEED[i:i + 7] for i in range(0, len(RSS_FEED), 7))
+    atom = parse_feed_stream(ATOM_FEED[i:i + 7] for i in range(0, len(ATOM_FEED), 7))
+
+    print(f"✅ RSS {len(rss)}개, Atom {len(atom)}개: {atom[0]}")
+    assert [entry["link"] for entry in rss] == ["https://news.example.com/rss/1", "https://news.example.com/rss/2"]
+    assert rss[0]["title"] == "삼성전자 3분기 실적 발표"
+    assert rss[0]["description"] == "삼성전자가 3분기 실적을 발표했다."
+    assert rss[0]["pubDate"] == "Mon, 07 Oct 2024 09:00:00 +0900"
+    # Atom: alternate 링크만, ISO 날짜는 RFC 822로
+    assert atom[0]["link"] == "https://news.example.com/atom/1"
+    assert atom[0]["description"] == "삼성전자가 반도체 투자를 확대한다."
+    assert atom[0]["pubDate"] == "Mon, 07 Oct 2024 03:00:00 +0000"
+
+
+def test_conditional_poll_skips_parsing():
+    """두 번째 폴링은 304를 받아 파싱하지 않고 이전 항목을 유지하는지 테스트"""
+    print("\n=== 조건부 요청 테스트 ===")
+
+    server = _start_server()
+    parsed = []
+    original_parse = feed_news.parse_feed_stream
+
+    def counting_parse(chunks):
+        parsed.append(1)
+        return original_parse(chunks)
+
+    feed_news.parse_feed_stream = counting_parse
+    _FeedHandler.requests = []
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}/rss"
+        service = FeedNewsService()
+        state = FeedState(url)
+        service._poll_feed(state)
+        entries = state.entries
+        service._poll_feed(state)
+    finally:
+        feed_news.parse_feed_stream = original_parse
+        server.shutdown()
+
+    print(f"✅ 요청 {_FeedHandler.requests}, 파싱 {len(parsed)}회")
+    assert _FeedHandler.requests == [("/rss", 200), ("/rss", 304)]
+    assert len(parsed) == 1
+    assert state.etag == '"rss-v1"'
+    assert state.entries is entries and len(entries) == 2
+
+
+def test_search_company_news_across_feeds():
+    """여러 피드에서 기업을 언급한 항목만 최신 순으로 모으는지 테스트"""
+    print("\n=== 피드 기업 검색 테스트 ===")
+
+    server = _start_server()
+    try:
+        base_url = f"http://127.0.0.1:{server.server_address[1]}"
+        service = FeedNewsService()
+        service.feed_urls = [f"{base_url}/rss", f"{base_url}/atom"]
+        service.poll_interval = 0
+        response = asyncio.run(service.search_company_news(FeedNewsRequest(company_name="삼성전자", limit=10)))
+    finally:
+        server.shutdown()
+
+    links = [item.link for item in response.items]
+    print(f"✅ {links}")
+    assert links == ["https://news.example.com/atom/1", "https://news.example.com/rss/1"]
+    assert all(item.source == "feed" for item in response.items)
+    assert response.total == 2
+
+
+def test_slow_feed_does_not_block_other_feeds():
+    """느린 피드를 폴링하는 동안에도 다른 피드만 검색하는 요청은 기다리지 않는지 테스트"""
+    print("\n=== 피드별 잠금 테스트 ===")
+
+    server = _start_server()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    slow, fast = FeedNewsService(), FeedNewsService()
+    slow.feed_urls, fast.feed_urls = [f"{base_url}/slow"], [f"{base_url}/atom"]
+    slow.poll_interval = fast.poll_interval = 0
+
+    async def run():
+        started = time.monotonic()
+
+        async def timed(service):
+            await service.search_company_news(FeedNewsRequest(company_name="삼성전자", limit=10))
+            return time.monotonic() - started
+
+        return await asyncio.gather(timed(slow), timed(fast))
+
+    try:
+        slow_elapsed, fast_elapsed = asyncio.run(run())
+    finally:
+        server.shutdown()
+
+    print(f"✅ 느린 피드 {slow_elapsed:.2f}초, 다른 피드 {fast_elapsed:.2f}초")
+    assert slow_elapsed >= 0.5
+    assert fast_elapsed < 0.4
+
+
+def main():
+    """메인 테스트 함수"""
+    print("RSS/Atom 피드 뉴스 테스트를 시작합니다...\n")
+
+    test_parse_rss_and_atom_stream()
+    test_conditional_poll_skips_parsing()
+    test_search_company_news_across_feeds()
+    test_slow_feed_does_not_block_other_feeds()
+
+    print("\n=== 테스트 완료 ===")
+
+
+if __name__ == "__main__":
+    main()
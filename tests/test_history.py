@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+기사 이력 keyset 페이지네이션 테스트
+"""
+import asyncio
+import os
+import tempfile
+import time
+
+from app.services.article_store import ArticleStore
+from app.services.history import HistoryService, encode_cursor
+
+
+def _article(i: int, published_at: str) -> dict:
+    return {
+        "url": f"https://news.com/{i}",
+        "source": "naver",
+        "title": f"기사 {i}",
+        "description": "설명",
+        "published_at": published_at,
+        "sentiment": "neutral",
+        "company_mentions": ["삼성전자"],
+    }
+
+
+def _walk_from(service: HistoryService, cursor: str) -> list:
+    """cursor부터 마지막 페이지까지 조회"""
+    items = []
+    while cursor:
+        page = asyncio.run(service.get_history("삼성전자", 10, cursor))
+        items.extend(page["items"])
+        cursor = page["next_cursor"]
+    return items
+
+
+def test_pages_are_stable_under_inserts():
+    """페이지 순회 중 새 기사가 추가되어도 중복/누락이 없는지 테스트"""
+    print("=== keyset 페이지 테스트 ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ArticleStore(os.path.join(tmp, "news.db"))
+        # 같은 발행일시가 여러 개인 경우도 포함
+        store.add_articles("삼성전자", [
+            _article(i, f"2024-01-{i // 10 + 1:02d}T09:00:00Z") for i in range(95)
+        ])
+        store.add_articles("삼성전자", [_article(999, "Mon, 01 Jan 2024 10:00:00 +0900")])
+        service = HistoryService(store)
+
+        first = asyncio.run(service.get_history("삼성전자", 10))
+        store.add_articles("삼성전자", [_article(1000 + i, "2024-02-01T00:00:00Z") for i in range(5)])
+        rest = _walk_from(service, first["next_cursor"])
+
+        items = first["items"] + rest
+        keys = [(item["published_at"], item["id"]) for item in items]
+
+    print(f"✅ {len(items)}개 기사를 중복 없이 조회")
+    assert len(items) == 95
+    assert keys == sorted(keys, reverse=True)
+    assert len(set(keys)) == len(keys)
+
+
+def test_deep_page_uses_index():
+    """깊은 페이지도 인덱스 탐색으로 첫 페이지와 비슷한 속도로 조회되는지 테스트"""
+    print("\n=== 깊은 페이지 속도 테스트 ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ArticleStore(os.path.join(tmp, "news.db"))
+        store.add_articles("삼성전자", [
+            _article(i, f"2020-01-01T00:00:{i % 60:02d}Z") for i in range(200000)
+        ])
+        plan = store._connection().execute(
+            "EXPLAIN QUERY PLAN SELECT id FROM articles WHERE company = ? AND (published_at, id) < (?, ?) "
+            "ORDER BY published_at DESC, id DESC LIMIT 20",
+            ("삼성전자", "2020", 1)
+        ).fetchall()
+        service = HistoryService(store)
+
+        started = time.perf_counter()
+        asyncio.run(service.get_history("삼성전자", 20))
+        first_page = time.perf_counter() - started
+
+        deep = store.history_page("삼성전자", ("9999", 2 ** 63 - 1), 199990)[-1]
+        cursor = encode_cursor(deep["published_at"], deep["id"])
+        started = time.perf_counter()
+        page = asyncio.run(service.get_history("삼성전자", 20, cursor))
+        deep_page = time.perf_counter() - started
+
+    print(f"✅ 첫 페이지 {first_page * 1000:.2f}ms, 10,000번째 페이지 {deep_page * 1000:.2f}ms")
+    assert "ix_articles_company_published" in str(plan)
+    assert "TEMP B-TREE" not in str(plan)
+    assert len(page["items"]) == 10
+    assert deep_page < 0.05
+
+
+def test_published_since_uses_index():
+    """기업과 무관한 기간 조회(집계/급상승 시작 시 적재)가 전체 테이블을 훑지 않고 인덱스를 쓰는지 테스트"""
+    print("\n=== 기간 조회 인덱스 테스트 ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ArticleStore(os.path.join(tmp, "news.db"))
+        store.add_articles("삼성전자", [_article(i, f"2020-01-01T00:00:{i:02d}Z") for i in range(30)])
+        store.add_articles("LG전자", [_article(i, f"2020-01-02T00:00:{i:02d}Z") for i in range(30)])
+        plans = [
+            str(store._connection().execute(f"EXPLAIN QUERY PLAN {query}", ("2020-01-02",)).fetchall())
+            for query in (
+                "SELECT company, url FROM articles WHERE published_at >= ? AND published_at LIKE '____-__-__T%'",
+                "SELECT company, url FROM articles WHERE published_at >= ? AND published_at LIKE '____-__-__T%' "
+                "ORDER BY published_at, id",
+            )
+        ]
+        rows = list(store.iter_published_since("2020-01-02"))
+        texts = list(store.iter_texts_since("2020-01-01T00:00:29Z"))
+
+    print(f"✅ {plans[0]}")
+    assert all("ix_articles_published" in plan and "TEMP B-TREE" not in plan for plan in plans)
+    assert len(rows) == 30 and {row[0] for row in rows} == {"LG전자"}
+    assert [text[4] for text in texts] == sorted(text[4] for text in texts) and len(texts) == 31
+
+
+def main():
+    """메인 테스트 함수"""
+    print("기사 이력 페이지네이션 테스트를 시작합니다...\n")
+
+    test_pages_are_stable_under_inserts()
+    test_deep_page_uses_index()
+    test_published_since_uses_index()
+
+    print("\n=== 테스트 완료 ===")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+수집 워커와 읽기 전용 API 모드 테스트
+"""
+import asyncio
+import os
+import tempfile
+
+import httpx
+
+from app.api.v1.endpoints import news
+from app.core.settings import settings
+from app.main import app
+from app.services.article_store import ArticleStore
+from app.services.deepsearch_news import DeepSearchNewsService
+from app.services.feed_news import FeedNewsService
+from app.services.ingest_worker import IngestWorker
+from app.services.ingestion import IngestionService, add_article_listener, remove_article_listener
+from app.services.naver_news import NaverNewsService
+from app.services.store_follower import StoreFollower
+from app.services.webhooks import WebhookDispatcher, WebhookStore
+
+
+class _FakeNaverService(NaverNewsService):
+    """호출할 때마다 기사 하나가 새로 올라오는 네이버 API 대역"""
+
+    def __init__(self):
+        super().__init__()
+        self.client_id = self.client_secret = "test"
+        self.calls = {}
+
+    async def refresh_page(self, query: str, display: int, start: int) -> dict:
+        self.calls[query] = self.calls.get(query, 0) + 1
+        items = [
+            {
+                "title": f"{query} 기사 {i}",
+                "originallink": f"https://news.com/{query}/{i}",
+                "link": f"https://n.news.naver.com/{query}/{i}",
+                "description": f"{query} 관련 뉴스",
+                "pubDate": "Mon, 01 Jan 2024 09:00:00 +0900",
+            }
+            for i in range(self.calls[query] + 4)
+        ]
+        return {"total": len(items), "start": 1, "display": display, "items": items}
+
+    async def fetch_page(self, query: str, display: int, start: int) -> dict:
+        return await self.refresh_page(query, display, start)
+
+
+def _worker(store: ArticleStore, naver: NaverNewsService) -> IngestWorker:
+    deepsearch = DeepSearchNewsService()
+    deepsearch.api_key = None
+    feed = FeedNewsService()
+    feed.feed_urls = []
+    return IngestWorker(
+        ["삼성전자", "LG전자"],
+        ingestion_service=IngestionService(store=store),
+        naver_service=naver,
+        deepsearch_service=deepsearch,
+        feed_service=feed
+    )
+
+
+def test_worker_ingests_watchlist_and_follower_delivers():
+    """수집 워커가 새 기사만 저장하고, 다른 프로세스의 추종기가 새 기사를 리스너에 전달하는지 테스트"""
+    print("=== 수집 워커/저장소 추종 테스트 ===")
+
+    fetch_enabled = settings.article_fetch_enabled
+    settings.article_fetch_enabled = False
+    received = []
+
+    async def listener(company, articles):
+        received.extend((company, article["url"]) for article in articles)
+
+    async def run():
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "news.db")
+            worker = _worker(ArticleStore(path), _FakeNaverService())
+            first = await worker.run_once()
+
+            # API 워커 쪽: 위치를 잡은 시점 이후 저장된 기사만 따라 읽음
+            follower = StoreFollower(ArticleStore(path))
+            await follower.mark()
+            # 읽기 모델들이 적재하는 사이에 저장된 기사도 놓치지 않음
+            second = await worker.run_once()
+            await follower.start()
+            follower.stop()
+            third = await worker.run_once()
+            delivered = await follower.poll_once()
+            idle = await follower.poll_once()
+            return first, (second, third), delivered, idle
+
+    add_article_listener(listener)
+    try:
+        first, second, delivered, idle = asyncio.run(run())
+    finally:
+        remove_article_listener(listener)
+        settings.article_fetch_enabled = fetch_enabled
+
+    print(f"✅ 첫 수집 {first}, 두 번째 수집 {second}, 추종기 전달 {delivered}건")
+    assert first == {"삼성전자": 5, "LG전자": 5}
+    assert second == ({"삼성전자": 1, "LG전자": 1},) * 2
+    assert delivered == 4 and idle == 0
+    # 수집 워커 안의 리스너 호출 14건 + 추종기 전달 4건
+    assert {("삼성전자", "https://news.com/삼성전자/5"), ("삼성전자", "https://news.com/삼성전자/6")} <= set(received[-4:])
+    assert len(received) == 18
+
+
+def test_worker_reloads_webhook_subscriptions():
+    """API 워커에서 추가/삭제한 구독이 수집 워커의 전달 대상에 반영되는지 테스트"""
+    print("\n=== 웹훅 구독 반영 테스트 ===")
+
+    async def run():
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "webhooks.db")
+            api_side = WebhookDispatcher(WebhookStore(path))
+            worker_side = WebhookDispatcher(WebhookStore(path))
+            await worker_side.reload_subscriptions()
+            before = dict(worker_side._by_company)
+
+            subscription = await api_side.subscribe("http://127.0.0.1:1/hook", ["삼성전자"])
+            await worker_side.reload_subscriptions()
+            added = dict(worker_side._by_company)
+
+            await api_side.unsubscribe(subscription["id"])
+            await worker_side.reload_subscriptions()
+            return before, added, dict(worker_side._by_company)
+
+    before, added, removed = asyncio.run(run())
+    print(f"✅ {before} → {added} → {removed}")
+    assert before == {} and removed == {}
+    assert "삼성전자" in added
+
+
+def test_read_only_api_does_not_ingest():
+    """읽기 전용 모드의 API는 검색 결과를 수집하지 않는지 테스트"""
+    print("\n=== 읽기 전용 API 테스트 ===")
+
+    ingested = []
+
+    class _RecordingIngestion:
+        async def ingest_and_enrich(self, company, items):
+            ingested.append(company)
+            return []
+
+    app.dependency_overrides[news.get_naver_service] = _FakeNaverService
+    app.dependency_overrides[news.get_ingestion_service] = _RecordingIngestion
+
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            settings.api_read_only = True
+            read_only = await client.get("/api/v1/news/company/삼성전자")
+            settings.api_read_only = False
+            read_write = await client.get("/api/v1/news/company/삼성전자")
+            return read_only, read_write
+
+    try:
+        read_only, read_write = asyncio.run(run())
+    finally:
+        settings.api_read_only = False
+        app.dependency_overrides.clear()
+
+    print(f"✅ 읽기 전용 {read_only.status_code}, 수집 {ingested}")
+    assert read_only.status_code == 200 and read_write.status_code == 200
+    assert ingested == ["삼성전자"]
+
+
+def main():
+    """메인 테스트 함수"""
+    print("수집 워커 테스트를 시작합니다...\n")
+
+    test_worker_ingests_watchlist_and_follower_delivers()
+    test_worker_reloads_webhook_subscriptions()
+    test_read_only_api_does_not_ingest()
+
+    print("\n=== 테스트 완료 ===")
+
+
+if __name__ == "__main__":
+    main()
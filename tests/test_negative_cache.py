@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+부정 캐시 (빈 결과, 업스트림 오류) 테스트
+"""
+import asyncio
+import http.server
+import json
+import threading
+
+from fastapi import HTTPException
+
+from app.core.cache import ResponseCache, UpstreamError, jittered
+from app.core.cache_backends import MemoryCacheBackend
+from app.services.naver_news import NaverNewsService
+
+
+class _NaverStub(http.server.BaseHTTPRequestHandler):
+    """검색어에 따라 빈 결과, 400, 500, 정상 결과를 돌려주는 네이버 API 대역"""
+
+    calls = []
+
+    def do_GET(self):
+        query = self.path.split("query=")[1].split("&")[0]
+        self.calls.append(query)
+        if query == "bad":
+            self.send_response(400)
+            self.end_headers()
+            return
+        if query == "down":
+            self.send_response(500)
+            self.end_headers()
+            return
+        items = [] if query == "typo" else [{"title": "기사", "link": "https://n.news.naver.com/1"}]
+        body = json.dumps({"total": len(items), "start": 1, "display": 10, "items": items}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _service(port: int) -> NaverNewsService:
+    service = NaverNewsService()
+    service.api_url = f"http://127.0.0.1:{port}/v1/search/news.json"
+    service.client_id = service.client_secret = "test"
+    service.cache = ResponseCache(MemoryCacheBackend(100))
+    return service
+
+
+async def _fetch(service: NaverNewsService, query: str):
+    try:
+        return await service.fetch_page(query, 10, 1)
+    except HTTPException as e:
+        return e
+
+
+def test_repeated_bad_queries_stop_reaching_upstream():
+    """빈 결과와 4xx/5xx 오류는 반복 요청해도 업스트림을 한 번만 호출하는지 테스트"""
+    print("=== 반복 잘못된 검색어 테스트 ===")
+
+    _NaverStub.calls = []
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _NaverStub)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        service = _service(server.server_address[1])
+
+        async def run():
+            results = {}
+            for query in ("typo", "bad", "down"):
+                results[query] = [await _fetch(service, query) for _ in range(20)]
+            return results
+
+        results = asyncio.run(run())
+    finally:
+        server.shutdown()
+
+    stats = service.cache.stats()
+    print(f"✅ 업스트림 호출 {_NaverStub.calls}, 부정 캐시 {stats['negative_stored']}")
+    assert sorted(_NaverStub.calls) == ["bad", "down", "typo"]
+    assert all(result["items"] == [] for result in results["typo"])
+    assert all(isinstance(e, UpstreamError) and e.kind == "client_error" for e in results["bad"])
+    assert all(isinstance(e, UpstreamError) and e.kind == "server_error" for e in results["down"])
+    assert stats["negative_hits"] == 38
+    assert stats["negative_stored"]["empty"] == 1
+
+
+def test_negative_entries_expire_by_kind():
+    """오류 종류별 TTL로 만료되어 다시 로드하는지 테스트"""
+    print("\n=== 종류별 TTL 테스트 ===")
+
+    cache = ResponseCache(MemoryCacheBackend(100))
+    cache.negative_ttls.update({"empty": 60, "timeout": 0.1, "server_error": 60})
+    loads = []
+
+    async def failing():
+        loads.append(1)
+        raise UpstreamError(504, "timeout", "timeout")
+
+    async def run():
+        for _ in range(3):
+            try:
+                await cache.get_or_load("k", failing, ttl=300)
+            except UpstreamError:
+                pass
+        await asyncio.sleep(0.15)
+        try:
+            await cache.get_or_load("k", failing, ttl=300)
+        except UpstreamError:
+            pass
+
+    asyncio.run(run())
+    print(f"✅ 만료 전 1회, 만료 후 1회 로드 ({len(loads)}회)")
+    assert len(loads) == 2
+
+
+def test_budget_timeouts_are_not_cached():
+    """요청 예산 부족으로 생긴 일반 504는 캐시하지 않는지 테스트"""
+    print("\n=== 예산 504 미캐시 테스트 ===")
+
+    cache = ResponseCache(MemoryCacheBackend(100))
+    loads = []
+
+    async def budget_exceeded():
+        loads.append(1)
+        raise HTTPException(status_code=504, detail="budget")
+
+    async def run():
+        for _ in range(3):
+            try:
+                await cache.get_or_load("k", budget_exceeded, ttl=300)
+            except HTTPException:
+                pass
+
+    asyncio.run(run())
+    assert len(loads) == 3
+    print("✅ 매번 다시 로드")
+
+
+def test_jitter_spreads_expiry():
+    """부정 캐시 TTL이 설정한 비율 안에서 흩어지는지 테스트"""
+    print("\n=== TTL 지터 테스트 ===")
+
+    ttls = [jittered(10) for _ in range(1000)]
+    print(f"✅ TTL 범위 {min(ttls):.2f} ~ {max(ttls):.2f}초")
+    assert all(8 <= ttl <= 12 for ttl in ttls)
+    assert max(ttls) - min(ttls) > 2
+
+
+def main():
+    """메인 테스트 함수"""
+    print("부정 캐시 테스트를 시작합니다...\n")
+
+    test_repeated_bad_queries_stop_reaching_upstream()
+    test_negative_entries_expire_by_kind()
+    test_budget_timeouts_are_not_cached()
+    test_jitter_spreads_expiry()
+
+    print("\n=== 테스트 완료 ===")
+
+
+if __name__ == "__main__":
+    main()
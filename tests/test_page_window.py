@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+네이버 페이지 창(page window) 캐시 테스트
+"""
+import asyncio
+
+from app.core.cache import ResponseCache
+from app.core.cache_backends import MemoryCacheBackend
+from app.services.naver_news import NaverNewsService
+
+TOTAL = 250
+
+
+class _CountingNaverService(NaverNewsService):
+    """검색 결과가 total개인 네이버 API 대역 (호출한 (display, start)를 기록)"""
+
+    def __init__(self, total: int = TOTAL):
+        super().__init__()
+        self.client_id = self.client_secret = "test"
+        self.cache = ResponseCache(MemoryCacheBackend(100))
+        self.total = total
+        self.calls = []
+
+    def _request_page(self, query: str, display: int, start: int) -> dict:
+        self.calls.append((display, start))
+        items = [
+            {"title": f"{query} 기사 {i}", "link": f"https://n.news.naver.com/{i}", "pubDate": ""}
+            for i in range(start, min(start + display, self.total + 1))
+        ]
+        return {"total": self.total, "start": start, "display": len(items), "items": items}
+
+
+def _titles(data: dict) -> list:
+    return [int(item["title"].rsplit(" ", 1)[1]) for item in data["items"]]
+
+
+def test_pages_are_served_from_aligned_windows():
+    """겹치는 페이지 요청들이 정렬된 창 하나의 호출로 처리되고, 잘라낸 구간이 정확한지 테스트"""
+    print("=== 페이지 창 테스트 ===")
+
+    service = _CountingNaverService()
+    requests = [(5, 1), (10, 1), (10, 11), (10, 21), (20, 41), (100, 1), (10, 91)]
+
+    async def run():
+        return [await service.fetch_page("삼성전자", display, start) for display, start in requests]
+
+    pages = asyncio.run(run())
+
+    print(f"✅ 요청 {len(requests)}건 → 네이버 호출 {service.calls}")
+    assert service.calls == [(100, 1)]
+    for (display, start), page in zip(requests, pages):
+        assert _titles(page) == list(range(start, start + display))
+        assert page["start"] == start and page["display"] == display and page["total"] == TOTAL
+
+
+def test_pages_spanning_windows_and_result_end():
+    """두 창에 걸친 요청, 결과 끝을 넘는 요청, 캐시를 거치지 않는 갱신 테스트"""
+    print("\n=== 창 경계 테스트 ===")
+
+    service = _CountingNaverService()
+
+    async def run():
+        spanning = await service.fetch_page("삼성전자", 10, 95)
+        tail = await service.fetch_page("삼성전자", 10, 245)
+        beyond = await service.fetch_page("삼성전자", 10, 1100)
+        calls_before_refresh = list(service.calls)
+        refreshed = await service.refresh_page("삼성전자", 10, 1)
+        cached = await service.fetch_page("삼성전자", 10, 11)
+        return spanning, tail, beyond, calls_before_refresh, refreshed, cached
+
+    spanning, tail, beyond, calls_before_refresh, refreshed, cached = asyncio.run(run())
+
+    print(f"✅ 네이버 호출 {service.calls}")
+    assert _titles(spanning) == list(range(95, 105))
+    assert _titles(tail) == list(range(245, 251))
+    assert beyond["items"] == []
+    assert calls_before_refresh == [(100, 1), (100, 101), (100, 201)]
+    # 갱신은 창을 다시 가져오고, 이후 요청은 갱신된 창에서 응답
+    assert service.calls[-1] == (100, 1) and len(service.calls) == 4
+    assert _titles(refreshed) == list(range(1, 11))
+    assert _titles(cached) == list(range(11, 21))
+
+
+def test_pages_past_start_limit():
+    """네이버 start 한도(1000)를 넘는 구간은 한도 위치에서 시작하는 끝 창 하나로 덮는지 테스트"""
+    print("\n=== start 한도 테스트 ===")
+
+    service = _CountingNaverService(total=5000)
+
+    async def run():
+        crossing = await service.fetch_page("삼성전자", 10, 1000)
+        inside_tail = await service.fetch_page("삼성전자", 30, 1050)
+        capped = await service.fetch_page("삼성전자", 100, 1090)
+        unreachable = await service.fetch_page("삼성전자", 10, 1100)
+        return crossing, inside_tail, capped, unreachable
+
+    crossing, inside_tail, capped, unreachable = asyncio.run(run())
+
+    print(f"✅ 네이버 호출 {service.calls}")
+    assert _titles(crossing) == list(range(1000, 1010))
+    assert _titles(inside_tail) == list(range(1050, 1080))
+    # 네이버로 볼 수 있는 마지막 위치는 1099번째
+    assert _titles(capped) == list(range(1090, 1100))
+    assert unreachable["items"] == []
+    # 정렬된 창(901)과 끝 창(1000) 한 번씩, 이후 요청은 캐시된 끝 창에서 응답
+    assert service.calls == [(100, 901), (100, 1000)]
+
+
+def main():
+    """메인 테스트 함수"""
+    print("네이버 페이지 창 캐시 테스트를 시작합니다...\n")
+
+    test_pages_are_served_from_aligned_windows()
+    test_pages_spanning_windows_and_result_end()
+    test_pages_past_start_limit()
+
+    print("\n=== 테스트 완료 ===")
+
+
+if __name__ == "__main__":
+    main()
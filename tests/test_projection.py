@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+응답 필드 선택 (fields=, profile=) 테스트
+"""
+import asyncio
+import json
+
+import httpx
+from fastapi import HTTPException
+
+from app.api.v1.endpoints import news
+from app.main import app
+from app.services import deepsearch_news, naver_news
+from app.services.deepsearch_news import DeepSearchNewsService
+from app.services.naver_news import NaverNewsService
+from app.services.projection import resolve_fields
+from app.services.query_planner import CompanyQueryPlanner
+
+
+def _raw_items(count: int) -> list:
+    return [
+        {
+            "title": f"<b>삼성전자</b> 실적 발표 {i}",
+            "originallink": f"https://news.com/{i}",
+            "link": f"https://n.news.naver.com/{i}",
+            "description": "삼성전자가 분기 실적을 발표했다. " * 10,
+            "pubDate": "Mon, 01 Jan 2024 09:00:00 +0900",
+        }
+        for i in range(count)
+    ]
+
+
+class _FakeNaverService(NaverNewsService):
+    """네이버 API 대신 고정 응답을 돌려주는 서비스"""
+
+    async def fetch_page(self, query: str, display: int, start: int) -> dict:
+        return {"total": 100, "start": start, "display": display, "items": _raw_items(display)}
+
+
+class _FakeDeepSearchService(DeepSearchNewsService):
+    """딥서치 API 대신 고정 응답을 돌려주는 서비스"""
+
+    def __init__(self):
+        super().__init__()
+        self.api_key = "test"
+
+    async def fetch_news(self, query: str, limit: int, days_back: int) -> dict:
+        return {"articles": [
+            {"title": f"{query} 뉴스 {i}", "url": f"https://deep.com/{i}", "description": "설명",
+             "published_at": "2024-01-01T00:00:00Z", "sentiment": "positive", "company_mentions": []}
+            for i in range(limit)
+        ]}
+
+
+class _RecordingIngestion:
+    def __init__(self):
+        self.ingested = []
+
+    async def ingest_and_enrich(self, company, items):
+        self.ingested.extend(items)
+
+
+def test_resolve_fields():
+    """fields/profile 해석과 잘못된 필드 거절 테스트"""
+    print("=== 필드 해석 테스트 ===")
+
+    assert resolve_fields(None, None, "naver") is None
+    assert resolve_fields(None, "full", "naver") is None
+    assert resolve_fields(None, "minimal", "naver") == ("title", "link", "pubDate")
+    assert resolve_fields("title,link,title", None, "naver") == ("title", "link")
+    assert resolve_fields("title,total", None, "deepsearch") == ("title", "total")
+
+    for fields, profile, kind in (("title,body", None, "naver"), (None, "tiny", "naver"), ("total", None, "stored")):
+        try:
+            resolve_fields(fields, profile, kind)
+            raise AssertionError("잘못된 필드가 허용되었습니다")
+        except HTTPException as e:
+            assert e.status_code == 400
+    print("✅ 필드 해석 및 400 응답 확인")
+
+
+def test_projection_skips_unrequested_enrichment():
+    """요청하지 않은 감정 분석/기업 언급은 계산하지 않는지 테스트"""
+    print("\n=== 요청하지 않은 필드 생략 테스트 ===")
+
+    calls = []
+    original = naver_news.get_sentiment_scorer
+
+    def counting_scorer():
+        calls.append(1)
+        return original()
+
+    naver_news.get_sentiment_scorer = counting_scorer
+    try:
+        service = NaverNewsService()
+        minimal = service.project_raw_items(_raw_items(3), ("title", "link"))
+        assert not calls
+        with_sentiment = service.project_raw_items(_raw_items(3), ("title", "sentiment", "company_mentions"))
+        assert calls
+    finally:
+        naver_news.get_sentiment_scorer = original
+
+    full = {item.link: item for item in service.build_items(_raw_items(3))}
+    print(f"✅ {minimal[0]}")
+    assert minimal[0] == {"title": "삼성전자 실적 발표 0", "link": "https://n.news.naver.com/0"}
+    for row, raw in zip(with_sentiment, _raw_items(3)):
+        item = full[raw["link"]]
+        assert row["sentiment"] == item.sentiment
+        assert row["company_mentions"] == item.company_mentions
+
+
+def test_endpoint_minimal_profile():
+    """minimal 응답이 전체 응답보다 작고, 수집은 전체 아이템으로 진행되는지 테스트"""
+    print("\n=== 엔드포인트 필드 선택 테스트 ===")
+
+    ingestion = _RecordingIngestion()
+    app.dependency_overrides[news.get_naver_service] = _FakeNaverService
+    app.dependency_overrides[news.get_ingestion_service] = lambda: ingestion
+
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            url = "/api/v1/news/company/삼성전자?display=100"
+            full = await client.get(url)
+            minimal = await client.get(url + "&profile=minimal")
+            bad = await client.get(url + "&fields=title,body")
+            return full, minimal, bad
+
+    try:
+        full, minimal, bad = asyncio.run(run())
+    finally:
+        app.dependency_overrides.clear()
+
+    print(f"✅ 전체 {len(full.content)}B → minimal {len(minimal.content)}B")
+    assert full.status_code == 200 and minimal.status_code == 200
+    assert bad.status_code == 400
+    payload = minimal.json()
+    assert "total" not in payload
+    assert set(payload["items"][0]) == {"title", "link", "pubDate"}
+    assert len(minimal.content) * 3 < len(full.content)
+    assert json.loads(full.content)["items"][0]["title"] == payload["items"][0]["title"]
+    # 두 요청 모두 전체 아이템으로 수집 (필드 선택 응답은 보강 전 레코드로 넘김)
+    assert len(ingestion.ingested) == 200
+
+
+def test_projection_for_every_source():
+    """별칭 검색/딥서치 응답도 원본에서 필드를 만들고, total은 요청했을 때만 담는지 테스트"""
+    print("\n=== 제공자별 필드 선택 테스트 ===")
+
+    ingestion = _RecordingIngestion()
+    app.dependency_overrides[news.get_query_planner] = lambda: CompanyQueryPlanner(naver_service=_FakeNaverService())
+    app.dependency_overrides[news.get_deepsearch_service] = _FakeDeepSearchService
+    app.dependency_overrides[news.get_ingestion_service] = lambda: ingestion
+    built = []
+    original = deepsearch_news.DeepSearchNewsItem
+
+    def recording_item(**kwargs):
+        built.append(kwargs)
+        return original(**kwargs)
+
+    deepsearch_news.DeepSearchNewsItem = recording_item
+
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            aliases = await client.get("/api/v1/news/company/삼성전자?expand_aliases=true&display=5&fields=title,total")
+            deepsearch = await client.get("/api/v1/news/deepsearch/삼성전자?limit=3&fields=url,company_mentions")
+            return aliases, deepsearch
+
+    try:
+        aliases, deepsearch = asyncio.run(run())
+    finally:
+        deepsearch_news.DeepSearchNewsItem = original
+        app.dependency_overrides.clear()
+
+    print(f"✅ 별칭 {aliases.json()['items'][0]}, 딥서치 {deepsearch.json()['items'][0]}")
+    assert aliases.status_code == 200 and deepsearch.status_code == 200
+    assert aliases.json()["total"] == 100 and len(aliases.json()["items"]) == 5
+    assert set(aliases.json()["items"][0]) == {"title"}
+    assert "total" not in deepsearch.json()
+    assert deepsearch.json()["items"][0] == {"url": "https://deep.com/0", "company_mentions": ["삼성전자"]}
+    # 딥서치 응답 모델을 만들지 않고, 수집은 보강 전 레코드로 진행
+    assert not built
+    assert [record[0] for record in ingestion.ingested[-3:]] == [f"https://deep.com/{i}" for i in range(3)]
+    assert len(ingestion.ingested) == 8
+
+
+def main():
+    """메인 테스트 함수"""
+    print("응답 필드 선택 테스트를 시작합니다...\n")
+
+    test_resolve_fields()
+    test_projection_skips_unrequested_enrichment()
+    test_endpoint_minimal_profile()
+    test_projection_for_every_source()
+
+    print("\n=== 테스트 완료 ===")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+기업 별칭 검색 계획 테스트 (네이버 호출 대역 사용)
+"""
+import asyncio
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import Counter
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+
+from app.core.cache import ResponseCache
+from app.core.cache_backends import MemoryCacheBackend
+from app.models.news import CompanyNewsRequest
+from app.services.company_dictionary import CompanyDictionary
+from app.services.naver_news import NaverNewsService
+from app.services.query_planner import CompanyQueryPlanner
+
+BASE = datetime(2024, 3, 1, tzinfo=timezone.utc)
+
+COMPANIES = [
+    {"name": "삼성전자", "aliases": ["Samsung Electronics", "삼성"], "ticker": "005930"},
+    {"name": "삼성물산", "aliases": ["삼성"], "ticker": "028260"},
+]
+
+
+def _item(url_id: int, hours: int) -> dict:
+    return {
+        "title": f"기사 {url_id}", "originallink": f"https://news.com/{url_id}", "link": f"https://n.news.naver.com/{url_id}",
+        "description": "", "pubDate": format_datetime(BASE + timedelta(hours=hours)),
+    }
+
+
+# 검색어별 최신순 결과 (URL 번호, 발행 시각). 3, 7번 기사는 여러 검색어에서 찾음
+RESULTS = {
+    "삼성전자": [_item(1, 100), _item(3, 90), _item(5, 70), _item(7, 50), _item(9, 30)],
+    "Samsung Electronics": [_item(2, 95), _item(3, 90), _item(6, 60), _item(7, 50)],
+    "삼성": [_item(4, 80), _item(7, 50), _item(8, 40)],
+    "005930": [_item(10, 20)],
+}
+
+
+class _StubNaverService(NaverNewsService):
+    """검색어별 고정 결과에서 (display, start) 구간을 잘라 주는 fetch_page 대역"""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    async def fetch_page(self, query: str, display: int, start: int) -> dict:
+        self.calls.append((query, display, start))
+        items = RESULTS.get(query, [])
+        sliced = items[start - 1:start - 1 + display]
+        return {"total": len(items), "start": start, "display": len(sliced), "items": sliced}
+
+
+class _CountingNaverService(NaverNewsService):
+    """실제 fetch_page(창 캐시, 동시 요청 합치기)를 거치고 네이버 호출만 기록하는 대역"""
+
+    def __init__(self):
+        super().__init__()
+        self.client_id = self.client_secret = "test"
+        self.cache = ResponseCache(MemoryCacheBackend(100))
+        self.calls = Counter()
+
+    def _request_page(self, query: str, display: int, start: int) -> dict:
+        self.calls[query] += 1
+        time.sleep(0.05)
+        items = RESULTS.get(query, [])[start - 1:start - 1 + display]
+        return {"total": len(items), "start": start, "display": len(items), "items": items}
+
+
+def _dictionary(tmp: str) -> CompanyDictionary:
+    path = os.path.join(tmp, "companies.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(COMPANIES, f, ensure_ascii=False)
+    return CompanyDictionary(path)
+
+
+def _urls(response) -> list:
+    return [int(item.originallink.rsplit("/", 1)[1]) for item in response.items]
+
+
+def test_alias_expansion():
+    """기업명을 기업명/별칭/종목코드로 확장하고, 사전에 없으면 입력값만 쓰는지 테스트"""
+    print("=== 별칭 확장 테스트 ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        planner = CompanyQueryPlanner(naver_service=_StubNaverService(), dictionary=_dictionary(tmp))
+        company = planner.expand("삼성전자")
+        by_ticker = planner.expand("005930")
+        unknown = planner.expand("카카오")
+        planner.max_queries = 2
+        limited = planner.expand("삼성전자")
+
+    print(f"✅ {company}, {by_ticker}, {unknown}")
+    assert company == ["삼성전자", "Samsung Electronics", "삼성", "005930"]
+    assert by_ticker == ["005930", "삼성전자", "Samsung Electronics", "삼성"]
+    assert unknown == ["카카오"]
+    assert limited == ["삼성전자", "Samsung Electronics"]
+
+
+def test_merge_and_dedup():
+    """여러 검색어 결과를 URL 기준으로 합치고 최신순으로 정렬하는지 테스트"""
+    print("\n=== 결과 합치기 테스트 ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        service = _StubNaverService()
+        planner = CompanyQueryPlanner(naver_service=service, dictionary=_dictionary(tmp))
+        response = asyncio.run(planner.search_company_news(CompanyNewsRequest(company_name="삼성전자", display=20)))
+
+    print(f"✅ {_urls(response)}, 호출 {service.calls}")
+    assert _urls(response) == [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+    assert response.display == 10 and response.start == 1
+    assert {query for query, _, _ in service.calls} == set(RESULTS)
+
+
+def test_pages_follow_merged_ranking():
+    """페이지를 이어 붙이면 합친 순위와 같고 겹치거나 빠지는 기사가 없는지 테스트"""
+    print("\n=== 페이지 테스트 ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        service = _StubNaverService()
+        planner = CompanyQueryPlanner(naver_service=service, dictionary=_dictionary(tmp))
+
+        async def run():
+            return [
+                await planner.search_company_news(CompanyNewsRequest(company_name="삼성전자", display=3, start=start))
+                for start in (1, 4, 7, 10)
+            ]
+
+        pages = asyncio.run(run())
+
+    concatenated = [url for page in pages for url in _urls(page)]
+    print(f"✅ {[_urls(page) for page in pages]}")
+    assert concatenated == [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+    assert [page.start for page in pages] == [1, 4, 7, 10]
+    # 검색어마다 1번부터 start+display-1번째까지 가져옴
+    assert all(start == 1 for _, _, start in service.calls)
+    assert max(display for _, display, _ in service.calls) == 12
+
+
+def test_shared_alias_is_coalesced():
+    """별칭을 공유하는 기업들의 동시 검색이 같은 검색어를 한 번만 호출하는지 테스트"""
+    print("\n=== 동시 요청 합치기 테스트 ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        service = _CountingNaverService()
+        planner = CompanyQueryPlanner(naver_service=service, dictionary=_dictionary(tmp))
+
+        async def run():
+            return await asyncio.gather(
+                planner.search_company_news(CompanyNewsRequest(company_name="삼성전자", display=5)),
+                planner.search_company_news(CompanyNewsRequest(company_name="삼성물산", display=5)),
+                planner.search_company_news(CompanyNewsRequest(company_name="삼성전자", display=5, start=3)),
+            )
+
+        electronics, cnt, second_page = asyncio.run(run())
+
+    print(f"✅ 네이버 호출 {dict(service.calls)}")
+    assert service.calls["삼성"] == 1 and service.calls["삼성전자"] == 1
+    assert _urls(electronics) == [1, 2, 3, 4, 5]
+    assert _urls(second_page) == [3, 4, 5, 6, 7]
+    assert _urls(cnt) == [4, 7, 8]
+
+
+def test_items_built_off_event_loop():
+    """감정 분석/기업 언급 추출(build_items)이 이벤트 루프 스레드가 아닌 곳에서 실행되는지 테스트"""
+    print("\n=== 이벤트 루프 밖 변환 테스트 ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        service = _StubNaverService()
+        planner = CompanyQueryPlanner(naver_service=service, dictionary=_dictionary(tmp))
+        threads = []
+        original = service.build_items
+
+        def recording_build_items(raw_items):
+            threads.append(threading.current_thread())
+            return original(raw_items)
+
+        service.build_items = recording_build_items
+
+        async def run():
+            loop_thread = threading.current_thread()
+            planned = await planner.search_company_news(CompanyNewsRequest(company_name="삼성전자", display=5))
+            direct = await service.search_company_news(CompanyNewsRequest(company_name="삼성전자", display=5))
+            return loop_thread, planned, direct
+
+        loop_thread, planned, direct = asyncio.run(run())
+
+    print(f"✅ 변환 스레드 {[thread.name for thread in threads]}")
+    assert len(threads) == 2 and loop_thread not in threads
+    assert all(item.sentiment for item in planned.items + direct.items)
+
+
+def main():
+    """메인 테스트 함수"""
+    print("기업 별칭 검색 계획 테스트를 시작합니다...\n")
+
+    test_alias_expansion()
+    test_merge_and_dedup()
+    test_pages_follow_merged_ranking()
+    test_shared_alias_is_coalesced()
+    test_items_built_off_event_loop()
+
+    print("\n=== 테스트 완료 ===")
+
+
+if __name__ == "__main__":
+    main()
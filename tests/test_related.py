@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+관련 기사 색인 테스트 (해시 TF-IDF 벡터 행렬)
+"""
+import asyncio
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import numpy as np
+
+from app.main import app
+from app.api.v1.endpoints import news
+from app.services.article_store import ArticleStore
+from app.services.related import RelatedArticleIndex
+
+EARNINGS = [
+    ("삼성전자 1분기 영업이익 6조6천억원 잠정 집계", "삼성전자가 1분기 영업이익 6조6천억원을 기록했다고 잠정 공시했다"),
+    ("삼성전자, 1분기 영업이익 6조6천억원…시장 예상 상회", "삼성전자가 1분기 영업이익 6조6천억원을 기록했다고 5일 잠정 공시했다"),
+    ("[속보] 삼성전자 1분기 영업이익 6조6천억원", "삼성전자는 1분기 영업이익이 6조6천억원으로 잠정 집계됐다고 공시했다"),
+]
+OTHERS = [
+    ("삼성전자 갤럭시 충전기 자발적 리콜 결정", "삼성전자가 일부 갤럭시 충전기에서 발열 문제가 발견돼 자발적 리콜을 결정했다"),
+    ("현대차, 미국 전기차 공장 준공", "현대자동차가 미국 조지아주에 전기차 전용 공장을 준공했다"),
+    ("카카오 새 대표 내정", "카카오가 이사회를 열고 새 대표 후보를 내정했다"),
+]
+
+
+def _stamp(days_ago: float) -> str:
+    return (datetime.now(timezone.utc) - timedelta(days=days_ago)).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _article(url: str, title: str, description: str, published_at: str) -> dict:
+    return {"url": url, "source": "naver", "title": title, "description": description, "published_at": published_at}
+
+
+def _store(tmp: str) -> ArticleStore:
+    store = ArticleStore(os.path.join(tmp, "news.db"))
+    store.add_articles("삼성전자", [
+        _article(f"https://news.com/e{i}", title, description, _stamp(i * 10))
+        for i, (title, description) in enumerate(EARNINGS)
+    ] + [
+        _article(f"https://news.com/o{i}", title, description, _stamp(1))
+        for i, (title, description) in enumerate(OTHERS)
+    ])
+    # 같은 기사가 다른 기업 검색으로도 저장됨
+    store.add_articles("LG전자", [_article("https://news.com/e1", *EARNINGS[1], _stamp(10))])
+    return store
+
+
+def test_similar_articles_ranked_first():
+    """같은 사건의 기사가 먼저 오고, 기준 기사와 중복 저장된 기사는 빠지며, 기업/기간 조건이 적용되는지 테스트"""
+    print("=== 관련 기사 순위 테스트 ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        index = RelatedArticleIndex(path=os.path.join(tmp, "related"), store=_store(tmp))
+        assert index.open()
+        index.sync_once()
+
+        related = index.related("https://news.com/e0", limit=10)
+        lg_only = index.related("https://news.com/e0", limit=10, company="LG전자")
+        recent = index.related("https://news.com/e0", limit=10, days=5)
+        unknown_company = index.related("https://news.com/e0", company="네이버")
+        missing = index.related("https://news.com/none")
+        index.close()
+
+    urls = [item["url"] for item in related]
+    print(f"✅ {[(item['url'], item['score']) for item in related]}")
+    assert urls[:2] in (["https://news.com/e1", "https://news.com/e2"], ["https://news.com/e2", "https://news.com/e1"])
+    assert related[0]["score"] > related[2]["score"]
+    assert "https://news.com/e0" not in urls
+    assert len(urls) == len(set(urls)) == 5
+    assert [item["url"] for item in lg_only] == ["https://news.com/e1"] and lg_only[0]["company"] == "LG전자"
+    # 10일, 20일 전 기사는 빠짐
+    assert {item["url"] for item in recent} == {f"https://news.com/o{i}" for i in range(3)}
+    assert unknown_company == [] and missing is None
+
+
+def test_index_persists_and_readers_follow():
+    """재시작 후 이어서 색인하고, 잠금을 얻지 못한 프로세스는 읽기만 하면서 새 행을 따라 읽는지 테스트"""
+    print("\n=== 색인 유지/읽기 전용 테스트 ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "related")
+        store = _store(tmp)
+        writer = RelatedArticleIndex(path=path, store=store, chunk_rows=4)
+        writer.open()
+        writer.sync_once()
+        reader = RelatedArticleIndex(path=path, store=store, chunk_rows=4)
+        reader_is_writer = reader.open()
+        before = reader.rows
+
+        store.add_articles("삼성전자", [_article("https://news.com/e3", *EARNINGS[2], _stamp(0))])
+        asyncio.run(writer.sync())
+        related = [item["url"] for item in reader.related("https://news.com/e2", limit=3)]
+        writer.close()
+        reader.close()
+
+        # 재시작: 마지막으로 색인한 기사 다음부터 이어서
+        reopened = RelatedArticleIndex(path=path, store=store, chunk_rows=4)
+        reopened.open()
+        added = reopened.sync_once()
+        stats = reopened.stats()
+        reopened.close()
+
+    print(f"✅ 읽기 프로세스 {before} → 새 기사 포함 {related}, 재시작 후 {stats}")
+    assert not reader_is_writer
+    assert before == 7
+    assert related[0] == "https://news.com/e3"
+    assert added == 0
+    assert stats["writer"] and stats["rows"] == 8 and stats["chunks"] == 2
+
+
+def test_related_endpoint():
+    """관련 기사 엔드포인트 응답과 검증 테스트"""
+    print("\n=== 관련 기사 엔드포인트 테스트 ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        index = RelatedArticleIndex(path=os.path.join(tmp, "related"), store=_store(tmp))
+        index.open()
+        index.sync_once()
+        app.dependency_overrides[news.get_related_index] = lambda: index
+
+        async def run():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                ok = await client.get("/api/v1/news/related", params={"url": "https://news.com/e0", "limit": 2})
+                missing = await client.get("/api/v1/news/related", params={"url": "https://news.com/none"})
+                bad_limit = await client.get("/api/v1/news/related", params={"url": "https://news.com/e0", "limit": 0})
+                bad_days = await client.get("/api/v1/news/related", params={"url": "https://news.com/e0", "days": 0})
+                return ok, missing, bad_limit, bad_days
+
+        try:
+            ok, missing, bad_limit, bad_days = asyncio.run(run())
+        finally:
+            app.dependency_overrides.clear()
+            index.close()
+
+    payload = ok.json()
+    print(f"✅ {payload}")
+    assert ok.status_code == 200 and len(payload["items"]) == 2
+    assert {item["url"] for item in payload["items"]} == {"https://news.com/e1", "https://news.com/e2"}
+    assert missing.status_code == 404
+    assert bad_limit.status_code == 400 and bad_days.status_code == 400
+
+
+def test_query_time_on_large_matrix():
+    """무작위 벡터 26만 행에서 상위 K개 조회가 충분히 빠르고, 여러 질의를 한 번에 처리하는지 테스트"""
+    print("\n=== 대량 조회 시간 테스트 ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        index = RelatedArticleIndex(path=os.path.join(tmp, "related"), store=ArticleStore(os.path.join(tmp, "news.db")),
+                                    chunk_rows=65536)
+        index.open()
+        rng = np.random.default_rng(0)
+        rows = 4 * 65536
+        vectors = rng.standard_normal((rows, index.dimensions), dtype=np.float32)
+        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        index.companies = [str(code) for code in range(50)]
+        index._company_codes = {name: code for code, name in enumerate(index.companies)}
+        index.append(np.arange(1, rows + 1), rng.integers(0, 50, rows, dtype=np.int32),
+                     1_700_000_000 + np.arange(rows, dtype=np.int64), vectors)
+
+        queries = vectors[[10, 70000, 200000]]
+        index.search(queries[:1], 20)
+        started = time.perf_counter()
+        single = index.search(queries[:1], 20)
+        elapsed = time.perf_counter() - started
+        batch = index.search(queries, 20)
+        company = index.search(queries[:1], 20, company="7")
+        since = index.search(queries[:1], 20, since=1_700_000_000 + rows - 1000)
+        index.close()
+
+    print(f"✅ {rows}행 조회 {elapsed * 1000:.1f}ms")
+    assert single[0][0][0] == 11 and single[0][1][0] > 0.99
+    assert [ids[0] for ids, _ in batch] == [11, 70001, 200001]
+    assert np.all(np.diff(single[0][1]) <= 0)
+    assert len(company[0][0]) == 20
+    assert len(since[0][0]) == 20 and since[0][0].min() > rows - 1000
+    assert elapsed < 0.1
+
+
+def main():
+    """메인 테스트 함수"""
+    print("관련 기사 테스트를 시작합니다...\n")
+
+    test_similar_articles_ranked_first()
+    test_index_persists_and_readers_follow()
+    test_related_endpoint()
+    test_query_time_on_large_matrix()
+
+    print("\n=== 테스트 완료 ===")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+로컬 감정 분석 테스트 (사전 기반)
+"""
+import threading
+
+from app.models.news import NewsItem
+from app.services.sentiment import SentimentScorer
+
+
+def test_labels():
+    """긍정/부정/중립 레이블 테스트"""
+    print("=== 감정 레이블 테스트 ===")
+
+    scorer = SentimentScorer()
+    labels = scorer.score_batch([
+        ("삼성전자 주가 급등, 사상 최대 실적", "반도체 호조로 영업이익이 크게 증가했다"),
+        ("카카오 압수수색…주가 급락", "횡령 혐의로 검찰이 압수수색에 나섰다"),
+        ("현대차 신임 대표 선임", "현대차가 이사회를 열었다"),
+    ])
+
+    print(f"✅ {labels}")
+    assert labels == ["positive", "negative", "neutral"]
+
+
+def test_negation_flips_polarity():
+    """바로 뒤 어절이 부정어이면 극성을 뒤집는지 테스트"""
+    print("\n=== 부정어 테스트 ===")
+
+    scorer = SentimentScorer()
+    plain, negated, lone = scorer.score_texts(["주가 상승했다", "주가 상승하지 않았다", "않았다"])
+
+    print(f"✅ 상승 {plain}, 상승하지 않았다 {negated}")
+    assert plain == 1.0
+    # "상승하지"의 다음 어절 "않았다"가 부정어
+    assert negated == -1.0
+    assert lone == 0.0
+
+
+def test_batch_cache_hits():
+    """같은 내용은 다시 계산하지 않고, 어절 가중치도 배치 사이에 재사용하는지 테스트"""
+    print("\n=== 캐시 재사용 테스트 ===")
+
+    scorer = SentimentScorer()
+    lookups = []
+    original = scorer._token_weight
+
+    def counting_weight(token):
+        lookups.append(token)
+        return original(token)
+
+    scorer._token_weight = counting_weight
+
+    first = scorer.score_batch([("실적 호조", "영업이익 증가"), ("실적 호조", "영업이익 증가")])
+    after_first = len(lookups)
+    # 같은 내용: 문서 캐시로 처리되어 어절을 다시 보지 않음
+    scorer.score_batch([("실적 호조", "영업이익 증가")])
+    after_same = len(lookups)
+    # 새 내용이지만 어절이 같으면 어절 캐시 사용
+    scorer.score_batch([("영업이익 증가", "실적 호조")])
+    after_reordered = len(lookups)
+
+    items = [NewsItem(title="실적 호조", originallink="", link="", description="영업이익 증가", pubDate="")]
+    scorer.score_items(items)
+
+    print(f"✅ 어절 조회 {after_first} → {after_same} → {after_reordered}, 레이블 {first}")
+    assert first == ["positive", "positive"]
+    # 배치 안의 중복 어절은 한 번만 조회
+    assert after_first == 4
+    assert after_same == after_first and after_reordered == after_first
+    assert items[0].sentiment == "positive"
+
+
+def test_concurrent_batches_with_cache_eviction():
+    """여러 스레드가 어절 캐시를 비우고 채워도 오류 없이 같은 점수를 내는지 테스트"""
+    print("\n=== 동시 배치 테스트 ===")
+
+    scorer = SentimentScorer()
+    scorer._token_cache_size = 50
+    texts = [f"주가 급등 신고가 {i}번째 기사 반등 기대감 상승세" for i in range(200)]
+    expected = SentimentScorer().score_texts(texts)
+    errors, results = [], []
+
+    def worker():
+        try:
+            for _ in range(20):
+                results.append(scorer.score_texts(texts))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    print(f"✅ 배치 {len(results)}개, 오류 {len(errors)}개")
+    assert errors == []
+    assert all(scores == expected for scores in results)
+
+
+def main():
+    """메인 테스트 함수"""
+    print("감정 분석 테스트를 시작합니다...\n")
+
+    test_labels()
+    test_negation_flips_polarity()
+    test_batch_cache_hits()
+    test_concurrent_batches_with_cache_eviction()
+
+    print("\n=== 테스트 완료 ===")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+기사 묶음(스토리) 클러스터링 테스트
+"""
+import asyncio
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+import httpx
+
+from app.main import app
+from app.api.v1.endpoints import news
+from app.services.article_store import ArticleStore
+from app.services.stories import StoryClusterer
+
+BASE = datetime(2024, 3, 1, tzinfo=timezone.utc)
+
+EARNINGS = [
+    ("삼성전자 1분기 영업이익 6조6천억원 잠정 집계", "삼성전자가 1분기 영업이익 6조6천억원을 기록했다고 잠정 공시했다"),
+    ("삼성전자, 1분기 영업이익 6조6천억원…시장 예상 상회", "삼성전자가 1분기 영업이익 6조6천억원을 기록했다고 5일 잠정 공시했다"),
+    ("[속보] 삼성전자 1분기 영업이익 6조6천억원", "삼성전자는 1분기 영업이익이 6조6천억원으로 잠정 집계됐다고 공시했다"),
+]
+RECALL = [
+    ("삼성전자 갤럭시 충전기 자발적 리콜 결정", "삼성전자가 일부 갤럭시 충전기에서 발열 문제가 발견돼 자발적 리콜을 결정했다"),
+    ("삼성전자, 갤럭시 충전기 자발적 리콜…발열 문제", "일부 갤럭시 충전기에서 발열 문제가 발견돼 삼성전자가 자발적 리콜을 결정했다"),
+]
+
+
+def _at(hours: float) -> str:
+    return (BASE + timedelta(hours=hours)).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _clusterer(tmp: str) -> StoryClusterer:
+    return StoryClusterer(store=ArticleStore(os.path.join(tmp, "news.db")))
+
+
+def test_related_articles_form_stories():
+    """같은 사건의 기사끼리 묶이고, 다른 사건이나 시간이 멀리 떨어진 기사는 따로 묶이는지 테스트"""
+    print("=== 스토리 묶음 테스트 ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        clusterer = _clusterer(tmp)
+        earnings = [clusterer.add("삼성전자", f"https://news.com/e{i}", title, description, _at(i))
+                    for i, (title, description) in enumerate(EARNINGS)]
+        recall = [clusterer.add("삼성전자", f"https://news.com/r{i}", title, description, _at(3 + i))
+                  for i, (title, description) in enumerate(RECALL)]
+        # 같은 내용이라도 다른 기업의 기사는 그 기업의 스토리로
+        other = clusterer.add("LG전자", "https://news.com/l0", *EARNINGS[0], _at(1))
+        # 이미 배정된 기사는 다시 배정하지 않음
+        again = clusterer.add("삼성전자", "https://news.com/r0", *RECALL[0], _at(3))
+        # 한 달 뒤 비슷한 제목의 기사는 새 스토리
+        later = clusterer.add("삼성전자", "https://news.com/e-later", *EARNINGS[0], _at(24 * 30))
+
+        stories = clusterer.stories("삼성전자", limit=10)
+
+    print(f"✅ 실적 {earnings}, 리콜 {recall}, 다른 기업 {other}, 한 달 뒤 {later}")
+    assert len(set(earnings)) == 1 and len(set(recall)) == 1
+    assert earnings[0] != recall[0]
+    assert other not in (earnings[0], recall[0])
+    assert later not in (earnings[0], recall[0])
+    assert again == recall[0]
+    # 한 달 뒤 기사 기준으로 보관 기간이 지난 스토리는 정리됨
+    assert [story["story_id"] for story in stories] == [later]
+
+
+def test_story_summary_and_endpoint():
+    """스토리 요약(기사 수, 처음/마지막 발행일시)과 엔드포인트 응답 테스트"""
+    print("\n=== 스토리 엔드포인트 테스트 ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        clusterer = _clusterer(tmp)
+        now = datetime.now(timezone.utc)
+        for i, (title, description) in enumerate(EARNINGS):
+            published = (now - timedelta(hours=3 - i)).strftime("%Y-%m-%dT%H:%M:%SZ")
+            asyncio.run(clusterer.on_new_articles("삼성전자", [{
+                "url": f"https://news.com/e{i}", "title": title, "description": description, "published_at": published
+            }]))
+        clusterer.add("삼성전자", "https://news.com/r0", *RECALL[0], now.strftime("%Y-%m-%dT%H:%M:%SZ"))
+
+        app.dependency_overrides[news.get_story_clusterer] = lambda: clusterer
+
+        async def run():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                stories = await client.get("/api/v1/news/stories/삼성전자?min_articles=2")
+                everything = await client.get("/api/v1/news/stories/삼성전자")
+                bad = await client.get("/api/v1/news/stories/삼성전자?limit=0")
+                return stories, everything, bad
+
+        try:
+            stories, everything, bad = asyncio.run(run())
+        finally:
+            app.dependency_overrides.clear()
+
+    payload = stories.json()
+    print(f"✅ {payload['items'][0]['headline']} ({payload['items'][0]['count']}건)")
+    assert stories.status_code == 200 and bad.status_code == 400
+    assert len(payload["items"]) == 1
+    story = payload["items"][0]
+    assert story["count"] == 3 and story["headline"] == EARNINGS[0][0]
+    assert story["first_seen"] < story["last_seen"]
+    assert story["articles"][0]["url"] == "https://news.com/e2"
+    # 마지막 기사가 최근인 리콜 스토리가 먼저
+    assert [item["count"] for item in everything.json()["items"]] == [1, 3]
+
+
+def test_assignment_cost_independent_of_corpus():
+    """서로 다른 기사가 많이 쌓여도 기사 하나의 배정 시간이 늘지 않는지 테스트"""
+    print("\n=== 배정 비용 테스트 ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        clusterer = _clusterer(tmp)
+
+        def add_batch(start: int, count: int) -> float:
+            started = time.perf_counter()
+            for i in range(start, start + count):
+                # 서로 관련 없는 기사 (무작위 한글 음절)
+                rng = random.Random(i)
+                text = "".join(chr(rng.randrange(0xAC00, 0xD7A4)) for _ in range(60))
+                clusterer.add("삼성전자", f"https://news.com/{i}", text[:20], text[20:], _at(i / 1000))
+            return (time.perf_counter() - started) / count
+
+        early = add_batch(0, 500)
+        add_batch(500, 5000)
+        late = add_batch(5500, 500)
+
+    print(f"✅ 기사당 배정 시간 {early * 1e6:.0f}us → {late * 1e6:.0f}us")
+    assert late < early * 3
+
+
+def main():
+    """메인 테스트 함수"""
+    print("스토리 클러스터링 테스트를 시작합니다...\n")
+
+    test_related_articles_form_stories()
+    test_story_summary_and_endpoint()
+    test_assignment_cost_independent_of_corpus()
+
+    print("\n=== 테스트 완료 ===")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+실시간 뉴스 구독 테스트 (WebSocket, 네이버/수집 대역 사용)
+"""
+import asyncio
+import time
+from collections import Counter
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from app.api.v1.endpoints import news
+from app.core.settings import settings
+from app.services import subscriptions
+from app.services.naver_news import NaverNewsService
+from app.services.subscriptions import SubscriptionHub
+
+
+class _StubNaverService(NaverNewsService):
+    """폴링할 때마다 새 기사 하나가 올라오는 refresh_page 대역"""
+
+    polls = Counter()
+
+    async def refresh_page(self, query: str, display: int, start: int) -> dict:
+        _StubNaverService.polls[query] += 1
+        number = _StubNaverService.polls[query]
+        items = [
+            {"title": f"{query} 기사 {n}", "originallink": f"https://news.com/{query}/{n}", "link": "",
+             "description": "", "pubDate": ""}
+            for n in range(number, 0, -1)
+        ]
+        return {"items": items}
+
+
+class _StubIngestionService:
+    """수집 호출만 기록하는 대역"""
+
+    calls = []
+
+    async def ingest_and_enrich(self, company, items):
+        await asyncio.sleep(0.01)
+        _StubIngestionService.calls.append((company, len(items)))
+
+
+def _slow_send(app, delay: float):
+    """서버가 보내는 WebSocket 메시지마다 지연을 넣어 느린 클라이언트를 흉내 내는 ASGI 래퍼"""
+
+    async def wrapped(scope, receive, send):
+        async def slow(message):
+            if message["type"] == "websocket.send":
+                await asyncio.sleep(delay)
+            await send(message)
+
+        await app(scope, receive, slow)
+
+    return wrapped
+
+
+class _Subscriptions:
+    """테스트 동안 설정과 서비스를 바꾸고 끝나면 되돌리는 컨텍스트"""
+
+    def __init__(self, **overrides):
+        self.overrides = {"ws_poll_interval": 0.01, "api_read_only": False, **overrides}
+
+    def __enter__(self):
+        self.saved = {name: getattr(settings, name) for name in self.overrides}
+        for name, value in self.overrides.items():
+            setattr(settings, name, value)
+        self.services = subscriptions.NaverNewsService, subscriptions.IngestionService
+        subscriptions.NaverNewsService = _StubNaverService
+        subscriptions.IngestionService = _StubIngestionService
+        _StubNaverService.polls = Counter()
+        _StubIngestionService.calls = []
+        subscriptions._hub = SubscriptionHub()
+        app = FastAPI()
+        app.include_router(news.router)
+        return app
+
+    def __exit__(self, *exc_info):
+        for name, value in self.saved.items():
+            setattr(settings, name, value)
+        subscriptions.NaverNewsService, subscriptions.IngestionService = self.services
+        subscriptions._hub = None
+
+
+def _wait_for(condition, timeout: float = 5.0):
+    """서버 쪽 정리가 끝날 때까지 기다림"""
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+def _next(ws, message_type: str) -> dict:
+    """다른 종류의 메시지(폴링 중 도착한 기사 등)는 건너뛰고 원하는 종류의 메시지를 받음"""
+    while True:
+        message = ws.receive_json()
+        if message["type"] == message_type:
+            return message
+
+
+def test_shared_poller_and_ingest_tasks():
+    """같은 기업의 구독자들이 폴러 하나를 공유하고, 수집 작업이 끝까지 실행되는지 테스트"""
+    print("=== 공유 폴러 테스트 ===")
+
+    with _Subscriptions() as app:
+        hub = subscriptions._hub
+        with TestClient(app) as client:
+            with client.websocket_connect("/ws") as first, client.websocket_connect("/ws") as second:
+                first.send_json({"action": "subscribe", "companies": ["삼성전자"]})
+                second.send_json({"action": "subscribe", "companies": ["삼성전자", "LG전자"]})
+                acks = _next(first, "subscriptions"), _next(second, "subscriptions")
+                stats = hub.stats()
+                first_message = _next(first, "articles")
+                second_companies = {_next(second, "articles")["company"] for _ in range(6)}
+
+                # 잘못된 형식의 메시지는 오류로 응답하고 연결은 유지
+                first.send_json(["삼성전자"])
+                invalid_list = _next(first, "error")
+                first.send_json({"action": "subscribe", "companies": "삼성전자"})
+                invalid_companies = _next(first, "error")
+                first.send_json({"action": "unsubscribe", "companies": ["삼성전자"]})
+                remaining = _next(first, "subscriptions")
+                shared_after_leave = hub.stats()["subscriptions"]
+            closed = _wait_for(lambda: hub.stats()["pollers"] == 0)
+            drained = _wait_for(lambda: not hub._ingest_tasks)
+
+    print(f"✅ {stats}, 수집 {len(_StubIngestionService.calls)}회, 오류 {invalid_list['detail']}")
+    assert acks[0] == {"type": "subscriptions", "companies": ["삼성전자"]}
+    assert acks[1] == {"type": "subscriptions", "companies": ["LG전자", "삼성전자"]}
+    assert stats == {"pollers": 2, "subscriptions": {"삼성전자": 2, "LG전자": 1}}
+    # 첫 폴링은 기준점만 잡으므로 1번 기사는 전달하지 않음
+    assert first_message["company"] == "삼성전자" and first_message["items"][0]["title"] != "삼성전자 기사 1"
+    assert second_companies == {"삼성전자", "LG전자"}
+    assert invalid_companies["detail"] == invalid_list["detail"]
+    assert remaining["companies"] == [] and shared_after_leave == {"삼성전자": 1, "LG전자": 1}
+    assert closed and drained
+    assert {company for company, _ in _StubIngestionService.calls} == {"삼성전자", "LG전자"}
+
+
+def test_slow_client_drops_oldest():
+    """느린 클라이언트는 대기열이 차면 오래된 메시지를 버리고 최신 기사를 받는지 테스트"""
+    print("\n=== 오래된 메시지 버리기 테스트 ===")
+
+    with _Subscriptions(ws_queue_size=2, ws_max_dropped_messages=1000) as app:
+        with TestClient(_slow_send(app, 0.1)) as client:
+            with client.websocket_connect("/ws") as ws:
+                ws.send_json({"action": "subscribe", "companies": ["삼성전자"]})
+                ws.receive_json()
+                titles = [item["title"] for _ in range(3) for item in _next(ws, "articles")["items"]]
+                polls = _StubNaverService.polls["삼성전자"]
+
+    numbers = [int(title.rsplit(" ", 1)[1]) for title in titles]
+    print(f"✅ 받은 기사 {numbers}, 폴링 {polls}회")
+    # 중간 메시지를 버렸으므로 받은 기사 번호에 빈틈이 있고 순서는 유지
+    assert numbers == sorted(numbers)
+    assert numbers[-1] - numbers[0] + 1 > len(numbers)
+
+
+def test_slow_client_closed_with_1013():
+    """버린 메시지가 한도를 넘으면 1013 코드로 연결을 끊고 구독을 정리하는지 테스트"""
+    print("\n=== 느린 클라이언트 연결 종료 테스트 ===")
+
+    with _Subscriptions(ws_queue_size=1, ws_max_dropped_messages=3) as app:
+        hub = subscriptions._hub
+        with TestClient(_slow_send(app, 0.2)) as client:
+            with client.websocket_connect("/ws") as ws:
+                ws.send_json({"action": "subscribe", "companies": ["삼성전자"]})
+                code = None
+                try:
+                    while True:
+                        ws.receive_json()
+                except WebSocketDisconnect as e:
+                    code = e.code
+            closed = _wait_for(lambda: hub.stats()["pollers"] == 0)
+
+    print(f"✅ 종료 코드 {code}")
+    assert code == 1013
+    assert closed
+
+
+def main():
+    """메인 테스트 함수"""
+    print("실시간 뉴스 구독 테스트를 시작합니다...\n")
+
+    test_shared_poller_and_ingest_tasks()
+    test_slow_client_drops_oldest()
+    test_slow_client_closed_with_1013()
+
+    print("\n=== 테스트 완료 ===")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+기사 증분 동기화 (sync token) 테스트
+"""
+import asyncio
+import os
+import tempfile
+
+from fastapi import HTTPException
+
+from app.services.article_store import ArticleStore
+from app.services.sync import SyncService, encode_token
+
+
+def _article(i: int) -> dict:
+    return {
+        "url": f"https://news.com/{i}",
+        "source": "naver",
+        "title": f"기사 {i}",
+        "description": "설명",
+        "published_at": "2024-01-01T09:00:00Z",
+        "sentiment": "neutral",
+        "company_mentions": ["삼성전자"],
+    }
+
+
+def _sync_all(service: SyncService, token=None) -> tuple:
+    """has_more가 false가 될 때까지 동기화"""
+    items = []
+    while True:
+        result = asyncio.run(service.sync("삼성전자", 10, token))
+        items.extend(result["items"])
+        token = result["next_token"]
+        if not result["has_more"]:
+            return items, token
+
+
+def test_sync_returns_only_new_articles():
+    """처음 동기화 후에는 새로 저장된 기사만, 변화가 없으면 빈 목록을 받는지 테스트"""
+    print("=== 증분 동기화 테스트 ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "news.db")
+        store = ArticleStore(path)
+        store.add_articles("삼성전자", [_article(i) for i in range(25)])
+        store.add_articles("LG전자", [_article(100 + i) for i in range(5)])
+
+        initial, token = _sync_all(SyncService(store))
+        idle = asyncio.run(SyncService(store).sync("삼성전자", 10, token))
+
+        # 재시작 후에도 같은 token으로 이어서 동기화
+        store.add_articles("삼성전자", [_article(200 + i) for i in range(3)])
+        restarted = SyncService(ArticleStore(path))
+        delta, _ = _sync_all(restarted, token)
+
+    print(f"✅ 처음 {len(initial)}건, 변화 없음 {len(idle['items'])}건, 재시작 후 새 기사 {len(delta)}건")
+    assert len(initial) == 25
+    assert [item["id"] for item in initial] == sorted(item["id"] for item in initial)
+    assert idle["items"] == [] and idle["next_token"] == token and not idle["has_more"]
+    assert [item["url"] for item in delta] == [f"https://news.com/{200 + i}" for i in range(3)]
+
+
+def test_token_validation_and_reset():
+    """잘못된 token, 다른 기업의 token, 새로 만든 저장소 처리 테스트"""
+    print("\n=== token 검증 테스트 ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ArticleStore(os.path.join(tmp, "news.db"))
+        store.add_articles("삼성전자", [_article(i) for i in range(3)])
+        service = SyncService(store)
+
+        for token in ("잘못된", encode_token("LG전자", 1)):
+            try:
+                asyncio.run(service.sync("삼성전자", 10, token))
+                raise AssertionError("잘못된 token이 허용되었습니다")
+            except HTTPException as e:
+                assert e.status_code == 400
+
+        # 다른 저장소에서 발급된(더 큰 id의) token
+        result = asyncio.run(service.sync("삼성전자", 10, encode_token("삼성전자", 1000)))
+
+    print(f"✅ 400 응답, 저장소 재생성 시 reset={result['reset']}")
+    assert result["reset"]
+    assert len(result["items"]) == 3
+
+
+def main():
+    """메인 테스트 함수"""
+    print("증분 동기화 테스트를 시작합니다...\n")
+
+    test_sync_returns_only_new_articles()
+    test_token_validation_and_reset()
+
+    print("\n=== 테스트 완료 ===")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+급상승 기업 탐지 테스트
+"""
+import asyncio
+import os
+import tempfile
+import time
+from datetime import datetime, timezone
+
+from app.services.article_store import ArticleStore
+from app.services.trending import CountMinSketch, SpaceSaving, TrendDetector
+
+
+def test_sketches():
+    """Count-Min 스케치와 Space-Saving 기본 동작 테스트"""
+    print("=== 스케치 테스트 ===")
+
+    sketch = CountMinSketch(width=512, depth=4)
+    candidates = SpaceSaving(capacity=10)
+    for i in range(5000):
+        key = "삼성전자" if i % 5 == 0 else f"기업{i}"
+        sketch.add(key)
+        candidates.add(key)
+
+    print(f"✅ 삼성전자 추정 빈도: {sketch.estimate('삼성전자')}")
+    assert sketch.estimate("삼성전자") >= 1000
+    assert sketch.estimate("삼성전자") < 1100
+    assert "삼성전자" in candidates.candidates()
+    assert len(candidates.candidates()) == 10
+
+
+def test_burst_detection():
+    """평소보다 언급이 급증한 기업이 위로 오는지 테스트"""
+    print("\n=== 급상승 탐지 테스트 ===")
+
+    detector = TrendDetector(window_seconds=60, baseline_windows=5, width=4096, depth=4, top_k=200)
+    now = 1_000_000 * 60
+    # 지난 5개 창: 삼성전자는 꾸준히 20건, LG전자는 1건
+    for window in range(5):
+        for _ in range(20):
+            detector.add_mentions(["삼성전자"], now=now + window * 60)
+        detector.add_mentions(["LG전자"], now=now + window * 60)
+    # 현재 창: 삼성전자 20건(평소와 같음), LG전자 15건(급증), 잡음 기업 다수
+    current = now + 5 * 60
+    for _ in range(20):
+        detector.add_mentions(["삼성전자"], now=current)
+    for _ in range(15):
+        detector.add_mentions(["LG전자"], now=current)
+    for i in range(1000):
+        detector.add_mentions([f"기업{i}"], now=current)
+
+    trending = detector.trending(limit=5, now=current)
+    print(f"✅ 급상승: {trending}")
+    assert trending[0]["company"] == "LG전자"
+    assert all(row["company"] != "삼성전자" for row in trending)
+
+
+def test_duplicate_urls_counted_once():
+    """여러 기업 검색에 저장된 같은 기사는 한 번만 집계하는지 테스트"""
+    print("\n=== 중복 기사 테스트 ===")
+
+    detector = TrendDetector(window_seconds=3600, baseline_windows=2, width=256, depth=4, top_k=10)
+    article = {"url": "https://news.com/1", "company_mentions": ["삼성전자", "LG전자"]}
+    asyncio.run(detector.on_new_articles("삼성전자", [article]))
+    asyncio.run(detector.on_new_articles("LG전자", [article]))
+
+    print(f"✅ 삼성전자 {detector._current.estimate('삼성전자')}건")
+    assert detector._current.estimate("삼성전자") == 1
+
+
+def test_candidates_carried_over_window_roll():
+    """시간 창이 바뀌어도 지난 창의 후보를 이어받고, 늦게 온 과거 시각이 현재 창을 지우지 않는지 테스트"""
+    print("\n=== 후보 이어받기 테스트 ===")
+
+    detector = TrendDetector(window_seconds=60, baseline_windows=5, width=1024, depth=4, top_k=3)
+    now = 1_000_000 * 60
+    for company in ("삼성전자", "LG전자"):
+        detector.add_mentions([company], now=now)
+    detector.add_mentions(["카카오"], now=now + 60)
+    carried = dict(detector._candidates.counts)
+    detector.add_mentions(["카카오"], now=now + 30)
+    # 새 후보는 카운터 0인 이어받은 후보부터 밀어냄
+    detector.add_mentions(["네이버"], now=now + 60)
+
+    print(f"✅ 이어받은 후보 {carried} → {detector._candidates.counts}")
+    assert carried == {"삼성전자": 0, "LG전자": 0, "카카오": 1}
+    assert detector._current.estimate("카카오") == 2
+    assert set(detector._candidates.candidates()) == {"LG전자", "카카오", "네이버"}
+
+
+def _stored(i: int, published: float, mentions: list) -> dict:
+    return {
+        "url": f"https://news.com/{i}",
+        "source": "naver",
+        "title": f"기사 {i}",
+        "description": "설명",
+        "published_at": datetime.fromtimestamp(published, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "company_mentions": mentions,
+    }
+
+
+def test_seeded_from_store_at_start():
+    """시작 시 저장된 기사로 기준선과 현재 창을 채워 재시작 직후에도 급상승을 찾는지 테스트"""
+    print("\n=== 시작 시 적재 테스트 ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ArticleStore(os.path.join(tmp, "news.db"))
+        window_start = int(time.time() // 60) * 60
+        # 지난 5개 창: 삼성전자 20건, LG전자 1건 / 현재 창: 삼성전자 20건, LG전자 15건 / 기준선보다 오래된 기사
+        plan = []
+        for k in range(6):
+            plan += [(window_start - k * 60, "삼성전자")] * 20 + [(window_start - k * 60, "LG전자")] * (15 if k == 0 else 1)
+        plan += [(window_start - 3600, "카카오")] * 50
+        articles = [_stored(i, published, [company]) for i, (published, company) in enumerate(plan)]
+        store.add_articles("삼성전자", articles)
+
+        detector = TrendDetector(window_seconds=60, baseline_windows=5, width=4096, depth=4, top_k=200, store=store)
+        asyncio.run(detector.start())
+        try:
+            # 재수집된 기사는 다시 집계하지 않음
+            asyncio.run(detector.on_new_articles("LG전자", articles[-60:-50]))
+            trending = detector.trending(limit=5, now=window_start)
+            windows = len(detector._history)
+        finally:
+            detector.stop()
+
+    print(f"✅ 기준선 창 {windows}개, 급상승 {trending}")
+    assert windows == 5
+    assert [row["company"] for row in trending] == ["LG전자"]
+    assert trending[0]["count"] == 15 and trending[0]["baseline"] == 1.0
+
+
+def main():
+    """메인 테스트 함수"""
+    print("급상승 기업 탐지 테스트를 시작합니다...\n")
+
+    test_sketches()
+    test_burst_detection()
+    test_duplicate_urls_counted_once()
+    test_candidates_carried_over_window_roll()
+    test_seeded_from_store_at_start()
+
+    print("\n=== 테스트 완료 ===")
+
+
+if __name__ == "__main__":
+    main()
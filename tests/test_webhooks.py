@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+웹훅 전달 테스트 (로컬 수신 서버 사용)
+"""
+import asyncio
+import http.server
+import json
+import os
+import tempfile
+import threading
+
+from app.services.webhooks import WebhookDispatcher, WebhookStore
+
+
+class _Receiver:
+    """받은 배치를 기록하는 로컬 웹훅 수신 서버 (처음 fail_first번은 503 응답)"""
+
+    def __init__(self, fail_first: int = 0):
+        self.batches = []
+        self.requests = 0
+        self.fail_first = fail_first
+        receiver = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                receiver.requests += 1
+                if receiver.requests <= receiver.fail_first:
+                    self.send_response(503)
+                else:
+                    receiver.batches.append(json.loads(body))
+                    self.send_response(204)
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        self.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/hook"
+
+
+def _article(i: int, company: str, mentions=None) -> dict:
+    return {
+        "url": f"https://example.com/news/{company}/{i}",
+        "company": company,
+        "title": f"{company} 기사 {i}",
+        "company_mentions": mentions or [company],
+    }
+
+
+def _dispatcher(path: str) -> WebhookDispatcher:
+    dispatcher = WebhookDispatcher(WebhookStore(path))
+    dispatcher.batch_window = 0.05
+    dispatcher.backoff_base = 0.05
+    dispatcher.refresh_interval = 0.05
+    return dispatcher
+
+
+async def _wait_for(condition, timeout: float = 5.0):
+    for _ in range(int(timeout / 0.02)):
+        if condition():
+            return
+        await asyncio.sleep(0.02)
+    raise AssertionError("시간 안에 조건을 만족하지 못했습니다")
+
+
+def test_batched_delivery():
+    """구독 기업의 새 기사만 한 배치로 묶어 전달하는지 테스트"""
+    print("=== 배치 전달 테스트 ===")
+
+    async def run():
+        receiver = _Receiver()
+        with tempfile.TemporaryDirectory() as tmp:
+            dispatcher = _dispatcher(os.path.join(tmp, "webhooks.db"))
+            await dispatcher.start()
+            try:
+                await dispatcher.subscribe(receiver.url, ["삼성전자"])
+                await dispatcher.on_new_articles("삼성전자", [_article(i, "삼성전자") for i in range(3)])
+                await dispatcher.on_new_articles("LG전자", [_article(0, "LG전자", ["LG전자", "삼성전자"])])
+                await dispatcher.on_new_articles("카카오", [_article(0, "카카오")])
+
+                await _wait_for(lambda: receiver.batches)
+                await asyncio.sleep(0.1)
+            finally:
+                await dispatcher.stop()
+                receiver.server.shutdown()
+
+        print(f"✅ 받은 배치: {len(receiver.batches)}개")
+        assert len(receiver.batches) == 1
+        urls = [article["url"] for article in receiver.batches[0]["articles"]]
+        assert len(urls) == 4
+        assert not any("카카오" in url for url in urls)
+
+    asyncio.run(run())
+
+
+def test_retry_with_backoff():
+    """실패한 배치를 재시도하여 전달하는지 테스트"""
+    print("\n=== 재시도 테스트 ===")
+
+    async def run():
+        receiver = _Receiver(fail_first=2)
+        with tempfile.TemporaryDirectory() as tmp:
+            dispatcher = _dispatcher(os.path.join(tmp, "webhooks.db"))
+            await dispatcher.start()
+            try:
+                await dispatcher.subscribe(receiver.url, ["삼성전자"])
+                await dispatcher.on_new_articles("삼성전자", [_article(0, "삼성전자")])
+                await _wait_for(lambda: receiver.batches)
+                # 수신 기록은 응답 전에 남으므로 outbox에서 지워질 때까지 기다림
+                await _wait_for(lambda: not dispatcher.store.pending_subscription_ids())
+                subscriptions = await dispatcher.subscriptions()
+            finally:
+                await dispatcher.stop()
+                receiver.server.shutdown()
+
+        print(f"✅ 요청 {receiver.requests}번 만에 전달")
+        assert receiver.requests == 3
+        assert subscriptions[0]["pending_batches"] == 0
+
+    asyncio.run(run())
+
+
+def test_resume_after_restart():
+    """종료 시 모아 둔 기사가 재시작 후 전달되는지 테스트"""
+    print("\n=== 재시작 후 전달 테스트 ===")
+
+    async def run():
+        receiver = _Receiver()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "webhooks.db")
+            dispatcher = _dispatcher(path)
+            dispatcher.batch_window = 60
+            await dispatcher.start()
+            await dispatcher.subscribe(receiver.url, ["삼성전자"])
+            await dispatcher.on_new_articles("삼성전자", [_article(i, "삼성전자") for i in range(2)])
+            await dispatcher.stop()
+            assert not receiver.batches
+
+            restarted = _dispatcher(path)
+            await restarted.start()
+            try:
+                await _wait_for(lambda: receiver.batches)
+            finally:
+                await restarted.stop()
+                receiver.server.shutdown()
+
+        print(f"✅ 재시작 후 {len(receiver.batches[0]['articles'])}개 기사 전달")
+        assert len(receiver.batches[0]["articles"]) == 2
+
+    asyncio.run(run())
+
+
+def test_single_deliverer_across_workers():
+    """같은 outbox를 쓰는 워커 중 하나만 전달하고, 다른 워커의 구독/배치도 전달하며, 종료 시 잠금을 넘기는지 테스트"""
+    print("\n=== 여러 워커 전달 테스트 ===")
+
+    async def run():
+        receiver = _Receiver()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "webhooks.db")
+            first, second = _dispatcher(path), _dispatcher(path)
+            await first.start()
+            await second.start()
+            roles = first.deliverer, second.deliverer
+            try:
+                # 두 번째 워커에서 구독을 추가하고, 두 워커가 같은 기사를 각자 수집
+                await second.subscribe(receiver.url, ["삼성전자"])
+                await _wait_for(lambda: "삼성전자" in first._by_company)
+                await first.on_new_articles("삼성전자", [_article(0, "삼성전자")])
+                await second.on_new_articles("삼성전자", [_article(1, "삼성전자")])
+                await _wait_for(lambda: len(receiver.batches) == 2)
+                await asyncio.sleep(0.2)
+                before_handover = len(receiver.batches)
+                second_deliveries = len(second._deliveries)
+
+                # 전달 담당 워커가 종료되면 다른 워커가 이어받음
+                await first.stop()
+                await _wait_for(lambda: second.deliverer)
+                await second.on_new_articles("삼성전자", [_article(2, "삼성전자")])
+                await _wait_for(lambda: len(receiver.batches) == 3)
+            finally:
+                await first.stop()
+                await second.stop()
+                receiver.server.shutdown()
+
+        urls = sorted(article["url"] for batch in receiver.batches for article in batch["articles"])
+        print(f"✅ 역할 {roles}, 받은 배치 {len(receiver.batches)}개")
+        assert roles == (True, False)
+        assert before_handover == 2 and second_deliveries == 0
+        assert urls == [_article(i, "삼성전자")["url"] for i in range(3)]
+
+    asyncio.run(run())
+
+
+def main():
+    """메인 테스트 함수"""
+    print("웹훅 전달 테스트를 시작합니다...\n")
+
+    test_batched_delivery()
+    test_retry_with_backoff()
+    test_resume_after_restart()
+    test_single_deliverer_across_workers()
+
+    print("\n=== 테스트 완료 ===")
+
+
+if __name__ == "__main__":
+    main()